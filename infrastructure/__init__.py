@@ -1,14 +1,19 @@
 """Infrastructure adapters for web scraping, JSON storage, and PostgreSQL access."""
 
+from .http_client import HttpStatusError, PooledHttpClient
 from .json_repository import CollectionRunPaths, JsonGameRepository
 from .naver_scraper import NaverScraper
 from .postgres_repository import GameCatalogRepository, PostgresConnectionFactory, ReplayRepository
+from .rate_limiter import TokenBucketRateLimiter
 
 __all__ = [
     "CollectionRunPaths",
     "GameCatalogRepository",
+    "HttpStatusError",
     "JsonGameRepository",
     "NaverScraper",
+    "PooledHttpClient",
     "PostgresConnectionFactory",
     "ReplayRepository",
+    "TokenBucketRateLimiter",
 ]
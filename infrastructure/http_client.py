@@ -0,0 +1,219 @@
+"""Keep-alive HTTP client used by the scraper for Naver JSON endpoints."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+import http.client
+import io
+import json
+import math
+import ssl
+import threading
+import time
+from typing import Any, BinaryIO, Iterator
+from urllib.parse import urlsplit
+import zlib
+
+
+ConnectionKey = tuple[str, str, int]
+
+_RETRYABLE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+class HttpStatusError(OSError):
+    """Raised for non-2xx responses; keeps the status and headers for retry decisions."""
+
+    def __init__(self, url: str, status: int, reason: str = "", headers: dict[str, str] | None = None) -> None:
+        super().__init__(f"HTTP {status} {reason} for {url}".strip())
+        self.url = url
+        self.status = int(status)
+        self.reason = reason
+        self.headers = dict(headers or {})
+
+    @property
+    def retry_after(self) -> float | None:
+        value = self.headers.get("Retry-After") or self.headers.get("retry-after")
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except ValueError:
+            return None
+
+
+class _DecompressingReader(io.RawIOBase):
+    """Incrementally inflates a gzip/deflate body while it is being read from the socket."""
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, raw: BinaryIO, wbits: int) -> None:
+        self._raw = raw
+        self._decoder = zlib.decompressobj(wbits)
+        self._buffer = b""
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._buffer and not self._eof:
+            chunk = self._raw.read(self.CHUNK_SIZE)
+            if chunk:
+                self._buffer = self._decoder.decompress(chunk)
+            else:
+                self._buffer = self._decoder.flush()
+                self._eof = True
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def decoded_body(response: http.client.HTTPResponse) -> BinaryIO:
+    encoding = (response.getheader("Content-Encoding") or "").strip().lower()
+    if encoding == "gzip":
+        return io.BufferedReader(_DecompressingReader(response, 16 + zlib.MAX_WBITS))
+    if encoding == "deflate":
+        return io.BufferedReader(_DecompressingReader(response, 32 + zlib.MAX_WBITS))
+    return response
+
+
+def _percentile_ms(sorted_seconds: list[float], fraction: float) -> float | None:
+    if not sorted_seconds:
+        return None
+    index = min(len(sorted_seconds) - 1, max(0, math.ceil(fraction * len(sorted_seconds)) - 1))
+    return round(sorted_seconds[index] * 1000.0, 3)
+
+
+class OfflineHttpClient:
+    """Transport that never touches the network; used when rebuilding games from archived responses."""
+
+    def get_json(self, url: str, *, headers: dict[str, str] | None = None, timeout: float = 10.0) -> Any:
+        raise FileNotFoundError(f"no archived response for {url}")
+
+    def stats(self) -> dict[str, int]:
+        return {}
+
+    def close(self) -> None:
+        return None
+
+
+class PooledHttpClient:
+    """Reuses idle keep-alive connections per (scheme, host, port) across threads."""
+
+    DEFAULT_MAX_IDLE_PER_HOST = 8
+    LATENCY_SAMPLE_SIZE = 10000
+
+    def __init__(self, *, max_idle_per_host: int = DEFAULT_MAX_IDLE_PER_HOST, ssl_context: ssl.SSLContext | None = None) -> None:
+        self.max_idle_per_host = max(1, int(max_idle_per_host))
+        self._ssl_context = ssl_context
+        self._idle: dict[ConnectionKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._connections_opened = 0
+        self._requests_sent = 0
+        self._reused_requests = 0
+        self._latencies: deque[float] = deque(maxlen=self.LATENCY_SAMPLE_SIZE)
+
+    def get_json(self, url: str, *, headers: dict[str, str] | None = None, timeout: float = 10.0) -> Any:
+        with self.stream(url, headers=headers, timeout=timeout) as body:
+            return json.load(body)
+
+    @contextmanager
+    def stream(self, url: str, *, headers: dict[str, str] | None = None, timeout: float = 10.0) -> Iterator[BinaryIO]:
+        """Yield the decoded response body; the connection goes back to the pool once it is drained."""
+        started_at = time.perf_counter()
+        key, connection, response = self._send(url, headers=headers, timeout=timeout)
+        reusable = False
+        try:
+            if not 200 <= response.status < 300:
+                response.read()
+                reusable = not response.will_close
+                raise HttpStatusError(url, response.status, response.reason, dict(response.getheaders()))
+            yield decoded_body(response)
+            response.read()
+            reusable = not response.will_close
+        finally:
+            self._checkin(key, connection, reusable)
+            # 응답 본문을 다 읽을 때까지의 시간을 요청 지연으로 기록한다.
+            with self._lock:
+                self._latencies.append(time.perf_counter() - started_at)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "http_connections_opened": self._connections_opened,
+                "http_requests_sent": self._requests_sent,
+                "http_reused_requests": self._reused_requests,
+                "http_latency_p50_ms": _percentile_ms(latencies, 0.50),
+                "http_latency_p95_ms": _percentile_ms(latencies, 0.95),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [connection for connections in self._idle.values() for connection in connections]
+            self._idle.clear()
+        for connection in idle:
+            connection.close()
+
+    def _send(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None,
+        timeout: float,
+    ) -> tuple[ConnectionKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        key = (scheme, parts.hostname or "", parts.port or (443 if scheme == "https" else 80))
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request_headers = {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive", **(headers or {})}
+        for attempt in (1, 2):
+            connection, reused = self._checkout(key, timeout)
+            try:
+                connection.request("GET", path, headers=request_headers)
+                response = connection.getresponse()
+            except _RETRYABLE_CONNECTION_ERRORS:
+                connection.close()
+                # 서버가 먼저 닫은 유휴 연결이면 새 연결로 한 번만 다시 보낸다.
+                if reused and attempt == 1:
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+            with self._lock:
+                self._requests_sent += 1
+                self._reused_requests += int(reused)
+            return key, connection, response
+        raise RuntimeError("unreachable")
+
+    def _checkout(self, key: ConnectionKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            connection = idle.pop() if idle else None
+            if connection is None:
+                self._connections_opened += 1
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context or ssl.create_default_context()), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _checkin(self, key: ConnectionKey, connection: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle_per_host:
+                    idle.append(connection)
+                    return
+        connection.close()
@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
 import json
 from dataclasses import dataclass
+import os
 from pathlib import Path
-from typing import Any, Callable
+import threading
+from typing import Any, Callable, Iterable
+
+from .log_sink import BufferedLogSink
+from .raw_archive import RawResponseArchive
+from .validation_index import ValidationIndex
 
 
 Validator = Callable[[dict[str, Any]], dict[str, Any]]
@@ -19,13 +26,31 @@ class CollectionRunPaths:
     debug_log_path: Path
     anomaly_log_path: Path
     failure_log_path: Path
+    journal_path: Path
+
+    def as_dict(self) -> dict[str, str]:
+        return {name: str(getattr(self, name)) for name in self.__dataclass_fields__}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, str]) -> "CollectionRunPaths":
+        return cls(**{name: Path(data[name]) for name in cls.__dataclass_fields__})
 
 
 class JsonGameRepository:
     """Handles JSON persistence and collection-side log file management."""
 
-    def prepare_collection_run(self, save_dir: Path) -> CollectionRunPaths:
+    def __init__(self) -> None:
+        self._append_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        self._validation_indexes: dict[Path, ValidationIndex] = {}
+        self._raw_archives: dict[Path, RawResponseArchive] = {}
+        self._log_sinks: dict[Path, BufferedLogSink] = {}
+
+    def prepare_collection_run(self, save_dir: Path, run_label: str | None = None) -> CollectionRunPaths:
         timestamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 같은 초에 시작한 병렬 실행(백필 샤드)이 같은 로그 파일을 쓰지 않도록 구분자를 붙인다.
+        if run_label:
+            timestamp = f"{timestamp}_{run_label}"
         logs_dir = save_dir / "logs"
         logs_dir.mkdir(parents=True, exist_ok=True)
         return CollectionRunPaths(
@@ -34,6 +59,7 @@ class JsonGameRepository:
             debug_log_path=save_dir / f"scrape_debug_{timestamp}.log",
             anomaly_log_path=logs_dir / f"collection_anomalies_{timestamp}.jsonl",
             failure_log_path=logs_dir / f"collection_failures_{timestamp}.jsonl",
+            journal_path=logs_dir / f"collection_journal_{timestamp}.jsonl",
         )
 
     def build_target_path(self, base_dir: Path, *, season_year: int, file_name: str) -> Path:
@@ -41,24 +67,172 @@ class JsonGameRepository:
         path.parent.mkdir(parents=True, exist_ok=True)
         return path
 
-    def save_pretty_json(self, path: Path, payload_text: str) -> None:
-        path.write_text(payload_text, encoding="utf-8")
+    def write_json_chunks(self, path: Path, chunks: Iterable[str], *, buffer_size: int = 64 * 1024) -> str:
+        """Write text chunks as UTF-8 through a temporary file and return the SHA-256 of what was written.
+
+        The text is never held as a whole, and readers see either the previous file or the new one.
+        """
+        digest = hashlib.sha256()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        pending: list[str] = []
+        pending_size = 0
+        try:
+            with tmp_path.open("wb") as handle:
+                for chunk in chunks:
+                    pending.append(chunk)
+                    pending_size += len(chunk)
+                    if pending_size >= buffer_size:
+                        data = "".join(pending).encode("utf-8")
+                        digest.update(data)
+                        handle.write(data)
+                        pending, pending_size = [], 0
+                data = "".join(pending).encode("utf-8")
+                digest.update(data)
+                handle.write(data)
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return digest.hexdigest()
+
+    def validation_index(self, save_dir: Path) -> ValidationIndex:
+        key = save_dir.resolve()
+        with self._index_lock:
+            index = self._validation_indexes.get(key)
+            if index is None:
+                index = self._validation_indexes[key] = ValidationIndex(save_dir)
+            return index
 
-    def try_reuse_existing(self, path: Path, validator: Validator) -> dict[str, Any] | None:
+    def live_state_path(self, save_dir: Path, *, season_year: int, game_id: str) -> Path:
+        # 진행 중 경기는 *.json 검색에 잡히지 않도록 .partial 확장자로 둔다.
+        return save_dir / "_live" / str(season_year) / f"{game_id}.partial"
+
+    def load_live_state(self, path: Path) -> dict[str, Any] | None:
         if not path.exists():
             return None
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            return json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            return None
+
+    def save_live_state(self, path: Path, state: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+
+    def discard_live_state(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+
+    def raw_archive(self, save_dir: Path) -> RawResponseArchive:
+        key = save_dir.resolve()
+        with self._index_lock:
+            archive = self._raw_archives.get(key)
+            if archive is None:
+                archive = self._raw_archives[key] = RawResponseArchive.for_save_dir(save_dir)
+            return archive
+
+    def try_reuse_existing(
+        self,
+        path: Path,
+        validator: Validator,
+        *,
+        index: ValidationIndex | None = None,
+        validator_version: str = "",
+    ) -> dict[str, Any] | None:
+        if not path.exists():
+            return None
+        raw: bytes | None = None
+        if index is not None:
+            cached_ok, raw = index.lookup(path, validator_version)
+            if cached_ok is not None:
+                return {"ok": True, "issues": [], "warnings": [], "cached": True} if cached_ok else None
+        try:
+            raw = path.read_bytes() if raw is None else raw
+            payload = json.loads(raw.decode("utf-8"))
             validation = validator(payload)
         except Exception:
             return None
+        if index is not None:
+            index.record(path, raw, validator_version, bool(validation.get("ok")))
         return validation if validation.get("ok") else None
 
+    def record_validation(
+        self,
+        index: ValidationIndex,
+        path: Path,
+        *,
+        sha256: str,
+        validator_version: str,
+        ok: bool,
+    ) -> None:
+        index.record_digest(path, sha256, validator_version, ok)
+
+    def open_run_log_sink(self, paths: CollectionRunPaths, **options: Any) -> BufferedLogSink:
+        """Route this run's debug/anomaly/failure log appends through one buffered sink until closed."""
+        sink = BufferedLogSink(**options)
+        with self._append_lock:
+            for path in (paths.debug_log_path, paths.anomaly_log_path, paths.failure_log_path):
+                self._log_sinks[path] = sink
+        return sink
+
+    def close_run_log_sink(self, paths: CollectionRunPaths) -> None:
+        with self._append_lock:
+            sinks = {
+                id(sink): sink
+                for sink in (
+                    self._log_sinks.pop(path, None)
+                    for path in (paths.debug_log_path, paths.anomaly_log_path, paths.failure_log_path)
+                )
+                if sink is not None
+            }
+        for sink in sinks.values():
+            sink.close()
+
     def append_debug_log(self, path: Path, message: str) -> None:
+        sink = self._log_sinks.get(path)
+        if sink is not None:
+            sink.write_text(path, message)
+            return
         timestamp = dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with path.open("a", encoding="utf-8") as handle:
+        with self._append_lock, path.open("a", encoding="utf-8") as handle:
             handle.write(f"[{timestamp}] {message}\n")
 
     def append_jsonl(self, path: Path, record: dict[str, Any]) -> None:
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        sink = self._log_sinks.get(path)
+        if sink is not None:
+            sink.write_jsonl(path, record)
+            return
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._append_lock, path.open("a", encoding="utf-8") as handle:
+            handle.write(line)
+
+    def append_journal(self, path: Path, record: dict[str, Any]) -> None:
+        """Append one journal record and fsync it so that a crash never loses acknowledged outcomes."""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._append_lock, path.open("a", encoding="utf-8") as handle:
+            handle.write(line)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def read_journal(self, path: Path) -> list[dict[str, Any]]:
+        records: list[dict[str, Any]] = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # 기록 도중 중단된 마지막 줄은 버린다.
+                continue
+        return records
+
+    def find_resumable_journal(self, save_dir: Path) -> Path | None:
+        logs_dir = save_dir / "logs"
+        if not logs_dir.exists():
+            return None
+        for path in sorted(logs_dir.glob("collection_journal_*.jsonl"), reverse=True):
+            records = self.read_journal(path)
+            if records and not any(record.get("event") == "run_finished" for record in records):
+                return path
+        return None
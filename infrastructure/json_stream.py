@@ -0,0 +1,133 @@
+"""Incremental JSON reading: yield the items of one nested array without loading the whole document."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Iterator
+
+_TOKEN = re.compile(r'\s*(?:"((?:[^"\\]|\\.)*)"|([\[\]{}:,])|([^\s\[\]{}:,"]+))', re.S)
+_WHITESPACE = re.compile(r"\s*")
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class TruncatedJsonError(ValueError):
+    """The stream ended in the middle of the document, e.g. a dropped connection."""
+
+
+def iter_json_array_items(stream: BinaryIO, path: tuple[str, ...], *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield each element of the array found under object keys ``path`` as it is read from ``stream``.
+
+    Only the element being decoded and one read chunk are buffered, so memory does not grow with the
+    array length. Everything outside the array is scanned and discarded. Raises ``TruncatedJsonError``
+    when the stream ends mid-document and ``ValueError`` when there is no array at ``path`` or the
+    document is malformed.
+    """
+    yield from _ArrayItemScanner(stream, tuple(path), max(1, int(chunk_size))).items()
+
+
+class _ArrayItemScanner:
+    def __init__(self, stream: BinaryIO, path: tuple[str, ...], chunk_size: int) -> None:
+        self.stream = stream
+        self.path = path
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def items(self) -> Iterator[Any]:
+        # 각 항목은 (컨테이너 종류, 부모에서의 키, 현재 키)이다.
+        stack: list[list[Any]] = []
+        expect_key = False
+        while (token := self._next_token()) is not None:
+            string, punct, _ = token
+            if string is not None:
+                if expect_key:
+                    stack[-1][2] = json.loads(f'"{string}"')
+                    expect_key = False
+                continue
+            if punct is None:
+                continue
+            if punct in "{[":
+                parent_key = stack[-1][2] if stack and stack[-1][0] == "{" else None
+                stack.append([punct, parent_key, None])
+                expect_key = punct == "{"
+                if punct == "[" and [entry[1] for entry in stack[1:]] == list(self.path):
+                    yield from self._array_items()
+                    return
+            elif punct in "}]":
+                if not stack:
+                    raise ValueError("unbalanced JSON document")
+                stack.pop()
+            elif punct == ",":
+                expect_key = bool(stack) and stack[-1][0] == "{"
+        if stack:
+            raise TruncatedJsonError(f"JSON document ended before the array at {'.'.join(self.path)}")
+        raise ValueError(f"no JSON array at {'.'.join(self.path)}")
+
+    def _array_items(self) -> Iterator[Any]:
+        self._skip_whitespace()
+        if self._peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            self._skip_whitespace()
+            separator = self._peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"expected ',' or ']' in JSON array, got {separator!r}")
+            self._skip_whitespace()
+
+    def _decode_value(self) -> Any:
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                if self.eof:
+                    raise TruncatedJsonError(f"truncated or malformed JSON array item: {exc}") from exc
+                self._fill()
+                continue
+            # 숫자 같은 스칼라는 버퍼 끝에서 잘렸을 수 있으므로 더 읽은 뒤 다시 해석한다.
+            if end == len(self.buffer) and not self.eof:
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+    def _next_token(self) -> tuple[str | None, str | None, str | None] | None:
+        while True:
+            match = _TOKEN.match(self.buffer, self.pos)
+            if match is not None and (match.end() < len(self.buffer) or self.eof or match.group(2) is not None):
+                self.pos = match.end()
+                return match.group(1), match.group(2), match.group(3)
+            if self.eof:
+                if self.buffer[self.pos:].strip():
+                    raise TruncatedJsonError("truncated or malformed JSON document")
+                return None
+            self._fill()
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or self.eof:
+                return
+            self._fill()
+
+    def _peek(self) -> str:
+        if self.pos >= len(self.buffer):
+            raise TruncatedJsonError("truncated JSON array")
+        return self.buffer[self.pos]
+
+    def _fill(self) -> None:
+        chunk = self.stream.read(self.chunk_size)
+        text = self.decoder.decode(chunk or b"", final=not chunk)
+        self.eof = not chunk
+        # 이미 처리한 앞부분은 버려 버퍼가 항목 하나와 읽기 단위 정도로만 유지되게 한다.
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
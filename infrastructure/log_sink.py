@@ -0,0 +1,163 @@
+"""Buffered, thread-safe append sink for collection debug/anomaly/failure logs."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import datetime as dt
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable
+
+
+class BufferedLogSink:
+    """Collects appended lines per file and writes them in batches.
+
+    A batch is written once ``max_buffer_records`` lines or ``max_buffer_bytes`` are pending, when
+    the oldest pending line is older than ``flush_interval_seconds`` (checked on every append and
+    by a background flusher thread), and on ``flush()``/``close()``. A file that would grow past
+    ``max_file_bytes`` is rotated first, ``logging.handlers.RotatingFileHandler`` style
+    (``name.1`` is the newest backup, at most ``backup_count`` are kept).
+
+    Appends only take a short lock around the in-memory buffer; the thread that detaches a batch
+    writes it outside that lock, in the order batches were detached, so concurrent fetch workers
+    only wait on disk I/O when their own append fills the buffer.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_buffer_records: int = 256,
+        max_buffer_bytes: int = 256 * 1024,
+        flush_interval_seconds: float = 2.0,
+        max_file_bytes: int = 16 * 1024 * 1024,
+        backup_count: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+        background: bool = True,
+    ) -> None:
+        self.max_buffer_records = max(1, int(max_buffer_records))
+        self.max_buffer_bytes = max(1, int(max_buffer_bytes))
+        self.flush_interval_seconds = max(0.0, float(flush_interval_seconds))
+        self.max_file_bytes = int(max_file_bytes)
+        self.backup_count = max(0, int(backup_count))
+        self._clock = clock
+        self._buffer_lock = threading.Lock()
+        self._io_turn = threading.Condition()
+        self._next_ticket = 0
+        self._next_write = 0
+        self._pending: dict[Path, list[str]] = defaultdict(list)
+        self._pending_records = 0
+        self._pending_bytes = 0
+        self._oldest_pending_at: float | None = None
+        self._closed = False
+        self.flush_count = 0
+        self.rotation_count = 0
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if background and self.flush_interval_seconds > 0:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="log-sink-flusher", daemon=True)
+            self._flusher.start()
+
+    def write_text(self, path: Path, message: str) -> None:
+        timestamp = dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._append(path, f"[{timestamp}] {message}\n")
+
+    def write_jsonl(self, path: Path, record: dict[str, Any]) -> None:
+        self._append(path, json.dumps(record, ensure_ascii=False) + "\n")
+
+    def flush(self) -> None:
+        with self._buffer_lock:
+            batch = self._take_pending()
+        self._write_batch(batch)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._buffer_lock:
+            self._closed = True
+            batch = self._take_pending()
+        self._write_batch(batch)
+
+    def __enter__(self) -> "BufferedLogSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _append(self, path: Path, line: str) -> None:
+        batch = None
+        with self._buffer_lock:
+            if self._closed:
+                # 실행이 끝난 뒤 들어온 기록은 버퍼에 남기지 않고 바로 쓴다.
+                self._pending[path].append(line)
+                batch = self._take_pending()
+            else:
+                self._pending[path].append(line)
+                self._pending_records += 1
+                self._pending_bytes += len(line)
+                now = self._clock()
+                if self._oldest_pending_at is None:
+                    self._oldest_pending_at = now
+                if (
+                    self._pending_records >= self.max_buffer_records
+                    or self._pending_bytes >= self.max_buffer_bytes
+                    or now - self._oldest_pending_at >= self.flush_interval_seconds
+                ):
+                    batch = self._take_pending()
+        self._write_batch(batch)
+
+    def _take_pending(self) -> tuple[int, dict[Path, list[str]]] | None:
+        """Detach the buffer with a write ticket; callers must hold ``_buffer_lock``."""
+        if not self._pending:
+            return None
+        batch = dict(self._pending)
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        self._pending = defaultdict(list)
+        self._pending_records = 0
+        self._pending_bytes = 0
+        self._oldest_pending_at = None
+        return ticket, batch
+
+    def _write_batch(self, detached: tuple[int, dict[Path, list[str]]] | None) -> None:
+        if detached is None:
+            return
+        ticket, batch = detached
+        # 버퍼를 떼어낸 순서대로 쓰도록 번호표 순서를 지킨다.
+        with self._io_turn:
+            self._io_turn.wait_for(lambda: self._next_write == ticket)
+            try:
+                for path, lines in batch.items():
+                    data = "".join(lines).encode("utf-8")
+                    self._rotate_if_needed(path, len(data))
+                    with path.open("ab") as handle:
+                        handle.write(data)
+                self.flush_count += 1
+            finally:
+                self._next_write += 1
+                self._io_turn.notify_all()
+
+    def _rotate_if_needed(self, path: Path, incoming_bytes: int) -> None:
+        if self.max_file_bytes <= 0 or not path.exists():
+            return
+        size = path.stat().st_size
+        if size == 0 or size + incoming_bytes <= self.max_file_bytes:
+            return
+        if self.backup_count == 0:
+            path.unlink()
+        else:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = path.with_name(f"{path.name}.{index}")
+                if source.exists():
+                    source.replace(path.with_name(f"{path.name}.{index + 1}"))
+            path.replace(path.with_name(f"{path.name}.1"))
+        self.rotation_count += 1
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.flush_interval_seconds):
+            with self._buffer_lock:
+                due = self._oldest_pending_at is not None and self._clock() - self._oldest_pending_at >= self.flush_interval_seconds
+                batch = self._take_pending() if due else None
+            self._write_batch(batch)
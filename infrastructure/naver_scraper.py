@@ -1,14 +1,18 @@
 """Playwright-based Naver KBO scraper adapter used by backend services."""
 
+from collections import deque
+import copy
 import datetime
-import json
 import os
-import time
-from urllib.parse import urljoin
-from urllib.request import Request, urlopen
+from urllib.parse import urlencode, urljoin
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
+from .http_client import HttpStatusError, OfflineHttpClient, PooledHttpClient
+from .json_stream import iter_json_array_items
+from .rate_limiter import TokenBucketRateLimiter
+from .retry_policy import is_throttle_error
+
 # Selenium을 이용해 스크래핑을 수행하는 클래스
 class NaverScraper:
     NAVER_MOBILE_BASE_URL = "https://m.sports.naver.com"
@@ -19,30 +23,44 @@ class NaverScraper:
         "Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0"
     )
     DEFAULT_API_REQUEST_INTERVAL = 0.25
-
-    def __init__(self, wait=10, path="games", headless=True, api_request_interval=None):
-        self.playwright = sync_playwright().start()
-        try:
-            self.browser = self.playwright.chromium.launch(headless=headless, args=["--no-sandbox"])
-        except Exception as e:
-            self.playwright.stop()
-            raise RuntimeError(
-                "Playwright browser launch failed. "
-                "Run `playwright install chromium` or provide a valid browser runtime."
-            ) from e
-        self.context = self.browser.new_context(
-            user_agent=self.DEFAULT_USER_AGENT
-        )
-        self.page = self.context.new_page()
-        self.driver = self.page
+    SCHEDULE_FINISHED_STATUS = "RESULT"
+    SCHEDULE_LIVE_STATUS = "STARTED"
+    SCHEDULE_PENDING_STATUS = "BEFORE"
+    SCHEDULE_CANCELLED_STATUS = "CANCEL"
+    RELAY_ITEMS_PATH = ("result", "textRelayData", "textRelays")
+    relay_block_transform = None
+
+    def __init__(
+        self,
+        wait=10,
+        path="games",
+        headless=True,
+        api_request_interval=None,
+        rate_limiter=None,
+        http_client=None,
+        api_base_url=None,
+        relay_block_transform=None,
+    ):
+        # 브라우저는 DOM 기반 일정 탐색이 실제로 필요할 때 처음 실행한다.
+        self.headless = headless
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self._page = None
+        self._extra_pages = []
         self.DEFAULT_TIMEOUT = wait
         self.api_request_interval = (
             self.DEFAULT_API_REQUEST_INTERVAL
             if api_request_interval is None
             else max(0.0, float(api_request_interval))
         )
-        self._last_api_request_finished_at = None
-        self.page.set_default_timeout(wait * 1000)
+        # 간격 설정만 주어지면 버스트 1의 토큰 버킷으로 기존 고정 간격과 같은 상한을 유지한다.
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter.from_interval(self.api_request_interval)
+        # 테스트에서는 로컬 대역 서버 주소와 별도 클라이언트로 교체할 수 있다.
+        self.http_client = http_client or PooledHttpClient()
+        self.api_base_url = (api_base_url or self.NAVER_API_BASE_URL).rstrip("/")
+        # 지정하면 이닝 중계를 스트리밍으로 읽으며 블록마다 바로 변환(최소화)한다.
+        self.relay_block_transform = relay_block_transform
 
         try:
             if not os.path.exists('./' + path):
@@ -51,7 +69,41 @@ class NaverScraper:
             print(f"Error creating directory: {e}")
         self.path = './' + path + '/'
 
+    @property
+    def browser_started(self):
+        return self._page is not None
+
+    @property
+    def page(self):
+        if self._page is None:
+            self._start_browser()
+        return self._page
+
+    @property
+    def driver(self):
+        return self.page
+
+    def _start_browser(self):
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch(headless=self.headless, args=["--no-sandbox"])
+        except Exception as e:
+            playwright.stop()
+            raise RuntimeError(
+                "Playwright browser launch failed. "
+                "Run `playwright install chromium` or provide a valid browser runtime."
+            ) from e
+        context = browser.new_context(
+            user_agent=self.DEFAULT_USER_AGENT
+        )
+        page = context.new_page()
+        page.set_default_timeout(getattr(self, 'DEFAULT_TIMEOUT', 10) * 1000)
+        self.playwright, self.browser, self.context, self._page = playwright, browser, context, page
+
     def close(self):
+        self.http_client.close()
+        if self.playwright is None:
+            return
         try:
             self.context.close()
         finally:
@@ -59,6 +111,8 @@ class NaverScraper:
                 self.browser.close()
             finally:
                 self.playwright.stop()
+                self.playwright, self.browser, self.context, self._page = None, None, None, None
+                self._extra_pages = []
 
     def _to_locator(self, root, css=None):
         target = self.page if root is None else root
@@ -72,24 +126,115 @@ class NaverScraper:
             "Referer": referer_url or self.NAVER_MOBILE_BASE_URL,
         }
 
-    def _throttle_api_request(self):
-        if self.api_request_interval <= 0 or self._last_api_request_finished_at is None:
-            return
+    # 모든 API 요청은 공용 속도 제한을 거치고, 429/503 응답은 전체 요청 속도를 낮춘다.
+    def _get_api_json(self, api_url, referer_url=None):
+        self.rate_limiter.acquire()
+        try:
+            data = self.http_client.get_json(
+                api_url,
+                headers=self._build_api_headers(referer_url),
+                timeout=max(10, getattr(self, 'DEFAULT_TIMEOUT', 10)),
+            )
+        except HttpStatusError as exc:
+            if is_throttle_error(exc):
+                self.rate_limiter.on_throttled(exc.retry_after)
+            raise
+        self.rate_limiter.on_success()
+        return data
+
+    def _iter_api_array(self, api_url, item_path, referer_url=None):
+        self.rate_limiter.acquire()
+        try:
+            with self.http_client.stream(
+                api_url,
+                headers=self._build_api_headers(referer_url),
+                timeout=max(10, getattr(self, 'DEFAULT_TIMEOUT', 10)),
+            ) as body:
+                yield from iter_json_array_items(body, item_path)
+        except HttpStatusError as exc:
+            if is_throttle_error(exc):
+                self.rate_limiter.on_throttled(exc.retry_after)
+            raise
+        self.rate_limiter.on_success()
+
+    def fetch_game_endpoint(self, game_id, endpoint, referer_url=None, responses=None):
+        # responses에 이미 받은 엔드포인트가 있으면 재시도 시 다시 요청하지 않는다.
+        if responses is not None and endpoint in responses:
+            return responses[endpoint]
+        data = self._get_api_json(f"{self.api_base_url}/{game_id}/{endpoint}", referer_url)
+        if responses is not None and data:
+            responses[endpoint] = data
+        return data
+
+    def fetch_schedule_games(self, from_date, to_date):
+        """일정 JSON API에서 기간 내 KBO 경기 목록을 그대로 반환한다."""
+        query = urlencode(
+            {
+                "fields": "basic",
+                "upperCategoryId": "kbaseball",
+                "categoryId": "kbo",
+                "fromDate": from_date.isoformat(),
+                "toDate": to_date.isoformat(),
+                "size": 500,
+            }
+        )
+        schedule = self._get_api_json(
+            f"{self.api_base_url}?{query}",
+            self.get_schedule_page_url(from_date.year, from_date.month, from_date.day),
+        )
+        games = ((schedule or {}).get("result") or {}).get("games")
+        if not isinstance(games, list):
+            raise ValueError(f"unexpected schedule response for {from_date}~{to_date}")
+        return games
+
+    def is_finished_schedule_game(self, game):
+        return (
+            str(game.get("categoryId") or "kbo").lower() == "kbo"
+            and game.get("statusCode") == self.SCHEDULE_FINISHED_STATUS
+            and not game.get("cancel")
+        )
 
-        elapsed = time.monotonic() - self._last_api_request_finished_at
-        remaining = self.api_request_interval - elapsed
-        if remaining > 0:
-            time.sleep(remaining)
+    def get_schedule_statuses(self, game_date):
+        """해당 날짜 KBO 경기의 {game_id: 상태 코드}를 반환한다. 취소 경기는 CANCEL로 통일한다."""
+        statuses = {}
+        for game in self.fetch_schedule_games(game_date, game_date):
+            if not isinstance(game, dict) or not game.get("gameId"):
+                continue
+            if str(game.get("categoryId") or "kbo").lower() != "kbo":
+                continue
+            status = self.SCHEDULE_CANCELLED_STATUS if game.get("cancel") else str(game.get("statusCode") or "")
+            statuses[str(game["gameId"])] = status
+        return statuses
+
+    def iter_schedule_game_urls(self, start_date, end_date):
+        """
+        일정 JSON API로 (날짜, 종료된 경기 URL 리스트)를 순회한다.
 
-    def fetch_game_endpoint(self, game_id, endpoint, referer_url=None):
-        api_url = f"{self.NAVER_API_BASE_URL}/{game_id}/{endpoint}"
-        request = Request(api_url, headers=self._build_api_headers(referer_url))
-        self._throttle_api_request()
-        try:
-            with urlopen(request, timeout=max(10, getattr(self, 'DEFAULT_TIMEOUT', 10))) as response:
-                return json.load(response)
-        finally:
-            self._last_api_request_finished_at = time.monotonic()
+        - 월 단위로 한 번씩만 요청하고, 종료 경기가 없는 날짜는 건너뛴다.
+        - DOM 기반 iter_active_date_urls와 같은 형태로 반환한다.
+        """
+        if end_date < start_date:
+            raise ValueError("종료일이 시작일보다 앞설 수 없습니다.")
+
+        chunk_start = start_date
+        while chunk_start <= end_date:
+            if chunk_start.month == 12:
+                next_month = datetime.date(chunk_start.year + 1, 1, 1)
+            else:
+                next_month = datetime.date(chunk_start.year, chunk_start.month + 1, 1)
+            chunk_end = min(end_date, next_month - datetime.timedelta(days=1))
+
+            urls_by_date = {}
+            for game in self.fetch_schedule_games(chunk_start, chunk_end):
+                if not isinstance(game, dict) or not game.get("gameId") or not self.is_finished_schedule_game(game):
+                    continue
+                game_date = datetime.date.fromisoformat(str(game.get("gameDate"))[:10])
+                if chunk_start <= game_date <= chunk_end:
+                    urls_by_date.setdefault(game_date, []).append(self.normalize_game_url(f"/game/{game['gameId']}"))
+            for game_date in sorted(urls_by_date):
+                yield game_date, urls_by_date[game_date]
+
+            chunk_start = next_month
 
     # 버튼 클릭
     def click(self, button):
@@ -134,8 +279,8 @@ class NaverScraper:
     
     # 이닝 데이터 전처리
     def preprocess_inning_data(self, inning_data):
-        processed_data = inning_data["result"]["textRelayData"]["textRelays"]
-        processed_data.reverse()
+        # 캐시된 응답을 재사용할 수 있도록 원본 리스트는 뒤집지 않는다.
+        processed_data = list(reversed(inning_data["result"]["textRelayData"]["textRelays"]))
 
         return processed_data
     
@@ -148,17 +293,48 @@ class NaverScraper:
 
         return max((int(key) for key in inning_keys if str(key).isdigit()), default=0)
 
+    # 이닝 중계 응답 전체를 메모리에 올리지 않고 블록을 읽는 대로 변환한다. 결과 순서는 preprocess_inning_data와 같다.
+    # 재시도 캐시에는 원본 대신 변환된 블록을 "<endpoint>#transformed" 키로 둔다.
+    def stream_inning_blocks(self, game_id, endpoint, referer_url=None, responses=None):
+        cache_key = f"{endpoint}#transformed"
+        if responses is not None and cache_key in responses:
+            return responses[cache_key]
+        blocks = [
+            self.relay_block_transform(block)
+            for block in self._iter_api_array(f"{self.api_base_url}/{game_id}/{endpoint}", self.RELAY_ITEMS_PATH, referer_url)
+        ]
+        blocks.reverse()
+        if responses is not None and blocks:
+            responses[cache_key] = blocks
+        return blocks
+
     # API request를 통해 이닝 데이터 취득
-    def get_inning_data(self, game_id, referer_url=None):
-        summary = self.fetch_game_endpoint(game_id, "relay", referer_url=referer_url)
+    def get_inning_data(self, game_id, referer_url=None, responses=None):
+        summary = self.fetch_game_endpoint(game_id, "relay", referer_url=referer_url, responses=responses)
         inning_data = []
 
         for inning in range(1, self.get_inning_count(summary) + 1):
-            relay_data = self.fetch_game_endpoint(game_id, f"relay?inning={inning}", referer_url=referer_url)
+            endpoint = f"relay?inning={inning}"
+            if self.relay_block_transform is not None:
+                inning_data.append(self.stream_inning_blocks(game_id, endpoint, referer_url=referer_url, responses=responses))
+                continue
+            relay_data = self.fetch_game_endpoint(game_id, endpoint, referer_url=referer_url, responses=responses)
             inning_data.append(self.preprocess_inning_data(relay_data))
 
         return inning_data
     
+    # 실시간 수집용: 마지막으로 받은 이닝(진행 중이었을 수 있음)부터 현재 이닝까지만 받는다.
+    def get_new_inning_data(self, game_id, known_inning_count, referer_url=None):
+        summary = self.fetch_game_endpoint(game_id, "relay", referer_url=referer_url)
+        inning_count = self.get_inning_count(summary)
+        new_innings = {}
+
+        for inning in range(max(1, known_inning_count), inning_count + 1):
+            relay_data = self.fetch_game_endpoint(game_id, f"relay?inning={inning}", referer_url=referer_url)
+            new_innings[inning] = self.preprocess_inning_data(relay_data)
+
+        return inning_count, new_innings
+
     # 라인업 데이터 전처리
     def preprocess_lineup_data(self, lineup_data):
         preview_data = lineup_data["result"]["previewData"]
@@ -176,8 +352,8 @@ class NaverScraper:
         return processed_data
 
     # API request를 통해 선수 라인업 데이터 취득
-    def get_lineup_data(self, game_id, referer_url=None):
-        lineup_data = self.fetch_game_endpoint(game_id, "preview", referer_url=referer_url)
+    def get_lineup_data(self, game_id, referer_url=None, responses=None):
+        lineup_data = self.fetch_game_endpoint(game_id, "preview", referer_url=referer_url, responses=responses)
         return self.preprocess_lineup_data(lineup_data) if lineup_data else {}
     
     # 경기 기록 데이터 전처리
@@ -190,21 +366,31 @@ class NaverScraper:
         return processed_data
 
     # API request를 통해 경기 기록 데이터 취득
-    def get_record_data(self, game_id, referer_url=None):
-        record_data = self.fetch_game_endpoint(game_id, "record", referer_url=referer_url)
+    def get_record_data(self, game_id, referer_url=None, responses=None):
+        record_data = self.fetch_game_endpoint(game_id, "record", referer_url=referer_url, responses=responses)
         return self.preprocess_record_data(record_data) if record_data else {}
 
     # 경기 중계 url을 받아 필요한 데이터를 긁어서 반환
-    def get_game_data(self, game_url):
+    # responses 사전을 재시도 사이에 넘기면 실패한 엔드포인트만 다시 요청한다.
+    def get_game_data(self, game_url, responses=None):
         normalized_url = self.normalize_game_url(game_url)
         game_id = self.extract_game_id(normalized_url)
 
-        lineup_data = self.get_lineup_data(game_id, referer_url=normalized_url)
-        inning_data = self.get_inning_data(game_id, referer_url=f"{normalized_url}/relay")
-        record_data = self.get_record_data(game_id, referer_url=f"{normalized_url}/record")
+        lineup_data = self.get_lineup_data(game_id, referer_url=normalized_url, responses=responses)
+        inning_data = self.get_inning_data(game_id, referer_url=f"{normalized_url}/relay", responses=responses)
+        record_data = self.get_record_data(game_id, referer_url=f"{normalized_url}/record", responses=responses)
 
         return lineup_data, inning_data, record_data
 
+    # 보관된 엔드포인트 응답만으로 get_game_data()와 같은 결과를 만든다. 브라우저, 네트워크, 저장 폴더를 쓰지 않는다.
+    @classmethod
+    def game_data_from_responses(cls, game_url, responses):
+        scraper = cls.__new__(cls)
+        scraper.api_base_url = cls.NAVER_API_BASE_URL
+        scraper.http_client = OfflineHttpClient()
+        scraper.rate_limiter = TokenBucketRateLimiter(None)
+        return scraper.get_game_data(game_url, responses=dict(responses))
+
     @classmethod
     def normalize_game_url(cls, game_url):
         return urljoin(cls.NAVER_MOBILE_BASE_URL, str(game_url or "").strip())
@@ -255,13 +441,15 @@ class NaverScraper:
         return base + date
     
     # 특정 일자에서 경기 페이지 주소 얻기
-    def get_game_urls(self, year, month, date, soft_timeout = 8):
+    def get_game_urls(self, year, month, date, soft_timeout = 8, navigate = True):
         """
         해당 (year, month, day)의 경기 URL 리스트를 반환.
         - 경기 목록이 뜨면 즉시 URL 반환
         - 로딩이 계속되면 [] 반환
+        - navigate=False면 이미 해당 일정 페이지로 이동한 탭이라고 보고 바로 읽는다.
         """
-        self.page.goto(self.get_schedule_page_url(year, month, date))
+        if navigate:
+            self.page.goto(self.get_schedule_page_url(year, month, date))
         try:
             self.wait_all_present('div[class^="ScheduleAllType_match_list_group"]', timeout=soft_timeout)
         except PlaywrightTimeoutError:
@@ -309,43 +497,107 @@ class NaverScraper:
         month = current.get_attribute('datetime').split('-')[1]
         return int(month)
 
-    def iter_active_date_urls(self, start_date, end_date):
+    def iter_active_date_urls(self, start_date, end_date, page_count = 1):
         """
         일정 페이지의 활성화된 날짜를 이용해 (날짜, 경기 URL 리스트)를 순회한다.
 
         - start_date, end_date: datetime.date
         - 활성화되지 않은 날짜는 자동으로 건너뛴다.
+        - page_count > 1 이면 같은 브라우저의 여러 탭에서 일정 페이지를 동시에 불러온다.
         """
         if end_date < start_date:
             raise ValueError("종료일이 시작일보다 앞설 수 없습니다.")
 
-        self.page.goto(self.get_schedule_page_url(start_date.year, start_date.month, start_date.day))
-        cur_year, cur_month = start_date.year, start_date.month
-
-        while True:
-            activated_dates = self.get_activated_dates()
-            for day in activated_dates:
-                date_obj = datetime.date(cur_year, cur_month, day)
-                if date_obj < start_date or date_obj > end_date:
-                    continue
-
-                urls = self.get_game_urls(cur_year, cur_month, day)
-                yield date_obj, urls
+        ranges = []
+        cur = start_date
+        while cur <= end_date:
+            next_month = (cur.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+            ranges.append((cur, min(end_date, next_month - datetime.timedelta(days=1))))
+            cur = next_month
+        yield from self.iter_dom_schedule_urls(ranges, page_count=page_count)
 
-            if cur_year == end_date.year and cur_month == end_date.month:
-                break
+    def iter_dom_schedule_urls(self, ranges, page_count = 1):
+        """
+        한 달 안에 들어가는 (시작일, 종료일) 구간 목록을 받아 (날짜, 경기 URL 리스트)를 날짜 순으로 돌려준다.
 
-            if cur_month == 12:
-                next_year, next_month = cur_year + 1, 1
-            else:
-                next_year, next_month = cur_year, cur_month + 1
+        달별 활성 날짜 조회와 날짜별 경기 목록 조회를 page_count개 탭에 나눠 맡긴다.
+        Playwright 동기 API는 한 스레드에서만 쓸 수 있으므로, 한 스레드가 여러 탭의 이동을
+        먼저 시작해 두고 결과는 요청 순서대로 읽는다. 그래서 탭 수와 관계없이 결과 순서가 같다.
+        """
+        ranges = sorted(ranges)
 
+        def read_activated_dates(view, date_range):
             try:
-                moved = self.goto_next_month()
+                return view.get_activated_dates()
             except Exception:
-                moved = 0
-
-            if not moved or self.get_current_month() != next_month:
-                self.page.goto(self.get_schedule_page_url(next_year, next_month, 1))
+                return []
+
+        days = []
+        for (range_start, range_end), activated in self._map_on_pages(
+            ranges,
+            lambda date_range: self.get_schedule_page_url(date_range[0].year, date_range[0].month, 1),
+            read_activated_dates,
+            page_count,
+            navigation_error_result=[],
+        ):
+            for day in sorted(activated):
+                game_date = datetime.date(range_start.year, range_start.month, day)
+                if range_start <= game_date <= range_end:
+                    days.append(game_date)
+
+        yield from self._map_on_pages(
+            days,
+            lambda game_date: self.get_schedule_page_url(game_date.year, game_date.month, game_date.day),
+            lambda view, game_date: view.get_game_urls(game_date.year, game_date.month, game_date.day, navigate=False),
+            page_count,
+        )
 
-            cur_year, cur_month = next_year, next_month
+    def _page_views(self, page_count):
+        """같은 브라우저 컨텍스트의 탭마다 하나씩, self.page만 다른 얕은 복사본을 만든다."""
+        views = [self]
+        self.page  # 첫 탭을 쓰기 전에 브라우저를 띄운다.
+        while len(self._extra_pages) < page_count - 1:
+            extra_page = self.context.new_page()
+            extra_page.set_default_timeout(getattr(self, 'DEFAULT_TIMEOUT', 10) * 1000)
+            self._extra_pages.append(extra_page)
+        views.extend(self._view_for(extra_page) for extra_page in self._extra_pages[: max(0, page_count - 1)])
+        return views
+
+    def _view_for(self, page):
+        view = copy.copy(self)
+        view._page = page
+        return view
+
+    def _map_on_pages(self, items, url_for, read, page_count, navigation_error_result = None):
+        """items를 탭에 하나씩 배정해 이동을 시작하고, read(view, item) 결과를 items 순서대로 돌려준다."""
+        pending = deque(items)
+        if not pending:
+            return
+        idle = self._page_views(min(max(1, page_count), len(pending)))
+        in_flight = deque()
+
+        def dispatch():
+            while idle and pending:
+                view, item = idle.pop(0), pending.popleft()
+                try:
+                    # commit까지만 기다리면 나머지 로딩은 브라우저 안에서 다른 탭과 함께 진행된다.
+                    view.page.goto(url_for(item), wait_until="commit")
+                    error = None
+                except Exception as exc:
+                    error = exc
+                in_flight.append((item, view, error))
+
+        dispatch()
+        while in_flight:
+            item, view, error = in_flight.popleft()
+            try:
+                if error is None:
+                    result = read(view, item)
+                elif navigation_error_result is not None:
+                    result = navigation_error_result
+                else:
+                    raise error
+            finally:
+                idle.append(view)
+            dispatch()
+            yield item, result
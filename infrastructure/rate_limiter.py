@@ -0,0 +1,201 @@
+"""Token-bucket rate limiter shared by scraper threads and, optionally, worker processes."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def locked_state_file(path: Path) -> Iterator[Any]:
+    """Open ``path`` read/write under an exclusive OS-level lock shared between processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o644), "r+b")
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield handle
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        handle.close()
+
+
+class TokenBucketRateLimiter:
+    """Allows ``rate_per_second`` requests on average with bursts of up to ``burst`` requests.
+
+    Without ``state_path`` the bucket lives in memory and is shared by every thread holding this
+    instance. With ``state_path`` the bucket state is kept in a small JSON file guarded by an OS
+    file lock, so separate worker processes pointing at the same file share one request budget.
+    ``rate_per_second=None`` disables limiting but still records request statistics.
+
+    ``on_throttled()`` / ``on_success()`` adapt the effective rate to upstream feedback: a throttle
+    response halves the rate (down to ``min_rate_per_second``) and pauses every caller for the
+    server's ``Retry-After``; each successful request then raises the rate back towards the
+    configured ceiling in small additive steps. The adapted rate lives in the same shared state,
+    so every thread or process slows down together.
+    """
+
+    DECREASE_FACTOR = 0.5
+    RECOVERY_STEPS = 20
+
+    def __init__(
+        self,
+        rate_per_second: float | None,
+        *,
+        burst: int = 1,
+        state_path: Path | None = None,
+        min_rate_per_second: float | None = None,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate_per_second = float(rate_per_second) if rate_per_second and rate_per_second > 0 else None
+        self.min_rate_per_second = (
+            float(min_rate_per_second)
+            if min_rate_per_second
+            else (self.rate_per_second / 8.0 if self.rate_per_second is not None else None)
+        )
+        self.burst = max(1, int(burst))
+        self.state_path = Path(state_path) if state_path is not None else None
+        # 프로세스 간 공유 상태는 같은 시간축이 필요하므로 파일 모드에서는 벽시계를 사용한다.
+        self._clock = clock or (time.time if self.state_path is not None else time.monotonic)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._state: dict[str, Any] = {}
+        self._current_rate = self.rate_per_second
+        self._request_count = 0
+        self._throttled_seconds = 0.0
+        self._throttle_events = 0
+        self._first_request_at: float | None = None
+        self._last_request_at: float | None = None
+
+    @classmethod
+    def from_interval(cls, interval_seconds: float | None, **kwargs: Any) -> "TokenBucketRateLimiter":
+        interval = float(interval_seconds or 0.0)
+        return cls(1.0 / interval if interval > 0 else None, **kwargs)
+
+    @property
+    def current_rate_per_second(self) -> float | None:
+        return self._current_rate
+
+    def acquire(self) -> float:
+        """Block until one request token is available and return the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = self._with_state(self._take)
+                if wait <= 0:
+                    now = self._clock()
+                    self._request_count += 1
+                    self._throttled_seconds += waited
+                    if self._first_request_at is None:
+                        self._first_request_at = now
+                    self._last_request_at = now
+                    return waited
+            self._sleep(wait)
+            waited += wait
+
+    def on_throttled(self, retry_after: float | None = None) -> None:
+        """Record an upstream throttle (429/503): cut the shared rate and pause all callers."""
+
+        def update(state: dict[str, Any]) -> None:
+            rate = self._state_rate(state)
+            if rate is not None:
+                state["rate"] = max(self.min_rate_per_second, rate * self.DECREASE_FACTOR)
+            if retry_after and retry_after > 0:
+                state["paused_until"] = max(float(state.get("paused_until") or 0.0), self._clock() + float(retry_after))
+            self._current_rate = state.get("rate", self._current_rate)
+
+        with self._lock:
+            self._throttle_events += 1
+            self._with_state(update)
+
+    def on_success(self) -> None:
+        """Step the shared rate back towards the configured ceiling after a successful request."""
+        if self.rate_per_second is None or self._current_rate == self.rate_per_second:
+            return
+
+        def update(state: dict[str, Any]) -> None:
+            rate = self._state_rate(state)
+            state["rate"] = min(self.rate_per_second, rate + self.rate_per_second / self.RECOVERY_STEPS)
+            self._current_rate = state["rate"]
+
+        with self._lock:
+            self._with_state(update)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            span = (
+                self._last_request_at - self._first_request_at
+                if self._first_request_at is not None and self._last_request_at is not None
+                else 0.0
+            )
+            observed_rate = (self._request_count - 1) / span if self._request_count > 1 and span > 0 else 0.0
+            return {
+                "rate_limit_per_second": self.rate_per_second,
+                "rate_limit_burst": self.burst,
+                "rate_limit_current": round(self._current_rate, 3) if self._current_rate is not None else None,
+                "request_count": self._request_count,
+                "observed_request_rate": round(observed_rate, 3),
+                "throttled_seconds": round(self._throttled_seconds, 3),
+                "throttle_events": self._throttle_events,
+            }
+
+    def _state_rate(self, state: dict[str, Any]) -> float | None:
+        rate = state.get("rate")
+        return float(rate) if rate is not None else self.rate_per_second
+
+    def _with_state(self, update: Callable[[dict[str, Any]], Any]) -> Any:
+        if self.state_path is None:
+            return update(self._state)
+        with locked_state_file(self.state_path) as handle:
+            raw = handle.read()
+            try:
+                state = json.loads(raw.decode("utf-8")) if raw else {}
+            except ValueError:
+                state = {}
+            result = update(state)
+            handle.seek(0)
+            handle.truncate()
+            handle.write(json.dumps(state).encode("utf-8"))
+            handle.flush()
+        return result
+
+    def _take(self, state: dict[str, Any]) -> float:
+        now = self._clock()
+        paused_until = float(state.get("paused_until") or 0.0)
+        if paused_until > now:
+            return paused_until - now
+        rate = self._state_rate(state)
+        self._current_rate = rate
+        if rate is None:
+            return 0.0
+        tokens = float(state.get("tokens", self.burst))
+        updated_at = state.get("updated_at")
+        if updated_at is not None:
+            tokens = min(float(self.burst), tokens + max(0.0, now - float(updated_at)) * rate)
+        state["updated_at"] = now
+        if tokens >= 1.0:
+            state["tokens"] = tokens - 1.0
+            return 0.0
+        state["tokens"] = tokens
+        return (1.0 - tokens) / rate
@@ -0,0 +1,162 @@
+"""Content-addressed, compressed archive of raw Naver endpoint responses."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any, Iterator
+
+try:
+    import zstandard
+except ImportError:  # zstandard는 선택 의존성이며 없으면 gzip만 사용한다.
+    zstandard = None
+
+
+_CODEC_SUFFIXES = {"zstd": ".json.zst", "gzip": ".json.gz"}
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def canonical_response_bytes(data: Any) -> bytes:
+    """Stable encoding used both for hashing and for the stored blob."""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class ArchivedGame:
+    season: int
+    game_id: str
+    game_url: str
+    file_name: str
+    collected_at: str
+    endpoints: dict[str, str] = field(default_factory=dict)
+
+
+class RawResponseArchive:
+    """Stores each endpoint response once under ``objects/<sha[:2]>/<sha>`` and a per-game manifest.
+
+    Blobs are keyed by the SHA-256 of their canonical JSON, so an unchanged response collected
+    twice (re-runs, retries) costs no extra space. ``games/<season>/<game_id>.jsonl`` maps the
+    endpoints (``preview``, ``relay``, ``relay?inning=N``, ``record``) to blob hashes; the last line
+    wins. No file ends in ``.json``, so game JSON globbing over the save directory skips the archive.
+    """
+
+    DIR_NAME = "_raw"
+
+    def __init__(self, root: Path, codec: str | None = None) -> None:
+        self.root = root
+        self.codec = codec or default_codec()
+        if self.codec not in _CODEC_SUFFIXES:
+            raise ValueError(f"unsupported archive codec: {self.codec}")
+        if self.codec == "zstd" and zstandard is None:
+            raise ValueError("zstd archive codec requires the 'zstandard' package")
+        self._manifest_lock = threading.Lock()
+
+    @classmethod
+    def for_save_dir(cls, save_dir: Path, codec: str | None = None) -> "RawResponseArchive":
+        return cls(save_dir / cls.DIR_NAME, codec=codec)
+
+    def put(self, data: Any) -> str:
+        raw = canonical_response_bytes(data)
+        digest = hashlib.sha256(raw).hexdigest()
+        if self._find_blob(digest) is not None:
+            return digest
+        path = self._blob_path(digest, self.codec)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(self._compress(raw, self.codec))
+        tmp_path.replace(path)
+        return digest
+
+    def get(self, digest: str) -> Any:
+        found = self._find_blob(digest)
+        if found is None:
+            raise FileNotFoundError(f"raw archive blob not found: {digest}")
+        path, codec = found
+        raw = self._decompress(path.read_bytes(), codec)
+        if hashlib.sha256(raw).hexdigest() != digest:
+            raise ValueError(f"raw archive blob is corrupted: {path}")
+        return json.loads(raw.decode("utf-8"))
+
+    def store_game(
+        self,
+        *,
+        season: int,
+        game_id: str,
+        game_url: str,
+        file_name: str,
+        collected_at: str,
+        responses: dict[str, Any],
+    ) -> ArchivedGame:
+        game = ArchivedGame(
+            season=int(season),
+            game_id=game_id,
+            game_url=game_url,
+            file_name=file_name,
+            collected_at=collected_at,
+            endpoints={endpoint: self.put(data) for endpoint, data in responses.items()},
+        )
+        manifest_path = self._manifest_path(game.season, game_id)
+        line = json.dumps(game.__dict__, ensure_ascii=False) + "\n"
+        with self._manifest_lock:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with manifest_path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+        return game
+
+    def load_responses(self, game: ArchivedGame) -> dict[str, Any]:
+        return {endpoint: self.get(digest) for endpoint, digest in game.endpoints.items()}
+
+    def iter_games(self, season: int | None = None) -> Iterator[ArchivedGame]:
+        games_root = self.root / "games"
+        season_dirs = [games_root / str(season)] if season is not None else sorted(games_root.glob("*"))
+        for season_dir in season_dirs:
+            for manifest_path in sorted(season_dir.glob("*.jsonl")):
+                game = self._latest_manifest_entry(manifest_path)
+                if game is not None:
+                    yield game
+
+    def _latest_manifest_entry(self, manifest_path: Path) -> ArchivedGame | None:
+        latest: ArchivedGame | None = None
+        for line in manifest_path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                latest = ArchivedGame(**json.loads(line))
+            except (TypeError, ValueError):
+                continue
+        return latest
+
+    def _manifest_path(self, season: int, game_id: str) -> Path:
+        return self.root / "games" / str(season) / f"{game_id}.jsonl"
+
+    def _blob_path(self, digest: str, codec: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}{_CODEC_SUFFIXES[codec]}"
+
+    def _find_blob(self, digest: str) -> tuple[Path, str] | None:
+        for codec in (self.codec, *(name for name in _CODEC_SUFFIXES if name != self.codec)):
+            path = self._blob_path(digest, codec)
+            if path.exists():
+                return path, codec
+        return None
+
+    @staticmethod
+    def _compress(raw: bytes, codec: str) -> bytes:
+        if codec == "zstd":
+            return zstandard.ZstdCompressor(level=10).compress(raw)
+        return gzip.compress(raw, compresslevel=6, mtime=0)
+
+    @staticmethod
+    def _decompress(data: bytes, codec: str) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise ValueError("zstd archive blob requires the 'zstandard' package")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
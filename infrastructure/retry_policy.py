@@ -0,0 +1,57 @@
+"""Retry classification and exponential backoff for Naver API requests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import http.client
+import json
+import random
+from typing import Callable
+import zlib
+
+from .http_client import HttpStatusError
+from .json_stream import TruncatedJsonError
+
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+THROTTLE_STATUSES = frozenset({429, 503})
+# 연결 끊김/시간 초과(OSError)와 중간에 잘린 본문만 다시 요청할 가치가 있다.
+TRANSIENT_ERRORS = (OSError, http.client.HTTPException, json.JSONDecodeError, zlib.error, TruncatedJsonError)
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """True for responses that mean "slow down" rather than "this request is broken"."""
+    return isinstance(error, HttpStatusError) and error.status in THROTTLE_STATUSES
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter, capped at ``max_delay`` and floored by ``Retry-After``.
+
+    Only ``TRANSIENT_ERRORS`` (connection errors, timeouts, truncated bodies) and HTTP errors in
+    ``RETRYABLE_STATUSES`` are retried. Everything else is final, e.g. 404/403 or a ``KeyError`` /
+    ``ValueError`` from an unexpected payload shape: the same response would fail the same way, so
+    retrying only burns the request budget.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if isinstance(error, HttpStatusError):
+            return error.status in RETRYABLE_STATUSES
+        return isinstance(error, TRANSIENT_ERRORS)
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        return attempt < max(1, int(self.max_attempts)) and self.is_retryable(error)
+
+    def delay_for(self, attempt: int, error: BaseException | None = None, rng: Callable[[], float] = random.random) -> float:
+        """Seconds to wait before attempt ``attempt + 1``."""
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** max(0, attempt - 1))
+        delay = ceiling * rng()
+        retry_after = error.retry_after if isinstance(error, HttpStatusError) else None
+        if retry_after:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return max(0.0, delay)
@@ -0,0 +1,118 @@
+"""On-disk cache of finished KBO game URLs discovered per (season, month, day)."""
+
+from __future__ import annotations
+
+import calendar
+import datetime as dt
+import json
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+
+from .rate_limiter import locked_state_file
+
+
+@dataclass(frozen=True)
+class DiscoveryCacheEntry:
+    game_date: dt.date
+    urls: tuple[str, ...]
+    observed_at: str
+
+
+class ScheduleDiscoveryCache:
+    """Append-only JSONL cache; a month is served from its latest ``closed`` observation only.
+
+    Only months that had already ended when they were observed are recorded, so a cached
+    month never needs to be queried again. The file uses ``.jsonl`` so that game JSON globbing
+    (`rglob("*.json")`) over the save directory never picks it up.
+    """
+
+    FILE_NAME = "schedule_discovery.jsonl"
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._days: dict[tuple[int, int, int], DiscoveryCacheEntry] = {}
+        self._closed_months: dict[tuple[int, int], str] = {}
+        self._load()
+
+    @classmethod
+    def for_save_dir(cls, save_dir: Path) -> "ScheduleDiscoveryCache":
+        return cls(save_dir / "_cache" / cls.FILE_NAME)
+
+    @staticmethod
+    def month_bounds(season: int, month: int) -> tuple[dt.date, dt.date]:
+        return dt.date(season, month, 1), dt.date(season, month, calendar.monthrange(season, month)[1])
+
+    @classmethod
+    def is_month_closed(cls, season: int, month: int, today: dt.date) -> bool:
+        return cls.month_bounds(season, month)[1] < today
+
+    def get_month(self, season: int, month: int) -> list[DiscoveryCacheEntry] | None:
+        with self._lock:
+            observed_at = self._closed_months.get((season, month))
+            if observed_at is None:
+                return None
+            # 같은 달을 다시 기록했다면 마지막 관측에 속한 날짜만 사용한다.
+            return sorted(
+                (
+                    entry
+                    for (year, entry_month, _), entry in self._days.items()
+                    if (year, entry_month) == (season, month) and entry.observed_at == observed_at
+                ),
+                key=lambda entry: entry.game_date,
+            )
+
+    def store_month(self, season: int, month: int, dated_urls: list[tuple[dt.date, list[str]]]) -> None:
+        observed_at = dt.datetime.now(dt.UTC).isoformat()
+        records = [
+            {
+                "season": season,
+                "month": month,
+                "day": game_date.day,
+                "urls": list(urls),
+                "observed_at": observed_at,
+            }
+            for game_date, urls in dated_urls
+            if (game_date.year, game_date.month) == (season, month)
+        ]
+        records.append({"season": season, "month": month, "day": None, "closed": True, "observed_at": observed_at})
+        with self._lock:
+            for record in records:
+                self._apply(record)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # 백필 샤드처럼 여러 프로세스가 같은 파일에 덧붙이므로 검증 색인처럼 파일 잠금으로 직렬화한다.
+            with locked_state_file(self.path.with_suffix(".lock")):
+                with self.path.open("a", encoding="utf-8") as handle:
+                    handle.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            # 잘리거나 섞인 줄은 JSON으로 읽히더라도 형식이 맞지 않으면 건너뛴다.
+            if isinstance(record, dict):
+                self._apply(record)
+
+    def _apply(self, record: dict) -> None:
+        try:
+            season, month = int(record["season"]), int(record["month"])
+            if record.get("day") is None:
+                if record.get("closed"):
+                    self._closed_months[(season, month)] = str(record.get("observed_at") or "")
+                return
+            day = int(record["day"])
+            entry = DiscoveryCacheEntry(
+                game_date=dt.date(season, month, day),
+                urls=tuple(str(url) for url in record.get("urls") or []),
+                observed_at=str(record.get("observed_at") or ""),
+            )
+        except (KeyError, TypeError, ValueError):
+            return
+        self._days[(season, month, day)] = entry
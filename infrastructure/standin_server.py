@@ -0,0 +1,205 @@
+"""Local HTTP stand-in for the Naver game API that replays archived endpoint responses."""
+
+from __future__ import annotations
+
+import datetime as dt
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import random
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from .raw_archive import ArchivedGame, RawResponseArchive, canonical_response_bytes
+
+
+class RecordedResponseServer:
+    """Serves ``<base>/<game_id>/<endpoint>`` and the schedule query from a ``RawResponseArchive``.
+
+    Recording is simply a collection run with ``archive_raw_responses`` enabled; this server
+    replays that archive with optional per-request latency (``latency`` plus uniform ``jitter``
+    seconds) and error injection (``error_rate`` of requests answered with ``error_status``).
+    Point ``NaverScraper(api_base_url=server.api_base_url)`` at it to collect without network.
+
+    ``play_live(game_id)`` replays a game inning by inning for live-mode tests: the schedule
+    reports it as ``BEFORE``/``STARTED`` and the relay summary only shows the innings revealed so
+    far, until ``advance_live()`` has revealed the last inning and the status becomes ``RESULT``.
+    """
+
+    API_PATH = "/schedule/games"
+
+    def __init__(
+        self,
+        archive: RawResponseArchive,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: float | None = None,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.archive = archive
+        self.latency = max(0.0, float(latency))
+        self.jitter = max(0.0, float(jitter))
+        self.error_rate = min(1.0, max(0.0, float(error_rate)))
+        self.error_status = int(error_status)
+        self.retry_after = retry_after
+        self.games: dict[str, ArchivedGame] = {game.game_id: game for game in archive.iter_games()}
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._bodies: dict[str, bytes] = {}
+        self._bodies_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self.request_count = 0
+        self.request_paths: list[str] = []
+        self.injected_error_count = 0
+        self._live_innings: dict[str, int] = {}
+        self._server = ThreadingHTTPServer((host, port), _build_handler(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def api_base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.API_PATH}"
+
+    def start(self) -> "RecordedResponseServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="recorded-response-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "RecordedResponseServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def play_live(self, game_id: str, innings_revealed: int = 0) -> None:
+        with self._state_lock:
+            self._live_innings[game_id] = max(0, int(innings_revealed))
+
+    def advance_live(self, game_id: str, innings: int = 1) -> int:
+        """Reveal ``innings`` more innings and return how many are visible now."""
+        total = self.total_innings(game_id)
+        with self._state_lock:
+            self._live_innings[game_id] = min(total, self._live_innings.get(game_id, 0) + int(innings))
+            return self._live_innings[game_id]
+
+    def total_innings(self, game_id: str) -> int:
+        game = self.games[game_id]
+        return _inning_count(self.archive.get(game.endpoints["relay"])) if "relay" in game.endpoints else 0
+
+    def schedule_status(self, game_id: str) -> str:
+        with self._state_lock:
+            revealed = self._live_innings.get(game_id)
+        if revealed is None or revealed >= self.total_innings(game_id):
+            return "RESULT"
+        return "STARTED" if revealed > 0 else "BEFORE"
+
+    def respond(self, raw_path: str) -> tuple[int, bytes, dict[str, str]]:
+        """Return ``(status, body, headers)`` for one request path; called from handler threads."""
+        with self._state_lock:
+            self.request_count += 1
+            self.request_paths.append(raw_path)
+        with self._random_lock:
+            delay = self.latency + (self._random.uniform(0.0, self.jitter) if self.jitter else 0.0)
+            inject_error = self.error_rate > 0 and self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if inject_error:
+            with self._state_lock:
+                self.injected_error_count += 1
+            headers = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else {}
+            return self.error_status, b'{"code": %d}' % self.error_status, headers
+
+        parts = urlsplit(raw_path)
+        if not parts.path.startswith(self.API_PATH):
+            return 404, b'{"code": 404}', {}
+        relative = parts.path[len(self.API_PATH):].strip("/")
+        if not relative:
+            return 200, self._schedule_body(parse_qs(parts.query)), {}
+        game_id, _, endpoint = relative.partition("/")
+        endpoint = f"{endpoint}?{parts.query}" if parts.query else endpoint
+        game = self.games.get(game_id)
+        if game is None or endpoint not in game.endpoints:
+            return 404, b'{"code": 404}', {}
+        with self._state_lock:
+            revealed = self._live_innings.get(game_id)
+        if revealed is not None and endpoint.startswith("relay"):
+            return self._live_relay_response(game, endpoint, revealed)
+        return 200, self._body(game.endpoints[endpoint]), {}
+
+    def _live_relay_response(self, game: ArchivedGame, endpoint: str, revealed: int) -> tuple[int, bytes, dict[str, str]]:
+        if endpoint != "relay":
+            inning = int(endpoint.rsplit("=", 1)[-1])
+            if inning > revealed:
+                return 404, b'{"code": 404}', {}
+            return 200, self._body(game.endpoints[endpoint]), {}
+        summary = self.archive.get(game.endpoints["relay"])
+        inning_score = ((summary.get("result") or {}).get("textRelayData") or {}).get("inningScore") or {}
+        for side in ("home", "away"):
+            scores = inning_score.get(side) or {}
+            inning_score[side] = {key: value for key, value in scores.items() if str(key).isdigit() and int(key) <= revealed}
+        return 200, canonical_response_bytes(summary), {}
+
+    def _body(self, digest: str) -> bytes:
+        with self._bodies_lock:
+            body = self._bodies.get(digest)
+        if body is None:
+            body = canonical_response_bytes(self.archive.get(digest))
+            with self._bodies_lock:
+                self._bodies[digest] = body
+        return body
+
+    def _schedule_body(self, query: dict[str, list[str]]) -> bytes:
+        from_date = dt.date.fromisoformat(query.get("fromDate", ["0001-01-01"])[0])
+        to_date = dt.date.fromisoformat(query.get("toDate", ["9999-12-31"])[0])
+        games = []
+        for game_id in sorted(self.games):
+            try:
+                game_date = dt.datetime.strptime(game_id[:8], "%Y%m%d").date()
+            except ValueError:
+                continue
+            if from_date <= game_date <= to_date:
+                games.append(
+                    {"gameId": game_id, "gameDate": game_date.isoformat(), "statusCode": self.schedule_status(game_id), "categoryId": "kbo"}
+                )
+        return json.dumps({"code": 200, "success": True, "result": {"games": games}}).encode("utf-8")
+
+
+def _inning_count(relay_summary: dict[str, Any]) -> int:
+    inning_score = ((relay_summary.get("result") or {}).get("textRelayData") or {}).get("inningScore") or {}
+    keys = {str(key) for side in ("home", "away") for key in (inning_score.get(side) or {})}
+    return max((int(key) for key in keys if key.isdigit()), default=0)
+
+
+def _build_handler(owner: RecordedResponseServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # 헤더와 본문을 따로 쓰므로 Nagle 지연이 측정값에 섞이지 않게 한다.
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            status, body, headers = owner.respond(self.path)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return None
+
+    return Handler
@@ -0,0 +1,117 @@
+"""Sidecar index of validation verdicts for saved game JSON files."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+
+from .rate_limiter import locked_state_file
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass(frozen=True)
+class ValidationIndexEntry:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    validator_version: str
+    ok: bool
+
+
+class ValidationIndex:
+    """Maps files under one save directory to content hash, validator version, and last verdict.
+
+    Lookups first compare size/mtime, then fall back to hashing the file, so an unchanged file
+    is never parsed or validated again. Entries are appended as JSONL and the last line per path
+    wins; the file is compacted when stale lines outnumber live entries.
+    """
+
+    FILE_NAME = "validation_index.jsonl"
+
+    def __init__(self, root: Path, path: Path | None = None) -> None:
+        self.root = root
+        self.path = path or root / "_cache" / self.FILE_NAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, ValidationIndexEntry] = {}
+        self._line_count = 0
+        self._load()
+
+    def lookup(self, path: Path, validator_version: str) -> tuple[bool | None, bytes | None]:
+        """Return ``(cached_ok, raw_bytes)``; ``cached_ok`` is None when full validation is required.
+
+        ``raw_bytes`` is returned whenever the file had to be read for hashing so callers can
+        validate it without a second read.
+        """
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry.validator_version != validator_version:
+            return None, None
+        stat = path.stat()
+        if stat.st_size == entry.size and stat.st_mtime_ns == entry.mtime_ns:
+            return entry.ok, None
+        raw = path.read_bytes()
+        if content_hash(raw) != entry.sha256:
+            return None, raw
+        # 내용은 같고 mtime만 바뀐 경우(복사, touch)에는 판정을 유지하고 stat만 갱신한다.
+        self._store(ValidationIndexEntry(key, stat.st_size, stat.st_mtime_ns, entry.sha256, validator_version, entry.ok))
+        return entry.ok, raw
+
+    def record(self, path: Path, raw: bytes, validator_version: str, ok: bool) -> None:
+        self.record_digest(path, content_hash(raw), validator_version, ok)
+
+    def record_digest(self, path: Path, sha256: str, validator_version: str, ok: bool) -> None:
+        """Like ``record`` for callers that hashed the content while writing it."""
+        stat = path.stat()
+        self._store(ValidationIndexEntry(self._key(path), stat.st_size, stat.st_mtime_ns, sha256, validator_version, bool(ok)))
+
+    def get(self, path: Path) -> ValidationIndexEntry | None:
+        with self._lock:
+            return self._entries.get(self._key(path))
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def _store(self, entry: ValidationIndexEntry) -> None:
+        with self._lock:
+            self._entries[entry.path] = entry
+            # 백필 샤드처럼 여러 프로세스가 같은 색인에 쓰므로 추가와 압축을 파일 잠금으로 직렬화한다.
+            with locked_state_file(self.path.with_suffix(".lock")):
+                if self._line_count >= 2 * max(64, len(self._entries)):
+                    # 다른 프로세스가 덧붙인 항목을 잃지 않도록 디스크 내용을 다시 읽어 합친 뒤 압축한다.
+                    self._load()
+                    self._entries[entry.path] = entry
+                    lines = [json.dumps(asdict(item), ensure_ascii=False) + "\n" for item in self._entries.values()]
+                    tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                    tmp_path.write_text("".join(lines), encoding="utf-8")
+                    tmp_path.replace(self.path)
+                    self._line_count = len(lines)
+                    return
+                with self.path.open("a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+                self._line_count += 1
+
+    def _load(self) -> None:
+        self._line_count = 0
+        if not self.path.exists():
+            return
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = ValidationIndexEntry(**json.loads(line))
+            except (TypeError, ValueError):
+                continue
+            self._entries[entry.path] = entry
+            self._line_count += 1
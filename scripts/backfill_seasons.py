@@ -0,0 +1,84 @@
+"""시즌 범위를 날짜 샤드로 나눠 여러 프로세스로 수집하는 CLI 엔트리포인트."""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from services.backfill_service import BackfillRequest, BackfillService
+
+
+class _ConsoleReporter:
+    def log(self, level: str, message: str, **context: Any) -> None:
+        fields = " ".join(f"{key}={value}" for key, value in context.items())
+        print(f"[{level}] {message} {fields}".rstrip(), flush=True)
+
+    def set_progress(self, progress: float, message: str | None = None) -> None:
+        return None
+
+    def is_cancelled(self) -> bool:
+        return False
+
+    def check_cancelled(self) -> None:
+        return None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="시즌 범위를 날짜 샤드로 나눠 프로세스마다 별도 스크레이퍼로 수집합니다.")
+    parser.add_argument("first_season", type=int, help="첫 시즌입니다. 예: 2023")
+    parser.add_argument("last_season", type=int, nargs="?", help="마지막 시즌입니다. 생략하면 첫 시즌만 수집합니다.")
+    parser.add_argument("--save-dir", type=Path, default=Path("games"), help="수집 결과를 저장할 폴더입니다.")
+    parser.add_argument("--start-date", type=dt.date.fromisoformat, help="시즌 대신 시작 날짜(YYYY-MM-DD)를 지정합니다.")
+    parser.add_argument("--end-date", type=dt.date.fromisoformat, help="시즌 대신 종료 날짜(YYYY-MM-DD)를 지정합니다.")
+    parser.add_argument("--processes", type=int, default=4, help="동시에 실행할 샤드 프로세스 수입니다.")
+    parser.add_argument("--shard-days", type=int, help="샤드 길이(일)입니다. 생략하면 월 단위로 나눕니다.")
+    parser.add_argument("--workers", type=int, default=2, help="프로세스마다 동시에 수집할 경기 수입니다.")
+    parser.add_argument("--rate", type=float, help="모든 프로세스가 나눠 쓰는 초당 요청 상한입니다.")
+    parser.add_argument("--retry", type=int, default=3, help="경기별 최대 시도 횟수입니다.")
+    parser.add_argument("--timeout", type=int, default=10, help="요청 제한 시간(초)입니다.")
+    parser.add_argument("--archive-raw", action="store_true", help="원본 응답을 보관소에 함께 저장합니다.")
+    parser.add_argument("--json", action="store_true", help="결과 지표를 JSON으로 출력합니다.")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    last_season = args.last_season or args.first_season
+    request = BackfillRequest.for_seasons(
+        args.first_season,
+        last_season,
+        args.save_dir,
+        timeout_seconds=args.timeout,
+        retry_count=args.retry,
+        process_count=args.processes,
+        shard_days=args.shard_days,
+        workers_per_process=args.workers,
+        request_rate_per_second=args.rate,
+        archive_raw_responses=args.archive_raw,
+    )
+    if args.start_date:
+        request.start_date = args.start_date
+    if args.end_date:
+        request.end_date = args.end_date
+    result = BackfillService().run(request, _ConsoleReporter())
+
+    print(result.summary)
+    print(result.detail)
+    for failed_shard in result.metrics["failed_shards"]:
+        print(f"실패한 샤드: {failed_shard}")
+    if args.json:
+        metrics = {key: value for key, value in result.metrics.items() if key not in {"day_logs", "failed_targets", "failed_target_items"}}
+        print(json.dumps(metrics, ensure_ascii=False, indent=2, default=str))
+    return 1 if result.metrics["failed_shards"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
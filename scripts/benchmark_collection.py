@@ -0,0 +1,76 @@
+"""녹화된 응답 대역 서버로 수집 처리량을 측정하는 CLI 엔트리포인트."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from services.collection_benchmark import (
+    BenchmarkSetting,
+    RawResponseArchive,
+    format_benchmark_results,
+    results_as_dicts,
+    run_collection_benchmark,
+)
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="원본 응답 보관소를 로컬 대역 서버로 재생해 수집 처리량을 측정합니다.")
+    parser.add_argument("save_dir", nargs="?", default="games", help="원본 응답 보관소(<save_dir>/_raw)가 있는 수집 폴더입니다.")
+    parser.add_argument("--archive-dir", type=Path, help="보관소 위치를 직접 지정합니다.")
+    parser.add_argument("--season", type=int, help="특정 시즌 경기만 사용합니다.")
+    parser.add_argument("--limit", type=int, help="사용할 최대 경기 수입니다.")
+    parser.add_argument("--workers", type=_int_list, default=[1, 4, 8], help="비교할 동시 수집 수 목록입니다. 예: 1,4,8")
+    parser.add_argument("--validation-processes", type=_int_list, default=[0], help="비교할 검증 프로세스 수 목록입니다.")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="요청마다 더할 기본 지연(ms)입니다.")
+    parser.add_argument("--jitter-ms", type=float, default=25.0, help="지연에 더할 무작위 폭(ms)입니다.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503으로 응답할 요청 비율(0~1)입니다.")
+    parser.add_argument("--rate", type=float, default=0.0, help="초당 요청 상한입니다. 0이면 제한하지 않습니다.")
+    parser.add_argument("--retry", type=int, default=3, help="경기별 최대 시도 횟수입니다.")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력합니다.")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    archive = RawResponseArchive(args.archive_dir) if args.archive_dir else RawResponseArchive.for_save_dir(Path(args.save_dir))
+    settings = [
+        BenchmarkSetting(max_workers=workers, validation_processes=processes)
+        for workers in args.workers
+        for processes in args.validation_processes
+    ]
+    try:
+        results = run_collection_benchmark(
+            archive,
+            settings,
+            season=args.season,
+            limit=args.limit,
+            latency=args.latency_ms / 1000.0,
+            jitter=args.jitter_ms / 1000.0,
+            error_rate=args.error_rate,
+            request_rate_per_second=args.rate,
+            retry_count=args.retry,
+        )
+    except ValueError as exc:
+        print(str(exc))
+        return 1
+
+    if args.json:
+        print(json.dumps(results_as_dicts(results), ensure_ascii=False, indent=2))
+    else:
+        print(format_benchmark_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
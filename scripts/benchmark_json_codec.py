@@ -0,0 +1,55 @@
+"""저장된 경기 JSON으로 JSON 코덱별 읽기/쓰기 시간을 측정하는 CLI 엔트리포인트."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from services.json_codec_benchmark import codec_results_as_dicts, format_codec_benchmark_results, run_json_codec_benchmark
+from src.kbo_ingest.json_codec import CODEC_NAMES
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="시즌 경기 JSON을 코덱별로 읽고 다시 써서 시간과 출력 일치 여부를 비교합니다.")
+    parser.add_argument("root", nargs="?", default="games", help="시즌 폴더가 있는 수집 폴더입니다.")
+    parser.add_argument("--season", type=_int_list, help="측정할 시즌 목록입니다. 예: 2024,2025")
+    parser.add_argument("--codec", action="append", choices=[name for name in CODEC_NAMES if name != "auto"], help="비교할 코덱입니다. 생략하면 설치된 코덱 전부입니다.")
+    parser.add_argument("--limit", type=int, help="사용할 최대 파일 수입니다.")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수입니다. 가장 빠른 값을 보고합니다.")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력합니다.")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    try:
+        results = run_json_codec_benchmark(
+            Path(args.root),
+            seasons=args.season,
+            codecs=args.codec,
+            limit=args.limit,
+            repeat=args.repeat,
+        )
+    except ValueError as exc:
+        print(str(exc))
+        return 1
+
+    if args.json:
+        print(json.dumps(codec_results_as_dicts(results), ensure_ascii=False, indent=2))
+    else:
+        print(format_codec_benchmark_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
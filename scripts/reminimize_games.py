@@ -0,0 +1,67 @@
+"""보관된 원본 응답으로 게임 JSON을 다시 만드는 CLI 엔트리포인트."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from services.json_migration_service import RawResponseArchive, reminimize_archived_game
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="원본 응답 보관소(_raw)에서 네트워크 없이 게임 JSON을 다시 만듭니다.")
+    parser.add_argument("save_dir", nargs="?", default="games", help="수집 저장 폴더입니다. 보관소는 <save_dir>/_raw 를 사용합니다.")
+    parser.add_argument("--season", type=int, help="특정 시즌만 다시 만듭니다.")
+    parser.add_argument("--archive-dir", type=Path, help="보관소 위치를 직접 지정합니다.")
+    parser.add_argument("--output-dir", type=Path, help="결과를 저장할 폴더입니다. 기본값은 save_dir 입니다.")
+    parser.add_argument("--no-validate", action="store_true", help="재생성 결과 검증을 생략합니다.")
+    parser.add_argument("--force", action="store_true", help="마지막으로 기록된 해시와 다른(손으로 고친) 파일도 덮어씁니다.")
+    return parser
+
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    save_dir = Path(args.save_dir)
+    archive = RawResponseArchive(args.archive_dir) if args.archive_dir else RawResponseArchive.for_save_dir(save_dir)
+    games = list(archive.iter_games(args.season))
+    if not games:
+        print(f"보관된 경기가 없습니다: {archive.root}")
+        return 1
+
+    results = []
+    errors = []
+    for game in games:
+        try:
+            results.append(
+                reminimize_archived_game(
+                    archive,
+                    game,
+                    output_root=args.output_dir or save_dir,
+                    validate=not args.no_validate,
+                    force=args.force,
+                )
+            )
+        except Exception as exc:
+            errors.append((game.game_id, f"{type(exc).__name__}: {exc}"))
+
+    changed_count = sum(1 for item in results if item["changed"])
+    failed_after = [item for item in results if item["after_ok"] is False]
+
+    print(f"games={len(games)} rebuilt={len(results)} changed={changed_count} after_failures={len(failed_after)} errors={len(errors)}")
+    for item in results[:20]:
+        print(f"- {item['game_id']} | changed={item['changed']} | written={item['written_path']} | after_ok={item['after_ok']}")
+    for game_id, message in errors[:20]:
+        print(f"! {game_id} | {message}")
+
+    return 0 if not failed_after and not errors else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,7 +10,8 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
-from src.kbo_ingest.game_validation import collect_json_files, validate_json_file
+from src.kbo_ingest.game_catalog import GameCatalog
+from src.kbo_ingest.game_validation import VALIDATOR_VERSION, collect_json_files, validate_json_file
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -34,6 +35,11 @@ def main() -> int:
         print(f"검사할 JSON 파일이 없습니다: {target}")
         return 1
 
+    # 저장 폴더처럼 게임 파일 카탈로그가 이미 있으면 판정을 남겨 다른 도구가 파일을 다시 읽지 않고 조회할 수 있게 한다.
+    # 카탈로그가 없는 폴더에는 아무것도 만들지 않는다.
+    catalog = GameCatalog(target) if target.is_dir() else None
+    if catalog is not None and not catalog.exists():
+        catalog = None
     total = len(files)
     ok_count = 0
     warning_count = 0
@@ -41,6 +47,8 @@ def main() -> int:
 
     for json_file in files:
         result = validate_json_file(json_file)
+        if catalog is not None:
+            catalog.record_validation(json_file, result["ok"], VALIDATOR_VERSION)
         if result["ok"]:
             ok_count += 1
             if result["warnings"]:
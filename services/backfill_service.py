@@ -0,0 +1,390 @@
+"""Multi-process season backfill: date shards collected by separate worker processes."""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import datetime as dt
+from dataclasses import dataclass
+import multiprocessing
+from pathlib import Path
+import queue
+import time
+from typing import Any
+
+from services.collection_service import (
+    DEFAULT_REQUEST_RATE_PER_SECOND,
+    CollectionLogRecord,
+    CollectionRequest,
+    CollectionService,
+    CollectionTarget,
+)
+from services.common import ProgressReporter, ServiceResult
+
+
+_CANCEL_POLL_SECONDS = 0.5
+_SUMMED_REQUEST_METRICS = ("request_count", "throttle_events", "throttled_seconds")
+
+
+class BackfillCancelledError(RuntimeError):
+    """Raised inside a shard process once the parent run has been cancelled."""
+
+
+@dataclass(frozen=True)
+class BackfillShard:
+    index: int
+    start_date: dt.date
+    end_date: dt.date
+
+    @property
+    def label(self) -> str:
+        return f"shard{self.index:02d}"
+
+
+@dataclass
+class BackfillRequest:
+    save_dir: Path
+    start_date: dt.date
+    end_date: dt.date
+    timeout_seconds: int = 10
+    retry_count: int = 3
+    headless: bool = True
+    process_count: int = 4
+    shard_days: int | None = None
+    workers_per_process: int = 2
+    request_rate_per_second: float | None = None
+    request_burst: int = 1
+    validation_processes: int = 0
+    archive_raw_responses: bool = False
+    use_discovery_cache: bool = True
+    api_base_url: str | None = None
+    discovery_pages: int = 1
+
+    @classmethod
+    def for_seasons(cls, first_season: int, last_season: int, save_dir: Path, **options: Any) -> "BackfillRequest":
+        return cls(save_dir=save_dir, start_date=dt.date(first_season, 1, 1), end_date=dt.date(last_season, 12, 31), **options)
+
+
+def plan_shards(start_date: dt.date, end_date: dt.date, shard_days: int | None = None) -> list[BackfillShard]:
+    """Split ``[start_date, end_date]`` into calendar-month shards, or ``shard_days``-day shards when given.
+
+    Month shards line up with the schedule discovery cache, so no two shards look up the same month.
+    """
+    if end_date < start_date:
+        raise ValueError("end_date must not be before start_date")
+    shards: list[BackfillShard] = []
+    current = start_date
+    while current <= end_date:
+        if shard_days:
+            shard_end = current + dt.timedelta(days=max(1, int(shard_days)) - 1)
+        else:
+            next_month = dt.date(current.year + (current.month == 12), current.month % 12 + 1, 1)
+            shard_end = next_month - dt.timedelta(days=1)
+        shard_end = min(shard_end, end_date)
+        shards.append(BackfillShard(index=len(shards), start_date=current, end_date=shard_end))
+        current = shard_end + dt.timedelta(days=1)
+    return shards
+
+
+class _ShardReporter:
+    """Progress reporter used inside shard processes; cancellation is signalled by a marker file.
+
+    Log lines are put on ``log_queue`` tagged with the shard label so the parent can forward them.
+    """
+
+    def __init__(self, cancel_path: Path, log_queue: Any = None, shard_label: str | None = None) -> None:
+        self.cancel_path = cancel_path
+        self.log_queue = log_queue
+        self.shard_label = shard_label
+
+    def log(self, level: str, message: str, **context: Any) -> None:
+        if self.log_queue is None:
+            return
+        # 큐로 넘기려면 pickle되어야 하므로 기본 타입이 아닌 값은 문자열로 바꾼다.
+        fields = {key: value if isinstance(value, (str, int, float, bool, type(None))) else str(value) for key, value in context.items()}
+        self.log_queue.put((level, message, {"shard": self.shard_label, **fields}))
+
+    def set_progress(self, progress: float, message: str | None = None) -> None:
+        return None
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_path.exists()
+
+    def check_cancelled(self) -> None:
+        if self.is_cancelled():
+            raise BackfillCancelledError("backfill cancelled")
+
+
+def run_backfill_shard(
+    request: CollectionRequest,
+    cancel_path: str,
+    log_queue: Any = None,
+    shard_label: str | None = None,
+) -> ServiceResult:
+    """Collect one shard with its own scraper; the entry point of each worker process."""
+    return CollectionService().run(request, _ShardReporter(Path(cancel_path), log_queue, shard_label))
+
+
+def forward_shard_logs(log_queue: Any, context: ProgressReporter) -> int:
+    """Pass every log line queued by shard processes on to ``context``; returns how many were forwarded."""
+    forwarded = 0
+    while True:
+        try:
+            level, message, fields = log_queue.get_nowait()
+        except queue.Empty:
+            return forwarded
+        context.log(level, message, **fields)
+        forwarded += 1
+
+
+class BackfillService:
+    """Runs a season range as date shards, each collected by ``CollectionService`` in its own process.
+
+    All shards share one token-bucket state file under ``<save_dir>/_cache``, so the request rate and
+    any throttling slowdown are global rather than per process. Each shard writes the same save
+    directory but gets its own labelled anomaly/failure/journal/debug logs, and the per-shard results
+    are merged into a single ``ServiceResult``. ``process_count=1`` runs the shards in-process.
+    """
+
+    def __init__(self, collection_service: CollectionService | None = None) -> None:
+        self.collection_service = collection_service or CollectionService()
+
+    def plan(self, request: BackfillRequest, *, run_id: str | None = None) -> list[tuple[BackfillShard, CollectionRequest]]:
+        run_id = run_id or dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+        state_path = request.save_dir / "_cache" / f"backfill_rate_limit_{run_id}.state"
+        rate = DEFAULT_REQUEST_RATE_PER_SECOND if request.request_rate_per_second is None else request.request_rate_per_second
+        planned = []
+        for shard in plan_shards(request.start_date, request.end_date, request.shard_days):
+            planned.append(
+                (
+                    shard,
+                    CollectionRequest(
+                        mode="period",
+                        save_dir=request.save_dir,
+                        timeout_seconds=request.timeout_seconds,
+                        retry_count=request.retry_count,
+                        headless=request.headless,
+                        start_date=shard.start_date,
+                        end_date=shard.end_date,
+                        max_workers=request.workers_per_process,
+                        request_rate_per_second=rate,
+                        request_burst=request.request_burst,
+                        rate_limit_state_path=state_path if rate else None,
+                        use_discovery_cache=request.use_discovery_cache,
+                        validation_processes=request.validation_processes,
+                        archive_raw_responses=request.archive_raw_responses,
+                        api_base_url=request.api_base_url,
+                        discovery_pages=request.discovery_pages,
+                        run_label=f"{run_id}_{shard.label}",
+                    ),
+                )
+            )
+        return planned
+
+    def run(self, request: BackfillRequest, context: ProgressReporter) -> ServiceResult:
+        request.save_dir.mkdir(parents=True, exist_ok=True)
+        run_id = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+        planned = self.plan(request, run_id=run_id)
+        cancel_path = request.save_dir / "_cache" / f"backfill_{run_id}.cancel"
+        cancel_path.parent.mkdir(parents=True, exist_ok=True)
+        process_count = max(1, min(int(request.process_count or 1), len(planned)))
+        context.log(
+            "info",
+            "backfill started",
+            shard_count=len(planned),
+            process_count=process_count,
+            start=request.start_date.isoformat(),
+            end=request.end_date.isoformat(),
+        )
+        started_at = time.perf_counter()
+        results: dict[int, ServiceResult] = {}
+        errors: dict[int, str] = {}
+        try:
+            if process_count == 1:
+                for shard, shard_request in planned:
+                    context.check_cancelled()
+                    self._record_shard(shard, self._run_in_process(shard_request, context), results, errors, context)
+                    context.set_progress(
+                        (len(results) + len(errors)) / len(planned),
+                        f"{len(results) + len(errors)}/{len(planned)} shards processed",
+                    )
+            else:
+                self._run_in_pool(planned, process_count, cancel_path, results, errors, context)
+        finally:
+            cancel_path.unlink(missing_ok=True)
+            state_path = planned[0][1].rate_limit_state_path if planned else None
+            if state_path is not None:
+                state_path.unlink(missing_ok=True)
+        context.check_cancelled()
+        return self._merge_results(planned, results, errors, elapsed=time.perf_counter() - started_at, request=request)
+
+    def _run_in_process(self, shard_request: CollectionRequest, context: ProgressReporter) -> ServiceResult | str:
+        try:
+            return self.collection_service.run(shard_request, context)
+        except Exception as exc:
+            if context.is_cancelled():
+                raise
+            return f"{type(exc).__name__}: {exc}"
+
+    def _run_in_pool(
+        self,
+        planned: list[tuple[BackfillShard, CollectionRequest]],
+        process_count: int,
+        cancel_path: Path,
+        results: dict[int, ServiceResult],
+        errors: dict[int, str],
+        context: ProgressReporter,
+    ) -> None:
+        # 스크레이퍼가 스레드와 브라우저를 쓰므로 fork 대신 spawn으로 깨끗한 프로세스를 띄운다.
+        mp_context = multiprocessing.get_context("spawn")
+        # 샤드의 로그(오류, 재시도, 속도 제한)는 관리자 큐로 모아 부모가 context.log로 넘긴다.
+        with mp_context.Manager() as manager, ProcessPoolExecutor(max_workers=process_count, mp_context=mp_context) as executor:
+            log_queue = manager.Queue()
+            futures: dict[Future, BackfillShard] = {
+                executor.submit(run_backfill_shard, shard_request, str(cancel_path), log_queue, shard.label): shard
+                for shard, shard_request in planned
+            }
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=_CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                forward_shard_logs(log_queue, context)
+                if context.is_cancelled() and not cancel_path.exists():
+                    cancel_path.touch()
+                    for future in pending:
+                        future.cancel()
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    try:
+                        outcome: ServiceResult | str = future.result()
+                    except BackfillCancelledError:
+                        continue
+                    except Exception as exc:
+                        outcome = f"{type(exc).__name__}: {exc}"
+                    self._record_shard(futures[future], outcome, results, errors, context)
+                    context.set_progress(
+                        (len(results) + len(errors)) / len(planned),
+                        f"{len(results) + len(errors)}/{len(planned)} shards processed",
+                    )
+            forward_shard_logs(log_queue, context)
+
+    def _record_shard(
+        self,
+        shard: BackfillShard,
+        outcome: ServiceResult | str,
+        results: dict[int, ServiceResult],
+        errors: dict[int, str],
+        context: ProgressReporter,
+    ) -> None:
+        if isinstance(outcome, str):
+            errors[shard.index] = outcome
+            context.log("error", "backfill shard failed", shard=shard.label, error=outcome)
+            return
+        results[shard.index] = outcome
+        context.log(
+            "info",
+            "backfill shard finished",
+            shard=shard.label,
+            start=shard.start_date.isoformat(),
+            end=shard.end_date.isoformat(),
+            detail=outcome.detail,
+        )
+
+    def _merge_results(
+        self,
+        planned: list[tuple[BackfillShard, CollectionRequest]],
+        results: dict[int, ServiceResult],
+        errors: dict[int, str],
+        *,
+        elapsed: float,
+        request: BackfillRequest,
+    ) -> ServiceResult:
+        day_logs: list[CollectionLogRecord] = []
+        failed_targets: list[CollectionTarget] = []
+        artifacts = {"save_dir": str(request.save_dir)}
+        shard_metrics: list[dict[str, Any]] = []
+        request_stats: dict[str, Any] = {name: 0 for name in _SUMMED_REQUEST_METRICS}
+        latency_p95: list[float] = []
+        browser_started = False
+        for shard, _ in planned:
+            result = results.get(shard.index)
+            if result is None:
+                continue
+            metrics = result.metrics
+            day_logs.extend(metrics.get("day_logs", []))
+            failed_targets.extend(metrics.get("failed_targets", []))
+            for name, path in result.artifacts.items():
+                if name != "save_dir":
+                    artifacts[f"{shard.label}_{name}"] = path
+            for name in _SUMMED_REQUEST_METRICS:
+                request_stats[name] += metrics.get(name) or 0
+            for name, value in metrics.items():
+                if name.startswith("http_") and not name.startswith("http_latency") and isinstance(value, int):
+                    request_stats[name] = request_stats.get(name, 0) + value
+            if metrics.get("http_latency_p95_ms") is not None:
+                latency_p95.append(metrics["http_latency_p95_ms"])
+            browser_started = browser_started or bool(metrics.get("browser_started"))
+            shard_metrics.append(
+                {
+                    "shard": shard.label,
+                    "start_date": shard.start_date.isoformat(),
+                    "end_date": shard.end_date.isoformat(),
+                    "games": metrics.get("games", 0),
+                    "success": metrics.get("success_count", 0),
+                    "anomaly": metrics.get("anomaly_count", 0),
+                    "failed": metrics.get("failure_count", 0),
+                    "request_count": metrics.get("request_count", 0),
+                }
+            )
+        day_logs.sort(key=lambda day: day.game_date)
+        failed_targets.sort(key=lambda target: (target.game_date, target.url))
+        failed_shards = [
+            f"{shard.label} ({shard.start_date.isoformat()}~{shard.end_date.isoformat()}): {errors[shard.index]}"
+            for shard, _ in planned
+            if shard.index in errors
+        ]
+        totals = {
+            name: sum(getattr(day, field_name) for day in day_logs)
+            for name, field_name in (
+                ("games", "game_count"),
+                ("success", "success_count"),
+                ("anomaly", "anomaly_count"),
+                ("failed", "failure_count"),
+                ("skipped", "skipped_count"),
+            )
+        }
+        rate = DEFAULT_REQUEST_RATE_PER_SECOND if request.request_rate_per_second is None else request.request_rate_per_second
+        summary = "backfill completed" if not failed_shards else f"backfill completed with {len(failed_shards)} failed shard(s)"
+        return ServiceResult(
+            summary=summary,
+            detail=(
+                f"shards={len(planned)}, games={totals['games']}, success={totals['success']}, anomaly={totals['anomaly']}, "
+                f"failed={totals['failed']}, skipped={totals['skipped']}, failed_shards={len(failed_shards)}"
+            ),
+            artifacts=artifacts,
+            metrics={
+                **totals,
+                "success_count": totals["success"],
+                "anomaly_count": totals["anomaly"],
+                "failure_count": totals["failed"],
+                "skipped_count": totals["skipped"],
+                "anomaly_files": [name for day in day_logs for name in day.anomaly_files],
+                "anomaly_reasons": [reason for day in day_logs for reason in day.anomaly_reasons],
+                "failed_files": [name for day in day_logs for name in day.failed_files],
+                "failed_reasons": [reason for day in day_logs for reason in day.failed_reasons],
+                "failed_target_count": len(failed_targets),
+                "failed_targets": failed_targets,
+                "failed_target_items": failed_targets,
+                "day_logs": day_logs,
+                "shard_count": len(planned),
+                "failed_shards": failed_shards,
+                "shard_metrics": shard_metrics,
+                "elapsed_seconds": round(elapsed, 3),
+                "rate_limit_per_second": rate,
+                **request_stats,
+                "throttled_seconds": round(request_stats["throttled_seconds"], 3),
+                "observed_request_rate": round(request_stats["request_count"] / elapsed, 3) if elapsed > 0 else 0.0,
+                "http_latency_p95_ms": max(latency_p95) if latency_p95 else None,
+                "browser_started": browser_started,
+            },
+        )
+
@@ -0,0 +1,183 @@
+"""Collection throughput benchmark against the recorded-response stand-in server."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import datetime as dt
+from dataclasses import asdict, dataclass
+import multiprocessing
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Any
+
+from infrastructure.raw_archive import RawResponseArchive
+from infrastructure.standin_server import RecordedResponseServer
+from services.collection_service import CollectionRequest, CollectionService, CollectionTarget
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없어 최대 RSS를 보고하지 않는다.
+    resource = None
+
+
+@dataclass(frozen=True)
+class BenchmarkSetting:
+    max_workers: int = 1
+    validation_processes: int = 0
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    max_workers: int
+    validation_processes: int
+    game_count: int
+    elapsed_seconds: float
+    games_per_minute: float
+    success_count: int
+    anomaly_count: int
+    failure_count: int
+    request_count: int
+    throttle_events: int
+    latency_p50_ms: float | None
+    latency_p95_ms: float | None
+    peak_rss_mb: float | None
+
+
+class _SilentReporter:
+    def log(self, level: str, message: str, **context: Any) -> None:
+        return None
+
+    def set_progress(self, progress: float, message: str | None = None) -> None:
+        return None
+
+    def is_cancelled(self) -> bool:
+        return False
+
+    def check_cancelled(self) -> None:
+        return None
+
+
+def archived_targets(archive: RawResponseArchive, *, season: int | None = None, limit: int | None = None) -> list[CollectionTarget]:
+    targets = []
+    for game in archive.iter_games(season):
+        try:
+            game_date = dt.datetime.strptime(game.game_id[:8], "%Y%m%d").date()
+        except ValueError:
+            continue
+        targets.append(CollectionTarget(game_date=game_date, url=game.game_url))
+    targets.sort(key=lambda target: (target.game_date, target.url))
+    return targets[:limit] if limit else targets
+
+
+def peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KiB, macOS는 byte 단위로 보고한다.
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def run_benchmark_setting(
+    api_base_url: str,
+    targets: list[CollectionTarget],
+    setting: BenchmarkSetting,
+    *,
+    request_rate_per_second: float,
+    retry_count: int,
+) -> BenchmarkResult:
+    """Run one collection against the stand-in; meant to execute in a fresh process so peak RSS is per setting."""
+    with tempfile.TemporaryDirectory(prefix="collection_benchmark_") as save_dir:
+        request = CollectionRequest(
+            mode="period",
+            save_dir=Path(save_dir),
+            timeout_seconds=10,
+            retry_count=retry_count,
+            headless=True,
+            start_date=targets[0].game_date,
+            end_date=targets[-1].game_date,
+            targets=list(targets),
+            max_workers=setting.max_workers,
+            validation_processes=setting.validation_processes,
+            request_rate_per_second=request_rate_per_second,
+            retry_base_delay_seconds=0.05,
+            retry_max_delay_seconds=1.0,
+            use_discovery_cache=False,
+            api_base_url=api_base_url,
+        )
+        started_at = time.perf_counter()
+        result = CollectionService().run(request, _SilentReporter())
+        elapsed = time.perf_counter() - started_at
+    metrics = result.metrics
+    return BenchmarkResult(
+        max_workers=setting.max_workers,
+        validation_processes=setting.validation_processes,
+        game_count=len(targets),
+        elapsed_seconds=round(elapsed, 3),
+        games_per_minute=round(len(targets) * 60.0 / elapsed, 1) if elapsed > 0 else 0.0,
+        success_count=int(metrics.get("success_count", 0)),
+        anomaly_count=int(metrics.get("anomaly_count", 0)),
+        failure_count=int(metrics.get("failure_count", 0)),
+        request_count=int(metrics.get("request_count", 0)),
+        throttle_events=int(metrics.get("throttle_events", 0)),
+        latency_p50_ms=metrics.get("http_latency_p50_ms"),
+        latency_p95_ms=metrics.get("http_latency_p95_ms"),
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def run_collection_benchmark(
+    archive: RawResponseArchive,
+    settings: list[BenchmarkSetting],
+    *,
+    season: int | None = None,
+    limit: int | None = None,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    request_rate_per_second: float = 0.0,
+    retry_count: int = 3,
+    seed: int | None = 0,
+) -> list[BenchmarkResult]:
+    """Replay the archive through ``RecordedResponseServer`` once per setting, each in its own process.
+
+    ``request_rate_per_second=0`` disables the rate limiter so the numbers reflect the pipeline
+    rather than the politeness budget.
+    """
+    targets = archived_targets(archive, season=season, limit=limit)
+    if not targets:
+        raise ValueError(f"no archived games to benchmark under {archive.root}")
+    results = []
+    with RecordedResponseServer(archive, latency=latency, jitter=jitter, error_rate=error_rate, seed=seed) as server:
+        for setting in settings:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                results.append(
+                    executor.submit(
+                        run_benchmark_setting,
+                        server.api_base_url,
+                        targets,
+                        setting,
+                        request_rate_per_second=request_rate_per_second,
+                        retry_count=retry_count,
+                    ).result()
+                )
+    return results
+
+
+def format_benchmark_results(results: list[BenchmarkResult]) -> str:
+    header = "workers  vproc  games  elapsed_s  games/min  p50_ms  p95_ms  peak_rss_mb  ok/anom/fail  requests  throttled"
+    lines = [header]
+    for item in results:
+        lines.append(
+            f"{item.max_workers:>7}  {item.validation_processes:>5}  {item.game_count:>5}  {item.elapsed_seconds:>9}  "
+            f"{item.games_per_minute:>9}  {item.latency_p50_ms if item.latency_p50_ms is not None else '-':>6}  "
+            f"{item.latency_p95_ms if item.latency_p95_ms is not None else '-':>6}  "
+            f"{item.peak_rss_mb if item.peak_rss_mb is not None else '-':>11}  "
+            f"{f'{item.success_count}/{item.anomaly_count}/{item.failure_count}':>12}  {item.request_count:>8}  {item.throttle_events:>9}"
+        )
+    return "\n".join(lines)
+
+
+def results_as_dicts(results: list[BenchmarkResult]) -> list[dict[str, Any]]:
+    return [asdict(item) for item in results]
@@ -0,0 +1,166 @@
+"""Bounded fetch -> validate -> write pipeline used by collection runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import queue
+import threading
+from typing import Any, Callable, Generic, Iterator, TypeVar
+
+from services.validation_service import ValidationService
+
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+_STOP = object()
+_POLL_SECONDS = 0.1
+
+
+_WORKER_VALIDATION_SERVICE: ValidationService | None = None
+
+
+def init_validation_worker(validation_service: ValidationService) -> None:
+    """Process-pool initializer; keeps the collection's own validator for ``validate_in_worker``."""
+    global _WORKER_VALIDATION_SERVICE
+    _WORKER_VALIDATION_SERVICE = validation_service
+
+
+def validate_in_worker(payload: dict[str, Any]) -> dict[str, Any]:
+    """Process-pool entry point; runs the validator the pool was initialized with in a child process."""
+    return (_WORKER_VALIDATION_SERVICE or ValidationService()).validate_game(payload)
+
+
+@dataclass
+class _Slot:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+
+
+class StagedPipeline(Generic[ItemT, ResultT]):
+    """Runs ``fetch`` on worker threads, ``validate`` on its own workers, and ``write`` on one writer thread.
+
+    ``fetch(item)`` returns ``("done", result)`` when the item needs no further stages (reused or
+    failed) or ``("validate", value)`` to hand ``value`` to validation. ``validate(item, value)``
+    returns the value passed to ``write(item, validated)``, which produces the final result.
+    Stages are connected by queues of ``queue_size`` entries, so a slow stage applies back-pressure
+    instead of buffering whole payloads. Results are yielded in input order.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch: Callable[[ItemT], tuple[str, Any]],
+        validate: Callable[[ItemT, Any], Any],
+        write: Callable[[ItemT, Any], ResultT],
+        fetch_workers: int,
+        validate_workers: int,
+        queue_size: int,
+    ) -> None:
+        self.fetch = fetch
+        self.validate = validate
+        self.write = write
+        self.fetch_workers = max(1, int(fetch_workers))
+        self.validate_workers = max(1, int(validate_workers))
+        self.queue_size = max(1, int(queue_size))
+
+    def run(self, items: list[ItemT], check_cancelled: Callable[[], None]) -> Iterator[tuple[ItemT, ResultT]]:
+        slots = [_Slot() for _ in items]
+        pending: "queue.Queue[tuple[int, ItemT]]" = queue.Queue()
+        for index, item in enumerate(items):
+            pending.put((index, item))
+        validate_queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        write_queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        counters = {"fetch": self.fetch_workers, "validate": self.validate_workers}
+        counter_lock = threading.Lock()
+
+        def finish(index: int, *, result: Any = None, error: BaseException | None = None) -> None:
+            slots[index].result = result
+            slots[index].error = error
+            slots[index].done.set()
+
+        def put(target: "queue.Queue[Any]", entry: Any) -> None:
+            while not stop.is_set():
+                try:
+                    target.put(entry, timeout=_POLL_SECONDS)
+                    return
+                except queue.Full:
+                    continue
+
+        def get(source: "queue.Queue[Any]") -> Any:
+            while not stop.is_set():
+                try:
+                    return source.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+            return _STOP
+
+        def stage_exited(stage: str, downstream: "queue.Queue[Any]", downstream_workers: int) -> None:
+            with counter_lock:
+                counters[stage] -= 1
+                last = counters[stage] == 0
+            if last:
+                for _ in range(downstream_workers):
+                    put(downstream, _STOP)
+
+        def fetch_worker() -> None:
+            try:
+                while not stop.is_set():
+                    try:
+                        index, item = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    try:
+                        kind, value = self.fetch(item)
+                    except BaseException as exc:
+                        finish(index, error=exc)
+                        continue
+                    if kind == "done":
+                        finish(index, result=value)
+                    else:
+                        put(validate_queue, (index, item, value))
+            finally:
+                stage_exited("fetch", validate_queue, self.validate_workers)
+
+        def validate_worker() -> None:
+            try:
+                while (entry := get(validate_queue)) is not _STOP:
+                    index, item, value = entry
+                    try:
+                        validated = self.validate(item, value)
+                    except BaseException as exc:
+                        finish(index, error=exc)
+                        continue
+                    put(write_queue, (index, item, validated))
+            finally:
+                stage_exited("validate", write_queue, 1)
+
+        def write_worker() -> None:
+            while (entry := get(write_queue)) is not _STOP:
+                index, item, validated = entry
+                try:
+                    finish(index, result=self.write(item, validated))
+                except BaseException as exc:
+                    finish(index, error=exc)
+
+        threads = [
+            *(threading.Thread(target=fetch_worker, name=f"collection-fetch-{i}", daemon=True) for i in range(self.fetch_workers)),
+            *(threading.Thread(target=validate_worker, name=f"collection-validate-{i}", daemon=True) for i in range(self.validate_workers)),
+            threading.Thread(target=write_worker, name="collection-write", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for index, item in enumerate(items):
+                slot = slots[index]
+                while not slot.done.wait(_POLL_SECONDS):
+                    check_cancelled()
+                if slot.error is not None:
+                    raise slot.error
+                yield item, slot.result
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
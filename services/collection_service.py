@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 import datetime as dt
 from dataclasses import dataclass, field
 from pathlib import Path
+import pickle
+import time
 import traceback
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
+from infrastructure.http_client import PooledHttpClient
 from infrastructure.json_repository import CollectionRunPaths, JsonGameRepository
 from infrastructure.naver_scraper import NaverScraper
+from infrastructure.rate_limiter import TokenBucketRateLimiter
+from infrastructure.retry_policy import RetryPolicy
+from infrastructure.schedule_cache import ScheduleDiscoveryCache
+from infrastructure.validation_index import ValidationIndex
+from services.collection_pipeline import StagedPipeline, init_validation_worker, validate_in_worker
 from services.common import ProgressReporter, ServiceResult
 from services.validation_service import ValidationService
-from src.kbo_ingest.game_json import minimize_game_payload, pretty_game_json
+from src.kbo_ingest.game_json import iter_pretty_game_json, minimize_game_payload, minimize_relay_block
+
+
+# NaverScraper.DEFAULT_API_REQUEST_INTERVAL(0.25s)과 같은 기본 상한
+DEFAULT_REQUEST_RATE_PER_SECOND = 4.0
+_RETRY_WAIT_SLICE_SECONDS = 0.25
 
 
 @dataclass(frozen=True)
@@ -26,6 +40,22 @@ class CollectionRequest:
     end_date: dt.date
     season_year: int | None = None
     targets: list["CollectionTarget"] | None = None
+    max_workers: int = 1
+    request_rate_per_second: float | None = None
+    request_burst: int = 1
+    rate_limit_state_path: Path | None = None
+    use_discovery_cache: bool = True
+    refresh_discovery_cache: bool = False
+    validation_processes: int = 0
+    retry_base_delay_seconds: float = 1.0
+    retry_max_delay_seconds: float = 30.0
+    archive_raw_responses: bool = False
+    api_base_url: str | None = None
+    discovery_pages: int = 3
+    live_poll_interval_seconds: float = 60.0
+    live_max_polls: int | None = None
+    run_label: str | None = None
+    stream_relay: bool = True
 
 
 @dataclass(frozen=True)
@@ -61,6 +91,33 @@ class CollectionItemOutcome:
     game_id: str | None = None
 
 
+@dataclass(frozen=True)
+class _GameJob:
+    target: CollectionTarget
+    normalized_url: str
+    game_id: str | None
+    file_name: str
+    target_path: Path
+    anomaly_path: Path
+    validation_index: ValidationIndex
+
+
+@dataclass(frozen=True)
+class _FetchedGame:
+    job: _GameJob
+    payload: dict[str, Any]
+    attempt: int
+
+
+@dataclass(frozen=True)
+class _ValidatedGame:
+    fetched: _FetchedGame
+    validation: dict[str, Any] | None
+    exception_type: str | None = None
+    exception_message: str | None = None
+    traceback_text: str | None = None
+
+
 class CollectionService:
     """Collects Naver games and persists minimal-schema payloads."""
 
@@ -75,45 +132,184 @@ class CollectionService:
 
     def run(self, request: CollectionRequest, context: ProgressReporter) -> ServiceResult:
         request.save_dir.mkdir(parents=True, exist_ok=True)
-        paths = self.json_repository.prepare_collection_run(request.save_dir)
-        day_logs: dict[str, CollectionLogRecord] = {}
-        failed_targets: list[CollectionTarget] = []
+        paths = self.json_repository.prepare_collection_run(request.save_dir, run_label=request.run_label)
+        if request.mode == "live":
+            return self._run_live(request, context, paths)
+        self.json_repository.append_journal(
+            paths.journal_path,
+            {"event": "run_started", "request": self._request_to_journal(request), "paths": paths.as_dict()},
+        )
+        return self._execute(request, context, paths)
+
+    def resume(self, journal_path: Path, context: ProgressReporter) -> ServiceResult:
+        """Continue an interrupted run from its journal without re-discovering or re-checking finished targets."""
+        records = self.json_repository.read_journal(journal_path)
+        started = next((record for record in records if record.get("event") == "run_started"), None)
+        if started is None:
+            raise ValueError(f"collection journal has no run_started record: {journal_path}")
+        request = self._request_from_journal(started["request"])
+        paths = CollectionRunPaths.from_dict(started["paths"])
+        targets_record = next((record for record in reversed(records) if record.get("event") == "targets"), None)
+        targets = None if targets_record is None else [self._target_from_journal(item) for item in targets_record["targets"]]
+        completed = {
+            int(record["index"]): self._outcome_from_journal(record)
+            for record in records
+            if record.get("event") == "outcome"
+        }
+        self.json_repository.append_journal(paths.journal_path, {"event": "run_resumed", "completed_count": len(completed)})
+        context.log("info", "collection resumed", journal=str(journal_path), completed=len(completed))
+        return self._execute(request, context, paths, targets=targets, completed=completed)
+
+    def _execute(
+        self,
+        request: CollectionRequest,
+        context: ProgressReporter,
+        paths: CollectionRunPaths,
+        *,
+        targets: list[CollectionTarget] | None = None,
+        completed: dict[int, CollectionItemOutcome] | None = None,
+    ) -> ServiceResult:
+        outcomes: dict[int, CollectionItemOutcome] = dict(completed or {})
         scraper: NaverScraper | None = None
+        rate_limiter = self._build_rate_limiter(request)
+        http_client = PooledHttpClient(max_idle_per_host=self._worker_count(request))
+        self.json_repository.open_run_log_sink(paths)
 
         try:
-            scraper = NaverScraper(wait=request.timeout_seconds, path=str(request.save_dir), headless=request.headless)
+            scraper = self._open_scraper(request, rate_limiter, http_client)
             context.log("info", "collection started", mode=request.mode, save_dir=str(request.save_dir))
-            targets = request.targets or self._discover_targets(scraper, request, context)
+            if targets is None:
+                targets = request.targets or self._discover_targets(scraper, request, context)
+                self.json_repository.append_journal(
+                    paths.journal_path,
+                    {"event": "targets", "targets": [self._target_to_journal(target) for target in targets]},
+                )
+            pending = [(index, target) for index, target in enumerate(targets) if index not in outcomes]
             total = max(1, len(targets))
-            for index, target in enumerate(targets, start=1):
-                context.check_cancelled()
-                day_key = target.game_date.isoformat()
-                day_log = day_logs.setdefault(day_key, CollectionLogRecord(game_date=day_key))
-                day_log.game_count += 1
-                outcome = self._fetch_one(scraper, request, target, paths, context)
-                if outcome.status == "success":
-                    day_log.success_count += 1
-                elif outcome.status == "anomaly":
-                    day_log.anomaly_count += 1
-                    day_log.anomaly_files.append(outcome.file_name)
-                    if outcome.reason:
-                        day_log.anomaly_reasons.append(outcome.reason)
-                elif outcome.status == "skipped":
-                    day_log.skipped_count += 1
-                else:
-                    day_log.failure_count += 1
-                    failed_targets.append(target)
-                    day_log.failed_files.append(outcome.file_name)
-                    if outcome.reason:
-                        day_log.failed_reasons.append(outcome.reason)
-                context.set_progress(index / total, f"{index}/{total} games processed")
+            context.log(
+                "info",
+                "collection fetch pool",
+                worker_count=self._worker_count(request),
+                target_count=len(targets),
+                pending_count=len(pending),
+            )
+            pending_outcomes = self._iter_outcomes(scraper, request, [target for _, target in pending], paths, context)
+            for (index, target), (_, outcome) in zip(pending, pending_outcomes):
+                self.json_repository.append_journal(
+                    paths.journal_path,
+                    {"event": "outcome", "index": index, **self._target_to_journal(target), **self._outcome_to_journal(outcome)},
+                )
+                outcomes[index] = outcome
+                context.set_progress(len(outcomes) / total, f"{len(outcomes)}/{total} games processed")
 
+            day_logs, failed_targets = self._build_day_logs(targets, outcomes)
             summary = "collection completed" if not context.is_cancelled() else "collection cancelled"
+            self.json_repository.append_journal(paths.journal_path, {"event": "run_finished", "summary": summary})
+            return self._build_service_result(
+                summary=summary,
+                day_logs=day_logs,
+                failed_targets=failed_targets,
+                paths=paths,
+                request_stats={
+                    **rate_limiter.stats(),
+                    **http_client.stats(),
+                    "browser_started": scraper.browser_started,
+                },
+            )
+        except Exception as exc:
+            self.json_repository.append_debug_log(paths.debug_log_path, f"fatal: {type(exc).__name__}: {exc}\n{traceback.format_exc()}")
+            raise
+        finally:
+            if scraper is not None:
+                try:
+                    scraper.close()
+                except Exception:
+                    pass
+            http_client.close()
+            self.json_repository.close_run_log_sink(paths)
+
+    def _open_scraper(
+        self,
+        request: CollectionRequest,
+        rate_limiter: TokenBucketRateLimiter,
+        http_client: PooledHttpClient,
+    ) -> NaverScraper:
+        return NaverScraper(
+            wait=request.timeout_seconds,
+            path=str(request.save_dir),
+            headless=request.headless,
+            rate_limiter=rate_limiter,
+            http_client=http_client,
+            api_base_url=request.api_base_url,
+            # 원본 응답을 보관할 때는 이닝 응답 원문이 필요하므로 스트리밍 최소화를 쓰지 않는다.
+            relay_block_transform=minimize_relay_block if request.stream_relay and not request.archive_raw_responses else None,
+        )
+
+    def _run_live(self, request: CollectionRequest, context: ProgressReporter, paths: CollectionRunPaths) -> ServiceResult:
+        """Poll ``request.start_date`` until every game on that date has finished or been cancelled.
+
+        Each poll reads the day's schedule once. In-progress games fetch only the innings from the
+        last stored inning (which may have grown) onwards and merge them into a ``.partial`` state
+        under ``<save_dir>/_live``; finished games get a final relay/lineup/record pass and are
+        validated and saved like a regular collection.
+        """
+        game_date = request.start_date
+        rate_limiter = self._build_rate_limiter(request)
+        http_client = PooledHttpClient()
+        scraper: NaverScraper | None = None
+        targets: list[CollectionTarget] = []
+        outcomes: dict[int, CollectionItemOutcome] = {}
+        settled: set[str] = set()
+        poll_count = 0
+        self.json_repository.open_run_log_sink(paths)
+        try:
+            scraper = self._open_scraper(request, rate_limiter, http_client)
+            context.log("info", "live collection started", date=game_date.isoformat(), save_dir=str(request.save_dir))
+            while True:
+                context.check_cancelled()
+                statuses = scraper.get_schedule_statuses(game_date)
+                poll_count += 1
+                for game_id, status in sorted(statuses.items()):
+                    if game_id in settled:
+                        continue
+                    target = CollectionTarget(game_date=game_date, url=NaverScraper.normalize_game_url(f"/game/{game_id}"))
+                    if status == NaverScraper.SCHEDULE_LIVE_STATUS:
+                        self._poll_live_game(scraper, target, game_id, paths, context)
+                    elif status == NaverScraper.SCHEDULE_FINISHED_STATUS:
+                        settled.add(game_id)
+                        outcome = self._finalize_live_game(scraper, request, target, game_id, paths, context)
+                        if outcome is not None:
+                            outcomes[len(targets)] = outcome
+                            targets.append(target)
+                    elif status == NaverScraper.SCHEDULE_CANCELLED_STATUS:
+                        settled.add(game_id)
+                        self.json_repository.discard_live_state(self._live_state_path(paths, target, game_id))
+                remaining = [
+                    game_id
+                    for game_id, status in statuses.items()
+                    if game_id not in settled and status in (NaverScraper.SCHEDULE_LIVE_STATUS, NaverScraper.SCHEDULE_PENDING_STATUS)
+                ]
+                context.set_progress(
+                    len(settled) / max(1, len(statuses)),
+                    f"poll {poll_count}: {len(settled)}/{len(statuses)} games settled",
+                )
+                if not remaining or (request.live_max_polls and poll_count >= request.live_max_polls):
+                    break
+                self._wait_before_retry(max(0.0, float(request.live_poll_interval_seconds)), context)
+
+            day_logs, failed_targets = self._build_day_logs(targets, outcomes)
+            summary = "live collection completed" if not context.is_cancelled() else "live collection cancelled"
             return self._build_service_result(
                 summary=summary,
-                day_logs=list(day_logs.values()),
+                day_logs=day_logs,
                 failed_targets=failed_targets,
                 paths=paths,
+                request_stats={
+                    **rate_limiter.stats(),
+                    **http_client.stats(),
+                    "browser_started": scraper.browser_started,
+                    "live_poll_count": poll_count,
+                },
             )
         except Exception as exc:
             self.json_repository.append_debug_log(paths.debug_log_path, f"fatal: {type(exc).__name__}: {exc}\n{traceback.format_exc()}")
@@ -124,6 +320,256 @@ class CollectionService:
                     scraper.close()
                 except Exception:
                     pass
+            http_client.close()
+            self.json_repository.close_run_log_sink(paths)
+
+    def _live_state_path(self, paths: CollectionRunPaths, target: CollectionTarget, game_id: str) -> Path:
+        return self.json_repository.live_state_path(paths.save_dir, season_year=target.game_date.year, game_id=game_id)
+
+    def _poll_live_game(
+        self,
+        scraper: NaverScraper,
+        target: CollectionTarget,
+        game_id: str,
+        paths: CollectionRunPaths,
+        context: ProgressReporter,
+    ) -> None:
+        state_path = self._live_state_path(paths, target, game_id)
+        state = self.json_repository.load_live_state(state_path) or {}
+        try:
+            payload, inning_count = self._merge_live_relay(scraper, target, game_id, state, refresh_boxes=not state)
+        except Exception as exc:
+            # 한 번의 폴링 실패는 다음 폴링에서 같은 이닝부터 다시 받으므로 기록만 남긴다.
+            context.log("warn", "live poll failed", game_id=game_id, error=f"{type(exc).__name__}: {exc}")
+            return
+        self.json_repository.save_live_state(state_path, {"inning_count": inning_count, "payload": payload})
+        context.log("info", "live game updated", game_id=game_id, innings=len(payload["relay"]))
+
+    def _finalize_live_game(
+        self,
+        scraper: NaverScraper,
+        request: CollectionRequest,
+        target: CollectionTarget,
+        game_id: str,
+        paths: CollectionRunPaths,
+        context: ProgressReporter,
+    ) -> CollectionItemOutcome | None:
+        state_path = self._live_state_path(paths, target, game_id)
+        state = self.json_repository.load_live_state(state_path)
+        file_name = self._build_file_name(target.url, game_id)
+        target_path = self.json_repository.build_target_path(paths.save_dir, season_year=target.game_date.year, file_name=file_name)
+        if state is None and target_path.exists():
+            # 이번 실행에서 지켜본 적 없고 이미 저장된 경기는 다시 받지 않는다.
+            return None
+        job = _GameJob(
+            target=target,
+            normalized_url=target.url,
+            game_id=game_id,
+            file_name=file_name,
+            target_path=target_path,
+            anomaly_path=self.json_repository.build_target_path(paths.anomaly_dir, season_year=target.game_date.year, file_name=file_name),
+            validation_index=self.json_repository.validation_index(paths.save_dir),
+        )
+        policy = self._build_retry_policy(request)
+        for attempt in range(1, policy.max_attempts + 1):
+            context.check_cancelled()
+            try:
+                payload, _ = self._merge_live_relay(scraper, target, game_id, state or {}, refresh_boxes=True)
+                break
+            except Exception as exc:
+                if not policy.should_retry(exc, attempt):
+                    failure = CollectionItemOutcome(
+                        status="failed",
+                        file_name=file_name,
+                        reason=str(exc),
+                        exception_type=type(exc).__name__,
+                        traceback_text=traceback.format_exc(),
+                        attempt=attempt,
+                        game_id=game_id,
+                    )
+                    return self._record_failure(job, failure, paths, context)
+                self._wait_before_retry(policy.delay_for(attempt, exc), context)
+        fetched = _FetchedGame(job=job, payload=payload, attempt=attempt)
+        outcome = self._write_stage(self._validate_stage(fetched, self.validation_service.validate_game), paths, context)
+        if outcome.status != "failed":
+            self.json_repository.discard_live_state(state_path)
+        context.log("info", "live game finalized", game_id=game_id, status=outcome.status)
+        return outcome
+
+    def _merge_live_relay(
+        self,
+        scraper: NaverScraper,
+        target: CollectionTarget,
+        game_id: str,
+        state: dict[str, Any],
+        *,
+        refresh_boxes: bool,
+    ) -> tuple[dict[str, Any], int]:
+        """Fetch innings from the last stored inning on and return ``(merged minimal payload, inning count)``."""
+        previous = state.get("payload") or {}
+        known_inning_count = int(state.get("inning_count") or 0)
+        inning_count, new_innings = scraper.get_new_inning_data(game_id, known_inning_count, referer_url=f"{target.url}/relay")
+        relay = list(previous.get("relay") or [])
+        for inning, blocks in sorted(new_innings.items()):
+            while len(relay) < inning:
+                relay.append([])
+            relay[inning - 1] = blocks
+        if refresh_boxes:
+            lineup = scraper.get_lineup_data(game_id, referer_url=target.url)
+            record = scraper.get_record_data(game_id, referer_url=f"{target.url}/record")
+        else:
+            lineup, record = previous.get("lineup") or {}, previous.get("record") or {}
+        payload = minimize_game_payload(
+            {"lineup": lineup, "relay": relay, "record": record},
+            game_id=game_id,
+            game_url=target.url,
+            collected_at=dt.datetime.now(dt.UTC).isoformat(),
+        )
+        return payload, max(inning_count, known_inning_count)
+
+    def _build_day_logs(
+        self,
+        targets: list[CollectionTarget],
+        outcomes: dict[int, CollectionItemOutcome],
+    ) -> tuple[list[CollectionLogRecord], list[CollectionTarget]]:
+        day_logs: dict[str, CollectionLogRecord] = {}
+        failed_targets: list[CollectionTarget] = []
+        for index, target in enumerate(targets):
+            outcome = outcomes.get(index)
+            if outcome is None:
+                continue
+            day_key = target.game_date.isoformat()
+            day_log = day_logs.setdefault(day_key, CollectionLogRecord(game_date=day_key))
+            day_log.game_count += 1
+            if outcome.status == "success":
+                day_log.success_count += 1
+            elif outcome.status == "anomaly":
+                day_log.anomaly_count += 1
+                day_log.anomaly_files.append(outcome.file_name)
+                if outcome.reason:
+                    day_log.anomaly_reasons.append(outcome.reason)
+            elif outcome.status == "skipped":
+                day_log.skipped_count += 1
+            else:
+                day_log.failure_count += 1
+                failed_targets.append(target)
+                day_log.failed_files.append(outcome.file_name)
+                if outcome.reason:
+                    day_log.failed_reasons.append(outcome.reason)
+        return list(day_logs.values()), failed_targets
+
+    def _request_to_journal(self, request: CollectionRequest) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for name, value in request.__dict__.items():
+            if name == "targets":
+                continue
+            if isinstance(value, Path):
+                value = str(value)
+            elif isinstance(value, dt.date):
+                value = value.isoformat()
+            data[name] = value
+        return data
+
+    def _request_from_journal(self, data: dict[str, Any]) -> CollectionRequest:
+        values = dict(data)
+        for name in ("save_dir", "rate_limit_state_path"):
+            if values.get(name) is not None:
+                values[name] = Path(values[name])
+        for name in ("start_date", "end_date"):
+            values[name] = dt.date.fromisoformat(values[name])
+        known = set(CollectionRequest.__dataclass_fields__)
+        return CollectionRequest(**{name: value for name, value in values.items() if name in known})
+
+    def _target_to_journal(self, target: CollectionTarget) -> dict[str, str]:
+        return {"game_date": target.game_date.isoformat(), "url": target.url}
+
+    def _target_from_journal(self, data: dict[str, Any]) -> CollectionTarget:
+        return CollectionTarget(game_date=dt.date.fromisoformat(data["game_date"]), url=str(data["url"]))
+
+    def _outcome_to_journal(self, outcome: CollectionItemOutcome) -> dict[str, Any]:
+        return {
+            "status": outcome.status,
+            "file_name": outcome.file_name,
+            "reason": outcome.reason,
+            "attempt": outcome.attempt,
+            "game_id": outcome.game_id,
+        }
+
+    def _outcome_from_journal(self, data: dict[str, Any]) -> CollectionItemOutcome:
+        return CollectionItemOutcome(
+            status=str(data["status"]),
+            file_name=str(data["file_name"]),
+            reason=data.get("reason"),
+            attempt=int(data.get("attempt") or 0),
+            game_id=data.get("game_id"),
+        )
+
+    def _build_rate_limiter(self, request: CollectionRequest) -> TokenBucketRateLimiter:
+        rate = request.request_rate_per_second
+        return TokenBucketRateLimiter(
+            DEFAULT_REQUEST_RATE_PER_SECOND if rate is None else rate,
+            burst=request.request_burst,
+            state_path=request.rate_limit_state_path,
+        )
+
+    def _worker_count(self, request: CollectionRequest) -> int:
+        return max(1, int(request.max_workers or 1))
+
+    def _iter_outcomes(
+        self,
+        scraper: NaverScraper,
+        request: CollectionRequest,
+        targets: list[CollectionTarget],
+        paths: CollectionRunPaths,
+        context: ProgressReporter,
+    ) -> Iterator[tuple[CollectionTarget, CollectionItemOutcome]]:
+        """Yield outcomes in target order.
+
+        With a single worker and no validation processes every game runs start to finish on the
+        calling thread. Otherwise games flow through a bounded fetch -> validate -> write pipeline:
+        ``max_workers`` threads fetch, validation runs on ``validation_processes`` child processes
+        (or one thread when 0), and a single writer persists files and logs. Child processes run a
+        pickled copy of this service's ``validation_service``, so it must be picklable.
+        """
+        worker_count = self._worker_count(request)
+        validation_processes = max(0, int(request.validation_processes or 0))
+        if worker_count == 1 and validation_processes == 0:
+            for target in targets:
+                context.check_cancelled()
+                yield target, self._fetch_one(scraper, request, target, paths, context)
+            return
+
+        process_pool = None
+        if validation_processes:
+            try:
+                pickle.dumps(self.validation_service)
+            except Exception as exc:
+                raise ValueError("validation_processes requires a picklable validation_service") from exc
+            # 주입된 검증기를 워커마다 한 번씩 넘겨 스레드 모드와 같은 판정을 내리게 한다.
+            process_pool = ProcessPoolExecutor(
+                max_workers=validation_processes,
+                initializer=init_validation_worker,
+                initargs=(self.validation_service,),
+            )
+        if process_pool is None:
+            validator = self.validation_service.validate_game
+        else:
+            def validator(payload: dict[str, Any]) -> dict[str, Any]:
+                return process_pool.submit(validate_in_worker, payload).result()
+
+        pipeline: StagedPipeline[CollectionTarget, CollectionItemOutcome] = StagedPipeline(
+            fetch=lambda target: self._fetch_stage(scraper, request, target, paths, context),
+            validate=lambda target, fetched: self._validate_stage(fetched, validator),
+            write=lambda target, validated: self._write_stage(validated, paths, context),
+            fetch_workers=worker_count,
+            validate_workers=validation_processes or 1,
+            queue_size=worker_count * 2,
+        )
+        try:
+            yield from pipeline.run(targets, context.check_cancelled)
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown(wait=True, cancel_futures=True)
 
     def _discover_targets(
         self,
@@ -131,24 +577,81 @@ class CollectionService:
         request: CollectionRequest,
         context: ProgressReporter,
     ) -> list[CollectionTarget]:
-        targets: list[CollectionTarget] = []
-        if request.mode == "season" and request.season_year is not None:
-            for month in range(1, 13):
-                active_days = scraper.get_activated_dates_for_month(request.season_year, month)
-                for day in active_days:
-                    game_date = dt.date(request.season_year, month, day)
-                    if not (request.start_date <= game_date <= request.end_date):
-                        continue
-                    urls = scraper.get_game_urls(request.season_year, month, day)
-                    if urls == -1 or not urls:
-                        continue
-                    targets.extend(CollectionTarget(game_date=game_date, url=url) for url in urls)
-        else:
-            for game_date, urls in scraper.iter_active_date_urls(request.start_date, request.end_date):
-                if urls == -1 or not urls:
+        start_date, end_date = self._discovery_range(request)
+        cache = ScheduleDiscoveryCache.for_save_dir(request.save_dir) if request.use_discovery_cache else None
+        today = dt.date.today()
+        dated_urls: list[tuple[dt.date, Any]] = []
+        dom_ranges: list[tuple[dt.date, dt.date]] = []
+        backends: dict[str, int] = {}
+        for season, month in self._iter_months(start_date, end_date):
+            month_start, month_end = ScheduleDiscoveryCache.month_bounds(season, month)
+            cached = cache.get_month(season, month) if cache is not None and not request.refresh_discovery_cache else None
+            if cached is not None:
+                month_urls = [(entry.game_date, list(entry.urls)) for entry in cached]
+                backend = "cache"
+            else:
+                # 이미 끝난 달은 캐시에 남기기 위해 요청 범위와 관계없이 한 달 전체를 조회한다.
+                closed = ScheduleDiscoveryCache.is_month_closed(season, month, today)
+                query_start = month_start if closed else max(start_date, month_start)
+                query_end = month_end if closed else min(end_date, month_end)
+                month_urls = self._discover_month_api(scraper, query_start, query_end, context)
+                if month_urls is None:
+                    # DOM 조회가 필요한 달은 모아 두었다가 여러 탭에서 한 번에 조회한다.
+                    dom_ranges.append((max(start_date, month_start), min(end_date, month_end)))
+                    backends["dom"] = backends.get("dom", 0) + 1
                     continue
-                targets.extend(CollectionTarget(game_date=game_date, url=url) for url in urls)
-        context.log("info", "collection targets discovered", target_count=len(targets))
+                backend = "api"
+                if cache is not None and closed:
+                    cache.store_month(season, month, month_urls)
+            backends[backend] = backends.get(backend, 0) + 1
+            dated_urls.extend((game_date, urls) for game_date, urls in month_urls if start_date <= game_date <= end_date)
+        if dom_ranges:
+            # DOM 결과는 소프트 타임아웃으로 빈 목록이 섞일 수 있어 캐시에 남기지 않는다.
+            dated_urls.extend(scraper.iter_dom_schedule_urls(dom_ranges, page_count=max(1, int(request.discovery_pages))))
+            dated_urls.sort(key=lambda entry: entry[0])
+        targets = self._collect_targets(dated_urls)
+        context.log("info", "collection targets discovered", target_count=len(targets), backends=backends)
+        return targets
+
+    def _discovery_range(self, request: CollectionRequest) -> tuple[dt.date, dt.date]:
+        if request.mode == "season" and request.season_year is not None:
+            return (
+                max(request.start_date, dt.date(request.season_year, 1, 1)),
+                min(request.end_date, dt.date(request.season_year, 12, 31)),
+            )
+        return request.start_date, request.end_date
+
+    def _iter_months(self, start_date: dt.date, end_date: dt.date) -> Iterator[tuple[int, int]]:
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            yield year, month
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    def _discover_month_api(
+        self,
+        scraper: NaverScraper,
+        start_date: dt.date,
+        end_date: dt.date,
+        context: ProgressReporter,
+    ) -> list[tuple[dt.date, Any]] | None:
+        try:
+            return list(scraper.iter_schedule_game_urls(start_date, end_date))
+        except Exception as exc:
+            context.log(
+                "warn",
+                "schedule api discovery failed, falling back to DOM",
+                start_date=start_date.isoformat(),
+                end_date=end_date.isoformat(),
+                error=f"{type(exc).__name__}: {exc}",
+            )
+            return None
+
+    def _collect_targets(self, dated_urls: Iterable[tuple[dt.date, Any]]) -> list[CollectionTarget]:
+        targets: list[CollectionTarget] = []
+        for game_date, urls in dated_urls:
+            if urls == -1 or not urls:
+                continue
+            targets.extend(CollectionTarget(game_date=game_date, url=url) for url in urls)
         return targets
 
     def _fetch_one(
@@ -159,81 +662,72 @@ class CollectionService:
         paths: CollectionRunPaths,
         context: ProgressReporter,
     ) -> CollectionItemOutcome:
+        kind, value = self._fetch_stage(scraper, request, target, paths, context)
+        if kind == "done":
+            return value
+        return self._write_stage(self._validate_stage(value, self.validation_service.validate_game), paths, context)
+
+    def _fetch_stage(
+        self,
+        scraper: NaverScraper,
+        request: CollectionRequest,
+        target: CollectionTarget,
+        paths: CollectionRunPaths,
+        context: ProgressReporter,
+    ) -> tuple[str, Any]:
+        """Reuse check, network fetch, and minimization; returns ("done", outcome) or ("validate", fetched)."""
         context.log("info", "collecting game", date=target.game_date.isoformat(), url=target.url)
         normalized_url = NaverScraper.normalize_game_url(target.url)
         game_id = self._extract_game_id(normalized_url)
         file_name = self._build_file_name(normalized_url, game_id)
-        target_path = self.json_repository.build_target_path(paths.save_dir, season_year=target.game_date.year, file_name=file_name)
-        anomaly_path = self.json_repository.build_target_path(paths.anomaly_dir, season_year=target.game_date.year, file_name=file_name)
+        job = _GameJob(
+            target=target,
+            normalized_url=normalized_url,
+            game_id=game_id,
+            file_name=file_name,
+            target_path=self.json_repository.build_target_path(paths.save_dir, season_year=target.game_date.year, file_name=file_name),
+            anomaly_path=self.json_repository.build_target_path(paths.anomaly_dir, season_year=target.game_date.year, file_name=file_name),
+            validation_index=self.json_repository.validation_index(paths.save_dir),
+        )
 
-        existing_outcome = self.json_repository.try_reuse_existing(target_path, self.validation_service.validate_game)
+        existing_outcome = self.json_repository.try_reuse_existing(
+            job.target_path,
+            self.validation_service.validate_game,
+            index=job.validation_index,
+            validator_version=self.validation_service.version,
+        )
         if existing_outcome is not None:
-            context.log("info", "reused existing valid game", path=str(target_path))
-            return CollectionItemOutcome(status="skipped", file_name=file_name, attempt=0, game_id=game_id)
+            context.log("info", "reused existing valid game", path=str(job.target_path))
+            return "done", CollectionItemOutcome(status="skipped", file_name=file_name, attempt=0, game_id=game_id)
 
-        max_attempts = max(1, int(request.retry_count))
+        policy = self._build_retry_policy(request)
+        max_attempts = policy.max_attempts
+        # 재시도 사이에 이미 받은 엔드포인트 응답을 유지해 실패한 엔드포인트만 다시 요청한다.
+        responses: dict[str, Any] = {}
         last_failure: CollectionItemOutcome | None = None
         for attempt in range(1, max_attempts + 1):
             context.check_cancelled()
             try:
-                lineup_data, inning_data, record_data = scraper.get_game_data(normalized_url)
+                lineup_data, inning_data, record_data = scraper.get_game_data(normalized_url, responses=responses)
                 if not (lineup_data and inning_data and record_data):
                     raise ValueError("missing lineup, relay, or record payload")
+                collected_at = dt.datetime.now(dt.UTC).isoformat()
+                if request.archive_raw_responses:
+                    self.json_repository.raw_archive(paths.save_dir).store_game(
+                        season=target.game_date.year,
+                        game_id=game_id or file_name.removesuffix(".json"),
+                        game_url=normalized_url,
+                        file_name=file_name,
+                        collected_at=collected_at,
+                        responses=responses,
+                    )
                 payload = minimize_game_payload(
                     {"lineup": lineup_data, "relay": inning_data, "record": record_data},
                     game_id=game_id,
                     game_url=normalized_url,
-                    collected_at=dt.datetime.now(dt.UTC).isoformat(),
+                    collected_at=collected_at,
                 )
-
-                try:
-                    validation = self.validation_service.validate_game(payload)
-                except Exception as exc:
-                    anomaly_outcome = CollectionItemOutcome(
-                        status="anomaly",
-                        file_name=file_name,
-                        reason=f"validation exception: {type(exc).__name__}: {exc}",
-                        validation_issues=[f"validation exception: {type(exc).__name__}: {exc}"],
-                        validation_warnings=[],
-                        exception_type=type(exc).__name__,
-                        traceback_text=traceback.format_exc(),
-                        attempt=attempt,
-                        game_id=game_id,
-                    )
-                    self.json_repository.append_debug_log(
-                        paths.debug_log_path,
-                        f"{file_name} | validation_exception | {type(exc).__name__}: {exc}\n{anomaly_outcome.traceback_text}",
-                    )
-                    self.json_repository.save_pretty_json(anomaly_path, pretty_game_json(payload))
-                    self.json_repository.append_jsonl(
-                        paths.anomaly_log_path,
-                        self._build_structured_log_record(target=target, url=normalized_url, outcome=anomaly_outcome),
-                    )
-                    context.log("warn", "saved anomaly payload", path=str(anomaly_path), reason=anomaly_outcome.reason)
-                    return anomaly_outcome
-
-                if validation.get("ok"):
-                    self.json_repository.save_pretty_json(target_path, pretty_game_json(payload))
-                    context.log("info", "saved collected game", path=str(target_path))
-                    return CollectionItemOutcome(status="success", file_name=file_name, attempt=attempt, game_id=game_id)
-
-                anomaly_outcome = CollectionItemOutcome(
-                    status="anomaly",
-                    file_name=file_name,
-                    reason=self._summarize_validation(validation),
-                    validation_issues=list(validation.get("issues") or []),
-                    validation_warnings=list(validation.get("warnings") or []),
-                    attempt=attempt,
-                    game_id=game_id,
-                )
-                self.json_repository.append_debug_log(paths.debug_log_path, f"{file_name} | validation_failed | {anomaly_outcome.reason}")
-                self.json_repository.save_pretty_json(anomaly_path, pretty_game_json(payload))
-                self.json_repository.append_jsonl(
-                    paths.anomaly_log_path,
-                    self._build_structured_log_record(target=target, url=normalized_url, outcome=anomaly_outcome),
-                )
-                context.log("warn", "saved anomaly payload", path=str(anomaly_path), reason=anomaly_outcome.reason)
-                return anomaly_outcome
+                return "validate", _FetchedGame(job=job, payload=payload, attempt=attempt)
             except Exception as exc:
                 last_failure = CollectionItemOutcome(
                     status="failed",
@@ -248,6 +742,14 @@ class CollectionService:
                     paths.debug_log_path,
                     f"{file_name} | attempt={attempt}/{max_attempts} | {type(exc).__name__}: {exc}\n{last_failure.traceback_text}",
                 )
+                if not isinstance(exc, OSError):
+                    # 응답 형식 오류는 캐시된 응답 자체가 원인일 수 있으므로 전부 다시 받는다.
+                    responses.clear()
+                if not policy.should_retry(exc, attempt):
+                    break
+                delay = policy.delay_for(attempt, exc)
+                context.log("warn", "retrying game fetch", file_name=file_name, attempt=attempt, delay=round(delay, 3), reason=str(exc))
+                self._wait_before_retry(delay, context)
 
         if last_failure is None:
             last_failure = CollectionItemOutcome(
@@ -257,18 +759,140 @@ class CollectionService:
                 attempt=max_attempts,
                 game_id=game_id,
             )
+        return "done", self._record_failure(job, last_failure, paths, context)
+
+    def _build_retry_policy(self, request: CollectionRequest) -> RetryPolicy:
+        return RetryPolicy(
+            max_attempts=max(1, int(request.retry_count)),
+            base_delay=max(0.0, float(request.retry_base_delay_seconds)),
+            max_delay=max(0.0, float(request.retry_max_delay_seconds)),
+        )
+
+    def _wait_before_retry(self, delay: float, context: ProgressReporter) -> None:
+        deadline = time.monotonic() + delay
+        while (remaining := deadline - time.monotonic()) > 0:
+            context.check_cancelled()
+            time.sleep(min(remaining, _RETRY_WAIT_SLICE_SECONDS))
+
+    def _validate_stage(self, fetched: "_FetchedGame", validator: Callable[[dict[str, Any]], dict[str, Any]]) -> "_ValidatedGame":
+        try:
+            return _ValidatedGame(fetched=fetched, validation=validator(fetched.payload))
+        except Exception as exc:
+            return _ValidatedGame(
+                fetched=fetched,
+                validation=None,
+                exception_type=type(exc).__name__,
+                exception_message=str(exc),
+                traceback_text=traceback.format_exc(),
+            )
+
+    def _write_stage(self, validated: "_ValidatedGame", paths: CollectionRunPaths, context: ProgressReporter) -> CollectionItemOutcome:
+        fetched = validated.fetched
+        job = fetched.job
+        try:
+            validation = validated.validation
+            if validation is None:
+                reason = f"validation exception: {validated.exception_type}: {validated.exception_message}"
+                anomaly_outcome = CollectionItemOutcome(
+                    status="anomaly",
+                    file_name=job.file_name,
+                    reason=reason,
+                    validation_issues=[reason],
+                    validation_warnings=[],
+                    exception_type=validated.exception_type,
+                    traceback_text=validated.traceback_text,
+                    attempt=fetched.attempt,
+                    game_id=job.game_id,
+                )
+                self.json_repository.append_debug_log(
+                    paths.debug_log_path,
+                    f"{job.file_name} | validation_exception | {validated.exception_type}: {validated.exception_message}\n{anomaly_outcome.traceback_text}",
+                )
+                return self._save_anomaly(job, fetched.payload, anomaly_outcome, paths, context)
+
+            if validation.get("ok"):
+                # 저장할 JSON 텍스트 전체를 만들지 않고 조각 단위로 쓰면서 해시를 계산한다.
+                sha256 = self.json_repository.write_json_chunks(job.target_path, iter_pretty_game_json(fetched.payload))
+                self.json_repository.record_validation(
+                    job.validation_index,
+                    job.target_path,
+                    sha256=sha256,
+                    validator_version=self.validation_service.version,
+                    ok=True,
+                )
+                context.log("info", "saved collected game", path=str(job.target_path))
+                return CollectionItemOutcome(status="success", file_name=job.file_name, attempt=fetched.attempt, game_id=job.game_id)
+
+            anomaly_outcome = CollectionItemOutcome(
+                status="anomaly",
+                file_name=job.file_name,
+                reason=self._summarize_validation(validation),
+                validation_issues=list(validation.get("issues") or []),
+                validation_warnings=list(validation.get("warnings") or []),
+                attempt=fetched.attempt,
+                game_id=job.game_id,
+            )
+            self.json_repository.append_debug_log(paths.debug_log_path, f"{job.file_name} | validation_failed | {anomaly_outcome.reason}")
+            return self._save_anomaly(job, fetched.payload, anomaly_outcome, paths, context)
+        except Exception as exc:
+            failure = CollectionItemOutcome(
+                status="failed",
+                file_name=job.file_name,
+                reason=f"write failed: {exc}",
+                exception_type=type(exc).__name__,
+                traceback_text=traceback.format_exc(),
+                attempt=fetched.attempt,
+                game_id=job.game_id,
+            )
+            self.json_repository.append_debug_log(
+                paths.debug_log_path,
+                f"{job.file_name} | write_failed | {type(exc).__name__}: {exc}\n{failure.traceback_text}",
+            )
+            return self._record_failure(job, failure, paths, context)
+
+    def _save_anomaly(
+        self,
+        job: "_GameJob",
+        payload: dict[str, Any],
+        outcome: CollectionItemOutcome,
+        paths: CollectionRunPaths,
+        context: ProgressReporter,
+    ) -> CollectionItemOutcome:
+        sha256 = self.json_repository.write_json_chunks(job.anomaly_path, iter_pretty_game_json(payload))
+        # 재생성이 손으로 고친 파일을 덮어쓰지 않도록 이상 결과의 해시도 남긴다.
+        self.json_repository.record_validation(
+            job.validation_index,
+            job.anomaly_path,
+            sha256=sha256,
+            validator_version=self.validation_service.version,
+            ok=False,
+        )
+        self.json_repository.append_jsonl(
+            paths.anomaly_log_path,
+            self._build_structured_log_record(target=job.target, url=job.normalized_url, outcome=outcome),
+        )
+        context.log("warn", "saved anomaly payload", path=str(job.anomaly_path), reason=outcome.reason)
+        return outcome
+
+    def _record_failure(
+        self,
+        job: "_GameJob",
+        outcome: CollectionItemOutcome,
+        paths: CollectionRunPaths,
+        context: ProgressReporter,
+    ) -> CollectionItemOutcome:
         self.json_repository.append_jsonl(
             paths.failure_log_path,
-            self._build_structured_log_record(target=target, url=normalized_url, outcome=last_failure),
+            self._build_structured_log_record(target=job.target, url=job.normalized_url, outcome=outcome),
         )
         context.log(
             "error",
             "collection failed",
-            date=target.game_date.isoformat(),
-            file_name=file_name,
-            reason=last_failure.reason,
+            date=job.target.game_date.isoformat(),
+            file_name=job.file_name,
+            reason=outcome.reason,
         )
-        return last_failure
+        return outcome
 
     def _build_file_name(self, normalized_url: str, game_id: str | None) -> str:
         if game_id:
@@ -322,6 +946,7 @@ class CollectionService:
         day_logs: list[CollectionLogRecord],
         failed_targets: list[CollectionTarget],
         paths: CollectionRunPaths,
+        request_stats: dict[str, Any] | None = None,
     ) -> ServiceResult:
         total_games = sum(day.game_count for day in day_logs)
         total_success = sum(day.success_count for day in day_logs)
@@ -340,6 +965,7 @@ class CollectionService:
                 "debug_log_path": str(paths.debug_log_path),
                 "anomaly_log_path": str(paths.anomaly_log_path),
                 "failure_log_path": str(paths.failure_log_path),
+                "journal_path": str(paths.journal_path),
             },
             metrics={
                 "games": total_games,
@@ -359,6 +985,7 @@ class CollectionService:
                 "failed_targets": failed_targets,
                 "failed_target_items": failed_targets,
                 "day_logs": day_logs,
+                **(request_stats or {}),
             },
         )
 
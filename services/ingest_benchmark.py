@@ -0,0 +1,119 @@
+"""Raw-ingest throughput benchmark: row-by-row INSERT versus COPY for the relay tables."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import time
+from typing import Any
+
+import psycopg
+
+from src.kbo_ingest.db import create_schema
+from src.kbo_ingest.ingest_raw import ingest_raw_game
+
+RAW_INGEST_MODES = ("insert", "copy")
+
+# 시퀀스 값은 실행마다 달라지므로 파일 해시와 블록 순번을 키로, 나머지 열 전체를 비교한다.
+_SNAPSHOT_QUERIES = {
+    "raw_relay_blocks": """
+        SELECT g.source_file_hash, b.block_index, to_jsonb(b) - 'raw_block_id' - 'raw_game_id'
+        FROM raw_relay_blocks b JOIN raw_games g USING (raw_game_id)
+        WHERE g.source_file_hash = ANY(%s)
+        ORDER BY 1, 2
+    """,
+    "raw_plate_metrics": """
+        SELECT g.source_file_hash, b.block_index, to_jsonb(m) - 'raw_block_id'
+        FROM raw_plate_metrics m JOIN raw_relay_blocks b USING (raw_block_id) JOIN raw_games g USING (raw_game_id)
+        WHERE g.source_file_hash = ANY(%s)
+        ORDER BY 1, 2
+    """,
+    "raw_text_events": """
+        SELECT g.source_file_hash, b.block_index, e.event_index_in_block, to_jsonb(e) - 'raw_event_id' - 'raw_block_id'
+        FROM raw_text_events e JOIN raw_relay_blocks b USING (raw_block_id) JOIN raw_games g USING (raw_game_id)
+        WHERE g.source_file_hash = ANY(%s)
+        ORDER BY 1, 2, 3
+    """,
+    "raw_pitch_tracks": """
+        SELECT g.source_file_hash, b.block_index, t.track_index_in_block, to_jsonb(t) - 'raw_pitch_track_id' - 'raw_block_id'
+        FROM raw_pitch_tracks t JOIN raw_relay_blocks b USING (raw_block_id) JOIN raw_games g USING (raw_game_id)
+        WHERE g.source_file_hash = ANY(%s)
+        ORDER BY 1, 2, 3
+    """,
+}
+
+
+@dataclass(frozen=True)
+class RawIngestBenchmarkResult:
+    mode: str
+    game_count: int
+    elapsed_seconds: float
+    games_per_second: float
+    row_counts: dict[str, int]
+    rows_identical: bool
+
+
+def _raw_snapshot(conn: psycopg.Connection) -> dict[str, list[tuple[Any, ...]]]:
+    with conn.cursor() as cur:
+        cur.execute("SELECT source_file_hash FROM raw_games")
+        hashes = [row[0] for row in cur.fetchall()]
+        snapshot = {}
+        for table, query in _SNAPSHOT_QUERIES.items():
+            cur.execute(query, (hashes,))
+            snapshot[table] = cur.fetchall()
+    return snapshot
+
+
+def run_raw_ingest_benchmark(
+    dsn: str,
+    paths: list[Path],
+    *,
+    schema_path: Path | None = None,
+    modes: tuple[str, ...] = RAW_INGEST_MODES,
+) -> list[RawIngestBenchmarkResult]:
+    """Ingest ``paths`` once per mode, each inside a transaction that is rolled back afterwards.
+
+    The database keeps no rows from the benchmark. ``rows_identical`` compares every raw relay row
+    with the first mode's, ignoring only the serial IDs.
+    """
+    if not paths:
+        raise ValueError("no game JSON files to benchmark")
+    results = []
+    reference: dict[str, list[tuple[Any, ...]]] | None = None
+    with psycopg.connect(dsn) as conn:
+        if schema_path is not None:
+            create_schema(conn, schema_path)
+        for mode in modes:
+            if mode not in RAW_INGEST_MODES:
+                raise ValueError(f"unknown raw ingest mode {mode!r}")
+            started_at = time.perf_counter()
+            for path in paths:
+                ingest_raw_game(conn, path, bulk=mode == "copy")
+            elapsed = time.perf_counter() - started_at
+            snapshot = _raw_snapshot(conn)
+            conn.rollback()
+            if reference is None:
+                reference = snapshot
+            results.append(
+                RawIngestBenchmarkResult(
+                    mode=mode,
+                    game_count=len(paths),
+                    elapsed_seconds=round(elapsed, 3),
+                    games_per_second=round(len(paths) / elapsed, 2) if elapsed > 0 else 0.0,
+                    row_counts={table: len(rows) for table, rows in snapshot.items()},
+                    rows_identical=snapshot == reference,
+                )
+            )
+    return results
+
+
+def format_raw_ingest_results(results: list[RawIngestBenchmarkResult]) -> str:
+    lines = ["mode    games  elapsed_s  games/s  blocks  events  tracks  identical"]
+    for item in results:
+        lines.append(
+            f"{item.mode:<6}  {item.game_count:>5}  {item.elapsed_seconds:>9}  {item.games_per_second:>7}  "
+            f"{item.row_counts.get('raw_relay_blocks', 0):>6}  {item.row_counts.get('raw_text_events', 0):>6}  "
+            f"{item.row_counts.get('raw_pitch_tracks', 0):>6}  {'yes' if item.rows_identical else 'NO':>9}"
+        )
+    return "\n".join(lines)
+
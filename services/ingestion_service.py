@@ -12,6 +12,12 @@ import psycopg
 from infrastructure.postgres_repository import GameCatalogRepository, PostgresConnectionFactory
 from services.common import GameOption, ProgressReporter, ServiceResult
 from src.kbo_ingest.db import create_schema, reset_database
+from src.kbo_ingest.incremental import (
+    delete_raw_games,
+    delete_stale_games,
+    plan_incremental_load,
+    update_renamed_sources,
+)
 from src.kbo_ingest.manifest import build_manifest, load_manifest, resolve_stage_sizes, write_manifest
 from src.kbo_ingest.pipeline import load_one_game
 from src.kbo_ingest.runner import run_sampling_loop
@@ -41,10 +47,18 @@ class DatabaseService:
 class IngestionService:
     """Coordinates manifest generation, schema setup, loading, and validation."""
 
-    def _load_paths(self, conn: psycopg.Connection, paths: list[Path], context: ProgressReporter) -> None:
+    def _load_paths(
+        self,
+        conn: psycopg.Connection,
+        paths: list[Path],
+        context: ProgressReporter,
+        replaced_raw_game_ids: dict[str, list[int]] | None = None,
+    ) -> None:
         total = max(1, len(paths))
         for index, path in enumerate(paths, start=1):
             context.check_cancelled()
+            if replaced_raw_game_ids:
+                delete_raw_games(conn, replaced_raw_game_ids.get(str(path), []))
             load_one_game(conn, path)
             if index % 10 == 0 or index == len(paths):
                 context.set_progress(index / total, f"{index}/{len(paths)} files loaded")
@@ -94,15 +108,32 @@ class IngestionService:
         reset_first: bool,
         validate_after_load: bool,
         context: ProgressReporter,
+        incremental: bool = False,
+        delete_missing: bool = False,
     ) -> ServiceResult:
+        if incremental and reset_first:
+            raise ValueError("incremental ingest cannot reset the database first")
         entries = load_manifest(manifest_path)["entries"]
         load_started = time.perf_counter()
+        incremental_summary: dict[str, int] | None = None
         with psycopg.connect(dsn) as conn:
             if reset_first:
                 context.log("info", "resetting database before manifest ingest")
                 reset_database(conn)
             create_schema(conn, schema_path)
-            self._load_paths(conn, [Path(entry["path"]) for entry in entries], context)
+            load_entries = entries
+            replaced_raw_game_ids: dict[str, list[int]] = {}
+            if incremental:
+                plan = plan_incremental_load(conn, entries)
+                deleted = delete_stale_games(conn, plan, delete_missing=delete_missing)
+                update_renamed_sources(conn, plan)
+                conn.commit()
+                incremental_summary = {**plan.summary(), "deleted": deleted}
+                context.log("info", "incremental manifest ingest", **incremental_summary)
+                load_entries = plan.to_load
+                replaced_raw_game_ids = {str(Path(path)): ids for path, ids in plan.replaced_raw_game_ids.items()}
+            # 바뀐 경기의 이전 버전은 새 버전과 같은 트랜잭션에서 지우므로 적재가 실패하면 함께 되돌아간다.
+            self._load_paths(conn, [Path(entry["path"]) for entry in load_entries], context, replaced_raw_game_ids)
             conn.commit()
             validation_started = time.perf_counter()
             if validate_after_load:
@@ -120,6 +151,10 @@ class IngestionService:
             report["load_seconds"] = time.perf_counter() - load_started
             report["validation_seconds"] = time.perf_counter() - validation_started if validate_after_load else 0.0
             report["report_json_path"] = report_path.as_posix()
+            if incremental_summary is not None:
+                report["loaded_game_count"] = len(load_entries)
+                report["skipped_game_count"] = incremental_summary["unchanged"]
+                report["incremental"] = incremental_summary
             self._write_report(report_path, report)
         context.set_progress(1.0, "manifest ingest completed")
         return ServiceResult(
@@ -0,0 +1,87 @@
+"""Load/dump timing of the game JSON codecs over the saved files of a season."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import time
+from typing import Any
+
+from src.kbo_ingest.game_catalog import catalog_paths
+from src.kbo_ingest.json_codec import StdlibJsonCodec, available_codecs, create_json_codec
+
+
+@dataclass(frozen=True)
+class CodecBenchmarkResult:
+    codec: str
+    file_count: int
+    total_mb: float
+    load_seconds: float
+    dump_seconds: float
+    load_mb_per_second: float
+    dump_mb_per_second: float
+    mismatch_count: int
+
+
+def run_json_codec_benchmark(
+    root: Path,
+    *,
+    seasons: list[int] | None = None,
+    codecs: list[str] | None = None,
+    limit: int | None = None,
+    repeat: int = 1,
+) -> list[CodecBenchmarkResult]:
+    """Time ``loads`` and pretty ``dumps`` of every saved game file once per codec (best of ``repeat``).
+
+    ``mismatch_count`` counts files whose pretty text differs from the stdlib codec's, which must stay
+    zero for ``.history`` patches to remain stable.
+    """
+    paths = catalog_paths(Path(root), seasons=seasons)
+    paths = paths[:limit] if limit else paths
+    if not paths:
+        raise ValueError(f"no game JSON files to benchmark under {root}")
+    blobs = [path.read_bytes() for path in paths]
+    reference = StdlibJsonCodec()
+    expected = [reference.dumps_pretty(reference.loads(raw)) for raw in blobs]
+    total_mb = sum(len(raw) for raw in blobs) / (1024 * 1024)
+
+    results = []
+    for name in codecs or list(available_codecs()):
+        codec = create_json_codec(name)
+        load_seconds = dump_seconds = float("inf")
+        mismatch_count = 0
+        for _ in range(max(1, repeat)):
+            started_at = time.perf_counter()
+            payloads = [codec.loads(raw) for raw in blobs]
+            load_seconds = min(load_seconds, time.perf_counter() - started_at)
+            started_at = time.perf_counter()
+            texts = [codec.dumps_pretty(payload) for payload in payloads]
+            dump_seconds = min(dump_seconds, time.perf_counter() - started_at)
+            mismatch_count = sum(1 for text, reference_text in zip(texts, expected) if text != reference_text)
+        results.append(
+            CodecBenchmarkResult(
+                codec=codec.name,
+                file_count=len(blobs),
+                total_mb=round(total_mb, 2),
+                load_seconds=round(load_seconds, 3),
+                dump_seconds=round(dump_seconds, 3),
+                load_mb_per_second=round(total_mb / load_seconds, 1) if load_seconds > 0 else 0.0,
+                dump_mb_per_second=round(total_mb / dump_seconds, 1) if dump_seconds > 0 else 0.0,
+                mismatch_count=mismatch_count,
+            )
+        )
+    return results
+
+
+def format_codec_benchmark_results(results: list[CodecBenchmarkResult]) -> str:
+    lines = ["codec    files  size_mb  load_s  dump_s  load_mb/s  dump_mb/s  mismatches"]
+    for item in results:
+        lines.append(
+            f"{item.codec:<7}  {item.file_count:>5}  {item.total_mb:>7}  {item.load_seconds:>6}  {item.dump_seconds:>6}  "
+            f"{item.load_mb_per_second:>9}  {item.dump_mb_per_second:>9}  {item.mismatch_count:>10}"
+        )
+    return "\n".join(lines)
+
+
+def codec_results_as_dicts(results: list[CodecBenchmarkResult]) -> list[dict[str, Any]]:
+    return [asdict(item) for item in results]
@@ -2,25 +2,55 @@
 
 from __future__ import annotations
 
+import datetime as dt
 import difflib
-import json
 from pathlib import Path
 from typing import Any
 
-from src.kbo_ingest.game_validation import validate_game
+from infrastructure.json_repository import JsonGameRepository
+from infrastructure.naver_scraper import NaverScraper
+from infrastructure.raw_archive import ArchivedGame, RawResponseArchive
+from infrastructure.validation_index import ValidationIndex, content_hash
+from src.kbo_ingest import json_codec
+from src.kbo_ingest.game_catalog import catalog_paths
+from src.kbo_ingest.game_validation import VALIDATOR_VERSION, validate_game
 from src.kbo_ingest.game_json import minimize_game_payload, pretty_game_json
 
 
 def iter_json_files(target: Path) -> list[Path]:
     if target.is_file():
         return [target]
-    return sorted(path for path in target.rglob("*.json") if ".history" not in path.parts)
+    return catalog_paths(target)
 
 
 def history_root_for(path: Path) -> Path:
     return path.parent / ".history" / path.stem
 
 
+class ModifiedGameFileError(RuntimeError):
+    """Raised when a saved game file no longer matches the hash recorded when it was written."""
+
+
+def write_history(path: Path, before_text: str, after_text: str, stamp: str) -> tuple[Path, Path]:
+    """Keep ``before_text`` as ``.history/<stem>/<stamp>.bak`` with a unified diff next to it."""
+    history_dir = history_root_for(path)
+    history_dir.mkdir(parents=True, exist_ok=True)
+    backup_path = history_dir / f"{stamp}.bak"
+    patch_path = history_dir / f"{stamp}.patch"
+    backup_path.write_text(before_text, encoding="utf-8")
+    patch_text = "\n".join(
+        difflib.unified_diff(
+            before_text.splitlines(),
+            after_text.splitlines(),
+            fromfile=f"{path.name} (before)",
+            tofile=f"{path.name} (after)",
+            lineterm="",
+        )
+    )
+    patch_path.write_text(patch_text + ("\n" if patch_text else ""), encoding="utf-8")
+    return backup_path, patch_path
+
+
 def migrate_one_file(
     path: Path,
     *,
@@ -30,7 +60,7 @@ def migrate_one_file(
     validate: bool,
 ) -> dict[str, Any]:
     raw_text = path.read_text(encoding="utf-8")
-    raw_payload = json.loads(raw_text)
+    raw_payload = json_codec.loads(raw_text)
     migrated = minimize_game_payload(raw_payload, file_path=path)
     migrated_text = pretty_game_json(migrated)
 
@@ -43,22 +73,7 @@ def migrate_one_file(
     patch_path: Path | None = None
 
     if write_in_place and changed:
-        history_dir = history_root_for(path)
-        history_dir.mkdir(parents=True, exist_ok=True)
-        stamp = path.stem + "_migrate"
-        backup_path = history_dir / f"{stamp}.bak"
-        patch_path = history_dir / f"{stamp}.patch"
-        backup_path.write_text(raw_text, encoding="utf-8")
-        patch_text = "\n".join(
-            difflib.unified_diff(
-                raw_text.splitlines(),
-                migrated_text.splitlines(),
-                fromfile=f"{path.name} (before)",
-                tofile=f"{path.name} (after)",
-                lineterm="",
-            )
-        )
-        patch_path.write_text(patch_text + ("\n" if patch_text else ""), encoding="utf-8")
+        backup_path, patch_path = write_history(path, raw_text, migrated_text, path.stem + "_migrate")
         path.write_text(migrated_text, encoding="utf-8")
         written_path = path
     elif output_root is not None:
@@ -82,3 +97,74 @@ def migrate_one_file(
         "after_issue_count": len(after_result["issues"]) if after_result is not None else None,
         "after_warning_count": len(after_result["warnings"]) if after_result is not None else None,
     }
+
+
+def reminimize_archived_game(
+    archive: RawResponseArchive,
+    game: ArchivedGame,
+    *,
+    output_root: Path,
+    validate: bool,
+    index: ValidationIndex | None = None,
+    force: bool = False,
+) -> dict[str, Any]:
+    """보관된 원본 응답으로 경기 JSON을 네트워크 없이 다시 만든다.
+
+    덮어쓰거나 지울 파일은 ``.history``에 백업하고, 마지막으로 기록된 해시와 다르면(GUI 수정 등)
+    ``force`` 없이는 ``ModifiedGameFileError``로 거부한다.
+    """
+    responses = archive.load_responses(game)
+    lineup_data, inning_data, record_data = NaverScraper.game_data_from_responses(game.game_url, responses)
+    payload = minimize_game_payload(
+        {"lineup": lineup_data, "relay": inning_data, "record": record_data},
+        game_id=game.game_id,
+        game_url=game.game_url,
+        collected_at=game.collected_at,
+    )
+    payload_text = pretty_game_json(payload)
+    result = validate_game(payload) if validate else None
+    ok = result is None or bool(result["ok"])
+    index = index if index is not None else ValidationIndex(output_root)
+
+    # 수집과 같은 규칙으로 정상 결과는 <season>/, 검증 실패는 _anomalies/<season>/ 아래에 둔다.
+    season_path = output_root / str(game.season) / game.file_name
+    anomaly_path = output_root / "_anomalies" / str(game.season) / game.file_name
+    output_path, stale_path = (season_path, anomaly_path) if ok else (anomaly_path, season_path)
+    if not force:
+        for path in (output_path, stale_path):
+            if path.exists() and not _matches_recorded_hash(index, path):
+                raise ModifiedGameFileError(f"{path} changed since it was last written; rerun with --force to overwrite it")
+
+    stamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S_%f") + "_reminimize"
+    before_text = output_path.read_text(encoding="utf-8") if output_path.exists() else None
+    changed = before_text != payload_text
+    backup_path: Path | None = None
+    if changed:
+        if before_text is not None:
+            backup_path, _ = write_history(output_path, before_text, payload_text, stamp)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        sha256 = JsonGameRepository().write_json_chunks(output_path, [payload_text])
+        # 다음 재생성이 이 파일을 그대로 덮어써도 되는지 판단할 수 있도록 쓴 내용의 해시를 남긴다.
+        index.record_digest(output_path, sha256, VALIDATOR_VERSION if result is not None else "", ok)
+
+    # 판정이 바뀌어 반대편에 남은 이전 결과는 백업한 뒤 지운다.
+    removed_path: Path | None = None
+    if stale_path.exists():
+        write_history(stale_path, stale_path.read_text(encoding="utf-8"), "", stamp)
+        stale_path.unlink()
+        removed_path = stale_path
+
+    return {
+        "game_id": game.game_id,
+        "written_path": output_path.as_posix(),
+        "changed": changed,
+        "backup_path": backup_path.as_posix() if backup_path else None,
+        "removed_path": removed_path.as_posix() if removed_path else None,
+        "after_ok": result["ok"] if result is not None else None,
+        "after_issue_count": len(result["issues"]) if result is not None else None,
+    }
+
+
+def _matches_recorded_hash(index: ValidationIndex, path: Path) -> bool:
+    entry = index.get(path)
+    return entry is not None and content_hash(path.read_bytes()) == entry.sha256
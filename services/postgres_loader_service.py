@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from services.ingest_benchmark import format_raw_ingest_results, run_raw_ingest_benchmark
 from src.kbo_ingest.db import create_schema, reset_database
 from src.kbo_ingest.manifest import DEFAULT_SEASONS, build_manifest, load_manifest, write_manifest
 from src.kbo_ingest.pipeline import load_one_game
@@ -50,6 +51,9 @@ def command_manifest(args: argparse.Namespace) -> int:
 
 
 def command_load(args: argparse.Namespace) -> int:
+    if args.incremental and args.reset_db:
+        print("--incremental cannot be combined with --reset-db")
+        return 1
     entries = _load_entries_from_manifest(Path(args.manifest), args.limit, args.offset)
     report = load_and_validate_entries(
         args.dsn,
@@ -59,6 +63,9 @@ def command_load(args: argparse.Namespace) -> int:
         reset_db_first=args.reset_db,
         run_label=args.run_label,
         validate_after_load=not args.skip_validate,
+        workers=args.workers,
+        incremental=args.incremental,
+        delete_missing=args.delete_missing,
     )
     print(
         f"load finished loaded_games={report['loaded_game_count']} blocking_issues={report['blocking_issue_count']} "
@@ -120,6 +127,17 @@ def command_legacy(args: argparse.Namespace) -> int:
     return 0
 
 
+def command_benchmark_raw(args: argparse.Namespace) -> int:
+    entries = _load_entries_from_manifest(Path(args.manifest), args.limit, args.offset)
+    results = run_raw_ingest_benchmark(
+        args.dsn,
+        [Path(entry["path"]) for entry in entries],
+        schema_path=Path(args.schema),
+    )
+    print(format_raw_ingest_results(results))
+    return 0 if all(item.rows_identical for item in results) else 2
+
+
 def build_cli_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="KBO JSON -> PostgreSQL loader and QA runner")
     subparsers = parser.add_subparsers(dest="command")
@@ -138,6 +156,9 @@ def build_cli_parser() -> argparse.ArgumentParser:
     load_parser.add_argument("--limit", type=int)
     load_parser.add_argument("--reset-db", action="store_true")
     load_parser.add_argument("--skip-validate", action="store_true")
+    load_parser.add_argument("--workers", type=int, default=1)
+    load_parser.add_argument("--incremental", action="store_true")
+    load_parser.add_argument("--delete-missing", action="store_true")
     load_parser.add_argument("--report-json", required=True)
     load_parser.add_argument("--run-label", default="KBO Load Validation")
     load_parser.set_defaults(func=command_load)
@@ -158,6 +179,16 @@ def build_cli_parser() -> argparse.ArgumentParser:
     loop_parser.add_argument("--batch-sizes", nargs="*")
     loop_parser.set_defaults(func=command_sample_loop)
 
+    benchmark_parser = subparsers.add_parser(
+        "benchmark-raw",
+        help="time raw ingest with row-by-row INSERT and with COPY, then roll back",
+    )
+    _build_common_parser(benchmark_parser)
+    benchmark_parser.add_argument("--manifest", required=True)
+    benchmark_parser.add_argument("--offset", type=int, default=0)
+    benchmark_parser.add_argument("--limit", type=int, default=50)
+    benchmark_parser.set_defaults(func=command_benchmark_raw)
+
     parser.add_argument("--dsn")
     parser.add_argument("--data-dir", default="games")
     parser.add_argument("--schema", default="sql/schema.sql")
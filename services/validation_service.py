@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from src.kbo_ingest.game_validation import validate_game
+from src.kbo_ingest.game_validation import VALIDATOR_VERSION, validate_game
 
 
 @dataclass(frozen=True)
@@ -25,6 +25,8 @@ class GameValidationResult:
 class ValidationService:
     """Wraps the repository's canonical game validation entry point."""
 
+    version = VALIDATOR_VERSION
+
     def validate_payload(self, payload: dict[str, Any]) -> GameValidationResult:
         result = validate_game(payload)
         return GameValidationResult(
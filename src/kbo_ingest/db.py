@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
+from typing import Any
 
 import psycopg
 
@@ -40,3 +42,14 @@ def reset_database(conn: psycopg.Connection) -> None:
         for table_name in reversed(SCHEMA_TABLES):
             cur.execute(f"DROP TABLE IF EXISTS {table_name} CASCADE")
     conn.commit()
+
+
+def pipeline_mode(conn: psycopg.Connection) -> AbstractContextManager[Any]:
+    """Enter libpq pipeline mode when the client library supports it, else run statements as usual.
+
+    Inside the block statements are sent without waiting for their results; only ``fetch*`` calls
+    (and leaving the block) wait for the server. ``COPY`` cannot run inside it.
+    """
+    if psycopg.Pipeline.is_supported():
+        return conn.pipeline()
+    return nullcontext()
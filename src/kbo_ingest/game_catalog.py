@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+import datetime as dt
+import hashlib
+import os
+from pathlib import Path
+import sqlite3
+from typing import Any, Iterable, Iterator
+
+from .game_document import LazyGameDocument
+
+
+CATALOG_DIR_NAME = "_cache"
+CATALOG_FILE_NAME = "game_catalog.sqlite3"
+HISTORY_DIR_NAME = ".history"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS game_files (
+    relative_path TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    in_history INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    game_id TEXT,
+    game_date TEXT,
+    home_team_code TEXT,
+    home_team_name TEXT,
+    away_team_code TEXT,
+    away_team_name TEXT,
+    schema_version INTEGER,
+    parse_error TEXT,
+    validation_ok INTEGER,
+    validator_version TEXT,
+    validated_at TEXT,
+    indexed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS game_files_parent ON game_files (parent);
+CREATE INDEX IF NOT EXISTS game_files_game_id ON game_files (game_id);
+CREATE INDEX IF NOT EXISTS game_files_game_date ON game_files (game_date);
+"""
+
+_HEADER_COLUMNS = (
+    "game_id",
+    "game_date",
+    "home_team_code",
+    "home_team_name",
+    "away_team_code",
+    "away_team_name",
+    "schema_version",
+    "parse_error",
+)
+
+
+@dataclass(frozen=True)
+class GameCatalogEntry:
+    path: Path
+    relative_path: str
+    parent: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    game_id: str | None
+    game_date: str | None
+    home_team_code: str | None
+    home_team_name: str | None
+    away_team_code: str | None
+    away_team_name: str | None
+    schema_version: int | None
+    parse_error: str | None
+    validation_ok: bool | None
+    validator_version: str | None
+
+
+@dataclass(frozen=True)
+class CatalogRefreshStats:
+    scanned: int = 0
+    added: int = 0
+    updated: int = 0
+    touched: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+
+class GameCatalog:
+    """SQLite catalog of the game JSON files under one root (``<root>/<season>/*.json`` and below).
+
+    ``refresh()`` walks the tree and only stats unchanged files; a file is re-read when its size or
+    mtime changed, and re-parsed (resetting the validation verdict) only when its content hash did.
+    Queries then answer from the database without touching the files. Verdicts recorded by another
+    ``validator_version`` than the catalog's read as no verdict.
+    """
+
+    def __init__(self, root: Path, db_path: Path | None = None, *, validator_version: str | None = None) -> None:
+        if validator_version is None:
+            # game_validation이 이 모듈을 불러오므로 순환을 피해 여기서 가져온다.
+            from .game_validation import VALIDATOR_VERSION
+
+            validator_version = VALIDATOR_VERSION
+        self.root = Path(root)
+        self.db_path = db_path or self.root / CATALOG_DIR_NAME / CATALOG_FILE_NAME
+        self.validator_version = validator_version
+
+    def exists(self) -> bool:
+        return self.db_path.exists()
+
+    def refresh(self) -> CatalogRefreshStats:
+        counts = {name: 0 for name in CatalogRefreshStats.__dataclass_fields__}
+        with self._connect() as connection:
+            known = {
+                row[0]: (row[1], row[2], row[3])
+                for row in connection.execute("SELECT relative_path, size, mtime_ns, sha256 FROM game_files")
+            }
+            seen: set[str] = set()
+            for path in self._walk():
+                relative_path = path.relative_to(self.root).as_posix()
+                seen.add(relative_path)
+                counts["scanned"] += 1
+                try:
+                    stat = path.stat()
+                    previous = known.get(relative_path)
+                    if previous is not None and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                        counts["unchanged"] += 1
+                        continue
+                    raw = path.read_bytes()
+                except OSError:
+                    seen.discard(relative_path)
+                    continue
+                digest = hashlib.sha256(raw).hexdigest()
+                if previous is not None and previous[2] == digest:
+                    connection.execute(
+                        "UPDATE game_files SET size = ?, mtime_ns = ? WHERE relative_path = ?",
+                        (stat.st_size, stat.st_mtime_ns, relative_path),
+                    )
+                    counts["touched"] += 1
+                    continue
+                self._upsert(connection, relative_path, stat, digest, raw)
+                counts["updated" if previous is not None else "added"] += 1
+            removed = [relative_path for relative_path in known if relative_path not in seen]
+            connection.executemany("DELETE FROM game_files WHERE relative_path = ?", [(item,) for item in removed])
+            counts["removed"] = len(removed)
+        return CatalogRefreshStats(**counts)
+
+    def entries(
+        self,
+        *,
+        seasons: Iterable[str] | None = None,
+        include_history: bool = False,
+        game_id: str | None = None,
+        team: str | None = None,
+        date_from: dt.date | None = None,
+        date_to: dt.date | None = None,
+        validation_ok: bool | None = None,
+    ) -> list[GameCatalogEntry]:
+        """Catalog rows sorted like ``sorted(Path)``; ``seasons`` matches files directly in ``<root>/<season>``."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        season_order = [str(season) for season in seasons] if seasons is not None else None
+        if season_order is not None:
+            clauses.append(f"parent IN ({', '.join('?' for _ in season_order)})")
+            params.extend(season_order)
+        if not include_history:
+            clauses.append("in_history = 0")
+        if game_id is not None:
+            clauses.append("game_id = ?")
+            params.append(game_id)
+        if team is not None:
+            clauses.append("? IN (home_team_code, home_team_name, away_team_code, away_team_name)")
+            params.append(team)
+        if date_from is not None:
+            clauses.append("game_date >= ?")
+            params.append(date_from.isoformat())
+        if date_to is not None:
+            clauses.append("game_date <= ?")
+            params.append(date_to.isoformat())
+        if validation_ok is not None:
+            clauses.append("validation_ok = ? AND validator_version = ?")
+            params.extend((int(validation_ok), self.validator_version))
+        query = "SELECT * FROM game_files" + (f" WHERE {' AND '.join(clauses)}" if clauses else "")
+        with self._connect() as connection:
+            entries = [self._entry_from_row(row) for row in connection.execute(query, params)]
+        entries.sort(key=lambda entry: entry.path)
+        if season_order is not None:
+            rank = {season: index for index, season in enumerate(season_order)}
+            entries.sort(key=lambda entry: rank[entry.parent])
+        return entries
+
+    def paths(self, **filters: Any) -> list[Path]:
+        return [entry.path for entry in self.entries(**filters)]
+
+    def get(self, path: Path) -> GameCatalogEntry | None:
+        with self._connect() as connection:
+            row = connection.execute("SELECT * FROM game_files WHERE relative_path = ?", (self._relative(path),)).fetchone()
+        return self._entry_from_row(row) if row is not None else None
+
+    def record_validation(self, path: Path, ok: bool, validator_version: str) -> None:
+        """Store the verdict for ``path`` as it is on disk now (the row is refreshed first if needed)."""
+        path = Path(path)
+        relative_path = self._relative(path)
+        stat = path.stat()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT size, mtime_ns FROM game_files WHERE relative_path = ?", (relative_path,)
+            ).fetchone()
+            if row is None or (row["size"], row["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+                raw = path.read_bytes()
+                self._upsert(connection, relative_path, stat, hashlib.sha256(raw).hexdigest(), raw)
+            connection.execute(
+                "UPDATE game_files SET validation_ok = ?, validator_version = ?, validated_at = ? WHERE relative_path = ?",
+                (int(bool(ok)), validator_version, _now(), relative_path),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 연결은 호출마다 새로 열어 GUI 스레드와 CLI, 여러 프로세스가 같은 카탈로그를 함께 쓸 수 있게 한다.
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as connection:
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            with connection:
+                yield connection
+
+    def _walk(self) -> Iterator[Path]:
+        if not self.root.is_dir():
+            return
+        for directory, dir_names, file_names in os.walk(self.root):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                if file_name.endswith(".json"):
+                    yield Path(directory) / file_name
+
+    def _upsert(self, connection: sqlite3.Connection, relative_path: str, stat: os.stat_result, digest: str, raw: bytes) -> None:
+        header = _read_header(raw, Path(relative_path))
+        parent = Path(relative_path).parent.as_posix()
+        connection.execute(
+            f"""
+            INSERT INTO game_files (relative_path, parent, in_history, size, mtime_ns, sha256, {', '.join(_HEADER_COLUMNS)},
+                                    validation_ok, validator_version, validated_at, indexed_at)
+            VALUES (?, ?, ?, ?, ?, ?, {', '.join('?' for _ in _HEADER_COLUMNS)}, NULL, NULL, NULL, ?)
+            ON CONFLICT (relative_path) DO UPDATE SET
+                parent = excluded.parent, in_history = excluded.in_history, size = excluded.size,
+                mtime_ns = excluded.mtime_ns, sha256 = excluded.sha256,
+                {', '.join(f'{column} = excluded.{column}' for column in _HEADER_COLUMNS)},
+                validation_ok = NULL, validator_version = NULL, validated_at = NULL, indexed_at = excluded.indexed_at
+            """,
+            (
+                relative_path,
+                "" if parent == "." else parent,
+                int(HISTORY_DIR_NAME in Path(relative_path).parts),
+                stat.st_size,
+                stat.st_mtime_ns,
+                digest,
+                *(header.get(column) for column in _HEADER_COLUMNS),
+                _now(),
+            ),
+        )
+
+    def _entry_from_row(self, row: sqlite3.Row) -> GameCatalogEntry:
+        current = row["validation_ok"] is not None and row["validator_version"] == self.validator_version
+        return GameCatalogEntry(
+            path=self.root / row["relative_path"],
+            relative_path=row["relative_path"],
+            parent=row["parent"],
+            size=row["size"],
+            mtime_ns=row["mtime_ns"],
+            sha256=row["sha256"],
+            game_id=row["game_id"],
+            game_date=row["game_date"],
+            home_team_code=row["home_team_code"],
+            home_team_name=row["home_team_name"],
+            away_team_code=row["away_team_code"],
+            away_team_name=row["away_team_name"],
+            schema_version=row["schema_version"],
+            parse_error=row["parse_error"],
+            validation_ok=bool(row["validation_ok"]) if current else None,
+            validator_version=row["validator_version"],
+        )
+
+    def _relative(self, path: Path) -> str:
+        path = Path(path)
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.resolve().relative_to(self.root.resolve()).as_posix()
+
+
+def catalog_paths(
+    root: Path,
+    *,
+    seasons: Iterable[str] | None = None,
+    include_history: bool = False,
+    use_catalog: bool = False,
+) -> list[Path]:
+    """List the game files under ``root`` sorted like ``sorted(Path)``.
+
+    Only ``use_catalog=True`` (meant for the save directory) builds or refreshes ``<root>/_cache``;
+    otherwise, or if the catalog is unusable, the tree is globbed without writing anything.
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return []
+    if use_catalog:
+        try:
+            catalog = GameCatalog(root)
+            catalog.refresh()
+            return catalog.paths(seasons=seasons, include_history=include_history)
+        except (OSError, sqlite3.Error):
+            # 읽기 전용 폴더처럼 카탈로그를 만들 수 없으면 예전처럼 직접 훑는다.
+            pass
+    if seasons is not None:
+        return [path for season in seasons for path in sorted((root / str(season)).glob("*.json"))]
+    return sorted(path for path in root.rglob("*.json") if include_history or HISTORY_DIR_NAME not in path.parts)
+
+
+def _read_header(raw: bytes, relative_path: Path) -> dict[str, Any]:
+    # relay는 건드리지 않고 머리 부분만 읽는다.
+    document = LazyGameDocument(raw, relative_path)
+    try:
+        game_id = document.game_id
+        game_info = document.game_info
+        schema_version = document.schema_version
+    except ValueError as exc:
+        return {"parse_error": f"{type(exc).__name__}: {exc}"}
+    return {
+        "game_id": game_id,
+        "game_date": _game_date(game_info.get("gdate"), game_id),
+        "home_team_code": _text(game_info.get("hCode")),
+        "home_team_name": _text(game_info.get("hName")),
+        "away_team_code": _text(game_info.get("aCode")),
+        "away_team_name": _text(game_info.get("aName")),
+        "schema_version": schema_version,
+        "parse_error": None,
+    }
+
+
+def _game_date(gdate: Any, game_id: str) -> str | None:
+    for candidate in (str(gdate or ""), game_id[:8]):
+        try:
+            return dt.datetime.strptime(candidate[:8], "%Y%m%d").date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def _text(value: Any) -> str | None:
+    return str(value) if value not in (None, "") else None
+
+
+def _now() -> str:
+    return dt.datetime.now(dt.timezone.utc).isoformat()
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from pathlib import Path
+import re
+from typing import Any, Iterator
+
+from . import json_codec
+from .game_json import minimize_game_payload
+
+
+# pretty_game_json 배치에서 최상위 키는 정확히 두 칸, relay 이닝은 정확히 네 칸 들여쓴 "[" 줄에서 시작한다.
+# JSON 문자열 안에는 줄바꿈이 그대로 들어갈 수 없으므로 이 패턴은 더 깊은 값과 섞이지 않는다.
+_TOP_LEVEL_KEY = re.compile(rb'\n  ("(?:[^"\\\n]|\\.)*"): ')
+_UNSET = object()
+
+
+class LazyGameDocument:
+    """Read-on-demand view of one saved game JSON file.
+
+    Files in the ``pretty_game_json`` layout are split at their top-level keys without parsing, so the
+    header fields, ``lineup`` and ``record`` decode only their own bytes and ``relay`` innings decode one
+    at a time. Any other layout is parsed in full on first access and served from memory, so the
+    results never depend on the layout.
+    """
+
+    def __init__(self, raw: bytes, path: Path | None = None) -> None:
+        self.raw = raw
+        self.path = Path(path) if path is not None else None
+        self._spans: dict[str, tuple[int, int]] | None = _top_level_spans(raw)
+        self._values: dict[str, Any] = {}
+        self._payload: dict[str, Any] | None = None
+        self._relay_spans: list[tuple[int, int]] | None = None
+
+    @classmethod
+    def open(cls, path: Path) -> "LazyGameDocument":
+        path = Path(path)
+        return cls(path.read_bytes(), path)
+
+    @property
+    def is_lazy(self) -> bool:
+        return self._spans is not None
+
+    def keys(self) -> list[str]:
+        return list(self._spans) if self._spans is not None else list(self.payload())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if self._spans is None:
+            return self.payload().get(key, default)
+        if key not in self._spans:
+            return default
+        value = self._values.get(key, _UNSET)
+        if value is _UNSET:
+            value = self._decode(self._spans[key])
+            # relay는 통째로 붙잡아 두지 않는다.
+            if key != "relay":
+                self._values[key] = value
+        return value
+
+    @property
+    def schema_version(self) -> int | None:
+        value = self.get("schema_version")
+        return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+    @property
+    def game_id(self) -> str:
+        game_source = self.get("game_source") or {}
+        source_game_id = game_source.get("source_game_id") if isinstance(game_source, dict) else None
+        fallback = self.path.stem if self.path is not None else ""
+        return str(self.get("game_id") or source_game_id or fallback)
+
+    @property
+    def lineup(self) -> dict[str, Any]:
+        lineup = self.get("lineup")
+        return lineup if isinstance(lineup, dict) else {}
+
+    @property
+    def game_info(self) -> dict[str, Any]:
+        game_info = self.lineup.get("game_info")
+        return game_info if isinstance(game_info, dict) else {}
+
+    @property
+    def record(self) -> dict[str, Any]:
+        record = self.get("record")
+        return record if isinstance(record, dict) else {}
+
+    @property
+    def relay_inning_count(self) -> int:
+        spans = self._relay_item_spans()
+        if spans is not None:
+            return len(spans)
+        relay = self.get("relay")
+        return len(relay) if isinstance(relay, list) else 0
+
+    def relay_inning(self, index: int) -> Any:
+        spans = self._relay_item_spans()
+        if spans is not None:
+            return self._decode(spans[index])
+        relay = self.get("relay")
+        if not isinstance(relay, list):
+            raise IndexError(index)
+        return relay[index]
+
+    def iter_relay_innings(self) -> Iterator[Any]:
+        for index in range(self.relay_inning_count):
+            yield self.relay_inning(index)
+
+    def payload(self) -> dict[str, Any]:
+        """The whole document, exactly as ``json_codec.loads`` would return it."""
+        if self._payload is not None:
+            return self._payload
+        payload = json_codec.loads(self.raw)
+        if self._spans is None:
+            # 배치를 알아보지 못한 문서는 한 번 읽은 결과를 계속 쓴다.
+            if not isinstance(payload, dict):
+                raise ValueError("game JSON root is not an object")
+            self._payload = payload
+        return payload
+
+    def minimized(self) -> dict[str, Any]:
+        return minimize_game_payload(self.payload(), file_path=self.path)
+
+    def _decode(self, span: tuple[int, int]) -> Any:
+        return json_codec.loads(self.raw[span[0]:span[1]])
+
+    def _relay_item_spans(self) -> list[tuple[int, int]] | None:
+        if self._relay_spans is None and self._spans is not None and "relay" in self._spans:
+            self._relay_spans = _array_item_spans(self.raw, *self._spans["relay"])
+        return self._relay_spans
+
+
+def _top_level_spans(raw: bytes) -> dict[str, tuple[int, int]] | None:
+    """Byte span of each top-level value, or ``None`` when ``raw`` is not in the pretty layout.
+
+    Keys are found scanning forward up to ``relay`` and backward from the end down to the member that
+    follows it, so the relay bytes themselves are never scanned here. That relies on ``relay`` being the
+    last array-valued member, as in every schema v2 file; otherwise reading ``relay`` raises ``ValueError``.
+    """
+    body_end = len(raw)
+    while body_end > 0 and raw[body_end - 1:body_end] == b"\n":
+        body_end -= 1
+    if not raw.startswith(b'{\n  "') or raw[body_end - 2:body_end] != b"\n}":
+        return None
+    matches = []
+    position = 1
+    while position != -1:
+        match = _TOP_LEVEL_KEY.match(raw, position, body_end)
+        if match is None:
+            return None
+        matches.append(match)
+        if match.group(1) == b'"relay"':
+            break
+        position = raw.find(b'\n  "', match.end(), body_end)
+    else:
+        return _spans_from_matches(raw, matches, body_end)
+    relay_start = matches[-1].end()
+    tail = []
+    position = body_end
+    # relay 다음 멤버까지만 뒤에서부터 찾는다. 앞 값이 최상위 배열로 끝나면 그 배열이 relay다.
+    while (position := raw.rfind(b'\n  "', relay_start, position)) != -1:
+        match = _TOP_LEVEL_KEY.match(raw, position, body_end)
+        if match is None:
+            return None
+        tail.append(match)
+        if raw.endswith((b"\n  ],", b"[],"), relay_start, position):
+            break
+    return _spans_from_matches(raw, matches + tail[::-1], body_end)
+
+
+def _spans_from_matches(raw: bytes, matches: list[re.Match[bytes]], body_end: int) -> dict[str, tuple[int, int]] | None:
+    spans: dict[str, tuple[int, int]] = {}
+    for index, match in enumerate(matches):
+        if index + 1 < len(matches):
+            end = matches[index + 1].start()
+            if raw[end - 1:end] != b",":
+                return None
+            end -= 1
+        else:
+            end = body_end - 2
+        try:
+            key = json_codec.loads(match.group(1))
+        except ValueError:
+            return None
+        spans[key] = (match.end(), end)
+    return spans
+
+
+def _array_item_spans(raw: bytes, start: int, end: int) -> list[tuple[int, int]] | None:
+    """Byte span of each inning of a pretty-layout ``relay`` array, or ``None`` for any other shape."""
+    if raw[start:end] == b"[]":
+        return []
+    if not (raw.startswith(b"[\n    [", start) and raw.startswith(b"\n  ]", end - 4)):
+        return None
+    spans = []
+    item_start = start + len(b"[\n    ")
+    while True:
+        next_start = raw.find(b"\n    [", item_start, end)
+        item_end = next_start - 1 if next_start != -1 else end - 4
+        # 이닝은 배열이므로 이닝 사이에 다른 값이 끼어 있으면 "]"로 끝나지 않는다.
+        if raw[item_end - 1:item_end] != b"]" or (next_start != -1 and raw[item_end:next_start] != b","):
+            return None
+        spans.append((item_start, item_end))
+        if next_start == -1:
+            return spans
+        item_start = next_start + len(b"\n    ")
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import copy
-import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from . import json_codec
 
 
 SCHEMA_VERSION = 2
@@ -214,6 +215,11 @@ def _minimize_block(block: Any) -> dict[str, Any]:
     return minimized
 
 
+def minimize_relay_block(block: Any) -> dict[str, Any]:
+    """Minimize one raw relay block; idempotent, so already minimized blocks pass through unchanged."""
+    return _minimize_block(block)
+
+
 def _minimize_lineup_group(rows: Any, fields: tuple[str, ...]) -> list[dict[str, Any]]:
     if not isinstance(rows, list):
         return []
@@ -308,10 +314,16 @@ def minimize_game_payload(
 
 
 def load_game_payload(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = json_codec.loads(path.read_bytes())
     return minimize_game_payload(payload, file_path=path)
 
 
 def pretty_game_json(payload: dict[str, Any]) -> str:
-    return json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+    return json_codec.dumps_pretty(payload) + "\n"
+
+
+def iter_pretty_game_json(payload: dict[str, Any]) -> Iterator[str]:
+    """Yield ``pretty_game_json(payload)`` in pieces so it can be written without building the whole text."""
+    yield from json_codec.iter_pretty(payload)
+    yield "\n"
 
@@ -7,10 +7,14 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 from .common_utils import to_int
+from .game_catalog import catalog_paths
 from .game_json import load_game_payload, minimize_game_payload
 from .pa_scoring import classify_event, classify_terminal_pa_text, score_relay_plate_appearances
 
 
+# 검증 규칙이나 판정 결과가 바뀌는 수정을 하면 올린다. 수집 재사용 인덱스가 이 값으로 이전 판정을 무효화한다.
+VALIDATOR_VERSION = "1"
+
 BATTER_INTRO_RE = re.compile(r"^(?:\d+번타자|대타)\s+\S+")
 
 
@@ -812,7 +816,7 @@ def validate_json_file(json_path: Path) -> Dict[str, Any]:
 def collect_json_files(path: Path) -> List[Path]:
     if path.is_file():
         return [path]
-    return sorted(path.rglob("*.json"))
+    return catalog_paths(path, include_history=True)
 
 
 def main() -> int:
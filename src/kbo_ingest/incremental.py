@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import psycopg
+
+from .db import pipeline_mode
+from .game_json import load_game_payload
+from .ingest_raw import compute_file_hash, delete_existing_normalized_rows, game_source_key
+
+
+@dataclass
+class LoadedSource:
+    raw_game_id: int
+    source_file_name: str
+    source_file_hash: str
+    source_game_key: str | None
+
+
+@dataclass
+class IncrementalPlan:
+    """Which manifest entries still need loading, diffed against ``raw_games``/``games``."""
+
+    unchanged: list[dict[str, Any]] = field(default_factory=list)
+    to_load: list[dict[str, Any]] = field(default_factory=list)
+    new_count: int = 0
+    changed_count: int = 0
+    replaced_raw_game_ids: dict[str, list[int]] = field(default_factory=dict)
+    stale_raw_game_ids: list[int] = field(default_factory=list)
+    renamed_sources: dict[int, str] = field(default_factory=dict)
+    missing: list[tuple[int, str]] = field(default_factory=list)
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "unchanged": len(self.unchanged),
+            "new": self.new_count,
+            "changed": self.changed_count,
+            "missing": len(self.missing),
+        }
+
+
+def source_path_key(path: str | Path) -> str:
+    # raw_games.source_file_name은 적재한 OS의 구분자로 남으므로 비교할 때는 "/"로 맞춘다.
+    return str(Path(path)).replace("\\", "/")
+
+
+def fetch_loaded_sources(conn: psycopg.Connection) -> list[LoadedSource]:
+    """Every loaded raw game with its source file name, file hash and ``games.source_game_key``."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT rg.raw_game_id, rg.source_file_name, rg.source_file_hash, g.source_game_key
+            FROM raw_games rg
+            LEFT JOIN games g ON g.raw_game_id = rg.raw_game_id
+            """
+        )
+        return [LoadedSource(*row) for row in cur.fetchall()]
+
+
+def _source_root(loaded_name: str, current_path: Path) -> str | None:
+    # 상대 경로로 적재한 행이 지금 어느 폴더 기준인지, 같은 경기의 현재 절대 경로에서 거꾸로 구한다.
+    loaded_key = source_path_key(loaded_name)
+    if Path(loaded_key).is_absolute():
+        return None
+    current_key = source_path_key(current_path.resolve())
+    suffix = "/" + loaded_key.removeprefix("./")
+    return current_key[: -len(suffix)] if current_key.endswith(suffix) else None
+
+
+def _source_exists(loaded_name: str, source_roots: set[str]) -> bool:
+    loaded_key = source_path_key(loaded_name)
+    if Path(loaded_key).is_absolute():
+        return Path(loaded_key).exists()
+    if not source_roots:
+        # 어느 폴더 기준인지 모르는 상대 경로는 작업 디렉터리로 판단하지 않고 남겨 둔다.
+        return True
+    return any((Path(root) / loaded_key).exists() for root in source_roots)
+
+
+def plan_incremental_load(conn: psycopg.Connection, entries: list[dict[str, Any]]) -> IncrementalPlan:
+    """Split ``entries`` into unchanged games and games to (re)load.
+
+    Files are hashed as they are now, the same way ``ingest_raw_game`` does, and a file whose hash is
+    already loaded is unchanged wherever it was loaded from. Other loaded versions of the same game
+    (same ``source_game_key``, or same source path) are listed in ``replaced_raw_game_ids`` by entry
+    path when the file changed, and in ``stale_raw_game_ids`` when it did not. Unchanged games loaded
+    under another path spelling are listed in ``renamed_sources``.
+
+    Loaded games that no manifest entry matches are listed in ``missing`` when their file is gone.
+    Relative source names are resolved against the folders the matched entries were loaded from, not
+    the working directory, and are kept when no such folder is known. Nothing is written here.
+    """
+    loaded = fetch_loaded_sources(conn)
+    by_hash = {source.source_file_hash: source for source in loaded}
+    by_game_key: dict[str, list[LoadedSource]] = {}
+    by_path: dict[str, list[LoadedSource]] = {}
+    for source in loaded:
+        if source.source_game_key:
+            by_game_key.setdefault(source.source_game_key, []).append(source)
+        by_path.setdefault(source_path_key(source.source_file_name), []).append(source)
+
+    plan = IncrementalPlan()
+    matched: set[int] = set()
+    source_roots: set[str] = set()
+    for entry in entries:
+        path = Path(entry["path"])
+        if not path.exists():
+            continue
+        file_hash = compute_file_hash(path)
+        current = by_hash.get(file_hash)
+        if current is not None:
+            game_key = current.source_game_key
+        else:
+            game_key = game_source_key((load_game_payload(path).get("lineup") or {}).get("game_info") or {})
+        # 같은 경기(source_game_key)나 같은 경로로 적재된 다른 해시는 이전 버전이다.
+        versions = {
+            source.raw_game_id: source
+            for source in [*by_game_key.get(game_key or "", []), *by_path.get(source_path_key(path), [])]
+        }
+        if current is not None:
+            versions[current.raw_game_id] = current
+        for source in versions.values():
+            root = _source_root(source.source_file_name, path)
+            if root is not None:
+                source_roots.add(root)
+        matched.update(versions)
+        replaced = [raw_game_id for raw_game_id, source in versions.items() if source.source_file_hash != file_hash]
+        if current is not None:
+            plan.unchanged.append(entry)
+            plan.stale_raw_game_ids.extend(replaced)
+            if source_path_key(current.source_file_name) != source_path_key(path):
+                plan.renamed_sources[current.raw_game_id] = str(path)
+            continue
+        if replaced:
+            plan.replaced_raw_game_ids[entry["path"]] = replaced
+        plan.to_load.append(entry)
+        if replaced:
+            plan.changed_count += 1
+        else:
+            plan.new_count += 1
+
+    for source in loaded:
+        if source.raw_game_id not in matched and not _source_exists(source.source_file_name, source_roots):
+            plan.missing.append((source.raw_game_id, source_path_key(source.source_file_name)))
+    return plan
+
+
+def delete_raw_games(conn: psycopg.Connection, raw_game_ids: list[int]) -> int:
+    """Delete raw games with everything loaded from them; returns the number of ``raw_games`` rows removed."""
+    if not raw_game_ids:
+        return 0
+    with conn.cursor() as cur, pipeline_mode(conn):
+        cur.execute("SELECT game_id FROM games WHERE raw_game_id = ANY(%s)", (raw_game_ids,))
+        # batted_ball_results는 games에서 CASCADE로 닿지 않으므로 정규화 행은 먼저 직접 지운다.
+        for (game_id,) in cur.fetchall():
+            delete_existing_normalized_rows(cur, game_id)
+        # 파이프라인에서는 rowcount가 결과를 받은 뒤에야 채워지므로 지운 ID를 돌려받아 센다.
+        cur.execute("DELETE FROM raw_games WHERE raw_game_id = ANY(%s) RETURNING raw_game_id", (raw_game_ids,))
+        return len(cur.fetchall())
+
+
+def update_renamed_sources(conn: psycopg.Connection, plan: IncrementalPlan) -> int:
+    """Point unchanged games at the path they are listed under now, so validation finds them by path."""
+    if not plan.renamed_sources:
+        return 0
+    rows = [(path, raw_game_id) for raw_game_id, path in plan.renamed_sources.items()]
+    with conn.cursor() as cur, pipeline_mode(conn):
+        cur.executemany("UPDATE raw_games SET source_file_name = %s WHERE raw_game_id = %s", rows)
+        cur.executemany("UPDATE games SET source_file_name = %s WHERE raw_game_id = %s", rows)
+    return len(rows)
+
+
+def delete_stale_games(conn: psycopg.Connection, plan: IncrementalPlan, *, delete_missing: bool = False) -> int:
+    """Delete old versions of unchanged files (and, with ``delete_missing``, games whose file is gone).
+
+    Returns the number of ``raw_games`` rows removed. Replaced versions of files that are reloaded
+    are not touched here; callers delete ``replaced_raw_game_ids[path]`` in the transaction that reloads ``path``.
+    """
+    raw_game_ids = list(plan.stale_raw_game_ids)
+    if delete_missing:
+        raw_game_ids.extend(raw_game_id for raw_game_id, _ in plan.missing)
+    return delete_raw_games(conn, raw_game_ids)
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 import hashlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import psycopg
 from psycopg.types.json import Json
 
 from .common_utils import first_non_empty, to_int
-from .game_json import load_game_payload
+from .db import pipeline_mode
+from .game_document import LazyGameDocument
+from .game_json import load_game_payload, minimize_game_payload
 
 
 def _to_float(value: Any) -> float | None:
@@ -50,7 +53,7 @@ def _parse_game_date(value: Any) -> datetime.date | None:
     return None
 
 
-def _file_hash(path: Path) -> str:
+def compute_file_hash(path: Path) -> str:
     return hashlib.sha256(path.read_bytes()).hexdigest()
 
 
@@ -65,29 +68,404 @@ def _iter_relay_blocks(relay: list[Any]) -> list[tuple[int, dict[str, Any]]]:
     return blocks
 
 
-def _upsert_team(cur: psycopg.Cursor, team_code: str | None, team_name: str | None) -> int | None:
-    if not team_code:
-        return None
+RAW_RELAY_BLOCK_COLUMNS = (
+    "raw_game_id",
+    "block_index",
+    "title",
+    "title_style",
+    "block_no",
+    "inning_no",
+    "home_or_away",
+    "status_code",
+    "raw_block_json",
+)
+RAW_PLATE_METRIC_COLUMNS = ("raw_block_id", "home_team_win_rate", "away_team_win_rate", "wpa_by_plate")
+RAW_TEXT_EVENT_COLUMNS = (
+    "raw_block_id",
+    "event_index_in_block",
+    "seqno",
+    "type_code",
+    "text",
+    "current_game_state_json",
+    "batter_record_json",
+    "current_players_info_json",
+    "player_change_json",
+    "pitch_num",
+    "pitch_result",
+    "pts_pitch_id",
+    "speed_kph",
+    "stuff_text",
+    "raw_event_json",
+)
+RAW_PITCH_TRACK_COLUMNS = (
+    "raw_block_id",
+    "track_index_in_block",
+    "pitch_id",
+    "inn",
+    "ballcount",
+    "cross_plate_x",
+    "cross_plate_y",
+    "top_sz",
+    "bottom_sz",
+    "vx0",
+    "vy0",
+    "vz0",
+    "ax",
+    "ay",
+    "az",
+    "x0",
+    "y0",
+    "z0",
+    "stance",
+    "raw_track_json",
+)
+
+
+@dataclass
+class RawRelayBlock:
+    raw_block_id: int
+    block_index: int
+    block: dict[str, Any]
+    raw_event_ids: list[int]
+
+
+@dataclass
+class RawGameIngest:
+    """Everything ``ingest_raw_game_rows`` wrote for one game, kept so normalization can skip reading it back."""
+
+    raw_game_id: int
+    game_id: int
+    payload: dict[str, Any]
+    home_team_id: int | None
+    away_team_id: int | None
+    home_team_name: str | None
+    away_team_name: str | None
+    player_rows: list[tuple[Any, ...]]
+    roster_rows: list[tuple[Any, ...]]
+    relay_blocks: list[RawRelayBlock]
+
+
+def _optional_text(value: Any) -> str | None:
+    return str(value) if value is not None else None
+
+
+def build_relay_block_row(raw_game_id: int, block_index: int, block: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        raw_game_id,
+        block_index,
+        block.get("title"),
+        _optional_text(block.get("titleStyle")),
+        to_int(block.get("no"), None),
+        to_int(block.get("inn"), None),
+        _optional_text(block.get("homeOrAway")),
+        _optional_text(block.get("statusCode")),
+        Json(block),
+    )
+
+
+def build_plate_metric_row(raw_block_id: int, block: dict[str, Any]) -> tuple[Any, ...]:
+    metric = block.get("metricOption") or {}
+    return (
+        raw_block_id,
+        _to_float(metric.get("homeTeamWinRate")),
+        _to_float(metric.get("awayTeamWinRate")),
+        _to_float(metric.get("wpaByPlate")),
+    )
+
+
+def build_text_event_rows(raw_block_id: int, block: dict[str, Any]) -> list[tuple[Any, ...]]:
+    return [
+        (
+            raw_block_id,
+            event_idx,
+            to_int(ev.get("seqno"), None),
+            to_int(ev.get("type"), None),
+            ev.get("text"),
+            Json(ev.get("currentGameState")),
+            Json(ev.get("batterRecord")) if ev.get("batterRecord") is not None else None,
+            Json(ev.get("currentPlayersInfo")) if ev.get("currentPlayersInfo") is not None else None,
+            Json(ev.get("playerChange")) if ev.get("playerChange") is not None else None,
+            to_int(ev.get("pitchNum"), None),
+            ev.get("pitchResult"),
+            _optional_text(ev.get("ptsPitchId")),
+            _to_float(ev.get("speed")),
+            ev.get("stuff"),
+            Json(ev),
+        )
+        for event_idx, ev in enumerate(block.get("textOptions") or [], start=1)
+    ]
+
+
+def build_pitch_track_rows(raw_block_id: int, block: dict[str, Any]) -> list[tuple[Any, ...]]:
+    return [
+        (
+            raw_block_id,
+            track_index,
+            _optional_text(track.get("pitchId")),
+            to_int(track.get("inn"), None),
+            track.get("ballcount"),
+            _to_float(track.get("crossPlateX")),
+            _to_float(track.get("crossPlateY")),
+            _to_float(track.get("topSz")),
+            _to_float(track.get("bottomSz")),
+            _to_float(track.get("vx0")),
+            _to_float(track.get("vy0")),
+            _to_float(track.get("vz0")),
+            _to_float(track.get("ax")),
+            _to_float(track.get("ay")),
+            _to_float(track.get("az")),
+            _to_float(track.get("x0")),
+            _to_float(track.get("y0")),
+            _to_float(track.get("z0")),
+            track.get("stance"),
+            Json(track),
+        )
+        for track_index, track in enumerate(block.get("ptsOptions") or [], start=1)
+    ]
+
+
+def _allocate_serial_ids(cur: psycopg.Cursor, table: str, column: str, count: int) -> list[int]:
+    if count <= 0:
+        return []
+    # 행 단위 INSERT처럼 앞선 행이 작은 ID를 갖도록 정렬해서 돌려준다.
     cur.execute(
-        """
-        INSERT INTO teams (team_code, team_name_short, team_name_full)
-        VALUES (%s, %s, %s)
-        ON CONFLICT (team_code)
-        DO UPDATE SET
-            team_name_short = COALESCE(EXCLUDED.team_name_short, teams.team_name_short),
-            team_name_full = COALESCE(EXCLUDED.team_name_full, teams.team_name_full)
-        RETURNING team_id
-        """,
-        (team_code, team_name, team_name),
+        f"SELECT nextval(pg_get_serial_sequence('{table}', '{column}')) FROM generate_series(1, %s)",
+        (count,),
     )
+    return sorted(row[0] for row in cur.fetchall())
+
+
+def _allocate_event_ids(cur: psycopg.Cursor, relay_blocks: list[tuple[int, dict[str, Any]]]) -> list[list[int]]:
+    counts = [len(block.get("textOptions") or []) for _, block in relay_blocks]
+    event_ids = iter(_allocate_serial_ids(cur, "raw_text_events", "raw_event_id", sum(counts)))
+    return [[next(event_ids) for _ in range(count)] for count in counts]
+
+
+def _insert_relay_rows(
+    cur: psycopg.Cursor, raw_game_id: int, relay_blocks: list[tuple[int, dict[str, Any]]]
+) -> list[RawRelayBlock]:
+    written = []
+    # 정규화가 raw_text_events를 다시 읽지 않도록 이벤트 ID는 미리 받아 둔다.
+    event_ids_by_block = _allocate_event_ids(cur, relay_blocks)
+    for (block_index, block), raw_event_ids in zip(relay_blocks, event_ids_by_block):
+        cur.execute(
+            """
+            INSERT INTO raw_relay_blocks (
+                raw_game_id, block_index, title, title_style, block_no,
+                inning_no, home_or_away, status_code, raw_block_json
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            RETURNING raw_block_id
+            """,
+            build_relay_block_row(raw_game_id, block_index, block),
+        )
+        raw_block_id = cur.fetchone()[0]
+        written.append(RawRelayBlock(raw_block_id, block_index, block, raw_event_ids))
+
+        cur.execute(
+            """
+            INSERT INTO raw_plate_metrics (raw_block_id, home_team_win_rate, away_team_win_rate, wpa_by_plate)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (raw_block_id)
+            DO UPDATE SET
+                home_team_win_rate = EXCLUDED.home_team_win_rate,
+                away_team_win_rate = EXCLUDED.away_team_win_rate,
+                wpa_by_plate = EXCLUDED.wpa_by_plate
+            """,
+            build_plate_metric_row(raw_block_id, block),
+        )
+
+        text_event_rows = [
+            (raw_event_id, *row) for raw_event_id, row in zip(raw_event_ids, build_text_event_rows(raw_block_id, block))
+        ]
+        if text_event_rows:
+            cur.executemany(
+                """
+                INSERT INTO raw_text_events (
+                    raw_event_id, raw_block_id, event_index_in_block, seqno, type_code, text,
+                    current_game_state_json, batter_record_json, current_players_info_json,
+                    player_change_json, pitch_num, pitch_result, pts_pitch_id,
+                    speed_kph, stuff_text, raw_event_json
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                text_event_rows,
+            )
+
+        pitch_track_rows = build_pitch_track_rows(raw_block_id, block)
+        if pitch_track_rows:
+            cur.executemany(
+                """
+                INSERT INTO raw_pitch_tracks (
+                    raw_block_id, track_index_in_block, pitch_id, inn, ballcount,
+                    cross_plate_x, cross_plate_y, top_sz, bottom_sz,
+                    vx0, vy0, vz0, ax, ay, az, x0, y0, z0, stance,
+                    raw_track_json
+                ) VALUES (
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                )
+                ON CONFLICT (raw_block_id, track_index_in_block)
+                DO UPDATE SET
+                    pitch_id = EXCLUDED.pitch_id,
+                    inn = EXCLUDED.inn,
+                    ballcount = EXCLUDED.ballcount,
+                    cross_plate_x = EXCLUDED.cross_plate_x,
+                    cross_plate_y = EXCLUDED.cross_plate_y,
+                    top_sz = EXCLUDED.top_sz,
+                    bottom_sz = EXCLUDED.bottom_sz,
+                    vx0 = EXCLUDED.vx0,
+                    vy0 = EXCLUDED.vy0,
+                    vz0 = EXCLUDED.vz0,
+                    ax = EXCLUDED.ax,
+                    ay = EXCLUDED.ay,
+                    az = EXCLUDED.az,
+                    x0 = EXCLUDED.x0,
+                    y0 = EXCLUDED.y0,
+                    z0 = EXCLUDED.z0,
+                    stance = EXCLUDED.stance,
+                    raw_track_json = EXCLUDED.raw_track_json
+                """,
+                pitch_track_rows,
+            )
+    return written
+
+
+def _copy_rows(cur: psycopg.Cursor, table: str, columns: tuple[str, ...], rows: Iterable[tuple[Any, ...]]) -> None:
+    with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+
+
+def _copy_relay_rows(
+    cur: psycopg.Cursor, raw_game_id: int, relay_blocks: list[tuple[int, dict[str, Any]]]
+) -> list[RawRelayBlock]:
+    if not relay_blocks:
+        return []
+    # 블록/이벤트 ID를 한 번에 받아 두면 자식 테이블 행도 왕복 없이 COPY로 흘려보낼 수 있다.
+    # 행 단위 경로와 같은 순서로 받으므로 두 경로가 같은 ID를 준다.
+    event_ids_by_block = _allocate_event_ids(cur, relay_blocks)
+    block_ids = _allocate_serial_ids(cur, "raw_relay_blocks", "raw_block_id", len(relay_blocks))
+    written = [
+        RawRelayBlock(raw_block_id, block_index, block, raw_event_ids)
+        for raw_block_id, (block_index, block), raw_event_ids in zip(block_ids, relay_blocks, event_ids_by_block)
+    ]
+    blocks = [(item.raw_block_id, item.block_index, item.block) for item in written]
+
+    _copy_rows(
+        cur,
+        "raw_relay_blocks",
+        ("raw_block_id", *RAW_RELAY_BLOCK_COLUMNS),
+        ((raw_block_id, *build_relay_block_row(raw_game_id, block_index, block)) for raw_block_id, block_index, block in blocks),
+    )
+    # 방금 받은 블록 ID라 충돌할 기존 행이 없으므로 행 단위 경로의 ON CONFLICT는 필요 없다.
+    _copy_rows(cur, "raw_plate_metrics", RAW_PLATE_METRIC_COLUMNS, (build_plate_metric_row(raw_block_id, block) for raw_block_id, _, block in blocks))
+    _copy_rows(
+        cur,
+        "raw_text_events",
+        ("raw_event_id", *RAW_TEXT_EVENT_COLUMNS),
+        (
+            (raw_event_id, *row)
+            for item in written
+            for raw_event_id, row in zip(item.raw_event_ids, build_text_event_rows(item.raw_block_id, item.block))
+        ),
+    )
+    _copy_rows(
+        cur,
+        "raw_pitch_tracks",
+        RAW_PITCH_TRACK_COLUMNS,
+        (row for raw_block_id, _, block in blocks for row in build_pitch_track_rows(raw_block_id, block)),
+    )
+    return written
+
+
+_UPSERT_TEAM_SQL = """
+    INSERT INTO teams (team_code, team_name_short, team_name_full)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (team_code)
+    DO UPDATE SET
+        team_name_short = COALESCE(EXCLUDED.team_name_short, teams.team_name_short),
+        team_name_full = COALESCE(EXCLUDED.team_name_full, teams.team_name_full)
+    RETURNING team_id
+"""
+_UPSERT_STADIUM_SQL = """
+    INSERT INTO stadiums (stadium_name)
+    VALUES (%s)
+    ON CONFLICT (stadium_name) DO UPDATE SET stadium_name = EXCLUDED.stadium_name
+    RETURNING stadium_id
+"""
+
+
+def _upsert_team(cur: psycopg.Cursor, team_code: str | None, team_name: str | None, *, upsert: bool = True) -> int | None:
+    if not team_code:
+        return None
+    if not upsert:
+        cur.execute("SELECT team_id FROM teams WHERE team_code = %s", (team_code,))
+        row = cur.fetchone()
+        if row is None:
+            raise ValueError(f"team {team_code!r} is missing; run upsert_game_dimensions first")
+        return row[0]
+    cur.execute(_UPSERT_TEAM_SQL, (team_code, team_name, team_name))
+    return cur.fetchone()[0]
+
+
+def _upsert_stadium(cur: psycopg.Cursor, stadium_name: str | None, *, upsert: bool = True) -> int | None:
+    if not stadium_name:
+        return None
+    if not upsert:
+        cur.execute("SELECT stadium_id FROM stadiums WHERE stadium_name = %s", (stadium_name,))
+        row = cur.fetchone()
+        if row is None:
+            raise ValueError(f"stadium {stadium_name!r} is missing; run upsert_game_dimensions first")
+        return row[0]
+    cur.execute(_UPSERT_STADIUM_SQL, (stadium_name,))
     return cur.fetchone()[0]
 
 
-def _upsert_player(cur: psycopg.Cursor, row: dict[str, Any]) -> None:
+def _game_teams(game_info: dict[str, Any]) -> tuple[tuple[Any, Any], tuple[Any, Any]]:
+    home_code = first_non_empty(game_info.get("hCode"), game_info.get("homeTeamCode"))
+    away_code = first_non_empty(game_info.get("aCode"), game_info.get("awayTeamCode"))
+    home_name = first_non_empty(game_info.get("hName"), game_info.get("homeTeamName"))
+    away_name = first_non_empty(game_info.get("aName"), game_info.get("awayTeamName"))
+    return (home_code, home_name), (away_code, away_name)
+
+
+def game_source_key(game_info: dict[str, Any]) -> str:
+    """``games.source_game_key`` for a game's ``lineup.game_info``."""
+    (home_code, _), (away_code, _) = _game_teams(game_info)
+    raw_game_date = first_non_empty(game_info.get("gdate"), game_info.get("gameDate"), game_info.get("date"))
+    return "_".join(
+        [
+            str(raw_game_date or ""),
+            str(away_code or ""),
+            str(home_code or ""),
+            str(first_non_empty(game_info.get("gameFlag"), "")),
+            str(first_non_empty(game_info.get("round"), "")),
+        ]
+    )
+
+
+def _player_row(row: dict[str, Any]) -> tuple[Any, ...] | None:
     player_id = str(first_non_empty(row.get("playerCode"), row.get("pcode"), row.get("playerId")) or "")
     if not player_id:
+        return None
+    return (
+        player_id,
+        first_non_empty(row.get("playerName"), row.get("name")),
+        first_non_empty(row.get("throwBat"), row.get("throws"), row.get("batsThrows")),
+        first_non_empty(row.get("hitType"), row.get("bats")),
+        to_int(row.get("height"), None),
+        to_int(row.get("weight"), None),
+    )
+
+
+def _player_rows(rows: Iterable[dict[str, Any]]) -> list[tuple[Any, ...]]:
+    return [player_row for player_row in map(_player_row, rows) if player_row is not None]
+
+
+def _upsert_players(cur: psycopg.Cursor, player_rows: list[tuple[Any, ...]]) -> None:
+    # 같은 선수가 여러 번 나오면 행 순서대로 덮어쓰므로 목록 순서를 그대로 유지한다.
+    if not player_rows:
         return
-    cur.execute(
+    cur.executemany(
         """
         INSERT INTO players (player_id, player_name, bats_throws_text, hit_type_text, height, weight)
         VALUES (%s, %s, %s, %s, %s, %s)
@@ -99,17 +477,23 @@ def _upsert_player(cur: psycopg.Cursor, row: dict[str, Any]) -> None:
             height = COALESCE(EXCLUDED.height, players.height),
             weight = COALESCE(EXCLUDED.weight, players.weight)
         """,
-        (
-            player_id,
-            first_non_empty(row.get("playerName"), row.get("name")),
-            first_non_empty(row.get("throwBat"), row.get("throws"), row.get("batsThrows")),
-            first_non_empty(row.get("hitType"), row.get("bats")),
-            to_int(row.get("height"), None),
-            to_int(row.get("weight"), None),
-        ),
+        player_rows,
     )
 
 
+def _lineup_rows(lineup: dict[str, Any]) -> list[tuple[str, str, dict[str, Any]]]:
+    return [
+        (side, group, row)
+        for side in ("home", "away")
+        for group in ("starter", "bullpen", "candidate")
+        for row in lineup.get(f"{side}_{group}") or []
+    ]
+
+
+def _game_player_rows(lineup: dict[str, Any], record: dict[str, Any]) -> list[tuple[Any, ...]]:
+    return _player_rows([row for _, _, row in _lineup_rows(lineup)] + [row for _, row in _iter_record_player_rows(record)])
+
+
 def _iter_record_player_rows(record: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
     rows: list[tuple[str, dict[str, Any]]] = []
     for side in ("home", "away"):
@@ -122,7 +506,7 @@ def _iter_record_player_rows(record: dict[str, Any]) -> list[tuple[str, dict[str
     return rows
 
 
-def _delete_existing_normalized_rows(cur: psycopg.Cursor, game_id: int) -> None:
+def delete_existing_normalized_rows(cur: psycopg.Cursor, game_id: int) -> None:
     cur.execute("DELETE FROM substitution_events WHERE game_id = %s", (game_id,))
     cur.execute("DELETE FROM review_events WHERE game_id = %s", (game_id,))
     cur.execute("DELETE FROM baserunning_events WHERE game_id = %s", (game_id,))
@@ -137,9 +521,30 @@ def _delete_existing_normalized_rows(cur: psycopg.Cursor, game_id: int) -> None:
     cur.execute("DELETE FROM innings WHERE game_id = %s", (game_id,))
 
 
-def ingest_raw_game(conn: psycopg.Connection, json_path: Path) -> tuple[int, int]:
+def ingest_raw_game(conn: psycopg.Connection, json_path: Path, *, bulk: bool = True) -> tuple[int, int]:
+    """Load one game file into the raw tables and upsert its game/roster rows.
+
+    ``bulk`` streams the relay tables through ``COPY``; ``bulk=False`` keeps the row-by-row
+    ``INSERT`` path. Both leave identical rows behind.
+    """
+    ingested = ingest_raw_game_rows(conn, json_path, bulk=bulk)
+    return ingested.raw_game_id, ingested.game_id
+
+
+def ingest_raw_game_rows(
+    conn: psycopg.Connection,
+    json_path: Path,
+    *,
+    bulk: bool = True,
+    upsert_dimensions: bool = True,
+) -> RawGameIngest:
+    """``ingest_raw_game`` that also returns the parsed payload and the IDs it assigned.
+
+    With ``upsert_dimensions=False`` teams and stadiums are only looked up and players are not
+    written, so parallel loaders can share those rows after ``upsert_game_dimensions``.
+    """
     payload = load_game_payload(json_path)
-    file_hash = _file_hash(json_path)
+    file_hash = compute_file_hash(json_path)
     lineup = payload.get("lineup") or {}
     record = payload.get("record") or {}
     game_info = lineup.get("game_info") or {}
@@ -151,7 +556,8 @@ def ingest_raw_game(conn: psycopg.Connection, json_path: Path) -> tuple[int, int
     )
     cancel_flag = _to_bool_flag(first_non_empty(game_info.get("cancelFlag"), game_info.get("cancel")), default=False)
 
-    with conn.cursor() as cur:
+    # RETURNING 값을 바로 쓰는 문장만 결과를 기다리고, 나머지는 파이프라인으로 이어서 보낸다.
+    with conn.cursor() as cur, pipeline_mode(conn):
         cur.execute(
             """
             INSERT INTO raw_games (source_file_name, source_file_hash, raw_json)
@@ -166,37 +572,14 @@ def ingest_raw_game(conn: psycopg.Connection, json_path: Path) -> tuple[int, int
         )
         raw_game_id = cur.fetchone()[0]
 
-        home_code = first_non_empty(game_info.get("hCode"), game_info.get("homeTeamCode"))
-        away_code = first_non_empty(game_info.get("aCode"), game_info.get("awayTeamCode"))
-        home_name = first_non_empty(game_info.get("hName"), game_info.get("homeTeamName"))
-        away_name = first_non_empty(game_info.get("aName"), game_info.get("awayTeamName"))
-
-        home_team_id = _upsert_team(cur, str(home_code) if home_code else None, home_name)
-        away_team_id = _upsert_team(cur, str(away_code) if away_code else None, away_name)
+        (home_code, home_name), (away_code, away_name) = _game_teams(game_info)
+        home_team_id = _upsert_team(cur, str(home_code) if home_code else None, home_name, upsert=upsert_dimensions)
+        away_team_id = _upsert_team(cur, str(away_code) if away_code else None, away_name, upsert=upsert_dimensions)
 
         stadium_name = first_non_empty(game_info.get("stadium"), game_info.get("stadiumName"))
-        stadium_id = None
-        if stadium_name:
-            cur.execute(
-                """
-                INSERT INTO stadiums (stadium_name)
-                VALUES (%s)
-                ON CONFLICT (stadium_name) DO UPDATE SET stadium_name = EXCLUDED.stadium_name
-                RETURNING stadium_id
-                """,
-                (stadium_name,),
-            )
-            stadium_id = cur.fetchone()[0]
-
-        source_game_key = "_".join(
-            [
-                str(raw_game_date or ""),
-                str(away_code or ""),
-                str(home_code or ""),
-                str(first_non_empty(game_info.get("gameFlag"), "")),
-                str(first_non_empty(game_info.get("round"), "")),
-            ]
-        )
+        stadium_id = _upsert_stadium(cur, stadium_name, upsert=upsert_dimensions)
+
+        source_game_key = game_source_key(game_info)
 
         cur.execute(
             """
@@ -238,52 +621,43 @@ def ingest_raw_game(conn: psycopg.Connection, json_path: Path) -> tuple[int, int
         )
         game_id = cur.fetchone()[0]
 
-        _delete_existing_normalized_rows(cur, game_id)
+        delete_existing_normalized_rows(cur, game_id)
         cur.execute("DELETE FROM game_roster_entries WHERE game_id = %s", (game_id,))
+        roster_rows: list[tuple[Any, ...]] = []
         roster_player_ids: set[str] = set()
+        team_id_by_side = {"home": home_team_id, "away": away_team_id}
 
-        for side, team_id in (("home", home_team_id), ("away", away_team_id)):
-            for group in ("starter", "bullpen", "candidate"):
-                rows = lineup.get(f"{side}_{group}") or []
-                for row in rows:
-                    _upsert_player(cur, row)
-                    pid = str(first_non_empty(row.get("playerCode"), row.get("pcode"), row.get("playerId")) or "") or None
-                    if pid:
-                        roster_player_ids.add(pid)
-                    cur.execute(
-                        """
-                        INSERT INTO game_roster_entries (
-                            game_id, team_id, player_id, roster_group, is_starting_pitcher,
-                            batting_order_slot, field_position_code, field_position_name, back_number
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """,
-                        (
-                            game_id,
-                            team_id,
-                            pid,
-                            group,
-                            bool(str(row.get("position")) == "1" and group == "starter"),
-                            to_int(first_non_empty(row.get("batOrder"), row.get("bo")), None),
-                            str(row.get("position")) if row.get("position") is not None else None,
-                            first_non_empty(row.get("positionName"), row.get("positionText")),
-                            first_non_empty(row.get("backNo"), row.get("backnum")),
-                        ),
-                    )
+        lineup_rows = _lineup_rows(lineup)
+        record_rows = _iter_record_player_rows(record)
+        player_rows = _game_player_rows(lineup, record)
+        # 로스터가 참조하는 선수를 먼저 모두 넣는다. 선수 upsert 순서는 기존 행 단위 경로와 같다.
+        if upsert_dimensions:
+            _upsert_players(cur, player_rows)
 
-        team_id_by_side = {"home": home_team_id, "away": away_team_id}
-        for side, row in _iter_record_player_rows(record):
-            _upsert_player(cur, row)
+        for side, group, row in lineup_rows:
+            pid = str(first_non_empty(row.get("playerCode"), row.get("pcode"), row.get("playerId")) or "") or None
+            if pid:
+                roster_player_ids.add(pid)
+            roster_rows.append(
+                (
+                    game_id,
+                    team_id_by_side[side],
+                    pid,
+                    group,
+                    bool(str(row.get("position")) == "1" and group == "starter"),
+                    to_int(first_non_empty(row.get("batOrder"), row.get("bo")), None),
+                    str(row.get("position")) if row.get("position") is not None else None,
+                    first_non_empty(row.get("positionName"), row.get("positionText")),
+                    first_non_empty(row.get("backNo"), row.get("backnum")),
+                )
+            )
+
+        for side, row in record_rows:
             pid = str(first_non_empty(row.get("playerCode"), row.get("pcode"), row.get("playerId")) or "") or None
             if not pid or pid in roster_player_ids:
                 continue
             roster_player_ids.add(pid)
-            cur.execute(
-                """
-                INSERT INTO game_roster_entries (
-                    game_id, team_id, player_id, roster_group, is_starting_pitcher,
-                    batting_order_slot, field_position_code, field_position_name, back_number
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
+            roster_rows.append(
                 (
                     game_id,
                     team_id_by_side.get(side),
@@ -294,139 +668,84 @@ def ingest_raw_game(conn: psycopg.Connection, json_path: Path) -> tuple[int, int
                     None,
                     None,
                     None,
-                ),
+                )
             )
 
-        cur.execute("DELETE FROM raw_relay_blocks WHERE raw_game_id = %s", (raw_game_id,))
-
-        block_id_map: dict[int, int] = {}
-        for block_index, block in _iter_relay_blocks(payload.get("relay") or []):
-            cur.execute(
+        if roster_rows:
+            cur.executemany(
                 """
-                INSERT INTO raw_relay_blocks (
-                    raw_game_id, block_index, title, title_style, block_no,
-                    inning_no, home_or_away, status_code, raw_block_json
+                INSERT INTO game_roster_entries (
+                    game_id, team_id, player_id, roster_group, is_starting_pitcher,
+                    batting_order_slot, field_position_code, field_position_name, back_number
                 ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING raw_block_id
                 """,
-                (
-                    raw_game_id,
-                    block_index,
-                    block.get("title"),
-                    str(block.get("titleStyle")) if block.get("titleStyle") is not None else None,
-                    to_int(block.get("no"), None),
-                    to_int(block.get("inn"), None),
-                    str(block.get("homeOrAway")) if block.get("homeOrAway") is not None else None,
-                    str(block.get("statusCode")) if block.get("statusCode") is not None else None,
-                    Json(block),
-                ),
+                roster_rows,
             )
-            raw_block_id = cur.fetchone()[0]
-            block_id_map[block_index] = raw_block_id
 
-            metric = block.get("metricOption") or {}
-            cur.execute(
-                """
-                INSERT INTO raw_plate_metrics (raw_block_id, home_team_win_rate, away_team_win_rate, wpa_by_plate)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (raw_block_id)
-                DO UPDATE SET
-                    home_team_win_rate = EXCLUDED.home_team_win_rate,
-                    away_team_win_rate = EXCLUDED.away_team_win_rate,
-                    wpa_by_plate = EXCLUDED.wpa_by_plate
-                """,
-                (
-                    raw_block_id,
-                    _to_float(metric.get("homeTeamWinRate")),
-                    _to_float(metric.get("awayTeamWinRate")),
-                    _to_float(metric.get("wpaByPlate")),
-                ),
-            )
+        cur.execute("DELETE FROM raw_relay_blocks WHERE raw_game_id = %s", (raw_game_id,))
+        relay_blocks = _iter_relay_blocks(payload.get("relay") or [])
+        if not bulk:
+            written_blocks = _insert_relay_rows(cur, raw_game_id, relay_blocks)
+
+    # COPY는 파이프라인 안에서 실행할 수 없으므로 파이프라인을 닫은 뒤 보낸다.
+    if bulk:
+        with conn.cursor() as cur:
+            written_blocks = _copy_relay_rows(cur, raw_game_id, relay_blocks)
+
+    return RawGameIngest(
+        raw_game_id=raw_game_id,
+        game_id=game_id,
+        payload=payload,
+        home_team_id=home_team_id,
+        away_team_id=away_team_id,
+        home_team_name=home_name,
+        away_team_name=away_name,
+        player_rows=player_rows,
+        roster_rows=roster_rows,
+        relay_blocks=written_blocks,
+    )
 
-            for event_idx, ev in enumerate(block.get("textOptions") or [], start=1):
-                cur.execute(
-                    """
-                    INSERT INTO raw_text_events (
-                        raw_block_id, event_index_in_block, seqno, type_code, text,
-                        current_game_state_json, batter_record_json, current_players_info_json,
-                        player_change_json, pitch_num, pitch_result, pts_pitch_id,
-                        speed_kph, stuff_text, raw_event_json
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        raw_block_id,
-                        event_idx,
-                        to_int(ev.get("seqno"), None),
-                        to_int(ev.get("type"), None),
-                        ev.get("text"),
-                        Json(ev.get("currentGameState")),
-                        Json(ev.get("batterRecord")) if ev.get("batterRecord") is not None else None,
-                        Json(ev.get("currentPlayersInfo")) if ev.get("currentPlayersInfo") is not None else None,
-                        Json(ev.get("playerChange")) if ev.get("playerChange") is not None else None,
-                        to_int(ev.get("pitchNum"), None),
-                        ev.get("pitchResult"),
-                        str(ev.get("ptsPitchId")) if ev.get("ptsPitchId") is not None else None,
-                        _to_float(ev.get("speed")),
-                        ev.get("stuff"),
-                        Json(ev),
-                    ),
-                )
 
-            for track_index, track in enumerate(block.get("ptsOptions") or [], start=1):
-                cur.execute(
-                    """
-                    INSERT INTO raw_pitch_tracks (
-                        raw_block_id, track_index_in_block, pitch_id, inn, ballcount,
-                        cross_plate_x, cross_plate_y, top_sz, bottom_sz,
-                        vx0, vy0, vz0, ax, ay, az, x0, y0, z0, stance,
-                        raw_track_json
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                    ON CONFLICT (raw_block_id, track_index_in_block)
-                    DO UPDATE SET
-                        pitch_id = EXCLUDED.pitch_id,
-                        inn = EXCLUDED.inn,
-                        ballcount = EXCLUDED.ballcount,
-                        cross_plate_x = EXCLUDED.cross_plate_x,
-                        cross_plate_y = EXCLUDED.cross_plate_y,
-                        top_sz = EXCLUDED.top_sz,
-                        bottom_sz = EXCLUDED.bottom_sz,
-                        vx0 = EXCLUDED.vx0,
-                        vy0 = EXCLUDED.vy0,
-                        vz0 = EXCLUDED.vz0,
-                        ax = EXCLUDED.ax,
-                        ay = EXCLUDED.ay,
-                        az = EXCLUDED.az,
-                        x0 = EXCLUDED.x0,
-                        y0 = EXCLUDED.y0,
-                        z0 = EXCLUDED.z0,
-                        stance = EXCLUDED.stance,
-                        raw_track_json = EXCLUDED.raw_track_json
-                    """,
-                    (
-                        raw_block_id,
-                        track_index,
-                        str(track.get("pitchId")) if track.get("pitchId") is not None else None,
-                        to_int(track.get("inn"), None),
-                        track.get("ballcount"),
-                        _to_float(track.get("crossPlateX")),
-                        _to_float(track.get("crossPlateY")),
-                        _to_float(track.get("topSz")),
-                        _to_float(track.get("bottomSz")),
-                        _to_float(track.get("vx0")),
-                        _to_float(track.get("vy0")),
-                        _to_float(track.get("vz0")),
-                        _to_float(track.get("ax")),
-                        _to_float(track.get("ay")),
-                        _to_float(track.get("az")),
-                        _to_float(track.get("x0")),
-                        _to_float(track.get("y0")),
-                        _to_float(track.get("z0")),
-                        track.get("stance"),
-                        Json(track),
-                    ),
-                )
+GameDimensionRows = tuple[list[tuple[Any, ...]], list[tuple[Any, ...]], list[tuple[Any, ...]]]
 
-    return raw_game_id, game_id
+
+def game_dimension_rows(json_path: Path) -> GameDimensionRows:
+    """Team, stadium and player rows of one game file; only ``lineup`` and ``record`` are decoded."""
+    document = LazyGameDocument.open(json_path)
+    payload = minimize_game_payload({"lineup": document.lineup, "record": document.record}, file_path=Path(json_path))
+    lineup = payload.get("lineup") or {}
+    game_info = lineup.get("game_info") or {}
+    team_rows = [(str(team_code), team_name, team_name) for team_code, team_name in _game_teams(game_info) if team_code]
+    stadium_name = first_non_empty(game_info.get("stadium"), game_info.get("stadiumName"))
+    stadium_rows = [(stadium_name,)] if stadium_name else []
+    return team_rows, stadium_rows, _game_player_rows(lineup, payload.get("record") or {})
+
+
+def upsert_dimension_rows(conn: psycopg.Connection, rows_by_file: Iterable[GameDimensionRows]) -> int:
+    """Upsert ``game_dimension_rows`` results in the given order; returns the number of files."""
+    team_rows: list[tuple[Any, ...]] = []
+    stadium_rows: list[tuple[Any, ...]] = []
+    player_rows: list[tuple[Any, ...]] = []
+    file_count = 0
+    for teams, stadiums, players in rows_by_file:
+        team_rows.extend(teams)
+        stadium_rows.extend(stadiums)
+        player_rows.extend(players)
+        file_count += 1
+
+    with conn.cursor() as cur, pipeline_mode(conn):
+        if team_rows:
+            cur.executemany(_UPSERT_TEAM_SQL, team_rows)
+        if stadium_rows:
+            cur.executemany(_UPSERT_STADIUM_SQL, stadium_rows)
+        _upsert_players(cur, player_rows)
+    return file_count
+
+
+def upsert_game_dimensions(conn: psycopg.Connection, json_paths: Iterable[Path]) -> int:
+    """Upsert the teams, stadiums and players of ``json_paths`` in order, as loading them one by one would.
+
+    Only ``lineup`` and ``record`` are decoded from each file, but every file is still read once here
+    before it is loaded. Returns the number of files read.
+    """
+    return upsert_dimension_rows(conn, map(game_dimension_rows, json_paths))
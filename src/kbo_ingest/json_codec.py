@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성이며 없으면 표준 json만 사용한다.
+    orjson = None
+
+
+CODEC_ENV_VAR = "KBO_JSON_CODEC"
+CODEC_NAMES = ("auto", "stdlib", "orjson")
+
+# 표준 json은 이 범위 밖의 실수를 1e-05, 1e+16처럼 쓰지만 orjson은 0.00001, 1e16처럼 쓴다.
+_PLAIN_FLOAT_MIN = 1e-4
+_PLAIN_FLOAT_MAX = 1e16
+# orjson은 254단계보다 깊은 중첩을 거부한다. 순환 참조도 이 깊이에서 걸러진다.
+_MAX_DEPTH = 250
+# iter_pretty는 이 깊이까지의 컨테이너를 멤버별로 나눠 직렬화한다. 경기 JSON에서는 relay 블록 하나가 한 조각이 된다.
+_CHUNK_DEPTH = 3
+
+
+class StdlibJsonCodec:
+    """Reference codec: the ``json`` module settings game files have always been written with."""
+
+    name = "stdlib"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data.decode("utf-8") if isinstance(data, bytes) else data)
+
+    def dumps_pretty(self, value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, indent=2)
+
+    def iter_pretty(self, value: Any) -> Iterator[str]:
+        yield from json.JSONEncoder(ensure_ascii=False, indent=2).iterencode(value)
+
+
+class OrjsonCodec(StdlibJsonCodec):
+    """orjson-backed codec whose results are always identical to :class:`StdlibJsonCodec`.
+
+    Values orjson would render or parse differently (floats the stdlib writes in exponent form or as
+    NaN/Infinity, integers beyond 64 bits, non-string keys, subclasses and other non-JSON types, very
+    deep nesting) are handed to the stdlib instead, as is any input orjson rejects.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ValueError("orjson JSON codec requires the 'orjson' package")
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            value = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN, 1e400, 짝 없는 서로게이트, BOM처럼 orjson이 거부하는 입력은 표준 json의 판단을 따른다.
+            return super().loads(data)
+        # orjson은 64비트를 넘는 정수를 실수로 읽으므로 범위 밖 실수가 보이면 표준 json으로 다시 읽는다.
+        return value if _orjson_compatible(value, 0) else super().loads(data)
+
+    def dumps_pretty(self, value: Any) -> str:
+        if _orjson_compatible(value, 0):
+            try:
+                return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+            except TypeError:
+                pass
+        return super().dumps_pretty(value)
+
+    def iter_pretty(self, value: Any) -> Iterator[str]:
+        # 조각을 내보낸 뒤에는 표준 json으로 되돌릴 수 없으므로 호환 여부를 먼저 전부 확인한다.
+        if _orjson_compatible(value, 0):
+            yield from _iter_orjson_pretty(value, 0)
+        else:
+            yield from super().iter_pretty(value)
+
+
+def _iter_orjson_pretty(value: Any, depth: int) -> Iterator[str]:
+    """Pretty text of ``value`` at nesting ``depth``, split per member of its outer containers."""
+    kind = type(value)
+    if depth >= _CHUNK_DEPTH or not (kind is dict or kind is list or kind is tuple) or not value:
+        text = orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+        # JSON 문자열 안에는 줄바꿈이 그대로 들어갈 수 없으므로 줄 앞에 들여쓰기를 붙여도 값이 바뀌지 않는다.
+        yield text.replace("\n", "\n" + "  " * depth) if depth else text
+        return
+    indent = "\n" + "  " * (depth + 1)
+    if kind is dict:
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            yield ("," if index else "") + indent + orjson.dumps(key).decode("utf-8") + ": "
+            yield from _iter_orjson_pretty(item, depth + 1)
+        yield "\n" + "  " * depth + "}"
+        return
+    yield "["
+    for index, item in enumerate(value):
+        yield ("," if index else "") + indent
+        yield from _iter_orjson_pretty(item, depth + 1)
+    yield "\n" + "  " * depth + "]"
+
+
+def _orjson_compatible(value: Any, depth: int) -> bool:
+    if depth > _MAX_DEPTH:
+        return False
+    kind = type(value)
+    if kind is dict:
+        if not all(type(key) is str for key in value):
+            return False
+        items = value.values()
+    elif kind is list or kind is tuple:
+        items = value
+    else:
+        return _orjson_compatible([value], depth)
+    for item in items:
+        kind = type(item)
+        if kind is str or kind is int or kind is bool or item is None:
+            continue
+        if kind is float:
+            if not (_PLAIN_FLOAT_MIN <= abs(item) < _PLAIN_FLOAT_MAX or item == 0.0):
+                return False
+        elif kind is dict or kind is list or kind is tuple:
+            if not _orjson_compatible(item, depth + 1):
+                return False
+        else:
+            return False
+    return True
+
+
+_codec_lock = threading.Lock()
+_active_codec: StdlibJsonCodec | None = None
+
+
+def available_codecs() -> tuple[str, ...]:
+    return ("stdlib", "orjson") if orjson is not None else ("stdlib",)
+
+
+def create_json_codec(name: str = "auto") -> StdlibJsonCodec:
+    """Build a codec by name; ``auto`` picks orjson when it is installed and the stdlib otherwise."""
+    name = (name or "auto").strip().lower()
+    if name not in CODEC_NAMES:
+        raise ValueError(f"unknown JSON codec {name!r}; expected one of {', '.join(CODEC_NAMES)}")
+    if name == "orjson" or (name == "auto" and orjson is not None):
+        return OrjsonCodec()
+    return StdlibJsonCodec()
+
+
+def get_json_codec() -> StdlibJsonCodec:
+    global _active_codec
+    with _codec_lock:
+        if _active_codec is None:
+            _active_codec = create_json_codec(os.environ.get(CODEC_ENV_VAR, "auto"))
+        return _active_codec
+
+
+def set_json_codec(codec: StdlibJsonCodec | str | None) -> StdlibJsonCodec | None:
+    """Replace the process-wide codec and return the previous one; ``None`` re-reads ``KBO_JSON_CODEC``."""
+    global _active_codec
+    replacement = create_json_codec(codec) if isinstance(codec, str) else codec
+    with _codec_lock:
+        previous, _active_codec = _active_codec, replacement
+    return previous
+
+
+def loads(data: bytes | str) -> Any:
+    return get_json_codec().loads(data)
+
+
+def dumps_pretty(value: Any) -> str:
+    return get_json_codec().dumps_pretty(value)
+
+
+def iter_pretty(value: Any) -> Iterator[str]:
+    return get_json_codec().iter_pretty(value)
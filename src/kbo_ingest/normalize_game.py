@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 import re
 from typing import Any
 
 try:
     import psycopg
+
+    from .db import pipeline_mode
+    from .ingest_raw import RawGameIngest, build_pitch_track_rows, build_plate_metric_row, build_relay_block_row, build_text_event_rows
 except ModuleNotFoundError:  # pragma: no cover - test env fallback
     psycopg = Any  # type: ignore[assignment]
+
+    def pipeline_mode(conn: Any) -> Any:  # type: ignore[misc]
+        return nullcontext()
 try:
     from psycopg.types.json import Json
 except ModuleNotFoundError:  # pragma: no cover - test env fallback
@@ -191,7 +198,7 @@ def _is_bat_result_text(text: str) -> bool:
     return any(keyword in desc for keyword in BAT_RESULT_KEYWORDS)
 
 
-def _ensure_pa_event_runner_columns(conn: psycopg.Connection, cur: psycopg.Cursor) -> None:
+def ensure_pa_event_runner_columns(conn: psycopg.Connection, cur: psycopg.Cursor) -> None:
     conn_key = id(conn)
     if conn_key in _PA_RUNNER_COLUMNS_READY_BY_CONN:
         return
@@ -204,6 +211,11 @@ def _ensure_pa_event_runner_columns(conn: psycopg.Connection, cur: psycopg.Curso
     _PA_RUNNER_COLUMNS_READY_BY_CONN.add(conn_key)
 
 
+def mark_pa_event_runner_columns_ready(conn: psycopg.Connection) -> None:
+    """Skip the pa_events ALTERs on ``conn``; the caller already ensured the columns on another connection."""
+    _PA_RUNNER_COLUMNS_READY_BY_CONN.add(id(conn))
+
+
 @dataclass
 class EventRec:
     raw_event_id: int
@@ -316,46 +328,45 @@ def _fetch_events(cur: psycopg.Cursor, raw_game_id: int) -> list[EventRec]:
         (raw_game_id,),
     )
 
-    events: list[EventRec] = []
-    for row in cur.fetchall():
-        cgs = row[7] or {}
-        b1, b2, b3 = _bases_from_state(cgs)
-        txt = row[6]
-        events.append(
-            EventRec(
-                raw_event_id=row[0],
-                raw_block_id=row[1],
-                inning_no=row[2],
-                half=_normalize_half(row[3]),
-                seqno=row[4],
-                type_code=row[5],
-                text=txt,
-                batter_id=str(first_non_empty(cgs.get("batter"), (row[14] or {}).get("batterRecord", {}).get("pcode")) or "") or None,
-                pitcher_id=str(first_non_empty(cgs.get("pitcher")) or "") or None,
-                outs=to_int(first_non_empty(cgs.get("out"), cgs.get("outCount"), cgs.get("outs")), None),
-                balls=to_int(first_non_empty(cgs.get("ball"), cgs.get("ballCount"), cgs.get("balls")), None),
-                strikes=to_int(first_non_empty(cgs.get("strike"), cgs.get("strikeCount"), cgs.get("strikes")), None),
-                base1=b1,
-                base2=b2,
-                base3=b3,
-                home_score=to_int(first_non_empty(cgs.get("homeTeamScore"), cgs.get("homeScore")), None),
-                away_score=to_int(first_non_empty(cgs.get("awayTeamScore"), cgs.get("awayScore")), None),
-                home_hits=to_int(first_non_empty(cgs.get("homeHit"), cgs.get("homeHits")), None),
-                away_hits=to_int(first_non_empty(cgs.get("awayHit"), cgs.get("awayHits")), None),
-                home_errors=to_int(first_non_empty(cgs.get("homeError"), cgs.get("homeErrors")), None),
-                away_errors=to_int(first_non_empty(cgs.get("awayError"), cgs.get("awayErrors")), None),
-                home_ball_four=to_int(first_non_empty(cgs.get("homeBallFour"), cgs.get("homeWalks")), None),
-                away_ball_four=to_int(first_non_empty(cgs.get("awayBallFour"), cgs.get("awayWalks")), None),
-                pitch_num=row[8],
-                pitch_result=row[9],
-                pts_pitch_id=row[10],
-                speed_kph=row[11],
-                stuff_text=row[12],
-                category=classify_event(txt, row[8], row[9], row[10], row[13], row[5]),
-                raw_payload=row[14] or {},
-            )
-        )
-    return events
+    return [_event_rec_from_row(row) for row in cur.fetchall()]
+
+
+def _event_rec_from_row(row: tuple[Any, ...]) -> EventRec:
+    cgs = row[7] or {}
+    b1, b2, b3 = _bases_from_state(cgs)
+    txt = row[6]
+    return EventRec(
+        raw_event_id=row[0],
+        raw_block_id=row[1],
+        inning_no=row[2],
+        half=_normalize_half(row[3]),
+        seqno=row[4],
+        type_code=row[5],
+        text=txt,
+        batter_id=str(first_non_empty(cgs.get("batter"), (row[14] or {}).get("batterRecord", {}).get("pcode")) or "") or None,
+        pitcher_id=str(first_non_empty(cgs.get("pitcher")) or "") or None,
+        outs=to_int(first_non_empty(cgs.get("out"), cgs.get("outCount"), cgs.get("outs")), None),
+        balls=to_int(first_non_empty(cgs.get("ball"), cgs.get("ballCount"), cgs.get("balls")), None),
+        strikes=to_int(first_non_empty(cgs.get("strike"), cgs.get("strikeCount"), cgs.get("strikes")), None),
+        base1=b1,
+        base2=b2,
+        base3=b3,
+        home_score=to_int(first_non_empty(cgs.get("homeTeamScore"), cgs.get("homeScore")), None),
+        away_score=to_int(first_non_empty(cgs.get("awayTeamScore"), cgs.get("awayScore")), None),
+        home_hits=to_int(first_non_empty(cgs.get("homeHit"), cgs.get("homeHits")), None),
+        away_hits=to_int(first_non_empty(cgs.get("awayHit"), cgs.get("awayHits")), None),
+        home_errors=to_int(first_non_empty(cgs.get("homeError"), cgs.get("homeErrors")), None),
+        away_errors=to_int(first_non_empty(cgs.get("awayError"), cgs.get("awayErrors")), None),
+        home_ball_four=to_int(first_non_empty(cgs.get("homeBallFour"), cgs.get("homeWalks")), None),
+        away_ball_four=to_int(first_non_empty(cgs.get("awayBallFour"), cgs.get("awayWalks")), None),
+        pitch_num=row[8],
+        pitch_result=row[9],
+        pts_pitch_id=row[10],
+        speed_kph=row[11],
+        stuff_text=row[12],
+        category=classify_event(txt, row[8], row[9], row[10], row[13], row[5]),
+        raw_payload=row[14] or {},
+    )
 
 
 def _is_pa_end(event: EventRec) -> bool:
@@ -551,15 +562,221 @@ def _parse_substitution_details(raw_payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _allocate_event_ids(cur: psycopg.Cursor, count: int) -> list[int]:
+    if count <= 0:
+        return []
+    # 이벤트 ID를 미리 받아 두면 pa_events INSERT가 RETURNING 결과를 기다리지 않아도 된다.
+    # 행 단위로 받던 때처럼 event_seq_game 순서대로 작은 ID를 준다.
+    cur.execute(
+        "SELECT nextval(pg_get_serial_sequence('pa_events', 'event_id')) FROM generate_series(1, %s)",
+        (count,),
+    )
+    return sorted(row[0] for row in cur.fetchall())
+
+
+@dataclass
+class NormalizeSource:
+    """Raw rows one game is normalized from, each list shaped like the raw-table query that reads it back."""
+
+    game_id: int
+    home_team_id: int | None
+    away_team_id: int | None
+    events: list[EventRec]
+    player_rows: list[tuple[Any, ...]]
+    roster_rows: list[tuple[Any, ...]]
+    team_rows: list[tuple[Any, ...]]
+    metric_rows: list[tuple[Any, ...]]
+    pitch_track_rows: list[tuple[Any, ...]]
+
+
 def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
+    """Re-normalize a game from the rows already stored in the raw tables."""
+    with conn.cursor() as cur, pipeline_mode(conn):
+        source = _read_normalize_source(cur, raw_game_id)
+    return _write_normalized_game(conn, source)
+
+
+def normalize_ingested_game(conn: psycopg.Connection, ingested: RawGameIngest) -> int:
+    """Normalize a game straight from ``ingest_raw_game_rows``'s result, without reading the raw tables back.
+
+    Writes the same rows as ``normalize_game_from_raw`` would right after the same ingest.
+    """
     with conn.cursor() as cur:
-        _ensure_pa_event_runner_columns(conn, cur)
+        source = _ingested_normalize_source(cur, ingested)
+    return _write_normalized_game(conn, source)
+
+
+def _read_normalize_source(cur: psycopg.Cursor, raw_game_id: int) -> NormalizeSource:
+    cur.execute("SELECT game_id, home_team_id, away_team_id FROM games WHERE raw_game_id = %s", (raw_game_id,))
+    game_row = cur.fetchone()
+    if not game_row:
+        raise ValueError(f"game not found for raw_game_id={raw_game_id}")
+    game_id, home_team_id, away_team_id = game_row
+
+    events = _fetch_events(cur, raw_game_id)
+    cur.execute(
+        """
+        SELECT DISTINCT p.player_id, p.player_name
+        FROM players p
+        JOIN game_roster_entries gre ON gre.player_id = p.player_id
+        WHERE gre.game_id = %s
+        """,
+        (game_id,),
+    )
+    player_rows = cur.fetchall()
+    cur.execute(
+        """
+        SELECT gre.player_id, gre.team_id, gre.batting_order_slot
+        FROM game_roster_entries gre
+        WHERE gre.game_id = %s
+          AND gre.player_id IS NOT NULL
+        """,
+        (game_id,),
+    )
+    roster_rows = cur.fetchall()
+    cur.execute(
+        """
+        SELECT team_id, team_name_short, team_name_full
+        FROM teams
+        WHERE team_id IN (%s, %s)
+        """,
+        (home_team_id, away_team_id),
+    )
+    team_rows = cur.fetchall()
+    cur.execute(
+        """
+        SELECT raw_block_id, home_team_win_rate, away_team_win_rate, wpa_by_plate
+        FROM raw_plate_metrics rpm
+        WHERE EXISTS (
+            SELECT 1
+            FROM raw_relay_blocks rrb
+            WHERE rrb.raw_game_id = %s
+              AND rrb.raw_block_id = rpm.raw_block_id
+        )
+        """,
+        (raw_game_id,),
+    )
+    metric_rows = cur.fetchall()
+    cur.execute(
+        """
+        SELECT rpt.pitch_id,
+               rpt.ballcount,
+               rpt.cross_plate_x,
+               rpt.cross_plate_y,
+               rpt.top_sz,
+               rpt.bottom_sz,
+               rpt.vx0,
+               rpt.vy0,
+               rpt.vz0,
+               rpt.ax,
+               rpt.ay,
+               rpt.az,
+               rpt.x0,
+               rpt.y0,
+               rpt.z0,
+               rpt.stance
+        FROM raw_pitch_tracks rpt
+        JOIN raw_relay_blocks rrb ON rrb.raw_block_id = rpt.raw_block_id
+        WHERE rrb.raw_game_id = %s
+        """,
+        (raw_game_id,),
+    )
+    return NormalizeSource(
+        game_id=game_id,
+        home_team_id=home_team_id,
+        away_team_id=away_team_id,
+        events=events,
+        player_rows=player_rows,
+        roster_rows=roster_rows,
+        team_rows=team_rows,
+        metric_rows=metric_rows,
+        pitch_track_rows=cur.fetchall(),
+    )
+
+
+def _json_value(value: Any) -> Any:
+    # 행 생성 함수는 JSONB 열을 Json으로 감싸거나 None을 넣는다.
+    return value.obj if value is not None else None
+
+
+def _ingested_normalize_source(cur: psycopg.Cursor, ingested: RawGameIngest) -> NormalizeSource:
+    # 적재에 쓴 행 생성 함수를 그대로 다시 불러 DB가 돌려줄 값과 같은 행을 메모리에서 만든다.
+    event_rows = []
+    metric_rows = []
+    pitch_track_rows = []
+    for item in ingested.relay_blocks:
+        block_row = build_relay_block_row(ingested.raw_game_id, item.block_index, item.block)
+        inning_no, home_or_away = block_row[5], block_row[6]
+        for raw_event_id, row in zip(item.raw_event_ids, build_text_event_rows(item.raw_block_id, item.block)):
+            seqno = row[2] if row[2] is not None else raw_event_id
+            event_rows.append(
+                (
+                    raw_event_id,
+                    item.raw_block_id,
+                    inning_no,
+                    home_or_away,
+                    seqno,
+                    row[3],
+                    row[4] if row[4] is not None else "",
+                    _json_value(row[5]),
+                    row[9],
+                    row[10],
+                    row[11],
+                    row[12],
+                    row[13],
+                    _json_value(row[8]),
+                    _json_value(row[14]),
+                )
+            )
+        metric_rows.append(build_plate_metric_row(item.raw_block_id, item.block))
+        pitch_track_rows.extend((row[2], *row[4:19]) for row in build_pitch_track_rows(item.raw_block_id, item.block))
+    event_rows.sort(key=lambda row: (row[4], row[0]))
+
+    # 선수/팀 이름은 COALESCE upsert라 이번 경기에 이름이 없을 때만 DB에 남은 값을 읽는다.
+    player_name_by_id: dict[str, Any] = {}
+    for player_row in ingested.player_rows:
+        if player_row[1] is not None or player_row[0] not in player_name_by_id:
+            player_name_by_id[player_row[0]] = player_row[1]
+    unnamed_player_ids = [player_id for player_id, player_name in player_name_by_id.items() if player_name is None]
+    if unnamed_player_ids:
+        cur.execute("SELECT player_id, player_name FROM players WHERE player_id = ANY(%s)", (unnamed_player_ids,))
+        player_name_by_id.update(cur.fetchall())
+
+    team_rows = []
+    unnamed_team_ids = []
+    for team_id, team_name in ((ingested.home_team_id, ingested.home_team_name), (ingested.away_team_id, ingested.away_team_name)):
+        if team_id is None:
+            continue
+        if team_name is None:
+            unnamed_team_ids.append(team_id)
+        else:
+            team_rows.append((team_id, team_name, team_name))
+    if unnamed_team_ids:
+        cur.execute(
+            "SELECT team_id, team_name_short, team_name_full FROM teams WHERE team_id = ANY(%s)",
+            (unnamed_team_ids,),
+        )
+        team_rows.extend(cur.fetchall())
+
+    return NormalizeSource(
+        game_id=ingested.game_id,
+        home_team_id=ingested.home_team_id,
+        away_team_id=ingested.away_team_id,
+        events=[_event_rec_from_row(row) for row in event_rows],
+        player_rows=list(player_name_by_id.items()),
+        roster_rows=[(row[2], row[1], row[5]) for row in ingested.roster_rows if row[2] is not None],
+        team_rows=team_rows,
+        metric_rows=metric_rows,
+        pitch_track_rows=pitch_track_rows,
+    )
 
-        cur.execute("SELECT game_id, home_team_id, away_team_id FROM games WHERE raw_game_id = %s", (raw_game_id,))
-        game_row = cur.fetchone()
-        if not game_row:
-            raise ValueError(f"game not found for raw_game_id={raw_game_id}")
-        game_id, home_team_id, away_team_id = game_row
+
+def _write_normalized_game(conn: psycopg.Connection, source: NormalizeSource) -> int:
+    game_id, home_team_id, away_team_id = source.game_id, source.home_team_id, source.away_team_id
+    events = source.events
+    # innings/plate_appearances처럼 RETURNING 값을 바로 쓰는 문장만 결과를 기다린다.
+    with conn.cursor() as cur, pipeline_mode(conn):
+        ensure_pa_event_runner_columns(conn, cur)
 
         cur.execute("DELETE FROM substitution_events WHERE game_id = %s", (game_id,))
         cur.execute("DELETE FROM review_events WHERE game_id = %s", (game_id,))
@@ -571,33 +788,15 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
         cur.execute("DELETE FROM plate_appearances WHERE game_id = %s", (game_id,))
         cur.execute("DELETE FROM innings WHERE game_id = %s", (game_id,))
 
-        events = _fetch_events(cur, raw_game_id)
-        cur.execute(
-            """
-            SELECT DISTINCT p.player_id, p.player_name
-            FROM players p
-            JOIN game_roster_entries gre ON gre.player_id = p.player_id
-            WHERE gre.game_id = %s
-            """,
-            (game_id,),
-        )
-        player_name_by_id = {row[0]: row[1] for row in cur.fetchall() if row[0]}
+        event_ids = _allocate_event_ids(cur, len(events))
+        player_name_by_id = {row[0]: row[1] for row in source.player_rows if row[0]}
         name_to_player_id = {}
         for player_id, player_name in player_name_by_id.items():
             if player_name and player_name not in name_to_player_id:
                 name_to_player_id[player_name] = player_id
-        cur.execute(
-            """
-            SELECT gre.player_id, gre.team_id, gre.batting_order_slot
-            FROM game_roster_entries gre
-            WHERE gre.game_id = %s
-              AND gre.player_id IS NOT NULL
-            """,
-            (game_id,),
-        )
         team_id_by_player_id: dict[str, int] = {}
         batting_order_by_player_id: dict[str, int] = {}
-        for player_id, team_id, batting_order_slot in cur.fetchall():
+        for player_id, team_id, batting_order_slot in source.roster_rows:
             if not player_id:
                 continue
             if player_id not in team_id_by_player_id and team_id is not None:
@@ -605,40 +804,19 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
             if player_id not in batting_order_by_player_id and batting_order_slot is not None:
                 batting_order_by_player_id[player_id] = batting_order_slot
 
-        cur.execute(
-            """
-            SELECT team_id, team_name_short, team_name_full
-            FROM teams
-            WHERE team_id IN (%s, %s)
-            """,
-            (home_team_id, away_team_id),
-        )
         team_id_by_name: dict[str, int] = {}
-        for team_id, team_name_short, team_name_full in cur.fetchall():
+        for team_id, team_name_short, team_name_full in source.team_rows:
             for team_name in (team_name_short, team_name_full):
                 if team_name and team_name not in team_id_by_name:
                     team_id_by_name[team_name] = team_id
 
-        cur.execute(
-            """
-            SELECT raw_block_id, home_team_win_rate, away_team_win_rate, wpa_by_plate
-            FROM raw_plate_metrics rpm
-            WHERE EXISTS (
-                SELECT 1
-                FROM raw_relay_blocks rrb
-                WHERE rrb.raw_game_id = %s
-                  AND rrb.raw_block_id = rpm.raw_block_id
-            )
-            """,
-            (raw_game_id,),
-        )
         metric_by_block_id = {
             row[0]: {
                 "home_win_rate_after": row[1],
                 "away_win_rate_after": row[2],
                 "wpa_by_plate": row[3],
             }
-            for row in cur.fetchall()
+            for row in source.metric_rows
         }
 
         inning_map: dict[tuple[int, str], int] = {}
@@ -809,16 +987,16 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
             cur.execute(
                 """
                 INSERT INTO pa_events (
-                    game_id, inning_id, pa_id, event_seq_game, event_seq_in_pa,
+                    event_id, game_id, inning_id, pa_id, event_seq_game, event_seq_in_pa,
                     event_type_code, event_category, text, batter_id, pitcher_id,
                     outs, balls, strikes, base1_occupied, base2_occupied, base3_occupied,
                     home_score, away_score, home_hits, away_hits, home_errors, away_errors,
                     base1_runner_id, base2_runner_id, base3_runner_id,
                     base1_runner_name, base2_runner_name, base3_runner_name, raw_event_id, raw_payload
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING event_id
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
+                    event_ids[event_seq_game - 1],
                     game_id,
                     inning_id,
                     event_pa_id,
@@ -851,7 +1029,7 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
                     Json(ev.raw_payload),
                 ),
             )
-            pa_event_id = cur.fetchone()[0]
+            pa_event_id = event_ids[event_seq_game - 1]
             prev_pa_event_id = last_event_by_pa.get(event_pa_id) if event_pa_id is not None else None
             if False and (
                 event_pa_id is not None
@@ -1120,38 +1298,17 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
                 (ev.seqno, ev.seqno, inning_id),
             )
 
-        cur.execute(
-            """
-            SELECT rpt.pitch_id,
-                   rpt.ballcount,
-                   rpt.cross_plate_x,
-                   rpt.cross_plate_y,
-                   rpt.top_sz,
-                   rpt.bottom_sz,
-                   rpt.vx0,
-                   rpt.vy0,
-                   rpt.vz0,
-                   rpt.ax,
-                   rpt.ay,
-                   rpt.az,
-                   rpt.x0,
-                   rpt.y0,
-                   rpt.z0,
-                   rpt.stance
-            FROM raw_pitch_tracks rpt
-            JOIN raw_relay_blocks rrb ON rrb.raw_block_id = rpt.raw_block_id
-            WHERE rrb.raw_game_id = %s
-            """,
-            (raw_game_id,),
-        )
-        for tr in cur.fetchall():
+        pitch_tracking_rows = []
+        for tr in source.pitch_track_rows:
             source_pitch_id = tr[0]
             if not source_pitch_id:
                 continue
             normalized_pitch_id = normalized_pitch_id_by_source.get(source_pitch_id)
             if not normalized_pitch_id:
                 continue
-            cur.execute(
+            pitch_tracking_rows.append((normalized_pitch_id, source_pitch_id, *tr[1:16]))
+        if pitch_tracking_rows:
+            cur.executemany(
                 """
                 INSERT INTO pitch_tracking (
                     pitch_id, source_pitch_id, ballcount, cross_plate_x, cross_plate_y,
@@ -1176,25 +1333,7 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
                     z0 = EXCLUDED.z0,
                     stance = EXCLUDED.stance
                 """,
-                (
-                    normalized_pitch_id,
-                    source_pitch_id,
-                    tr[1],
-                    tr[2],
-                    tr[3],
-                    tr[4],
-                    tr[5],
-                    tr[6],
-                    tr[7],
-                    tr[8],
-                    tr[9],
-                    tr[10],
-                    tr[11],
-                    tr[12],
-                    tr[13],
-                    tr[14],
-                    tr[15],
-                ),
+                pitch_tracking_rows,
             )
 
         pa_ids_without_action = [pa_id for pa_id, has_action in pa_has_batter_action_by_id.items() if not has_action]
@@ -1247,6 +1386,7 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
             (game_id,),
         )
         pa_id_by_key = {(int(inning_no), half, int(start_seqno)): int(pa_id) for pa_id, inning_no, half, start_seqno in cur.fetchall()}
+        pa_credit_rows = []
         for scored_pa in scored_pas:
             if not scored_pa.is_terminal:
                 continue
@@ -1255,18 +1395,21 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
                 continue
             credited_batter_id = scored_pa.batter_credit_owner_id or scored_pa.finishing_batter_id
             credited_pitcher_id = scored_pa.pitcher_credit_owner_id or scored_pa.finishing_pitcher_id
-            cur.execute(
+            pa_credit_rows.append((credited_batter_id, credited_pitcher_id, pa_id))
+            if credited_batter_id:
+                pa_batter_id_by_id[pa_id] = credited_batter_id
+        if pa_credit_rows:
+            cur.executemany(
                 """
                 UPDATE plate_appearances
                 SET batter_id = COALESCE(%s, batter_id),
                     pitcher_id = COALESCE(%s, pitcher_id)
                 WHERE pa_id = %s
                 """,
-                (credited_batter_id, credited_pitcher_id, pa_id),
+                pa_credit_rows,
             )
-            if credited_batter_id:
-                pa_batter_id_by_id[pa_id] = credited_batter_id
 
+        pa_metric_rows = []
         for pa_id, start_state in pa_start_state.items():
             end_state = pa_end_state.get(pa_id, start_state)
             raw_block_id = pa_raw_block_id_by_id.get(pa_id)
@@ -1282,7 +1425,18 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
                 )
             ):
                 runs_scored = (end_state["home_score"] - start_state["home_score"]) + (end_state["away_score"] - start_state["away_score"])
-            cur.execute(
+            pa_metric_rows.append(
+                (
+                    batting_order_by_player_id.get(pa_batter_id_by_id.get(pa_id) or ""),
+                    runs_scored,
+                    metric_row.get("wpa_by_plate"),
+                    metric_row.get("home_win_rate_after"),
+                    metric_row.get("away_win_rate_after"),
+                    pa_id,
+                )
+            )
+        if pa_metric_rows:
+            cur.executemany(
                 """
                 UPDATE plate_appearances
                 SET batting_order_slot = COALESCE(%s, batting_order_slot),
@@ -1292,16 +1446,10 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
                     away_win_rate_after = COALESCE(%s, away_win_rate_after)
                 WHERE pa_id = %s
                 """,
-                (
-                    batting_order_by_player_id.get(pa_batter_id_by_id.get(pa_id) or ""),
-                    runs_scored,
-                    metric_row.get("wpa_by_plate"),
-                    metric_row.get("home_win_rate_after"),
-                    metric_row.get("away_win_rate_after"),
-                    pa_id,
-                ),
+                pa_metric_rows,
             )
 
+        inning_total_rows = []
         for inning_id, start_state in inning_start_state.items():
             end_state = inning_end_state.get(inning_id, start_state)
             half = inning_half_by_id.get(inning_id, "top")
@@ -1315,7 +1463,9 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
                 hits_in_half = _state_delta(end_state.get("home_hits"), start_state.get("home_hits"))
                 errors_in_half = _state_delta(end_state.get("away_errors"), start_state.get("away_errors"))
                 walks_in_half = _state_delta(end_state.get("home_ball_four"), start_state.get("home_ball_four"))
-            cur.execute(
+            inning_total_rows.append((runs_scored, hits_in_half, errors_in_half, walks_in_half, inning_id))
+        if inning_total_rows:
+            cur.executemany(
                 """
                 UPDATE innings
                 SET runs_scored = COALESCE(%s, runs_scored),
@@ -1324,13 +1474,7 @@ def normalize_game_from_raw(conn: psycopg.Connection, raw_game_id: int) -> int:
                     walks_in_half = COALESCE(%s, walks_in_half)
                 WHERE inning_id = %s
                 """,
-                (
-                    runs_scored,
-                    hits_in_half,
-                    errors_in_half,
-                    walks_in_half,
-                    inning_id,
-                ),
+                inning_total_rows,
             )
 
     return game_id
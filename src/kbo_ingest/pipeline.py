@@ -4,14 +4,15 @@ from pathlib import Path
 
 import psycopg
 
-from .ingest_raw import ingest_raw_game
-from .normalize_game import normalize_game_from_raw
+from .ingest_raw import ingest_raw_game_rows
+from .normalize_game import normalize_ingested_game
 
 
-def load_one_game(conn: psycopg.Connection, json_path: Path) -> tuple[int, int]:
-    raw_game_id, game_id = ingest_raw_game(conn, json_path)
-    game_id = normalize_game_from_raw(conn, raw_game_id)
-    return raw_game_id, game_id
+def load_one_game(conn: psycopg.Connection, json_path: Path, *, upsert_dimensions: bool = True) -> tuple[int, int]:
+    # 방금 적재한 payload와 ID로 바로 정규화하므로 raw 테이블을 다시 읽지 않는다.
+    ingested = ingest_raw_game_rows(conn, json_path, upsert_dimensions=upsert_dimensions)
+    game_id = normalize_ingested_game(conn, ingested)
+    return ingested.raw_game_id, game_id
 
 
 def validate_game(conn: psycopg.Connection, game_id: int) -> dict[str, int]:
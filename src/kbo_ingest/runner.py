@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import atexit
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import json
+import multiprocessing
 import time
 from pathlib import Path
 from typing import Any
@@ -8,9 +12,14 @@ from typing import Any
 import psycopg
 
 from .db import create_schema, reset_database
+from .incremental import delete_raw_games, delete_stale_games, plan_incremental_load, update_renamed_sources
+from .ingest_raw import GameDimensionRows, game_dimension_rows, upsert_dimension_rows
 from .manifest import resolve_stage_sizes
+from .normalize_game import ensure_pa_event_runner_columns, mark_pa_event_runner_columns_ready
 from .pipeline import load_one_game
-from .validation import validate_loaded_entries
+from .validation import make_issue, validate_loaded_entries
+
+_WORKER_CONN: psycopg.Connection | None = None
 
 
 def _write_report(report: dict[str, Any], report_path: Path) -> None:
@@ -55,6 +64,115 @@ def _write_markdown_report(report: dict[str, Any], report_path: Path) -> None:
     report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
+def _init_load_worker(dsn: str) -> None:
+    global _WORKER_CONN
+    _WORKER_CONN = psycopg.connect(dsn)
+    atexit.register(_WORKER_CONN.close)
+    # 열은 부모가 풀을 띄우기 전에 만들어 두었으므로 워커는 pa_events ALTER(테이블 전체 잠금)를 다시 하지 않는다.
+    mark_pa_event_runner_columns_ready(_WORKER_CONN)
+
+
+def _load_entry_in_worker(path: str, replaced_raw_game_ids: list[int] | None = None) -> str | None:
+    conn = _WORKER_CONN
+    try:
+        delete_raw_games(conn, replaced_raw_game_ids or [])
+        load_one_game(conn, Path(path), upsert_dimensions=False)
+        conn.commit()
+    except Exception as exc:
+        conn.rollback()
+        return f"{type(exc).__name__}: {exc}"
+    return None
+
+
+def _load_entry_in_savepoint(conn: psycopg.Connection, path: str, replaced_raw_game_ids: list[int] | None = None) -> str | None:
+    # 순차 적재는 commit_every 단위로 커밋하되, 경기마다 세이브포인트를 두어 실패한 경기만 되돌린다.
+    with conn.cursor() as cur:
+        cur.execute("SAVEPOINT load_game")
+        try:
+            delete_raw_games(conn, replaced_raw_game_ids or [])
+            load_one_game(conn, Path(path))
+        except Exception as exc:
+            cur.execute("ROLLBACK TO SAVEPOINT load_game")
+            return f"{type(exc).__name__}: {exc}"
+        cur.execute("RELEASE SAVEPOINT load_game")
+    return None
+
+
+def _dimension_rows_in_worker(path: str) -> GameDimensionRows | None:
+    try:
+        return game_dimension_rows(Path(path))
+    except Exception:
+        # 읽을 수 없는 파일은 차원 행 없이 넘기고, 그 경기 적재가 실패하면서 load_error로 남는다.
+        return None
+
+
+def _load_entries_parallel(
+    conn: psycopg.Connection,
+    dsn: str,
+    entries: list[dict[str, Any]],
+    *,
+    workers: int,
+    replaced_raw_game_ids: dict[str, list[int]] | None = None,
+) -> dict[str, str]:
+    """Load each entry in its own transaction on ``workers`` processes; returns the error of each failed path.
+
+    Before any game is submitted, the pool reads every file's team/stadium/player rows (``lineup`` and
+    ``record`` only), and ``conn`` upserts them in ``entries`` order and commits, so workers only look
+    those rows up. That pass still reads each file once more than a serial load does; it runs on the pool
+    and is included in the caller's ``load_seconds``. ``replaced_raw_game_ids`` maps a path to earlier
+    versions deleted in the same transaction as its reload.
+    """
+    replaced_raw_game_ids = replaced_raw_game_ids or {}
+    failures: dict[str, str] = {}
+    # psycopg 연결은 fork로 물려줄 수 없으므로 spawn으로 띄우고 워커마다 연결을 새로 연다.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_load_worker,
+        initargs=(dsn,),
+    ) as executor:
+        # 차원 행은 워커에서 나눠 읽고, 이름 등의 최종 값이 순차 적재와 같도록 목록 순서대로 부모가 넣는다.
+        started_at = time.perf_counter()
+        paths = [entry["path"] for entry in entries]
+        rows_by_file = executor.map(_dimension_rows_in_worker, paths, chunksize=max(1, len(paths) // (workers * 4)))
+        file_count = upsert_dimension_rows(conn, [rows for rows in rows_by_file if rows is not None])
+        conn.commit()
+        print(f"[load] dimensions {file_count}/{len(paths)} files {time.perf_counter() - started_at:.2f}s")
+        futures = {
+            executor.submit(_load_entry_in_worker, entry["path"], replaced_raw_game_ids.get(entry["path"])): entry["path"]
+            for entry in entries
+        }
+        for index, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            try:
+                error = future.result()
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            if error:
+                failures[path] = error
+            if index % 10 == 0 or index == len(futures):
+                print(f"[load] {index}/{len(futures)} {path}")
+    return failures
+
+
+def _add_load_failures(report: dict[str, Any], failures: dict[str, str]) -> dict[str, Any]:
+    if not failures:
+        return report
+    blocking_issues = [
+        make_issue("load_error", "game", "load_failed", message, path=path) for path, message in failures.items()
+    ] + report["blocking_issues"]
+    report.update(
+        {
+            "ok": False,
+            "failed_game_count": len(failures),
+            "blocking_issue_count": len(blocking_issues),
+            "blocking_issue_types": dict(Counter(issue["type"] for issue in blocking_issues)),
+            "blocking_issues": blocking_issues,
+        }
+    )
+    return report
+
+
 def load_and_validate_entries(
     dsn: str,
     entries: list[dict[str, Any]],
@@ -65,31 +183,72 @@ def load_and_validate_entries(
     run_label: str = "KBO Load Validation",
     commit_every: int = 50,
     validate_after_load: bool = True,
+    workers: int = 1,
+    incremental: bool = False,
+    delete_missing: bool = False,
 ) -> dict[str, Any]:
+    """Load ``entries`` and validate them into one report.
+
+    ``workers > 1`` loads games on that many processes, each game in its own transaction; serial loads
+    commit every ``commit_every`` games with a savepoint per game. Either way a game that fails is
+    rolled back alone and reported as a ``load_error`` issue instead of aborting the run.
+
+    ``incremental`` loads only games whose source file hash is not in ``raw_games`` yet. Older versions
+    of a changed file are deleted in the transaction that reloads it, so a failed reload keeps them;
+    ``delete_missing`` also drops games whose file is gone.
+    """
+    if incremental and reset_db_first:
+        raise ValueError("incremental load cannot reset the database first")
     load_started_at = time.perf_counter()
+    failures: dict[str, str] = {}
+    incremental_summary: dict[str, int] | None = None
     with psycopg.connect(dsn) as conn:
         if reset_db_first:
             reset_database(conn)
         create_schema(conn, schema_path)
 
-        for index, entry in enumerate(entries, start=1):
-            load_one_game(conn, Path(entry["path"]))
-            if commit_every and index % commit_every == 0:
-                conn.commit()
-            if index % 10 == 0 or index == len(entries):
-                print(f"[load] {index}/{len(entries)} {entry['path']}")
+        load_entries = entries
+        replaced_raw_game_ids: dict[str, list[int]] = {}
+        if incremental:
+            plan = plan_incremental_load(conn, entries)
+            deleted = delete_stale_games(conn, plan, delete_missing=delete_missing)
+            update_renamed_sources(conn, plan)
+            conn.commit()
+            incremental_summary = {**plan.summary(), "deleted": deleted}
+            print(f"[load] incremental {incremental_summary}")
+            load_entries = plan.to_load
+            replaced_raw_game_ids = plan.replaced_raw_game_ids
 
-        conn.commit()
+        if workers > 1:
+            # 팀/구장/선수는 _load_entries_parallel이 경기를 넘기기 전에 목록 순서대로 먼저 넣고 워커는 조회만 한다.
+            # 워커끼리 같은 차원 행을 잠그지 않으므로 교착이 생기지 않는다.
+            # pa_events ALTER는 테이블 전체 잠금이라 게임 트랜잭션 안에서 워커끼리 마주치면 교착된다. 부모에서 한 번만 끝낸다.
+            with conn.cursor() as cur:
+                ensure_pa_event_runner_columns(conn, cur)
+            conn.commit()
+            failures = _load_entries_parallel(conn, dsn, load_entries, workers=workers, replaced_raw_game_ids=replaced_raw_game_ids)
+        else:
+            for index, entry in enumerate(load_entries, start=1):
+                error = _load_entry_in_savepoint(conn, entry["path"], replaced_raw_game_ids.get(entry["path"]))
+                if error:
+                    failures[entry["path"]] = error
+                if commit_every and index % commit_every == 0:
+                    conn.commit()
+                if index % 10 == 0 or index == len(load_entries):
+                    print(f"[load] {index}/{len(load_entries)} {entry['path']}")
+
+            conn.commit()
 
+        loaded_entries = [entry for entry in entries if entry["path"] not in failures]
         load_seconds = time.perf_counter() - load_started_at
         if validate_after_load:
             validation_started_at = time.perf_counter()
-            report = validate_loaded_entries(conn, entries)
+            report = validate_loaded_entries(conn, loaded_entries)
             validation_seconds = time.perf_counter() - validation_started_at
         else:
             report = {
                 "ok": True,
-                "loaded_game_count": len(entries),
+                "loaded_game_count": len(loaded_entries),
                 "table_counts": {},
                 "blocking_issue_count": 0,
                 "source_issue_count": 0,
@@ -100,6 +259,7 @@ def load_and_validate_entries(
             }
             validation_seconds = 0.0
 
+    report = _add_load_failures(report, failures)
     report.update(
         {
             "run_label": run_label,
@@ -108,6 +268,11 @@ def load_and_validate_entries(
             "report_json_path": report_json_path.as_posix(),
         }
     )
+    if incremental_summary is not None:
+        # 검증은 manifest 전체를 보지만 적재 수는 이번에 실제로 다시 넣은 경기만 센다.
+        report["loaded_game_count"] = len(load_entries) - len(failures)
+        report["skipped_game_count"] = incremental_summary["unchanged"]
+        report["incremental"] = incremental_summary
     _write_report(report, report_json_path)
     _write_markdown_report(report, report_json_path.with_suffix(".md"))
     return report
@@ -37,7 +37,7 @@ def _normalize_source_path(path_text: str) -> str:
     return path_text.replace("\\", "/")
 
 
-def _make_issue(issue_type: str, scope: str, code: str, message: str, *, path: str | None = None) -> dict[str, Any]:
+def make_issue(issue_type: str, scope: str, code: str, message: str, *, path: str | None = None) -> dict[str, Any]:
     issue = {
         "type": issue_type,
         "scope": scope,
@@ -142,7 +142,7 @@ def _compare_side_totals(
                 actual_value = int(actual_row.get(stat_name, 0) or 0)
                 if expected_value != actual_value:
                     issues.append(
-                        _make_issue(
+                        make_issue(
                             "normalized_logic",
                             "aggregate",
                             f"{prefix}:{side}:{player_id}:{stat_name}",
@@ -194,10 +194,10 @@ def _validate_game_metadata(cur: psycopg.Cursor, entry: dict[str, Any]) -> tuple
     )
     rows = cur.fetchall()
     if not rows:
-        issues.append(_make_issue("raw_ingest", "game", "missing_game_row", "games/raw_games row not found", path=path))
+        issues.append(make_issue("raw_ingest", "game", "missing_game_row", "games/raw_games row not found", path=path))
         return issues, None, None
     if len(rows) != 1:
-        issues.append(_make_issue("raw_ingest", "game", "duplicate_game_row", f"expected 1 row, found {len(rows)}", path=path))
+        issues.append(make_issue("raw_ingest", "game", "duplicate_game_row", f"expected 1 row, found {len(rows)}", path=path))
         return issues, None, None
 
     row = rows[0]
@@ -220,11 +220,11 @@ def _validate_game_metadata(cur: psycopg.Cursor, entry: dict[str, Any]) -> tuple
         ("stadium_name", row[16], entry["stadium_name"]),
     ]
     if not row[2]:
-        issues.append(_make_issue("raw_ingest", "game", "missing_raw_json", "raw_json is NULL", path=path))
+        issues.append(make_issue("raw_ingest", "game", "missing_raw_json", "raw_json is NULL", path=path))
     for field_name, actual_value, expected_value in comparisons:
         if actual_value != expected_value:
             issues.append(
-                _make_issue(
+                make_issue(
                     "raw_ingest",
                     "game",
                     f"metadata_mismatch:{field_name}",
@@ -301,7 +301,7 @@ def _validate_raw_layer(cur: psycopg.Cursor, entry: dict[str, Any], raw_game_id:
     for table_name, expected_count in (entry.get("expected_counts") or {}).items():
         if table_name in actual_counts and actual_counts[table_name] != expected_count:
             issues.append(
-                _make_issue(
+                make_issue(
                     "raw_ingest",
                     "raw",
                     f"count_mismatch:{table_name}",
@@ -310,11 +310,11 @@ def _validate_raw_layer(cur: psycopg.Cursor, entry: dict[str, Any], raw_game_id:
                 )
             )
     if row[4]:
-        issues.append(_make_issue("raw_ingest", "raw", "raw_block_mismatch", f"raw block field mismatches={row[4]}", path=path))
+        issues.append(make_issue("raw_ingest", "raw", "raw_block_mismatch", f"raw block field mismatches={row[4]}", path=path))
     if row[5]:
-        issues.append(_make_issue("raw_ingest", "raw", "raw_text_mismatch", f"raw text field mismatches={row[5]}", path=path))
+        issues.append(make_issue("raw_ingest", "raw", "raw_text_mismatch", f"raw text field mismatches={row[5]}", path=path))
     if row[6]:
-        issues.append(_make_issue("raw_ingest", "raw", "raw_track_mismatch", f"raw pitch track field mismatches={row[6]}", path=path))
+        issues.append(make_issue("raw_ingest", "raw", "raw_track_mismatch", f"raw pitch track field mismatches={row[6]}", path=path))
     return issues
 
 
@@ -365,7 +365,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
     for table_name, expected_count in (entry.get("expected_counts") or {}).items():
         if table_name in actual_counts and actual_counts[table_name] != expected_count:
             issues.append(
-                _make_issue(
+                make_issue(
                     "normalized_logic",
                     "normalized",
                     f"count_mismatch:{table_name}",
@@ -374,15 +374,15 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
                 )
             )
     if row[10]:
-        issues.append(_make_issue("normalized_logic", "normalized", "score_nulls", f"pa_events with NULL score fields={row[10]}", path=path))
+        issues.append(make_issue("normalized_logic", "normalized", "score_nulls", f"pa_events with NULL score fields={row[10]}", path=path))
     if row[11]:
-        issues.append(_make_issue("normalized_logic", "normalized", "scoreboard_nulls", f"pa_events with NULL hit/error fields={row[11]}", path=path))
+        issues.append(make_issue("normalized_logic", "normalized", "scoreboard_nulls", f"pa_events with NULL hit/error fields={row[11]}", path=path))
     if row[12]:
-        issues.append(_make_issue("normalized_logic", "normalized", "baserunning_runner_nulls", f"baserunning_events with NULL runner_name_raw={row[12]}", path=path))
+        issues.append(make_issue("normalized_logic", "normalized", "baserunning_runner_nulls", f"baserunning_events with NULL runner_name_raw={row[12]}", path=path))
     expected_substitution_nulls = int((entry.get("expected_null_counts") or {}).get("substitution_missing_player_id_count", 0))
     if row[13] != expected_substitution_nulls:
         issues.append(
-            _make_issue(
+            make_issue(
                 "normalized_logic",
                 "normalized",
                 "substitution_player_nulls",
@@ -391,7 +391,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
             )
         )
     if row[14]:
-        issues.append(_make_issue("normalized_logic", "normalized", "review_target_nulls", f"review_events missing review_target_text={row[14]}", path=path))
+        issues.append(make_issue("normalized_logic", "normalized", "review_target_nulls", f"review_events missing review_target_text={row[14]}", path=path))
 
     cur.execute(
         """
@@ -403,7 +403,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
     )
     pa_count, pa_max_seq, pa_distinct = cur.fetchone()
     if pa_count and (pa_count != pa_max_seq or pa_count != pa_distinct):
-        issues.append(_make_issue("normalized_logic", "normalized", "pa_seq_gap", f"PA sequence count={pa_count}, max={pa_max_seq}, distinct={pa_distinct}", path=path))
+        issues.append(make_issue("normalized_logic", "normalized", "pa_seq_gap", f"PA sequence count={pa_count}, max={pa_max_seq}, distinct={pa_distinct}", path=path))
 
     cur.execute(
         """
@@ -416,7 +416,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
     )
     for inning_id, count_rows, max_seq, distinct_seq, min_seq in cur.fetchall():
         if count_rows and (count_rows != max_seq or count_rows != distinct_seq or min_seq != 1):
-            issues.append(_make_issue("normalized_logic", "normalized", "pa_seq_in_half_gap", f"inning_id={inning_id} count={count_rows}, max={max_seq}, distinct={distinct_seq}, min={min_seq}", path=path))
+            issues.append(make_issue("normalized_logic", "normalized", "pa_seq_in_half_gap", f"inning_id={inning_id} count={count_rows}, max={max_seq}, distinct={distinct_seq}, min={min_seq}", path=path))
 
     cur.execute(
         """
@@ -428,7 +428,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
     )
     event_count, event_max_seq, event_distinct = cur.fetchone()
     if event_count and (event_count != event_max_seq or event_count != event_distinct):
-        issues.append(_make_issue("normalized_logic", "normalized", "event_seq_gap", f"event sequence count={event_count}, max={event_max_seq}, distinct={event_distinct}", path=path))
+        issues.append(make_issue("normalized_logic", "normalized", "event_seq_gap", f"event sequence count={event_count}, max={event_max_seq}, distinct={event_distinct}", path=path))
 
     cur.execute(
         f"""
@@ -450,7 +450,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
     state_fields = ["home_score", "away_score", "outs", "balls", "strikes", "base1", "base2", "base3"]
     for field_name, mismatch_count in zip(state_fields, state_mismatches):
         if mismatch_count:
-            issues.append(_make_issue("normalized_logic", "normalized", f"state_mismatch:{field_name}", f"{field_name} mismatches={mismatch_count}", path=path))
+            issues.append(make_issue("normalized_logic", "normalized", f"state_mismatch:{field_name}", f"{field_name} mismatches={mismatch_count}", path=path))
 
     cur.execute(
         """
@@ -475,9 +475,9 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
         ]
         for field_name, actual_value, expected_value in comparisons:
             if expected_value is not None and actual_value != expected_value:
-                issues.append(_make_issue("normalized_logic", "aggregate", f"scoreboard_mismatch:{field_name}", f"{field_name} expected {expected_value}, got {actual_value}", path=path))
+                issues.append(make_issue("normalized_logic", "aggregate", f"scoreboard_mismatch:{field_name}", f"{field_name} expected {expected_value}, got {actual_value}", path=path))
     else:
-        issues.append(_make_issue("normalized_logic", "aggregate", "missing_final_state", "no pa_events found for final scoreboard", path=path))
+        issues.append(make_issue("normalized_logic", "aggregate", "missing_final_state", "no pa_events found for final scoreboard", path=path))
 
     cur.execute(
         """
@@ -511,7 +511,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
         for row in entry.get("inning_expectations", [])
     ]
     if actual_innings != expected_innings:
-        issues.append(_make_issue("normalized_logic", "aggregate", "inning_summary_mismatch", "innings summary rows do not match source expectations", path=path))
+        issues.append(make_issue("normalized_logic", "aggregate", "inning_summary_mismatch", "innings summary rows do not match source expectations", path=path))
 
     cur.execute(
         """
@@ -564,7 +564,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
 
     if terminal_pa_count != expected_terminal_pa_count:
         issues.append(
-            _make_issue(
+            make_issue(
                 "normalized_logic",
                 "aggregate",
                 "terminal_pa_count_mismatch",
@@ -574,7 +574,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
         )
     if nonterminal_pa_count != expected_partial_pa_count:
         issues.append(
-            _make_issue(
+            make_issue(
                 "normalized_logic",
                 "aggregate",
                 "partial_pa_count_mismatch",
@@ -584,7 +584,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
         )
     if empty_result_text_count != expected_partial_pa_count:
         issues.append(
-            _make_issue(
+            make_issue(
                 "normalized_logic",
                 "aggregate",
                 "empty_result_text_mismatch",
@@ -594,7 +594,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
         )
     if terminal_empty_result_text_count:
         issues.append(
-            _make_issue(
+            make_issue(
                 "normalized_logic",
                 "aggregate",
                 "terminal_pa_missing_result_text",
@@ -604,7 +604,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
         )
     if nonterminal_with_result_text_count:
         issues.append(
-            _make_issue(
+            make_issue(
                 "normalized_logic",
                 "aggregate",
                 "partial_pa_has_result_text",
@@ -615,7 +615,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
 
     if terminal_missing_batter_id_count:
         issues.append(
-            _make_issue(
+            make_issue(
                 "normalized_logic",
                 "aggregate",
                 "terminal_pa_missing_batter_id",
@@ -625,7 +625,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
         )
     if terminal_missing_pitcher_id_count:
         issues.append(
-            _make_issue(
+            make_issue(
                 "normalized_logic",
                 "aggregate",
                 "terminal_pa_missing_pitcher_id",
@@ -697,11 +697,11 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
     )
     pitch_orphan_count, pitch_tracking_missing_count = cur.fetchone()
     if pitch_orphan_count:
-        issues.append(_make_issue("normalized_logic", "normalized", "pitch_fk_nulls", f"pitches with NULL foreign keys={pitch_orphan_count}", path=path))
+        issues.append(make_issue("normalized_logic", "normalized", "pitch_fk_nulls", f"pitches with NULL foreign keys={pitch_orphan_count}", path=path))
     expected_pitch_tracking_gap = _expected_pitch_tracking_gap(entry)
     if pitch_tracking_missing_count != expected_pitch_tracking_gap:
         issues.append(
-            _make_issue(
+            make_issue(
                 "normalized_logic",
                 "normalized",
                 "pitch_tracking_gap_mismatch",
@@ -735,7 +735,7 @@ def _validate_normalized_game(cur: psycopg.Cursor, entry: dict[str, Any], game_i
     link_names = ["baserunning_link_mismatch", "review_link_mismatch", "substitution_link_mismatch"]
     for link_name, mismatch_count in zip(link_names, link_mismatches):
         if mismatch_count:
-            issues.append(_make_issue("normalized_logic", "normalized", link_name, f"{link_name}={mismatch_count}", path=path))
+            issues.append(make_issue("normalized_logic", "normalized", link_name, f"{link_name}={mismatch_count}", path=path))
     return issues
 
 
@@ -758,7 +758,7 @@ def validate_loaded_entries(conn: psycopg.Connection, entries: list[dict[str, An
             }
             if table_counts[table_name]["expected"] != table_counts[table_name]["actual"]:
                 issues.append(
-                    _make_issue(
+                    make_issue(
                         "raw_ingest" if table_name.startswith("raw_") else "normalized_logic",
                         "global",
                         f"table_count_mismatch:{table_name}",
@@ -769,15 +769,15 @@ def validate_loaded_entries(conn: psycopg.Connection, entries: list[dict[str, An
         cur.execute("SELECT COUNT(*), COUNT(DISTINCT source_file_hash), COUNT(DISTINCT REPLACE(source_file_name, E'\\\\', '/')) FROM raw_games")
         raw_game_count, raw_hash_count, raw_name_count = cur.fetchone()
         if raw_game_count != raw_hash_count:
-            issues.append(_make_issue("raw_ingest", "global", "raw_hash_duplicate", f"raw_games count={raw_game_count}, distinct hashes={raw_hash_count}"))
+            issues.append(make_issue("raw_ingest", "global", "raw_hash_duplicate", f"raw_games count={raw_game_count}, distinct hashes={raw_hash_count}"))
         if raw_game_count != raw_name_count:
-            issues.append(_make_issue("raw_ingest", "global", "raw_name_duplicate", f"raw_games count={raw_game_count}, distinct file names={raw_name_count}"))
+            issues.append(make_issue("raw_ingest", "global", "raw_name_duplicate", f"raw_games count={raw_game_count}, distinct file names={raw_name_count}"))
 
         for entry in entries:
             path = entry["path"]
             source_validation = entry.get("source_validation") or {}
             for message in source_validation.get("issues", []):
-                source_issues.append(_make_issue("source_json", "source", "source_consistency_issue", message, path=path))
+                source_issues.append(make_issue("source_json", "source", "source_consistency_issue", message, path=path))
 
             metadata_issues, raw_game_id, game_id = _validate_game_metadata(cur, entry)
             issues.extend(metadata_issues)
@@ -791,7 +791,7 @@ def validate_loaded_entries(conn: psycopg.Connection, entries: list[dict[str, An
     for issue in issues:
         if _is_source_derived_issue(issue, source_problem_paths):
             source_issues.append(
-                _make_issue(
+                make_issue(
                     "source_json",
                     issue.get("scope", "source"),
                     issue.get("code", "source_derived_issue"),
@@ -818,7 +818,7 @@ def validate_loaded_entries(conn: psycopg.Connection, entries: list[dict[str, An
                 expected_value, actual_value = parsed
                 if actual_value - expected_value == source_table_diffs.get(table_name, 0):
                     source_issues.append(
-                        _make_issue(
+                        make_issue(
                             "source_json",
                             issue.get("scope", "source"),
                             code,
@@ -850,7 +850,7 @@ def _validate_single_entry(dsn: str, entry: dict[str, Any]) -> tuple[list[dict[s
     path = entry["path"]
     source_validation = entry.get("source_validation") or {}
     for message in source_validation.get("issues", []):
-        entry_source_issues.append(_make_issue("source_json", "source", "source_consistency_issue", message, path=path))
+        entry_source_issues.append(make_issue("source_json", "source", "source_consistency_issue", message, path=path))
 
     with psycopg.connect(dsn) as conn:
         with conn.cursor() as cur:
@@ -882,7 +882,7 @@ def validate_loaded_entries_parallel(
                 }
                 if table_counts[table_name]["expected"] != table_counts[table_name]["actual"]:
                     issues.append(
-                        _make_issue(
+                        make_issue(
                             "raw_ingest" if table_name.startswith("raw_") else "normalized_logic",
                             "global",
                             f"table_count_mismatch:{table_name}",
@@ -893,9 +893,9 @@ def validate_loaded_entries_parallel(
             cur.execute("SELECT COUNT(*), COUNT(DISTINCT source_file_hash), COUNT(DISTINCT REPLACE(source_file_name, E'\\\\', '/')) FROM raw_games")
             raw_game_count, raw_hash_count, raw_name_count = cur.fetchone()
             if raw_game_count != raw_hash_count:
-                issues.append(_make_issue("raw_ingest", "global", "raw_hash_duplicate", f"raw_games count={raw_game_count}, distinct hashes={raw_hash_count}"))
+                issues.append(make_issue("raw_ingest", "global", "raw_hash_duplicate", f"raw_games count={raw_game_count}, distinct hashes={raw_hash_count}"))
             if raw_game_count != raw_name_count:
-                issues.append(_make_issue("raw_ingest", "global", "raw_name_duplicate", f"raw_games count={raw_game_count}, distinct file names={raw_name_count}"))
+                issues.append(make_issue("raw_ingest", "global", "raw_name_duplicate", f"raw_games count={raw_game_count}, distinct file names={raw_name_count}"))
 
     with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
         for entry_issues, entry_source_issues in executor.map(lambda item: _validate_single_entry(dsn, item), entries):
@@ -912,7 +912,7 @@ def validate_loaded_entries_parallel(
     for issue in issues:
         if _is_source_derived_issue(issue, source_problem_paths):
             source_issues.append(
-                _make_issue(
+                make_issue(
                     "source_json",
                     issue.get("scope", "source"),
                     issue.get("code", "source_derived_issue"),
@@ -939,7 +939,7 @@ def validate_loaded_entries_parallel(
                 expected_value, actual_value = parsed
                 if actual_value - expected_value == source_table_diffs.get(table_name, 0):
                     source_issues.append(
-                        _make_issue(
+                        make_issue(
                             "source_json",
                             issue.get("scope", "source"),
                             code,
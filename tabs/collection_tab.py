@@ -20,6 +20,9 @@ class CollectionViewModel:
     save_dir: str = "games"
     timeout_seconds: int = 8
     retry_count: int = 3
+    max_workers: int = 4
+    request_rate_per_second: float = 4.0
+    validation_processes: int = 0
     headless: bool = True
     start_date: str = dt.date.today().strftime("%Y-%m-%d")
     end_date: str = dt.date.today().strftime("%Y-%m-%d")
@@ -72,7 +75,7 @@ class CollectionTab:
             mode_row = self.mode_toolbar.build()
             dpg.add_text("수집 방식", parent=mode_row)
             dpg.add_radio_button(
-                items=["기간", "단일 날짜", "시즌"],
+                items=["기간", "단일 날짜", "시즌", "실시간"],
                 tag=self._tag("mode"),
                 default_value="기간",
                 horizontal=True,
@@ -115,12 +118,35 @@ class CollectionTab:
             dpg.add_input_int(tag=self._tag("timeout"), width=80, default_value=8, min_value=2, max_value=60, parent=options_row)
             dpg.add_text("재시도", parent=options_row)
             dpg.add_input_int(tag=self._tag("retry"), width=80, default_value=3, min_value=1, max_value=20, parent=options_row)
+            dpg.add_text("동시 수집", parent=options_row)
+            dpg.add_input_int(tag=self._tag("workers"), width=80, default_value=self.view_model.max_workers, min_value=1, max_value=16, parent=options_row)
+            dpg.add_text("초당 요청", parent=options_row)
+            dpg.add_input_float(
+                tag=self._tag("request_rate"),
+                width=80,
+                default_value=self.view_model.request_rate_per_second,
+                min_value=0.5,
+                max_value=50.0,
+                format="%.1f",
+                parent=options_row,
+            )
+            dpg.add_text("검증 프로세스", parent=options_row)
+            dpg.add_input_int(
+                tag=self._tag("validation_processes"),
+                width=80,
+                default_value=self.view_model.validation_processes,
+                min_value=0,
+                max_value=8,
+                parent=options_row,
+            )
             dpg.add_checkbox(tag=self._tag("headless"), label="헤드리스 브라우저", default_value=True, parent=options_row)
+            dpg.add_checkbox(tag=self._tag("archive_raw"), label="원본 응답 보관", default_value=False, parent=options_row)
 
             action_row = self.action_toolbar.build()
             dpg.add_button(tag=self._tag("start_button"), label="수집 시작", width=140, parent=action_row, callback=lambda: self.start_collection())
             dpg.add_button(tag=self._tag("cancel_button"), label="취소", width=100, parent=action_row, callback=lambda: self.cancel_collection(), enabled=False)
             dpg.add_button(tag=self._tag("retry_failed_button"), label="실패 재시도", width=120, parent=action_row, callback=lambda: self.retry_failed_collection(), enabled=False)
+            dpg.add_button(tag=self._tag("resume_button"), label="중단 작업 이어서", width=140, parent=action_row, callback=lambda: self.resume_collection())
 
             self.progress_panel.build()
             self.summary_card.build()
@@ -157,10 +183,10 @@ class CollectionTab:
 
     def _apply_mode_from_ui(self) -> None:
         mode_value = dpg.get_value(self._tag("mode"))
-        mode_map = {"기간": "period", "단일 날짜": "single", "시즌": "season"}
+        mode_map = {"기간": "period", "단일 날짜": "single", "시즌": "season", "실시간": "live"}
         self.view_model.mode = mode_map.get(mode_value, "period")
         dpg.configure_item(self.period_toolbar.tag, show=self.view_model.mode == "period")
-        dpg.configure_item(self.single_toolbar.tag, show=self.view_model.mode == "single")
+        dpg.configure_item(self.single_toolbar.tag, show=self.view_model.mode in ("single", "live"))
         dpg.configure_item(self.season_toolbar.tag, show=self.view_model.mode == "season")
         self.request_layout()
 
@@ -178,7 +204,7 @@ class CollectionTab:
 
     def _read_form(self) -> CollectionRequest:
         mode = self.view_model.mode
-        if mode == "single":
+        if mode in ("single", "live"):
             start_date = end_date = dt.datetime.strptime(dpg.get_value(self._tag("single_date")), "%Y-%m-%d").date()
             season_year = None
         elif mode == "season":
@@ -197,7 +223,11 @@ class CollectionTab:
             save_dir=save_dir,
             timeout_seconds=int(dpg.get_value(self._tag("timeout"))),
             retry_count=int(dpg.get_value(self._tag("retry"))),
+            max_workers=int(dpg.get_value(self._tag("workers"))),
+            request_rate_per_second=float(dpg.get_value(self._tag("request_rate"))),
+            validation_processes=int(dpg.get_value(self._tag("validation_processes"))),
             headless=bool(dpg.get_value(self._tag("headless"))),
+            archive_raw_responses=bool(dpg.get_value(self._tag("archive_raw"))),
             start_date=start_date,
             end_date=end_date,
             season_year=season_year,
@@ -249,6 +279,25 @@ class CollectionTab:
         )
         self.state.set_status("info", "실패 경기 재시도", f"targets={len(self.last_failed_targets)}", source=self.label, append=False)
 
+    def resume_collection(self) -> None:
+        if self.current_job and (snapshot := self.job_runner.get_snapshot(self.current_job.job_id)) and not snapshot.is_terminal:
+            self.state.set_status("warn", "수집 작업이 이미 실행 중입니다", "현재 작업이 끝난 뒤 다시 시도해 주세요.", source=self.label)
+            return
+        save_dir = Path(self.save_dir_selector.get_value() or "games")
+        journal_path = self.service.json_repository.find_resumable_journal(save_dir)
+        if journal_path is None:
+            self.state.set_status("warn", "이어서 수집할 중단 작업이 없습니다", str(save_dir), source=self.label)
+            return
+        self.log_panel.clear()
+        self._set_controls_enabled(running=True)
+        self.current_job = self.job_runner.start_job(
+            name="중단 수집 이어서",
+            source=self.label,
+            worker=lambda ctx: self.service.resume(journal_path, ctx),
+            listener=self._handle_job_event,
+        )
+        self.state.set_status("info", "중단된 수집을 이어서 진행합니다", str(journal_path), source=self.label, append=False)
+
     def cancel_collection(self) -> None:
         if self.current_job is None:
             return
@@ -329,6 +378,8 @@ class CollectionTab:
             f"{result.summary}\n"
             f"{detail}\n"
             f"실패 재시도 대상: {failed_target_count}\n"
+            f"API 요청: {metrics.get('request_count', 0)}건, 관측 속도 {metrics.get('observed_request_rate', 0.0)}/s "
+            f"(상한 {metrics.get('rate_limit_per_second') or '-'}/s, 제한 응답 {metrics.get('throttle_events', 0)}회)\n"
             f"이상 데이터: 수집은 되었지만 검증에서 문제나 경고가 확인된 경기\n"
             f"정상 저장 경로: {artifacts.get('save_dir', '-')}\n"
             f"이상 저장 경로: {artifacts.get('anomaly_dir', '-')}\n"
@@ -343,7 +394,7 @@ class CollectionTab:
         return path_text if Path(path_text).exists() else "없음"
 
     def _mode_label(self, mode: str) -> str:
-        return {"period": "기간", "single": "단일 날짜", "season": "시즌"}.get(mode, mode)
+        return {"period": "기간", "single": "단일 날짜", "season": "시즌", "live": "실시간"}.get(mode, mode)
 
     def _set_controls_enabled(self, *, running: bool) -> None:
         disabled_tags = [
@@ -354,8 +405,13 @@ class CollectionTab:
             self._tag("season_year"),
             self._tag("timeout"),
             self._tag("retry"),
+            self._tag("workers"),
+            self._tag("request_rate"),
+            self._tag("validation_processes"),
             self._tag("headless"),
+            self._tag("archive_raw"),
             self._tag("start_button"),
+            self._tag("resume_button"),
         ]
         for tag in disabled_tags:
             if dpg.does_item_exist(tag):
@@ -1,12 +1,16 @@
 import datetime as dt
 import json
+import time
 from pathlib import Path
 import sys
 
+import pytest
+
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 import services.collection_service as collection_service_module
 from services.collection_service import CollectionRequest, CollectionService, CollectionTarget
+from services.validation_service import ValidationService
 
 
 class DummyContext:
@@ -27,12 +31,20 @@ class DummyContext:
         return None
 
 
+class RejectingValidationService(ValidationService):
+    """Module-level so it pickles into validation worker processes."""
+
+    def validate_game(self, payload):
+        return {"ok": False, "issues": [f"rejected {payload['game_id']}"], "warnings": []}
+
+
 def _make_request(tmp_path: Path, targets: list[CollectionTarget], retry_count: int = 1) -> CollectionRequest:
     return CollectionRequest(
         mode="period",
         save_dir=tmp_path,
         timeout_seconds=8,
         retry_count=retry_count,
+        retry_base_delay_seconds=0.0,
         headless=True,
         start_date=dt.date(2026, 4, 8),
         end_date=dt.date(2026, 4, 8),
@@ -45,22 +57,26 @@ def _make_target(game_id: str, game_date: dt.date | None = None) -> CollectionTa
 
 
 def _build_fake_scraper(responses: dict[str, object]):
+    game_responses = responses
+
     class FakeScraper:
         calls: list[str] = []
         closed = False
+        browser_started = False
 
-        def __init__(self, wait=10, path="games", headless=True):
+        def __init__(self, wait=10, path="games", headless=True, **kwargs):
             self.wait = wait
             self.path = path
             self.headless = headless
+            self.options = kwargs
 
         def close(self):
             type(self).closed = True
 
-        def get_game_data(self, game_url):
+        def get_game_data(self, game_url, responses=None):
             normalized = type(self).normalize_game_url(game_url)
             type(self).calls.append(normalized)
-            response = responses[normalized]
+            response = game_responses[normalized]
             if isinstance(response, Exception):
                 raise response
             return response
@@ -120,6 +136,7 @@ def test_run_saves_successful_collection_to_normal_path(tmp_path, monkeypatch):
     assert result.metrics["failure_count"] == 0
     assert result.metrics["skipped_count"] == 0
     assert result.metrics["failed_targets"] == []
+    assert result.metrics["browser_started"] is False
     assert not Path(result.artifacts["debug_log_path"]).exists()
     assert not Path(result.artifacts["anomaly_log_path"]).exists()
     assert not Path(result.artifacts["failure_log_path"]).exists()
@@ -163,7 +180,7 @@ def test_run_saves_validation_failure_as_anomaly_and_excludes_retry_target(tmp_p
 def test_run_logs_failed_collection_and_includes_retry_target(tmp_path, monkeypatch):
     target = _make_target("20260408LGKT02026")
     normalized_url = f"https://m.sports.naver.com/game/{target.url.split('/')[-1]}"
-    fake_scraper = _build_fake_scraper({normalized_url: RuntimeError("network down")})
+    fake_scraper = _build_fake_scraper({normalized_url: ConnectionError("network down")})
     monkeypatch.setattr(collection_service_module, "NaverScraper", fake_scraper)
     monkeypatch.setattr(collection_service_module, "minimize_game_payload", _fake_minimize_game_payload)
     monkeypatch.setattr(
@@ -185,9 +202,9 @@ def test_run_logs_failed_collection_and_includes_retry_target(tmp_path, monkeypa
     assert len(failure_log_records) == 1
     assert failure_log_records[0]["status"] == "failed"
     assert failure_log_records[0]["attempt"] == 2
-    assert failure_log_records[0]["exception_type"] == "RuntimeError"
+    assert failure_log_records[0]["exception_type"] == "ConnectionError"
     assert "network down" in failure_log_records[0]["reason"]
-    assert "RuntimeError" in failure_log_records[0]["traceback"]
+    assert "ConnectionError" in failure_log_records[0]["traceback"]
 
 
 def test_run_reuses_existing_valid_file_as_skipped(tmp_path, monkeypatch):
@@ -249,3 +266,493 @@ def test_failed_targets_only_include_actual_failures_for_retry(tmp_path, monkeyp
     assert result.metrics["failure_count"] == 1
     assert result.metrics["failed_targets"] == [failed_target]
     assert anomaly_target not in result.metrics["failed_targets"]
+
+
+def test_concurrent_run_keeps_day_log_accounting_in_target_order(tmp_path, monkeypatch):
+    first_day = dt.date(2026, 4, 8)
+    second_day = dt.date(2026, 4, 9)
+    targets = [
+        _make_target("20260408SSKT02026", first_day),
+        _make_target("20260408NCLG02026", first_day),
+        _make_target("20260409SSKT02026", second_day),
+        _make_target("20260409NCLG02026", second_day),
+    ]
+    delays = {"20260408SSKT02026": 0.05, "20260409SSKT02026": 0.03}
+
+    class SlowScraper(_build_fake_scraper({})):
+        def get_game_data(self, game_url, responses=None):
+            game_id = type(self).extract_game_id(game_url)
+            time.sleep(delays.get(game_id, 0.0))
+            if game_id.endswith("NCLG02026"):
+                raise RuntimeError(f"{game_id} unavailable")
+            return ({"lineup": True}, [{"relay": True}], {"record": True})
+
+    monkeypatch.setattr(collection_service_module, "NaverScraper", SlowScraper)
+    monkeypatch.setattr(collection_service_module, "minimize_game_payload", _fake_minimize_game_payload)
+    monkeypatch.setattr(
+        collection_service_module.ValidationService,
+        "validate_game",
+        lambda self, payload: {"ok": True, "issues": [], "warnings": []},
+    )
+
+    request = CollectionRequest(**{**_make_request(tmp_path, targets).__dict__, "max_workers": 4})
+    context = DummyContext()
+    result = CollectionService().run(request, context)
+
+    assert [day.game_date for day in result.metrics["day_logs"]] == ["2026-04-08", "2026-04-09"]
+    assert [day.success_count for day in result.metrics["day_logs"]] == [1, 1]
+    assert result.metrics["failed_targets"] == [targets[1], targets[3]]
+    assert result.metrics["failed_files"] == ["20260408NCLG02026.json", "20260409NCLG02026.json"]
+    assert [message for _, message in context.progress_updates] == [f"{index}/4 games processed" for index in range(1, 5)]
+
+
+def test_discovery_prefers_schedule_api_and_falls_back_to_dom(tmp_path, monkeypatch):
+    game_date = dt.date(2026, 4, 8)
+    api_url = "https://m.sports.naver.com/game/20260408SSKT02026"
+    dom_url = "https://m.sports.naver.com/game/20260408NCLG02026"
+
+    class DiscoveryScraper(_build_fake_scraper({})):
+        api_error: Exception | None = None
+
+        def iter_schedule_game_urls(self, start_date, end_date):
+            if type(self).api_error is not None:
+                raise type(self).api_error
+            yield game_date, [api_url]
+
+        def iter_dom_schedule_urls(self, ranges, page_count=1):
+            assert ranges == [(dt.date(2026, 4, 8), dt.date(2026, 4, 8))]
+            yield game_date, [dom_url]
+
+    request = CollectionRequest(**{**_make_request(tmp_path, []).__dict__, "targets": None, "use_discovery_cache": False})
+    service = CollectionService()
+    context = DummyContext()
+
+    assert service._discover_targets(DiscoveryScraper(), request, context) == [CollectionTarget(game_date=game_date, url=api_url)]
+
+    DiscoveryScraper.api_error = ValueError("unexpected schedule response")
+    assert service._discover_targets(DiscoveryScraper(), request, context) == [CollectionTarget(game_date=game_date, url=dom_url)]
+    assert [entry[2].get("backends") for entry in context.logs if entry[1] == "collection targets discovered"] == [
+        {"api": 1},
+        {"dom": 1},
+    ]
+
+
+def test_discovery_serves_closed_months_from_cache(tmp_path, monkeypatch):
+    class FixedDate(dt.date):
+        @classmethod
+        def today(cls):
+            return cls(2025, 5, 15)
+
+    monkeypatch.setattr(collection_service_module.dt, "date", FixedDate)
+    requested_ranges = []
+
+    class CountingScraper(_build_fake_scraper({})):
+        def iter_schedule_game_urls(self, start_date, end_date):
+            requested_ranges.append((start_date.isoformat(), end_date.isoformat()))
+            for game_date in (dt.date(2025, 4, 30), dt.date(2025, 5, 2), dt.date(2025, 5, 20)):
+                if start_date <= game_date <= end_date:
+                    yield game_date, [f"https://m.sports.naver.com/game/{game_date:%Y%m%d}NCKT02025"]
+
+    request = CollectionRequest(
+        mode="season",
+        save_dir=tmp_path,
+        timeout_seconds=8,
+        retry_count=1,
+        headless=True,
+        start_date=dt.date(2025, 4, 15),
+        end_date=dt.date(2025, 5, 31),
+        season_year=2025,
+    )
+    service = CollectionService()
+
+    first = service._discover_targets(CountingScraper(), request, DummyContext())
+    second = service._discover_targets(CountingScraper(), request, DummyContext())
+
+    assert [target.game_date for target in first] == [dt.date(2025, 4, 30), dt.date(2025, 5, 2), dt.date(2025, 5, 20)]
+    assert second == first
+    assert requested_ranges == [
+        ("2025-04-01", "2025-04-30"),
+        ("2025-05-01", "2025-05-31"),
+        ("2025-05-01", "2025-05-31"),
+    ]
+    assert (tmp_path / "_cache" / "schedule_discovery.jsonl").exists()
+
+
+def test_resume_continues_only_unfinished_targets_from_journal(tmp_path, monkeypatch):
+    targets = [_make_target("20260408SSKT02026"), _make_target("20260408NCLG02026"), _make_target("20260408HHLT02026")]
+    fetched: list[str] = []
+    validated: list[str] = []
+
+    class MachineCrash(BaseException):
+        pass
+
+    class CrashingScraper(_build_fake_scraper({})):
+        crash_on: str | None = "20260408NCLG02026"
+
+        def get_game_data(self, game_url, responses=None):
+            game_id = type(self).extract_game_id(game_url)
+            if game_id == type(self).crash_on:
+                raise MachineCrash()
+            fetched.append(game_id)
+            return ({"lineup": True}, [{"relay": True}], {"record": True})
+
+    def fake_validate(self, payload):
+        validated.append(payload.get("game_id"))
+        return {"ok": True, "issues": [], "warnings": []}
+
+    monkeypatch.setattr(collection_service_module, "NaverScraper", CrashingScraper)
+    monkeypatch.setattr(collection_service_module, "minimize_game_payload", _fake_minimize_game_payload)
+    monkeypatch.setattr(collection_service_module.ValidationService, "validate_game", fake_validate)
+
+    service = CollectionService()
+    try:
+        service.run(_make_request(tmp_path, targets), DummyContext())
+    except MachineCrash:
+        pass
+
+    journal_path = service.json_repository.find_resumable_journal(tmp_path)
+    assert journal_path is not None
+    fetched.clear()
+    validated.clear()
+    CrashingScraper.crash_on = None
+
+    result = CollectionService().resume(journal_path, DummyContext())
+
+    assert fetched == ["20260408NCLG02026", "20260408HHLT02026"]
+    assert validated == ["20260408NCLG02026", "20260408HHLT02026"]
+    assert result.metrics["success_count"] == 3
+    assert result.metrics["games"] == 3
+    assert service.json_repository.find_resumable_journal(tmp_path) is None
+
+
+def test_reuse_check_uses_validation_index_until_file_or_validator_changes(tmp_path, monkeypatch):
+    target = _make_target("20260408LTKT02026")
+    cached_path = tmp_path / "2026" / "20260408LTKT02026.json"
+    cached_path.parent.mkdir(parents=True, exist_ok=True)
+    cached_path.write_text(json.dumps({"cached": True}, ensure_ascii=False), encoding="utf-8")
+    validated: list[dict] = []
+
+    def fake_validate(self, payload):
+        validated.append(payload)
+        return {"ok": bool(payload.get("cached")), "issues": [], "warnings": []}
+
+    monkeypatch.setattr(collection_service_module, "NaverScraper", _build_fake_scraper({}))
+    monkeypatch.setattr(collection_service_module.ValidationService, "validate_game", fake_validate)
+
+    first = CollectionService().run(_make_request(tmp_path, [target]), DummyContext())
+    second = CollectionService().run(_make_request(tmp_path, [target]), DummyContext())
+    assert first.metrics["skipped_count"] == second.metrics["skipped_count"] == 1
+    assert len(validated) == 1
+
+    cached_path.write_text(json.dumps({"cached": True, "edited": 1}, ensure_ascii=False), encoding="utf-8")
+    CollectionService().run(_make_request(tmp_path, [target]), DummyContext())
+    assert len(validated) == 2
+
+    monkeypatch.setattr(collection_service_module.ValidationService, "version", "test-next")
+    CollectionService().run(_make_request(tmp_path, [target]), DummyContext())
+    assert len(validated) == 3
+
+
+def test_staged_pipeline_keeps_input_order_and_bounds_in_flight_payloads():
+    from services.collection_pipeline import StagedPipeline
+    import threading
+
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+
+    def fetch(item):
+        if item % 5 == 0:
+            return "done", f"skipped-{item}"
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        return "validate", item * 10
+
+    def write(item, validated):
+        time.sleep(0.005)
+        with lock:
+            in_flight["now"] -= 1
+        return f"wrote-{validated}"
+
+    pipeline = StagedPipeline(
+        fetch=fetch,
+        validate=lambda item, value: value + 1,
+        write=write,
+        fetch_workers=4,
+        validate_workers=1,
+        queue_size=2,
+    )
+    results = list(pipeline.run(list(range(1, 21)), lambda: None))
+
+    assert [item for item, _ in results] == list(range(1, 21))
+    assert results[4] == (5, "skipped-5")
+    assert results[0] == (1, "wrote-11")
+    # fetch 4 + 두 큐 각 2 + validate 1 + write 1 을 넘지 않아야 한다.
+    assert in_flight["peak"] <= 4 + 2 + 1 + 2 + 1
+
+
+def test_pipelined_run_turns_write_errors_into_failures_without_refetching(tmp_path, monkeypatch):
+    targets = [_make_target("20260408SSKT02026"), _make_target("20260408NCLG02026"), _make_target("20260408LTHH02026")]
+    fake_scraper = _build_fake_scraper(
+        {
+            game_url: ({"lineup": True}, [{"relay": True}], {"record": True})
+            for game_url in (f"https://m.sports.naver.com/game/{target.url.split('/')[-1]}" for target in targets)
+        }
+    )
+    monkeypatch.setattr(collection_service_module, "NaverScraper", fake_scraper)
+    monkeypatch.setattr(collection_service_module, "minimize_game_payload", _fake_minimize_game_payload)
+    monkeypatch.setattr(
+        collection_service_module.ValidationService,
+        "validate_game",
+        lambda self, payload: {"ok": payload["game_id"] != "20260408NCLG02026", "issues": ["bad"], "warnings": []},
+    )
+    original_write = collection_service_module.JsonGameRepository.write_json_chunks
+
+    def flaky_write(self, path, chunks):
+        if path.name == "20260408LTHH02026.json":
+            raise OSError("disk full")
+        return original_write(self, path, chunks)
+
+    monkeypatch.setattr(collection_service_module.JsonGameRepository, "write_json_chunks", flaky_write)
+
+    request = CollectionRequest(**{**_make_request(tmp_path, targets, retry_count=3).__dict__, "max_workers": 2})
+    result = CollectionService().run(request, DummyContext())
+
+    assert result.metrics["success_count"] == 1
+    assert result.metrics["anomaly_count"] == 1
+    assert result.metrics["failed_targets"] == [targets[2]]
+    assert fake_scraper.calls.count("https://m.sports.naver.com/game/20260408LTHH02026") == 1
+    failure = _read_jsonl(result.artifacts["failure_log_path"])[0]
+    assert "disk full" in failure["reason"]
+
+
+def test_run_does_not_retry_final_http_errors(tmp_path, monkeypatch):
+    from infrastructure.http_client import HttpStatusError
+
+    target = _make_target("20260408HTOB02026")
+    normalized_url = f"https://m.sports.naver.com/game/{target.url.split('/')[-1]}"
+    fake_scraper = _build_fake_scraper({normalized_url: HttpStatusError(normalized_url, 404, "Not Found")})
+    fake_scraper.calls = []
+    monkeypatch.setattr(collection_service_module, "NaverScraper", fake_scraper)
+
+    result = CollectionService().run(_make_request(tmp_path, [target], retry_count=3), DummyContext())
+
+    assert fake_scraper.calls == [normalized_url]
+    assert result.metrics["failed_targets"] == [target]
+    assert _read_jsonl(result.artifacts["failure_log_path"])[0]["attempt"] == 1
+
+
+def test_run_does_not_retry_payload_shape_errors(tmp_path, monkeypatch):
+    target = _make_target("20260408HTOB02026")
+    normalized_url = f"https://m.sports.naver.com/game/{target.url.split('/')[-1]}"
+    fake_scraper = _build_fake_scraper({normalized_url: KeyError("textRelayData")})
+    fake_scraper.calls = []
+    monkeypatch.setattr(collection_service_module, "NaverScraper", fake_scraper)
+
+    result = CollectionService().run(_make_request(tmp_path, [target], retry_count=3), DummyContext())
+
+    assert fake_scraper.calls == [normalized_url]
+    assert result.metrics["failed_targets"] == [target]
+    assert _read_jsonl(result.artifacts["failure_log_path"])[0]["attempt"] == 1
+
+
+def test_validation_processes_use_the_injected_validation_service(tmp_path, monkeypatch):
+    targets = [_make_target("20260408SSKT02026"), _make_target("20260408NCLG02026")]
+    fake_scraper = _build_fake_scraper(
+        {f"https://m.sports.naver.com{target.url}": ({"lineup": True}, [{"relay": True}], {"record": True}) for target in targets}
+    )
+    monkeypatch.setattr(collection_service_module, "NaverScraper", fake_scraper)
+    monkeypatch.setattr(collection_service_module, "minimize_game_payload", _fake_minimize_game_payload)
+    request = CollectionRequest(**{**_make_request(tmp_path, targets).__dict__, "validation_processes": 1})
+
+    result = CollectionService(validation_service=RejectingValidationService()).run(request, DummyContext())
+
+    assert result.metrics["day_logs"][0].anomaly_count == 2
+    assert result.metrics["day_logs"][0].anomaly_reasons == ["issues=rejected 20260408SSKT02026", "issues=rejected 20260408NCLG02026"]
+
+    class LocalValidationService(ValidationService):
+        pass
+
+    with pytest.raises(ValueError):
+        CollectionService(validation_service=LocalValidationService()).run(request, DummyContext())
+
+
+def test_raw_archive_rebuilds_collected_game_without_network(tmp_path, monkeypatch):
+    from infrastructure.naver_scraper import NaverScraper
+    from infrastructure.raw_archive import RawResponseArchive
+    from services.json_migration_service import reminimize_archived_game
+
+    lineup = {"fullLineUp": [], "pitcherBullpen": [], "batterCandidate": []}
+    relay = {"result": {"textRelayData": {"inningScore": {"home": {"1": 0}}, "textRelays": [{"no": 2}, {"no": 1}]}}}
+    raw_responses = {
+        "preview": {"result": {"previewData": {"gameInfo": {}, "homeTeamLineUp": lineup, "awayTeamLineUp": lineup}}},
+        "relay": relay,
+        "relay?inning=1": relay,
+        "record": {"result": {"recordData": {"pitchersBoxscore": {}, "battersBoxscore": {}}}},
+    }
+
+    class ArchivingScraper(_build_fake_scraper({})):
+        def get_game_data(self, game_url, responses=None):
+            responses.update(raw_responses)
+            return NaverScraper.game_data_from_responses(game_url, responses)
+
+    monkeypatch.setattr(collection_service_module, "NaverScraper", ArchivingScraper)
+    monkeypatch.setattr(
+        collection_service_module.ValidationService,
+        "validate_game",
+        lambda self, payload: {"ok": True, "issues": [], "warnings": []},
+    )
+    target = _make_target("20260408SSKT02026")
+    request = CollectionRequest(**{**_make_request(tmp_path, [target]).__dict__, "archive_raw_responses": True})
+    CollectionService().run(request, DummyContext())
+
+    archive = RawResponseArchive.for_save_dir(tmp_path)
+    games = list(archive.iter_games(2026))
+    assert [game.game_id for game in games] == ["20260408SSKT02026"]
+    # relay 요약과 1이닝 응답은 내용이 같으므로 하나의 blob만 저장된다.
+    assert len(set(games[0].endpoints.values())) == 3
+    assert not list(archive.root.rglob("*.json"))
+
+    rebuilt = reminimize_archived_game(archive, games[0], output_root=tmp_path / "rebuilt", validate=False)
+
+    assert Path(rebuilt["written_path"]).read_text(encoding="utf-8") == (
+        tmp_path / "2026" / "20260408SSKT02026.json"
+    ).read_text(encoding="utf-8")
+
+
+def test_reminimize_in_place_refuses_hand_edited_files_and_keeps_backups(tmp_path, monkeypatch):
+    from infrastructure.naver_scraper import NaverScraper
+    from infrastructure.raw_archive import RawResponseArchive
+    from services.json_migration_service import ModifiedGameFileError, reminimize_archived_game
+
+    lineup = {"fullLineUp": [], "pitcherBullpen": [], "batterCandidate": []}
+    relay = {"result": {"textRelayData": {"inningScore": {"home": {"1": 0}}, "textRelays": [{"no": 1}]}}}
+    raw_responses = {
+        "preview": {"result": {"previewData": {"gameInfo": {}, "homeTeamLineUp": lineup, "awayTeamLineUp": lineup}}},
+        "relay": relay,
+        "relay?inning=1": relay,
+        "record": {"result": {"recordData": {"pitchersBoxscore": {}, "battersBoxscore": {}}}},
+    }
+
+    class ArchivingScraper(_build_fake_scraper({})):
+        def get_game_data(self, game_url, responses=None):
+            responses.update(raw_responses)
+            return NaverScraper.game_data_from_responses(game_url, responses)
+
+    monkeypatch.setattr(collection_service_module, "NaverScraper", ArchivingScraper)
+    monkeypatch.setattr(
+        collection_service_module.ValidationService,
+        "validate_game",
+        lambda self, payload: {"ok": True, "issues": [], "warnings": []},
+    )
+    target = _make_target("20260408SSKT02026")
+    request = CollectionRequest(**{**_make_request(tmp_path, [target]).__dict__, "archive_raw_responses": True})
+    CollectionService().run(request, DummyContext())
+    archive = RawResponseArchive.for_save_dir(tmp_path)
+    game = next(archive.iter_games(2026))
+    saved_path = tmp_path / "2026" / "20260408SSKT02026.json"
+    collected_text = saved_path.read_text(encoding="utf-8")
+
+    assert reminimize_archived_game(archive, game, output_root=tmp_path, validate=False)["changed"] is False
+
+    saved_path.write_text(collected_text.replace('"game_id"', '"game_id" ', 1), encoding="utf-8")
+    with pytest.raises(ModifiedGameFileError):
+        reminimize_archived_game(archive, game, output_root=tmp_path, validate=False)
+
+    forced = reminimize_archived_game(archive, game, output_root=tmp_path, validate=False, force=True)
+    assert forced["changed"] is True
+    assert saved_path.read_text(encoding="utf-8") == collected_text
+    assert Path(forced["backup_path"]).read_text(encoding="utf-8") != collected_text
+    assert Path(forced["backup_path"]).with_suffix(".patch").exists()
+
+    # 검증 결과가 이상으로 바뀌면 <season>/의 이전 결과는 백업 후 지워지고 _anomalies/에만 남는다.
+    monkeypatch.setattr(
+        "services.json_migration_service.validate_game",
+        lambda payload: {"ok": False, "issues": ["broken"], "warnings": []},
+    )
+    flipped = reminimize_archived_game(archive, game, output_root=tmp_path, validate=True)
+    assert flipped["written_path"] == (tmp_path / "_anomalies" / "2026" / "20260408SSKT02026.json").as_posix()
+    assert flipped["removed_path"] == saved_path.as_posix()
+    assert not saved_path.exists()
+    assert len(list((saved_path.parent / ".history" / saved_path.stem).glob("*_reminimize.bak"))) == 2
+
+
+def test_schedule_cache_shares_appends_between_instances_and_skips_torn_lines(tmp_path):
+    from infrastructure.schedule_cache import ScheduleDiscoveryCache
+
+    first = ScheduleDiscoveryCache.for_save_dir(tmp_path)
+    second = ScheduleDiscoveryCache.for_save_dir(tmp_path)
+    first.store_month(2025, 4, [(dt.date(2025, 4, 1), ["/game/20250401SSHH02025"])])
+    second.store_month(2025, 5, [(dt.date(2025, 5, 2), ["/game/20250502LGKT02025"])])
+    with first.path.open("a", encoding="utf-8") as handle:
+        # 다른 프로세스가 쓰다 만 줄과 형식이 틀린 줄
+        handle.write('{"season": 2025, "month": 6, "day": "x", "urls": []}\n[1, 2]\n{"season": 2025, "mon')
+
+    reloaded = ScheduleDiscoveryCache.for_save_dir(tmp_path)
+
+    assert [entry.urls for entry in reloaded.get_month(2025, 4)] == [("/game/20250401SSHH02025",)]
+    assert [entry.urls for entry in reloaded.get_month(2025, 5)] == [("/game/20250502LGKT02025",)]
+    assert reloaded.get_month(2025, 6) is None
+    assert first.path.with_suffix(".lock").exists()
+
+
+def test_backfill_shard_logs_reach_the_parent_context(tmp_path):
+    import queue
+
+    from services.backfill_service import _ShardReporter, forward_shard_logs
+
+    log_queue = queue.Queue()
+    reporter = _ShardReporter(tmp_path / "cancel", log_queue, "shard03")
+    reporter.log("warn", "retrying game fetch", file_name="20260408SSKT02026.json", attempt=1, path=tmp_path)
+    reporter.log("error", "collection failed", reason="boom")
+    context = DummyContext()
+
+    assert forward_shard_logs(log_queue, context) == 2
+    assert context.logs == [
+        ("warn", "retrying game fetch", {"shard": "shard03", "file_name": "20260408SSKT02026.json", "attempt": 1, "path": str(tmp_path)}),
+        ("error", "collection failed", {"shard": "shard03", "reason": "boom"}),
+    ]
+    assert forward_shard_logs(log_queue, context) == 0
+
+
+def test_backfill_merges_in_process_shard_results(tmp_path, monkeypatch):
+    from services.backfill_service import BackfillRequest, BackfillService, plan_shards
+
+    assert [(shard.start_date, shard.end_date) for shard in plan_shards(dt.date(2026, 3, 30), dt.date(2026, 5, 2))] == [
+        (dt.date(2026, 3, 30), dt.date(2026, 3, 31)),
+        (dt.date(2026, 4, 1), dt.date(2026, 4, 30)),
+        (dt.date(2026, 5, 1), dt.date(2026, 5, 2)),
+    ]
+    targets = {
+        dt.date(2026, 4, 8): _make_target("20260408SSKT02026", dt.date(2026, 4, 8)),
+        dt.date(2026, 5, 1): _make_target("20260501SSKT02026", dt.date(2026, 5, 1)),
+    }
+    urls = {key: f"https://m.sports.naver.com{target.url}" for key, target in targets.items()}
+    fake_scraper = _build_fake_scraper(
+        {urls[dt.date(2026, 4, 8)]: ({"lineup": True}, [{"relay": True}], {"record": True}), urls[dt.date(2026, 5, 1)]: RuntimeError("boom")}
+    )
+    monkeypatch.setattr(collection_service_module, "NaverScraper", fake_scraper)
+    monkeypatch.setattr(collection_service_module, "minimize_game_payload", _fake_minimize_game_payload)
+    monkeypatch.setattr(
+        collection_service_module.ValidationService,
+        "validate_game",
+        lambda self, payload: {"ok": True, "issues": [], "warnings": []},
+    )
+    monkeypatch.setattr(
+        CollectionService,
+        "_discover_targets",
+        lambda self, scraper, request, context: [target for day, target in targets.items() if request.start_date <= day <= request.end_date],
+    )
+
+    result = BackfillService().run(
+        BackfillRequest(save_dir=tmp_path, start_date=dt.date(2026, 4, 1), end_date=dt.date(2026, 5, 31), process_count=1, retry_count=1),
+        DummyContext(),
+    )
+
+    assert result.metrics["shard_count"] == 2
+    assert (result.metrics["games"], result.metrics["success"], result.metrics["failed"]) == (2, 1, 1)
+    assert [target.url for target in result.metrics["failed_targets"]] == ["/game/20260501SSKT02026"]
+    assert (tmp_path / "2026" / "20260408SSKT02026.json").exists()
+    journals = sorted((tmp_path / "logs").glob("collection_journal_*.jsonl"))
+    assert [path.stem.rsplit("_", 1)[-1] for path in journals] == ["shard00", "shard01"]
+    assert _read_jsonl(result.artifacts["shard01_failure_log_path"])[0]["game_id"] == "20260501SSKT02026"
@@ -0,0 +1,77 @@
+import datetime as dt
+import json
+import os
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from services.json_migration_service import iter_json_files
+from src.kbo_ingest.game_catalog import GameCatalog, catalog_paths
+from src.kbo_ingest.game_validation import collect_json_files
+from src.kbo_ingest.manifest import collect_season_files
+
+
+def write_game(root: Path, relative: str, *, home: str = "HH", away: str = "SS", gdate: int = 20250401) -> Path:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "schema_version": 2,
+        "game_id": path.stem,
+        "lineup": {"game_info": {"gdate": gdate, "hCode": home, "hName": f"{home} 팀", "aCode": away, "aName": f"{away} 팀"}},
+        "relay": [],
+        "record": {},
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_catalog_refresh_is_incremental_and_keeps_verdicts_for_unchanged_content(tmp_path):
+    first = write_game(tmp_path, "2025/20250401SSHH02025.json")
+    second = write_game(tmp_path, "2025/20250402LGKT02025.json", home="KT", away="LG", gdate=20250402)
+    write_game(tmp_path, "2025/.history/20250401SSHH02025/20250401T000000.json")
+    catalog = GameCatalog(tmp_path, validator_version="v1")
+
+    assert catalog.refresh().added == 3
+    catalog.record_validation(first, True, "v1")
+    catalog.record_validation(second, False, "v1")
+    assert catalog.refresh().unchanged == 3
+
+    os.utime(first, ns=(first.stat().st_atime_ns, first.stat().st_mtime_ns + 10_000_000))
+    write_game(tmp_path, "2025/20250402LGKT02025.json", home="KT", away="NC", gdate=20250402)
+    (tmp_path / "2025" / ".history" / "20250401SSHH02025" / "20250401T000000.json").unlink()
+    stats = catalog.refresh()
+
+    assert (stats.touched, stats.updated, stats.removed) == (1, 1, 1)
+    assert catalog.get(first).validation_ok is True
+    changed = catalog.get(second)
+    assert (changed.validation_ok, changed.away_team_code, changed.game_date) == (None, "NC", "2025-04-02")
+    assert catalog.paths(team="KT") == [second]
+    assert catalog.paths(date_from=dt.date(2025, 4, 2)) == [second]
+    assert catalog.paths(validation_ok=True) == [first]
+
+    # 검증기 버전이 바뀌면 이전 판정은 없는 것으로 본다.
+    bumped = GameCatalog(tmp_path, validator_version="v2")
+    assert bumped.get(first).validation_ok is None
+    assert bumped.paths(validation_ok=True) == []
+
+
+def test_file_discovery_helpers_list_games_from_catalog(tmp_path):
+    paths = [
+        write_game(tmp_path, "2025/20250401SSHH02025.json"),
+        write_game(tmp_path, "2024/20240401SSHH02024.json"),
+        write_game(tmp_path, "2025/_anomalies/2025/20250403SSHH02025.json"),
+        write_game(tmp_path, "2025/.history/20250401SSHH02025/20250401T000000.json"),
+    ]
+    (tmp_path / "2025" / "notes.txt").write_text("skip", encoding="utf-8")
+
+    # 경로만 필요한 목록은 glob만 하고 카탈로그를 만들지 않는다.
+    assert iter_json_files(tmp_path) == sorted(paths[:3])
+    assert collect_json_files(tmp_path) == sorted(path for path in tmp_path.rglob("*.json"))
+    assert collect_season_files(tmp_path, ("2025", "2024")) == [paths[0], paths[1]]
+    assert not (tmp_path / "_cache").exists()
+    assert catalog_paths(tmp_path, seasons=["2025", "2024"], use_catalog=True) == [paths[0], paths[1]]
+    assert (tmp_path / "_cache" / "game_catalog.sqlite3").exists()
+    assert catalog_paths(tmp_path, use_catalog=True) == iter_json_files(tmp_path)
+    assert catalog_paths(tmp_path / "missing") == []
+    assert not (tmp_path / "missing").exists()
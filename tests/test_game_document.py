@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.kbo_ingest.game_catalog import GameCatalog
+from src.kbo_ingest.game_document import LazyGameDocument
+from src.kbo_ingest.game_json import load_game_payload, minimize_game_payload, pretty_game_json
+
+
+def sample_payload(game_id: str = "20250401SSHH02025") -> dict:
+    def block(inning: int, side: str, text: str) -> dict:
+        return {"inn": inning, "homeOrAway": side, "textOptions": [{"seqno": 1, "text": text, "currentGameState": {"out": 0}}]}
+
+    raw_payload = {
+        "lineup": {"game_info": {"gdate": 20250401, "hCode": "HH", "hName": "한화", "aCode": "SS", "aName": "삼성"}},
+        "relay": [[block(1, "0", "1회초 타자"), block(1, "1", "1회말 타자")], [], [block(2, "0", "2회초 \"따옴표\" 타자")]],
+        "record": {"batter": {"home": [], "away": [], "homeTotal": {}, "awayTotal": {"ab": 1}}, "pitcher": {"home": [], "away": []}},
+    }
+    return minimize_game_payload(raw_payload, game_id=game_id, game_url=f"https://m.sports.naver.com/game/{game_id}")
+
+
+def test_lazy_document_reads_header_and_record_without_decoding_relay(tmp_path: Path):
+    payload = sample_payload()
+    text = pretty_game_json(payload)
+    # 두 번째 이닝 자리를 깨뜨려도 머리 부분과 record, 다른 이닝은 읽혀야 relay를 건너뛴 것이다.
+    broken = text.replace('"2회초 \\"따옴표\\" 타자"', '"2회초 <<truncated')
+    path = tmp_path / "2025" / f"{payload['game_id']}.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(broken, encoding="utf-8")
+
+    document = LazyGameDocument.open(path)
+
+    assert document.is_lazy
+    assert document.keys() == list(payload)
+    assert document.schema_version == 2
+    assert document.game_id == payload["game_id"]
+    assert document.game_info == payload["lineup"]["game_info"]
+    assert document.record == payload["record"]
+    assert document.relay_inning_count == 3
+    assert document.relay_inning(0) == payload["relay"][0]
+    assert document.relay_inning(1) == []
+    with pytest.raises(ValueError):
+        document.relay_inning(2)
+    with pytest.raises(ValueError):
+        document.payload()
+
+    catalog = GameCatalog(tmp_path)
+    assert catalog.refresh().added == 1
+    entry = catalog.get(path)
+    assert entry is not None
+    assert entry.parse_error is None
+    assert entry.home_team_name == "한화"
+
+
+@pytest.mark.parametrize("layout", ["pretty", "compact", "truncated"])
+def test_lazy_document_matches_full_parse_for_any_layout(tmp_path: Path, layout: str):
+    payload = sample_payload()
+    text = {
+        "pretty": pretty_game_json(payload),
+        "compact": json.dumps(payload, ensure_ascii=False),
+        "truncated": pretty_game_json(payload)[:-10],
+    }[layout]
+    path = tmp_path / f"{payload['game_id']}.json"
+    path.write_text(text, encoding="utf-8")
+
+    document = LazyGameDocument.open(path)
+
+    assert document.is_lazy == (layout == "pretty")
+    if layout == "truncated":
+        with pytest.raises(ValueError):
+            document.game_info
+        return
+    assert document.payload() == payload
+    assert [document.get(key) for key in document.keys()] == list(payload.values())
+    assert list(document.iter_relay_innings()) == payload["relay"]
+    assert document.minimized() == load_game_payload(path)
@@ -6,8 +6,15 @@ import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from src.kbo_ingest.game_json import minimize_game_payload, pretty_game_json
+from src.kbo_ingest.game_json import (
+    iter_pretty_game_json,
+    load_game_payload,
+    minimize_game_payload,
+    minimize_relay_block,
+    pretty_game_json,
+)
 from src.kbo_ingest.game_validation import validate_game
+from src.kbo_ingest import json_codec
 from src.kbo_ingest.source_profile import build_source_profile
 
 
@@ -90,6 +97,8 @@ def test_minimize_game_payload_strips_unused_fields():
     assert "birth" not in minimized["lineup"]["home_starter"][0]
     assert "inn1" not in minimized["record"]["batter"]["away"][0]
     assert "era" not in minimized["record"]["pitcher"]["home"][0]
+    assert [[minimize_relay_block(block) for block in inning] for inning in minimized["relay"]] == minimized["relay"]
+    assert "".join(iter_pretty_game_json(minimized)) == pretty_game_json(minimized)
 
 
 @pytest.mark.parametrize(
@@ -127,3 +136,65 @@ def test_validate_game_accepts_minimized_real_payload(source_path: Path):
     migrated_payload = minimize_game_payload(raw_payload, file_path=source_path)
 
     assert validate_game(migrated_payload) == validate_game(raw_payload)
+
+
+def test_json_codecs_produce_byte_identical_pretty_text():
+    real_path = Path("example/20240724WOOB02024.json")
+    edge_payload = {
+        "text": "한글 \"따옴표\" \\ \x00\x1f\x7f\u2028 \t\n",
+        "floats": [0.0, -0.0, 1e-05, 0.0001, 123.0, 0.1, 1e16, -2.5e-7, 9007199254740993.0, float("nan"), float("inf")],
+        "ints": [0, -1, 2**63 - 1, 2**64, -(2**70)],
+        "empty": [{}, [], ""],
+        1: "non-string key",
+        "nested": (True, False, None),
+    }
+    payloads = [edge_payload, {"floats": [1.5, 0.25], "ok": None}]
+    if real_path.exists():
+        payloads.append(minimize_game_payload(json.loads(real_path.read_text(encoding="utf-8")), file_path=real_path))
+
+    reference = json_codec.StdlibJsonCodec()
+    codecs = [json_codec.create_json_codec(name) for name in json_codec.available_codecs()]
+    for payload in payloads:
+        expected = json.dumps(payload, ensure_ascii=False, indent=2)
+        for codec in codecs:
+            assert codec.dumps_pretty(payload) == expected, codec.name
+            assert "".join(codec.iter_pretty(payload)) == expected, codec.name
+        text = reference.dumps_pretty(payload)
+        for codec in codecs:
+            assert codec.dumps_pretty(codec.loads(text.encode("utf-8"))) == reference.dumps_pretty(reference.loads(text))
+
+    for raw in [b"123456789012345678901234567890", b"[NaN, 1e400]", b'"\\ud800"', b'{"a": 1, "b": 2, "a": 3}']:
+        expected = repr(json.loads(raw.decode("utf-8")))
+        for codec in codecs:
+            assert repr(codec.loads(raw)) == expected, (codec.name, raw)
+
+
+@pytest.mark.skipif(json_codec.orjson is None, reason="orjson is not installed")
+def test_orjson_iter_pretty_streams_large_payload_in_bounded_chunks():
+    block = {"inn": 1, "homeOrAway": "0", "textOptions": [{"seqno": seqno, "text": "타자 " * 20} for seqno in range(20)]}
+    payload = minimize_game_payload({"lineup": {}, "relay": [[block] * 30 for _ in range(9)], "record": {}}, game_id="20260406TEST")
+    expected = json.dumps(payload, ensure_ascii=False, indent=2)
+
+    chunks = list(json_codec.create_json_codec("orjson").iter_pretty(payload))
+
+    assert len(chunks) >= 2
+    assert "".join(chunks) == expected
+    assert max(len(chunk) for chunk in chunks) < len(expected) // 100
+
+
+def test_json_codec_falls_back_to_stdlib_without_orjson(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(json_codec, "orjson", None)
+    previous = json_codec.set_json_codec(None)
+    try:
+        monkeypatch.setenv(json_codec.CODEC_ENV_VAR, "auto")
+        assert json_codec.available_codecs() == ("stdlib",)
+        assert json_codec.get_json_codec().name == "stdlib"
+        with pytest.raises(ValueError):
+            json_codec.create_json_codec("orjson")
+
+        path = tmp_path / "20260406TEST.json"
+        payload = minimize_game_payload({"lineup": {}, "relay": [], "record": {}}, file_path=path)
+        path.write_text(pretty_game_json(payload), encoding="utf-8")
+        assert pretty_game_json(load_game_payload(path)) == path.read_text(encoding="utf-8")
+    finally:
+        json_codec.set_json_codec(previous)
@@ -0,0 +1,431 @@
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import sys
+import threading
+import zlib
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from infrastructure.http_client import HttpStatusError, PooledHttpClient
+from infrastructure.naver_scraper import NaverScraper
+from infrastructure.rate_limiter import TokenBucketRateLimiter
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.client_ports.add(self.client_address[1])
+        server.paths.append(self.path)
+        if self.path.endswith("/missing"):
+            body = b'{"code": 404}'
+            self.send_response(404)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        body = json.dumps({"path": self.path, "name": "한화"}, ensure_ascii=False).encode("utf-8")
+        accept = self.headers.get("Accept-Encoding", "")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in accept and self.path.endswith("/gzip"):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        elif "deflate" in accept and self.path.endswith("/deflate"):
+            body = zlib.compress(body)
+            self.send_header("Content-Encoding", "deflate")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        return None
+
+
+@pytest.fixture
+def stand_in_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.client_ports = set()
+    server.paths = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pooled_client_reuses_connection_and_decodes_compressed_bodies(stand_in_server):
+    base_url = f"http://127.0.0.1:{stand_in_server.server_address[1]}"
+    client = PooledHttpClient()
+
+    plain = client.get_json(f"{base_url}/games/1/plain")
+    gzipped = client.get_json(f"{base_url}/games/1/gzip")
+    deflated = client.get_json(f"{base_url}/games/1/deflate")
+    client.close()
+
+    assert plain == {"path": "/games/1/plain", "name": "한화"}
+    assert gzipped["path"] == "/games/1/gzip"
+    assert deflated["path"] == "/games/1/deflate"
+    assert len(stand_in_server.client_ports) == 1
+    stats = client.stats()
+    assert {key: stats[key] for key in ("http_connections_opened", "http_requests_sent", "http_reused_requests")} == {
+        "http_connections_opened": 1,
+        "http_requests_sent": 3,
+        "http_reused_requests": 2,
+    }
+    assert 0 < stats["http_latency_p50_ms"] <= stats["http_latency_p95_ms"]
+
+
+def test_pooled_client_raises_status_error_and_keeps_connection(stand_in_server):
+    base_url = f"http://127.0.0.1:{stand_in_server.server_address[1]}"
+    client = PooledHttpClient()
+
+    with pytest.raises(HttpStatusError) as exc_info:
+        client.get_json(f"{base_url}/games/1/missing")
+    client.get_json(f"{base_url}/games/1/plain")
+    client.close()
+
+    assert exc_info.value.status == 404
+    assert client.stats()["http_connections_opened"] == 1
+
+
+def test_scraper_fetch_game_endpoint_uses_swappable_transport(stand_in_server):
+    base_url = f"http://127.0.0.1:{stand_in_server.server_address[1]}/schedule/games"
+    scraper = NaverScraper.__new__(NaverScraper)
+    scraper.rate_limiter = TokenBucketRateLimiter(None)
+    scraper.http_client = PooledHttpClient()
+    scraper.api_base_url = base_url
+
+    for endpoint in ("preview", "relay", "record"):
+        scraper.fetch_game_endpoint("20250409NCKT02025", endpoint)
+    scraper.http_client.close()
+
+    assert stand_in_server.paths == [
+        "/schedule/games/20250409NCKT02025/preview",
+        "/schedule/games/20250409NCKT02025/relay",
+        "/schedule/games/20250409NCKT02025/record",
+    ]
+    assert len(stand_in_server.client_ports) == 1
+
+
+def test_recorded_response_server_replays_archive_for_collection_with_injected_errors(tmp_path, monkeypatch):
+    import datetime as dt
+
+    import services.collection_service as collection_service_module
+    from infrastructure.raw_archive import RawResponseArchive
+    from infrastructure.standin_server import RecordedResponseServer
+    from services.collection_benchmark import archived_targets
+    from services.collection_service import CollectionRequest, CollectionService
+
+    monkeypatch.chdir(tmp_path)
+    lineup = {"fullLineUp": [], "pitcherBullpen": [], "batterCandidate": []}
+    relay = {"result": {"textRelayData": {"inningScore": {"home": {"1": 0}}, "textRelays": [{"no": 1}]}}}
+    archive = RawResponseArchive.for_save_dir(tmp_path / "recorded")
+    for game_id in ("20250401SSKT02025", "20250402SSKT02025", "20250403SSKT02025"):
+        archive.store_game(
+            season=2025,
+            game_id=game_id,
+            game_url=f"https://m.sports.naver.com/game/{game_id}",
+            file_name=f"{game_id}.json",
+            collected_at="2025-04-04T00:00:00+00:00",
+            responses={
+                "preview": {"result": {"previewData": {"gameInfo": {}, "homeTeamLineUp": lineup, "awayTeamLineUp": lineup}}},
+                "relay": relay,
+                "relay?inning=1": relay,
+                "record": {"result": {"recordData": {"pitchersBoxscore": {}, "battersBoxscore": {}}}},
+            },
+        )
+    monkeypatch.setattr(
+        collection_service_module.ValidationService,
+        "validate_game",
+        lambda self, payload: {"ok": True, "issues": [], "warnings": []},
+    )
+    targets = archived_targets(archive)
+
+    with RecordedResponseServer(archive, error_rate=0.3, seed=7) as server:
+        result = CollectionService().run(
+            CollectionRequest(
+                mode="period",
+                save_dir=tmp_path / "games",
+                timeout_seconds=5,
+                retry_count=10,
+                retry_base_delay_seconds=0.0,
+                headless=True,
+                start_date=dt.date(2025, 4, 1),
+                end_date=dt.date(2025, 4, 3),
+                targets=targets,
+                max_workers=2,
+                request_rate_per_second=0,
+                api_base_url=server.api_base_url,
+            ),
+            _QuietContext(),
+        )
+
+    assert server.injected_error_count > 0
+    assert result.metrics["success_count"] == 3
+    assert result.metrics["throttle_events"] == server.injected_error_count
+    assert result.metrics["http_latency_p95_ms"] is not None
+    assert sorted(path.name for path in (tmp_path / "games" / "2025").glob("*.json")) == [
+        "20250401SSKT02025.json",
+        "20250402SSKT02025.json",
+        "20250403SSKT02025.json",
+    ]
+
+
+class _QuietContext:
+    def log(self, level, message, **context):
+        return None
+
+    def set_progress(self, progress, message=None):
+        return None
+
+    def is_cancelled(self):
+        return False
+
+    def check_cancelled(self):
+        return None
+
+
+def test_live_mode_fetches_only_new_innings_and_finalizes_finished_game(tmp_path, monkeypatch):
+    import datetime as dt
+
+    import services.collection_service as collection_service_module
+    from infrastructure.raw_archive import RawResponseArchive
+    from infrastructure.standin_server import RecordedResponseServer
+    from services.collection_service import CollectionRequest, CollectionService
+
+    monkeypatch.chdir(tmp_path)
+    game_id = "20250405SSKT02025"
+    lineup = {"fullLineUp": [], "pitcherBullpen": [], "batterCandidate": []}
+
+    def relay(inning_keys, texts):
+        score = {str(key): 0 for key in inning_keys}
+        return {"result": {"textRelayData": {"inningScore": {"home": score, "away": score}, "textRelays": texts}}}
+
+    archive = RawResponseArchive.for_save_dir(tmp_path / "recorded")
+    archive.store_game(
+        season=2025,
+        game_id=game_id,
+        game_url=f"https://m.sports.naver.com/game/{game_id}",
+        file_name=f"{game_id}.json",
+        collected_at="2025-04-05T12:00:00+00:00",
+        responses={
+            "preview": {"result": {"previewData": {"gameInfo": {}, "homeTeamLineUp": lineup, "awayTeamLineUp": lineup}}},
+            "relay": relay([1, 2, 3], [{"no": 30}]),
+            **{f"relay?inning={inning}": relay([inning], [{"no": inning * 10}]) for inning in (1, 2, 3)},
+            "record": {"result": {"recordData": {"pitchersBoxscore": {}, "battersBoxscore": {}}}},
+        },
+    )
+    monkeypatch.setattr(
+        collection_service_module.ValidationService,
+        "validate_game",
+        lambda self, payload: {"ok": True, "issues": [], "warnings": []},
+    )
+    save_dir = tmp_path / "games"
+    partial_path = save_dir / "_live" / "2025" / f"{game_id}.partial"
+
+    with RecordedResponseServer(archive) as server:
+        request = CollectionRequest(
+            mode="live",
+            save_dir=save_dir,
+            timeout_seconds=5,
+            retry_count=2,
+            retry_base_delay_seconds=0.0,
+            headless=True,
+            start_date=dt.date(2025, 4, 5),
+            end_date=dt.date(2025, 4, 5),
+            request_rate_per_second=0,
+            live_poll_interval_seconds=0.0,
+            live_max_polls=1,
+            api_base_url=server.api_base_url,
+        )
+
+        def endpoints_of_next_poll():
+            server.request_paths.clear()
+            result = CollectionService().run(request, _QuietContext())
+            return [path.rsplit("/", 1)[-1] for path in server.request_paths if f"/{game_id}/" in path], result
+
+        server.play_live(game_id, innings_revealed=1)
+        first, _ = endpoints_of_next_poll()
+        assert first == ["relay", "relay?inning=1", "preview", "record"]
+        assert json.loads(partial_path.read_text(encoding="utf-8"))["inning_count"] == 1
+
+        server.advance_live(game_id)
+        second, _ = endpoints_of_next_poll()
+        assert second == ["relay", "relay?inning=1", "relay?inning=2"]
+
+        server.advance_live(game_id)
+        final, result = endpoints_of_next_poll()
+        assert final == ["relay", "relay?inning=2", "relay?inning=3", "preview", "record"]
+
+    saved = json.loads((save_dir / "2025" / f"{game_id}.json").read_text(encoding="utf-8"))
+    assert [[block["no"] for block in inning] for inning in saved["relay"]] == [[10], [20], [30]]
+    assert result.metrics["success_count"] == 1
+    assert not partial_path.exists()
+
+
+def test_backfill_runs_month_shards_in_processes_sharing_save_dir_and_rate_budget(tmp_path):
+    import datetime as dt
+
+    from infrastructure.raw_archive import RawResponseArchive
+    from infrastructure.standin_server import RecordedResponseServer
+    from services.backfill_service import BackfillRequest, BackfillService
+
+    lineup = {"fullLineUp": [], "pitcherBullpen": [], "batterCandidate": []}
+    relay = {"result": {"textRelayData": {"inningScore": {"home": {"1": 0}}, "textRelays": [{"no": 1}]}}}
+    game_ids = ["20250401SSKT02025", "20250402SSKT02025", "20250501SSKT02025", "20250502SSKT02025"]
+    archive = RawResponseArchive.for_save_dir(tmp_path / "recorded")
+    for game_id in game_ids:
+        archive.store_game(
+            season=2025,
+            game_id=game_id,
+            game_url=f"https://m.sports.naver.com/game/{game_id}",
+            file_name=f"{game_id}.json",
+            collected_at="2025-05-03T00:00:00+00:00",
+            responses={
+                "preview": {"result": {"previewData": {"gameInfo": {}, "homeTeamLineUp": lineup, "awayTeamLineUp": lineup}}},
+                "relay": relay,
+                "relay?inning=1": relay,
+                "record": {"result": {"recordData": {"pitchersBoxscore": {}, "battersBoxscore": {}}}},
+            },
+        )
+    save_dir = tmp_path / "games"
+
+    with RecordedResponseServer(archive) as server:
+        result = BackfillService().run(
+            BackfillRequest(
+                save_dir=save_dir,
+                start_date=dt.date(2025, 4, 1),
+                end_date=dt.date(2025, 5, 31),
+                timeout_seconds=5,
+                process_count=2,
+                request_rate_per_second=200.0,
+                use_discovery_cache=False,
+                api_base_url=server.api_base_url,
+            ),
+            _QuietContext(),
+        )
+
+    assert result.metrics["shard_count"] == 2
+    assert result.metrics["failed_shards"] == []
+    assert result.metrics["games"] == 4
+    assert result.metrics["success"] + result.metrics["anomaly"] == 4
+    # 일정 조회 2회(월별) + 경기당 preview/relay/relay?inning=1/record 4회
+    assert result.metrics["request_count"] == server.request_count == 2 + 4 * 4
+    assert [day.game_date for day in result.metrics["day_logs"]] == ["2025-04-01", "2025-04-02", "2025-05-01", "2025-05-02"]
+    journals = sorted((save_dir / "logs").glob("collection_journal_*.jsonl"))
+    assert [path.stem.rsplit("_", 1)[-1] for path in journals] == ["shard00", "shard01"]
+    assert result.artifacts["shard01_journal_path"] == str(journals[1])
+    assert not list((save_dir / "_cache").glob("backfill_*"))
+
+
+def test_iter_json_array_items_streams_nested_array_across_chunk_boundaries():
+    import io
+
+    from infrastructure.json_stream import TruncatedJsonError, iter_json_array_items
+
+    items = [{"no": index, "text": "한화 \"홈런\" ]}" * index, "values": [1.5, -2e3, None, True]} for index in range(40)] + [12345]
+    document = {"result": {"other": [{"textRelays": [0]}, "]\""], "textRelayData": {"textRelays": items, "after": [1, 2]}}}
+    raw = json.dumps(document, ensure_ascii=False, indent=2).encode("utf-8")
+    path = ("result", "textRelayData", "textRelays")
+
+    for chunk_size in (1, 7, 4096):
+        assert list(iter_json_array_items(io.BytesIO(raw), path, chunk_size=chunk_size)) == items
+    with pytest.raises(TruncatedJsonError):
+        list(iter_json_array_items(io.BytesIO(raw[: len(raw) // 2]), path))
+    with pytest.raises(TruncatedJsonError):
+        list(iter_json_array_items(io.BytesIO(raw[: raw.index(b'"textRelays": [') - 1]), path))
+    with pytest.raises(ValueError) as missing:
+        list(iter_json_array_items(io.BytesIO(b'{"result": {}}'), path))
+    assert not isinstance(missing.value, TruncatedJsonError)
+
+
+def test_streamed_relay_collection_saves_same_file_as_full_parse(tmp_path, monkeypatch):
+    import datetime as dt
+
+    import services.collection_service as collection_service_module
+    from infrastructure.raw_archive import RawResponseArchive
+    from infrastructure.standin_server import RecordedResponseServer
+    from services.collection_benchmark import archived_targets
+    from services.collection_service import CollectionRequest, CollectionService
+
+    monkeypatch.chdir(tmp_path)
+    game_id = "20250401SSKT02025"
+    lineup = {"fullLineUp": [], "pitcherBullpen": [], "batterCandidate": []}
+
+    def relay(inning):
+        blocks = [
+            {
+                "no": inning * 10 + index,
+                "inn": inning,
+                "title": f"{inning}회 {index}번 타자",
+                "textOptions": [{"seqno": index, "text": "안타", "type": 1, "unused": "x" * 50}],
+                "ptsOptions": [{"pitchId": f"p{index}", "speed": 145}],
+                "unusedBlockField": {"nested": list(range(20))},
+            }
+            for index in range(3)
+        ]
+        return {"result": {"textRelayData": {"inningScore": {"home": {"1": 0, "2": 1}}, "textRelays": blocks}}}
+
+    archive = RawResponseArchive.for_save_dir(tmp_path / "recorded")
+    archive.store_game(
+        season=2025,
+        game_id=game_id,
+        game_url=f"https://m.sports.naver.com/game/{game_id}",
+        file_name=f"{game_id}.json",
+        collected_at="2025-04-02T00:00:00+00:00",
+        responses={
+            "preview": {"result": {"previewData": {"gameInfo": {}, "homeTeamLineUp": lineup, "awayTeamLineUp": lineup}}},
+            "relay": relay(2),
+            "relay?inning=1": relay(1),
+            "relay?inning=2": relay(2),
+            "record": {"result": {"recordData": {"pitchersBoxscore": {}, "battersBoxscore": {}}}},
+        },
+    )
+    monkeypatch.setattr(
+        collection_service_module.ValidationService,
+        "validate_game",
+        lambda self, payload: {"ok": True, "issues": [], "warnings": []},
+    )
+    monkeypatch.setattr(collection_service_module.dt, "datetime", _FrozenDatetime)
+
+    saved = {}
+    with RecordedResponseServer(archive) as server:
+        for stream_relay in (True, False):
+            save_dir = tmp_path / f"games_stream_{stream_relay}"
+            CollectionService().run(
+                CollectionRequest(
+                    mode="period",
+                    save_dir=save_dir,
+                    timeout_seconds=5,
+                    retry_count=1,
+                    headless=True,
+                    start_date=dt.date(2025, 4, 1),
+                    end_date=dt.date(2025, 4, 1),
+                    targets=archived_targets(archive),
+                    request_rate_per_second=0,
+                    api_base_url=server.api_base_url,
+                    stream_relay=stream_relay,
+                ),
+                _QuietContext(),
+            )
+            saved[stream_relay] = (save_dir / "2025" / f"{game_id}.json").read_bytes()
+
+    assert saved[True] == saved[False]
+    relay_blocks = json.loads(saved[True])["relay"]
+    assert [[block["no"] for block in inning] for inning in relay_blocks] == [[12, 11, 10], [22, 21, 20]]
+    assert "unusedBlockField" not in relay_blocks[0][0]
+
+
+class _FrozenDatetime(__import__("datetime").datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 4, 2, 12, 0, 0, tzinfo=tz)
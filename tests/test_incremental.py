@@ -0,0 +1,257 @@
+from contextlib import nullcontext
+import hashlib
+import json
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import src.kbo_ingest.runner as runner_module
+from src.kbo_ingest.incremental import delete_stale_games, plan_incremental_load, source_path_key, update_renamed_sources
+
+
+class FakeCursor:
+    """Cursor with pipeline-mode semantics: ``rowcount`` stays -1 until a result is fetched."""
+
+    def __init__(self, rows: dict[str, list[tuple]], events: list) -> None:
+        self.rows = rows
+        self.events = events
+        self.rowcount = -1
+        self._last: list[tuple] = []
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: tuple = ()) -> None:
+        sql = " ".join(sql.split())
+        self.events.append((sql, params))
+        self.rowcount = -1
+        self._last = next((rows for prefix, rows in self.rows.items() if sql.startswith(prefix)), [])
+        if sql.startswith("DELETE FROM raw_games") and "RETURNING" in sql:
+            self._last = [(raw_game_id,) for raw_game_id in params[0]]
+
+    def executemany(self, sql: str, params_seq: list[tuple]) -> None:
+        for params in params_seq:
+            self.execute(sql, params)
+
+    def fetchall(self) -> list[tuple]:
+        self.rowcount = len(self._last)
+        return self._last
+
+
+class FakeConnection:
+    def __init__(self, rows: dict[str, list[tuple]]) -> None:
+        self.events: list = []
+        self.cur = FakeCursor(rows, self.events)
+
+    def __enter__(self) -> "FakeConnection":
+        return self
+
+    def __exit__(self, exc_type, *_: object) -> None:
+        self.events.append("rollback" if exc_type else "commit")
+
+    def cursor(self) -> FakeCursor:
+        return self.cur
+
+    def pipeline(self):
+        return nullcontext()
+
+    def commit(self) -> None:
+        self.events.append("commit")
+
+    def rollback(self) -> None:
+        self.events.append("rollback")
+
+    @property
+    def statements(self) -> list[str]:
+        return [event[0] for event in self.events if isinstance(event, tuple)]
+
+
+LOADED_SOURCES = "SELECT rg.raw_game_id, rg.source_file_name"
+
+
+def write_game(path: Path, gdate: int = 20250401, *, edited: bool = False) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"lineup": {"game_info": {"gdate": gdate, "hCode": "HH", "aCode": "SS", "gameFlag": "0", "round": "1"}}, "edited": edited}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def game_key(gdate: int = 20250401) -> str:
+    return f"{gdate}_SS_HH_0_1"
+
+
+def test_plan_skips_unchanged_games_and_replaces_changed_ones(tmp_path: Path):
+    unchanged = tmp_path / "unchanged.json"
+    changed = tmp_path / "changed.json"
+    new = tmp_path / "new.json"
+    outside_slice = tmp_path / "outside.json"
+    unchanged_hash = write_game(unchanged, 20250401)
+    write_game(changed, 20250402, edited=True)
+    write_game(new, 20250403)
+    outside_hash = write_game(outside_slice, 20250404)
+    gone = tmp_path / "gone.json"
+    # Windows에서 적재한 행은 경로 구분자가 "\"로 남는다.
+    windows_changed = str(changed).replace("/", "\\")
+    conn = FakeConnection(
+        {
+            LOADED_SOURCES: [
+                (1, str(unchanged), unchanged_hash, game_key(20250401)),
+                (5, str(unchanged), "older-hash", None),
+                (2, windows_changed, "old-hash", game_key(20250402)),
+                (3, str(gone), "gone-hash", game_key(20250405)),
+                (4, str(outside_slice), outside_hash, game_key(20250404)),
+            ]
+        }
+    )
+    entries = [{"path": str(path)} for path in (unchanged, changed, new)]
+
+    plan = plan_incremental_load(conn, entries)
+
+    assert source_path_key(windows_changed) == source_path_key(changed)
+    assert plan.unchanged == [entries[0]]
+    assert plan.to_load == [entries[1], entries[2]]
+    assert plan.summary() == {"unchanged": 1, "new": 1, "changed": 1, "missing": 1}
+    assert plan.replaced_raw_game_ids == {str(changed): [2]}
+    assert plan.stale_raw_game_ids == [5]
+    assert plan.renamed_sources == {}
+    assert plan.missing == [(3, source_path_key(gone))]
+    assert len(conn.statements) == 1 and conn.statements[0].startswith(LOADED_SOURCES)
+
+
+def test_plan_matches_games_loaded_from_a_relative_path_when_run_with_absolute_paths(tmp_path: Path, monkeypatch):
+    data_root = tmp_path / "project"
+    unchanged = data_root / "games" / "2025" / "unchanged.json"
+    changed = data_root / "games" / "2025" / "changed.json"
+    outside_slice = data_root / "games" / "2024" / "outside.json"
+    unchanged_hash = write_game(unchanged, 20250401)
+    write_game(changed, 20250402, edited=True)
+    outside_hash = write_game(outside_slice, 20240401)
+    # 처음에는 project 폴더에서 상대 경로로 적재했다.
+    conn = FakeConnection(
+        {
+            LOADED_SOURCES: [
+                (1, "games/2025/unchanged.json", unchanged_hash, game_key(20250401)),
+                (2, "games\\2025\\changed.json", "old-hash", game_key(20250402)),
+                (3, "games/2024/outside.json", outside_hash, game_key(20240401)),
+                (4, "games/2024/gone.json", "gone-hash", game_key(20240402)),
+            ]
+        }
+    )
+    # 이번에는 다른 작업 디렉터리에서 절대 경로 manifest로 실행한다.
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    entries = [{"path": str(unchanged)}, {"path": str(changed)}]
+
+    plan = plan_incremental_load(conn, entries)
+
+    assert plan.unchanged == [entries[0]]
+    assert plan.to_load == [entries[1]]
+    assert plan.replaced_raw_game_ids == {str(changed): [2]}
+    assert plan.summary() == {"unchanged": 1, "new": 0, "changed": 1, "missing": 1}
+    # 작업 디렉터리가 아니라 적재했던 폴더 기준으로 보므로 남아 있는 2024 경기는 지우지 않는다.
+    assert plan.missing == [(4, "games/2024/gone.json")]
+    assert plan.renamed_sources == {1: str(unchanged)}
+
+    conn.events.clear()
+    assert update_renamed_sources(conn, plan) == 1
+    assert conn.events == [
+        ("UPDATE raw_games SET source_file_name = %s WHERE raw_game_id = %s", (str(unchanged), 1)),
+        ("UPDATE games SET source_file_name = %s WHERE raw_game_id = %s", (str(unchanged), 1)),
+    ]
+
+
+def test_plan_keeps_relative_sources_when_their_folder_is_unknown(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    conn = FakeConnection({LOADED_SOURCES: [(4, "games/2024/elsewhere.json", "hash", game_key(20240402))]})
+
+    plan = plan_incremental_load(conn, [])
+
+    assert plan.missing == []
+
+
+def test_stale_game_delete_counts_rows_returned_after_the_pipeline_syncs(tmp_path: Path):
+    gone = tmp_path / "gone.json"
+    conn = FakeConnection(
+        {
+            LOADED_SOURCES: [(3, str(gone), "gone-hash", game_key(20250405))],
+            "SELECT game_id FROM games": [(30,)],
+        }
+    )
+    plan = plan_incremental_load(conn, [])
+    conn.events.clear()
+
+    assert delete_stale_games(conn, plan) == 0
+    assert conn.events == []
+
+    assert delete_stale_games(conn, plan, delete_missing=True) == 1
+    assert conn.cur.rowcount == 1
+    statements = conn.statements
+    assert statements[0] == "SELECT game_id FROM games WHERE raw_game_id = ANY(%s)"
+    assert any(sql.startswith("DELETE FROM batted_ball_results") for sql in statements)
+    assert statements[-1] == "DELETE FROM raw_games WHERE raw_game_id = ANY(%s) RETURNING raw_game_id"
+    assert conn.events[-1][1] == ([3],)
+
+
+def test_incremental_load_deletes_replaced_version_in_the_reload_transaction(tmp_path: Path, monkeypatch):
+    changed = tmp_path / "changed.json"
+    write_game(changed, edited=True)
+    conn = FakeConnection({LOADED_SOURCES: [(2, str(changed), "old-hash", game_key())]})
+    monkeypatch.setattr(runner_module.psycopg, "connect", lambda dsn: conn)
+    monkeypatch.setattr(runner_module, "create_schema", lambda conn, schema_path: None)
+
+    def failing_load(conn, path, **kwargs):
+        conn.events.append(("load", str(path)))
+        raise RuntimeError("broken game")
+
+    monkeypatch.setattr(runner_module, "load_one_game", failing_load)
+
+    report = runner_module.load_and_validate_entries(
+        "postgresql://",
+        [{"path": str(changed)}],
+        schema_path=tmp_path / "schema.sql",
+        report_json_path=tmp_path / "report.json",
+        reset_db_first=False,
+        validate_after_load=False,
+        incremental=True,
+    )
+
+    # 이전 버전 삭제는 적재와 같은 세이브포인트 안에서 실행되고, 적재가 실패하면 같이 되돌아간다.
+    savepoint = conn.events.index(("SAVEPOINT load_game", ()))
+    after_savepoint = conn.events[savepoint + 1 :]
+    assert ("DELETE FROM raw_games WHERE raw_game_id = ANY(%s) RETURNING raw_game_id", ([2],)) in after_savepoint
+    rollback = after_savepoint.index(("ROLLBACK TO SAVEPOINT load_game", ()))
+    assert after_savepoint[rollback - 1] == ("load", str(changed))
+    assert report["failed_game_count"] == 1
+    assert report["loaded_game_count"] == 0
+
+
+def test_incremental_load_reports_only_reloaded_games_as_loaded(tmp_path: Path, monkeypatch):
+    unchanged = tmp_path / "unchanged.json"
+    new = tmp_path / "new.json"
+    unchanged_hash = write_game(unchanged, 20250401)
+    write_game(new, 20250402)
+    conn = FakeConnection({LOADED_SOURCES: [(1, str(unchanged), unchanged_hash, game_key(20250401))]})
+    monkeypatch.setattr(runner_module.psycopg, "connect", lambda dsn: conn)
+    monkeypatch.setattr(runner_module, "create_schema", lambda conn, schema_path: None)
+    loaded = []
+    monkeypatch.setattr(runner_module, "load_one_game", lambda conn, path, **kwargs: loaded.append(path))
+
+    report = runner_module.load_and_validate_entries(
+        "postgresql://",
+        [{"path": str(unchanged)}, {"path": str(new)}],
+        schema_path=tmp_path / "schema.sql",
+        report_json_path=tmp_path / "report.json",
+        reset_db_first=False,
+        validate_after_load=False,
+        incremental=True,
+    )
+
+    assert loaded == [new]
+    assert report["loaded_game_count"] == 1
+    assert report["skipped_game_count"] == 1
+    assert report["incremental"] == {"unchanged": 1, "new": 1, "changed": 0, "missing": 0, "deleted": 0}
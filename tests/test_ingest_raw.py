@@ -1,9 +1,26 @@
+from contextlib import contextmanager
+import itertools
 from pathlib import Path
+import re
 import sys
 
+import psycopg
+
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from src.kbo_ingest.ingest_raw import _parse_game_date, _to_bool_flag
+from src.kbo_ingest.game_json import minimize_game_payload, pretty_game_json
+from src.kbo_ingest.ingest_raw import (
+    RawGameIngest,
+    _copy_relay_rows,
+    _insert_relay_rows,
+    _iter_relay_blocks,
+    _parse_game_date,
+    _to_bool_flag,
+    ingest_raw_game,
+    ingest_raw_game_rows,
+    upsert_game_dimensions,
+)
+from src.kbo_ingest.normalize_game import _event_rec_from_row, _ingested_normalize_source
 
 
 def test_to_bool_flag_handles_game_info_markers():
@@ -21,3 +38,305 @@ def test_parse_game_date_accepts_common_source_formats():
     assert str(_parse_game_date("2025-03-08")) == "2025-03-08"
     assert str(_parse_game_date("2025/03/08")) == "2025-03-08"
     assert _parse_game_date("") is None
+
+
+class RecordingCursor:
+    """Stands in for a psycopg cursor and records the rows each raw table would receive."""
+
+    def __init__(self) -> None:
+        self.block_ids = itertools.count(501)
+        self.rows: dict[str, list[tuple]] = {}
+        self.round_trips = 0
+        self._result: list[tuple] = []
+
+    def execute(self, sql: str, params: tuple = ()) -> None:
+        self.round_trips += 1
+        if "nextval" in sql:
+            self._result = [(next(self.block_ids),) for _ in range(params[0])]
+            return
+        table = re.search(r"INSERT INTO (\w+)", sql).group(1)
+        if table == "raw_relay_blocks":
+            raw_block_id = next(self.block_ids)
+            self._record(table, (raw_block_id, *params))
+            self._result = [(raw_block_id,)]
+        else:
+            self._record(table, params)
+
+    def executemany(self, sql: str, params_seq: list[tuple]) -> None:
+        self.round_trips += 1
+        table = re.search(r"INSERT INTO (\w+)", sql).group(1)
+        for params in params_seq:
+            self._record(table, params)
+
+    def fetchone(self) -> tuple:
+        return self._result[0]
+
+    def fetchall(self) -> list[tuple]:
+        return self._result
+
+    def copy(self, sql: str):
+        self.round_trips += 1
+        table, columns = re.match(r"COPY (\w+) \((.*)\) FROM STDIN", sql).groups()
+        cursor = self
+
+        class _Copy:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return None
+
+            def write_row(self, row):
+                assert len(row) == len(columns.split(", "))
+                cursor._record(table, row)
+
+        return _Copy()
+
+    def _record(self, table: str, row: tuple) -> None:
+        # Json 래퍼는 감싼 값으로 비교한다.
+        self.rows.setdefault(table, []).append(tuple(("json", value.obj) if hasattr(value, "obj") else value for value in row))
+
+
+def test_copy_relay_path_writes_the_same_rows_as_row_by_row_inserts():
+    relay = [
+        [
+            {
+                "title": "1회초",
+                "titleStyle": 1,
+                "no": 0,
+                "inn": 1,
+                "homeOrAway": "0",
+                "statusCode": 2,
+                "textOptions": [
+                    {"seqno": 1, "type": 1, "text": "타자 \"따옴표\"\t탭", "currentGameState": {"out": 0}, "ptsPitchId": 777, "speed": "145"},
+                    {"seqno": 2, "type": 13, "text": "교체", "currentGameState": {"out": 1}, "playerChange": {"type": "in"}, "batterRecord": {"pcode": "2"}},
+                ],
+                "ptsOptions": [{"pitchId": 777, "inn": 1, "crossPlateX": 0.125, "stance": "R"}],
+                "metricOption": {"homeTeamWinRate": "51.5", "wpaByPlate": "-"},
+            },
+            "not a block",
+        ],
+        [],
+        [{"title": "1회말", "inn": 1, "homeOrAway": "1", "textOptions": [], "ptsOptions": []}],
+    ]
+    blocks = _iter_relay_blocks(relay)
+    insert_cursor = RecordingCursor()
+    copy_cursor = RecordingCursor()
+
+    _insert_relay_rows(insert_cursor, 7, blocks)
+    _copy_relay_rows(copy_cursor, 7, blocks)
+
+    assert copy_cursor.rows == insert_cursor.rows
+    assert [row[:3] for row in copy_cursor.rows["raw_relay_blocks"]] == [(503, 7, 1), (504, 7, 2)]
+    assert [row[:3] for row in copy_cursor.rows["raw_text_events"]] == [(501, 503, 1), (502, 503, 2)]
+    assert copy_cursor.round_trips == 6
+    assert insert_cursor.round_trips == 1 + 2 + 2 + 1 + 1
+
+
+class PipelineConnection:
+    """Stands in for a psycopg connection and counts the results awaited inside pipeline mode."""
+
+    def __init__(self) -> None:
+        self.ids = itertools.count(11)
+        self.in_pipeline = False
+        self.syncs = 0
+        self.statements: list[tuple[str, str]] = []
+        self.batches: dict[str, list[tuple]] = {}
+        self.copied: list[str] = []
+        self._result: list[tuple] = []
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    @contextmanager
+    def pipeline(self):
+        self.in_pipeline = True
+        try:
+            yield
+        finally:
+            self.in_pipeline = False
+
+    def execute(self, sql: str, params: tuple = ()) -> None:
+        lookup = re.match(r"SELECT \w+ FROM (\w+)", sql)
+        if lookup:
+            self.statements.append(("SELECT", lookup.group(1)))
+            self._result = [(next(self.ids),)]
+            return
+        verb, table = re.search(r"(INSERT INTO|DELETE FROM|SELECT nextval) ?(\w*)", sql).groups()
+        self.statements.append((verb, table))
+        if verb == "SELECT nextval":
+            self._result = [(next(self.ids),) for _ in range(params[0])]
+        elif "RETURNING" in sql:
+            self._result = [(next(self.ids),)]
+
+    def executemany(self, sql: str, params_seq: list[tuple]) -> None:
+        table = re.search(r"INSERT INTO (\w+)", sql).group(1)
+        self.statements.append(("executemany", table))
+        self.batches.setdefault(table, []).extend(params_seq)
+
+    def fetchone(self) -> tuple:
+        self.syncs += self.in_pipeline
+        return self._result[0]
+
+    def fetchall(self) -> list[tuple]:
+        self.syncs += self.in_pipeline
+        return self._result
+
+    def copy(self, sql: str):
+        assert not self.in_pipeline, "COPY cannot run inside a pipeline"
+        self.copied.append(re.match(r"COPY (\w+)", sql).group(1))
+        return RecordingCursor().copy(sql)
+
+
+def write_sample_game(directory: Path, game_id: str = "20250401SSHH02025", stadium: str = "대전") -> Path:
+    payload = minimize_game_payload(
+        {
+            "lineup": {
+                "game_info": {"gdate": 20250401, "hCode": "HH", "hName": "한화", "aCode": "SS", "aName": "삼성", "stadium": stadium},
+                "home_starter": [{"playerCode": "100", "playerName": "홈선발", "position": "1", "batOrder": 0}],
+                "home_bullpen": [{"playerCode": "101", "playerName": "홈불펜"}],
+                "away_starter": [{"playerCode": "200", "playerName": "원정타자", "position": "8", "batOrder": 1}],
+            },
+            "relay": [[{"title": "1회초", "inn": 1, "homeOrAway": "0", "textOptions": [{"seqno": 1, "text": "타자"}]}]],
+            "record": {
+                "batter": {"home": [], "away": [{"playerCode": "200", "name": "원정타자"}, {"playerCode": "201", "name": "대타"}]},
+                "pitcher": {"home": [{"pcode": "100", "name": "홈선발"}], "away": []},
+            },
+        },
+        game_id=game_id,
+        game_url=f"https://m.sports.naver.com/game/{game_id}",
+    )
+    path = directory / f"{game_id}.json"
+    path.write_text(pretty_game_json(payload), encoding="utf-8")
+    return path
+
+
+def test_ingest_raw_game_only_waits_for_consumed_returning_values(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(psycopg.Pipeline, "is_supported", classmethod(lambda cls: True))
+    path = write_sample_game(tmp_path)
+    conn = PipelineConnection()
+
+    ingest_raw_game(conn, path)
+
+    # raw_games, 두 팀, 구장, games의 RETURNING만 결과를 기다린다.
+    assert conn.syncs == 5
+    assert [row[0] for row in conn.batches["players"]] == ["100", "101", "200", "100", "200", "201"]
+    assert [(row[2], row[3]) for row in conn.batches["game_roster_entries"]] == [
+        ("100", "starter"),
+        ("101", "bullpen"),
+        ("200", "starter"),
+        ("201", "record_only"),
+    ]
+    assert ("INSERT INTO", "players") not in conn.statements
+    assert ("INSERT INTO", "game_roster_entries") not in conn.statements
+    assert conn.copied == ["raw_relay_blocks", "raw_plate_metrics", "raw_text_events", "raw_pitch_tracks"]
+
+
+class LookupCursor:
+    def __init__(self, rows_by_table: dict[str, list[tuple]]) -> None:
+        self.rows_by_table = rows_by_table
+        self.queries: list[str] = []
+        self._result: list[tuple] = []
+
+    def execute(self, sql: str, params: tuple = ()) -> None:
+        table = re.search(r"FROM (\w+)", sql).group(1)
+        self.queries.append(table)
+        self._result = [row for row in self.rows_by_table[table] if row[0] in params[0]]
+
+    def fetchall(self) -> list[tuple]:
+        return self._result
+
+
+def test_ingested_source_matches_what_the_raw_tables_would_return():
+    relay = [
+        [
+            {
+                "inn": 1,
+                "homeOrAway": "0",
+                "textOptions": [
+                    {"seqno": 3, "type": 1, "text": "1구 볼", "currentGameState": {"out": 0, "batter": "200"}, "pitchNum": 1, "ptsPitchId": 900},
+                    {"type": 13, "text": "seqno 없는 교체", "currentGameState": {"out": 0}, "playerChange": {"type": "in"}},
+                ],
+                "ptsOptions": [{"pitchId": 900, "inn": 1, "crossPlateX": 0.25, "stance": "R"}],
+                "metricOption": {"homeTeamWinRate": "48.5", "wpaByPlate": "0.01"},
+            }
+        ],
+        [{"inn": 1, "homeOrAway": "1", "textOptions": [{"seqno": 1, "type": 0, "text": "1회초", "currentGameState": None}]}],
+    ]
+    cursor = RecordingCursor()
+    written = _copy_relay_rows(cursor, 7, _iter_relay_blocks(relay))
+
+    # _fetch_events의 SELECT를 기록된 raw 행 위에서 그대로 흉내 낸다.
+    def unwrap(value):
+        return value[1] if isinstance(value, tuple) and value[:1] == ("json",) else value
+
+    block_by_id = {row[0]: row for row in cursor.rows["raw_relay_blocks"]}
+    read_back = sorted(
+        (
+            (
+                row[0],
+                row[1],
+                block_by_id[row[1]][6],
+                block_by_id[row[1]][7],
+                row[3] if row[3] is not None else row[0],
+                row[4],
+                row[5] or "",
+                unwrap(row[6]),
+                row[10],
+                row[11],
+                row[12],
+                row[13],
+                row[14],
+                unwrap(row[9]),
+                unwrap(row[15]),
+            )
+            for row in cursor.rows["raw_text_events"]
+        ),
+        key=lambda row: (row[4], row[0]),
+    )
+    ingested = RawGameIngest(
+        raw_game_id=7,
+        game_id=9,
+        payload={"relay": relay},
+        home_team_id=1,
+        away_team_id=2,
+        home_team_name="한화",
+        away_team_name=None,
+        player_rows=[("100", "홈선발", None, None, None, None), ("100", None, None, None, None, None), ("200", None, None, None, None, None)],
+        roster_rows=[(9, 1, "100", "starter", True, 0, "1", None, None), (9, 2, None, "starter", False, 1, None, None, None), (9, 2, "200", "record_only", False, 1, None, None, None)],
+        relay_blocks=written,
+    )
+    lookup = LookupCursor({"players": [("200", "이전 경기 이름")], "teams": [(2, "삼성", "삼성 라이온즈")]})
+
+    source = _ingested_normalize_source(lookup, ingested)
+
+    assert source.events == [_event_rec_from_row(row) for row in read_back]
+    assert [event.text for event in source.events] == ["1회초", "1구 볼", "seqno 없는 교체"]
+    assert source.player_rows == [("100", "홈선발"), ("200", "이전 경기 이름")]
+    assert source.roster_rows == [("100", 1, 0), ("200", 2, 1)]
+    assert source.team_rows == [(1, "한화", "한화"), (2, "삼성", "삼성 라이온즈")]
+    assert source.metric_rows == [row for row in cursor.rows["raw_plate_metrics"]]
+    assert source.pitch_track_rows == [("900", None, 0.25, *([None] * 12), "R")]
+    assert lookup.queries == ["players", "teams"]
+
+
+def test_dimension_upserts_up_front_leave_workers_lookup_only(tmp_path: Path):
+    paths = [write_sample_game(tmp_path), write_sample_game(tmp_path, "20250402SSHH02025", stadium="잠실")]
+    conn = PipelineConnection()
+
+    assert upsert_game_dimensions(conn, paths) == 2
+
+    # 경기를 하나씩 적재할 때와 같은 순서로 upsert해야 COALESCE 결과가 같다.
+    assert conn.batches["teams"] == [("HH", "한화", "한화"), ("SS", "삼성", "삼성")] * 2
+    assert conn.batches["stadiums"] == [("대전",), ("잠실",)]
+    assert [row[0] for row in conn.batches["players"]] == ["100", "101", "200", "100", "200", "201"] * 2
+
+    worker_conn = PipelineConnection()
+    ingested = ingest_raw_game_rows(worker_conn, paths[1], upsert_dimensions=False)
+
+    assert ("SELECT", "teams") in worker_conn.statements
+    assert ("SELECT", "stadiums") in worker_conn.statements
+    assert not [table for verb, table in worker_conn.statements if table in ("teams", "stadiums", "players") and verb != "SELECT"]
+    assert "players" not in worker_conn.batches
+    assert [row[0] for row in ingested.player_rows] == ["100", "101", "200", "100", "200", "201"]
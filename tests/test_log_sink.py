@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+import sys
+import threading
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from infrastructure.log_sink import BufferedLogSink
+
+
+def test_sink_batches_until_size_or_time_threshold_and_flushes_on_close(tmp_path):
+    now = [0.0]
+    path = tmp_path / "failures.jsonl"
+    sink = BufferedLogSink(max_buffer_records=3, flush_interval_seconds=5.0, clock=lambda: now[0], background=False)
+
+    sink.write_jsonl(path, {"n": 1})
+    sink.write_jsonl(path, {"n": 2})
+    assert not path.exists()
+    sink.write_jsonl(path, {"n": 3})
+    assert [json.loads(line)["n"] for line in path.read_text(encoding="utf-8").splitlines()] == [1, 2, 3]
+
+    sink.write_jsonl(path, {"n": 4})
+    now[0] = 6.0
+    sink.write_jsonl(path, {"n": 5})
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 5
+
+    sink.write_jsonl(path, {"n": 6})
+    sink.close()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 6
+    assert sink.flush_count == 3
+
+
+def test_sink_keeps_every_line_intact_under_concurrent_writers(tmp_path):
+    path = tmp_path / "debug.log"
+    sink = BufferedLogSink(max_buffer_records=7, flush_interval_seconds=0.01)
+
+    def worker(worker_id):
+        for index in range(200):
+            sink.write_text(path, f"worker={worker_id} index={index}")
+
+    threads = [threading.Thread(target=worker, args=(worker_id,)) for worker_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sink.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 8 * 200
+    for worker_id in range(8):
+        indexes = [int(line.rsplit("=", 1)[-1]) for line in lines if f"worker={worker_id} " in line]
+        assert indexes == list(range(200))
+
+
+def test_sink_rotates_large_files_and_keeps_backup_count(tmp_path):
+    path = tmp_path / "debug.log"
+    sink = BufferedLogSink(max_buffer_records=1, max_file_bytes=100, backup_count=2, background=False)
+
+    for index in range(12):
+        sink.write_text(path, f"{index:02d} " + "x" * 30)
+    sink.close()
+
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["debug.log", "debug.log.1", "debug.log.2"]
+    assert all(item.stat().st_size <= 100 for item in tmp_path.iterdir())
+    assert path.read_text(encoding="utf-8").splitlines()[-1].split("] ", 1)[1].startswith("11 ")
+    assert sink.rotation_count >= 3
@@ -1,3 +1,6 @@
+import datetime
+import http.client
+import json
 from pathlib import Path
 import sys
 from unittest.mock import patch
@@ -5,6 +8,7 @@ from unittest.mock import patch
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from infrastructure.naver_scraper import NaverScraper
+from infrastructure.rate_limiter import TokenBucketRateLimiter
 
 
 def test_normalize_game_url_with_relative_path():
@@ -42,24 +46,253 @@ def test_get_inning_count_from_relay_summary():
     assert scraper.get_inning_count(relay_summary) == 10
 
 
-def test_throttle_api_request_waits_for_remaining_interval():
+def test_rate_limiter_waits_for_next_token_after_burst():
+    now = [10.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = TokenBucketRateLimiter(4.0, burst=2, clock=lambda: now[0], sleep=fake_sleep)
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    now[0] += 0.1
+    waited = limiter.acquire()
+
+    assert len(sleeps) == 1
+    assert abs(waited - 0.15) < 1e-9
+    stats = limiter.stats()
+    assert stats["request_count"] == 3
+    assert abs(stats["observed_request_rate"] - 8.0) < 1e-3
+
+
+def test_rate_limiter_skips_sleep_when_tokens_refilled():
+    now = [10.0]
+    limiter = TokenBucketRateLimiter.from_interval(0.25, clock=lambda: now[0])
+
+    with patch("infrastructure.rate_limiter.time.sleep") as sleep_mock:
+        limiter.acquire()
+        now[0] += 0.4
+        limiter.acquire()
+
+    sleep_mock.assert_not_called()
+
+
+def test_rate_limiter_shares_budget_through_state_file(tmp_path):
+    now = [100.0]
+    state_path = tmp_path / "rate.json"
+    first = TokenBucketRateLimiter(2.0, state_path=state_path, clock=lambda: now[0])
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    second = TokenBucketRateLimiter(2.0, state_path=state_path, clock=lambda: now[0], sleep=fake_sleep)
+
+    first.acquire()
+    second.acquire()
+
+    assert sleeps == [0.5]
+
+
+def test_scraper_defers_browser_launch_until_page_is_used(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with patch("infrastructure.naver_scraper.sync_playwright") as playwright_mock:
+        scraper = NaverScraper(path="games")
+        assert scraper.browser_started is False
+        playwright_mock.assert_not_called()
+
+        scraper.page
+        assert scraper.browser_started is True
+        playwright_mock.return_value.start.return_value.chromium.launch.assert_called_once()
+
+        scraper.close()
+    assert scraper.browser_started is False
+
+
+def test_iter_schedule_game_urls_groups_finished_games_by_date_per_month():
+    class FakeHttpClient:
+        def __init__(self):
+            self.urls = []
+
+        def get_json(self, url, *, headers=None, timeout=10.0):
+            self.urls.append(url)
+            if "fromDate=2025-04-28" in url:
+                games = [
+                    {"gameId": "20250429NCKT02025", "gameDate": "2025-04-29", "statusCode": "RESULT", "categoryId": "kbo"},
+                    {"gameId": "20250429LGSS02025", "gameDate": "2025-04-29", "statusCode": "CANCEL", "cancel": True, "categoryId": "kbo"},
+                    {"gameId": "20250428HHLT02025", "gameDate": "2025-04-28", "statusCode": "RESULT", "categoryId": "kbo"},
+                ]
+            else:
+                games = [
+                    {"gameId": "20250501NCKT02025", "gameDate": "2025-05-01", "statusCode": "STARTED", "categoryId": "kbo"},
+                    {"gameId": "20250502NCKT02025", "gameDate": "2025-05-02", "statusCode": "RESULT", "categoryId": "kbo"},
+                ]
+            return {"code": 200, "success": True, "result": {"games": games}}
+
     scraper = NaverScraper.__new__(NaverScraper)
-    scraper.api_request_interval = 0.25
-    scraper._last_api_request_finished_at = 10.0
+    scraper.rate_limiter = TokenBucketRateLimiter(None)
+    scraper.http_client = FakeHttpClient()
+    scraper.api_base_url = NaverScraper.NAVER_API_BASE_URL
+
+    dated_urls = list(scraper.iter_schedule_game_urls(datetime.date(2025, 4, 28), datetime.date(2025, 5, 3)))
+
+    assert dated_urls == [
+        (datetime.date(2025, 4, 28), ["https://m.sports.naver.com/game/20250428HHLT02025"]),
+        (datetime.date(2025, 4, 29), ["https://m.sports.naver.com/game/20250429NCKT02025"]),
+        (datetime.date(2025, 5, 2), ["https://m.sports.naver.com/game/20250502NCKT02025"]),
+    ]
+    assert len(scraper.http_client.urls) == 2
+    assert "toDate=2025-04-30" in scraper.http_client.urls[0]
+    assert "fromDate=2025-05-01" in scraper.http_client.urls[1]
 
-    with patch("infrastructure.naver_scraper.time.monotonic", return_value=10.1), patch("infrastructure.naver_scraper.time.sleep") as sleep_mock:
-        scraper._throttle_api_request()
 
-    sleep_mock.assert_called_once()
-    assert abs(sleep_mock.call_args.args[0] - 0.15) < 1e-9
+def test_rate_limiter_backs_off_on_throttle_and_recovers_on_success():
+    now = [0.0]
+    sleeps: list[float] = []
 
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = TokenBucketRateLimiter(4.0, burst=1, clock=lambda: now[0], sleep=fake_sleep)
+    limiter.acquire()
+    limiter.on_throttled(retry_after=2.0)
+    assert limiter.current_rate_per_second == 2.0
+
+    limiter.acquire()
+    assert sleeps == [2.0]
+
+    for _ in range(30):
+        limiter.on_success()
+    assert limiter.current_rate_per_second == 4.0
+    assert limiter.stats()["throttle_events"] == 1
+
+
+def test_get_game_data_refetches_only_failed_endpoint():
+    from infrastructure.http_client import HttpStatusError
+
+    class FlakyHttpClient:
+        def __init__(self):
+            self.urls = []
+            self.record_failures = 1
+
+        def get_json(self, url, *, headers=None, timeout=10.0):
+            self.urls.append(url.rsplit("/", 1)[-1])
+            if url.endswith("/record") and self.record_failures:
+                self.record_failures -= 1
+                raise HttpStatusError(url, 503, "Service Unavailable", {"Retry-After": "0"})
+            if url.endswith("/preview"):
+                lineup = {"fullLineUp": [], "pitcherBullpen": [], "batterCandidate": []}
+                return {"result": {"previewData": {"gameInfo": {}, "homeTeamLineUp": lineup, "awayTeamLineUp": lineup}}}
+            if url.endswith("/record"):
+                return {"result": {"recordData": {"pitchersBoxscore": {}, "battersBoxscore": {}}}}
+            return {"result": {"textRelayData": {"inningScore": {"home": {"1": 0}}, "textRelays": [{"no": 2}, {"no": 1}]}}}
 
-def test_throttle_api_request_skips_sleep_when_interval_elapsed():
     scraper = NaverScraper.__new__(NaverScraper)
-    scraper.api_request_interval = 0.25
-    scraper._last_api_request_finished_at = 10.0
+    scraper.rate_limiter = TokenBucketRateLimiter(10.0)
+    scraper.http_client = FlakyHttpClient()
+    scraper.api_base_url = NaverScraper.NAVER_API_BASE_URL
+    responses = {}
 
-    with patch("infrastructure.naver_scraper.time.monotonic", return_value=10.4), patch("infrastructure.naver_scraper.time.sleep") as sleep_mock:
-        scraper._throttle_api_request()
+    try:
+        scraper.get_game_data("/game/20250409NCKT02025", responses=responses)
+    except HttpStatusError as exc:
+        assert exc.status == 503
+    else:
+        raise AssertionError("expected the first record request to fail")
+    _, inning_data, _ = scraper.get_game_data("/game/20250409NCKT02025", responses=responses)
 
-    sleep_mock.assert_not_called()
+    assert scraper.http_client.urls == ["preview", "relay", "relay?inning=1", "record", "record"]
+    assert inning_data == [[{"no": 1}, {"no": 2}]]
+    assert scraper.rate_limiter.current_rate_per_second < 10.0
+
+
+def test_retry_policy_skips_final_http_errors_and_honours_retry_after():
+    from infrastructure.http_client import HttpStatusError
+    from infrastructure.json_stream import TruncatedJsonError
+    from infrastructure.retry_policy import RetryPolicy
+
+    policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=8.0)
+    not_found = HttpStatusError("u", 404, "Not Found")
+    throttled = HttpStatusError("u", 429, "Too Many Requests", {"Retry-After": "5"})
+
+    assert policy.should_retry(not_found, 1) is False
+    assert policy.should_retry(throttled, 3) is True
+    assert policy.should_retry(throttled, 4) is False
+    assert policy.should_retry(ConnectionResetError(), 1) is True
+    assert policy.should_retry(TimeoutError(), 1) is True
+    assert policy.should_retry(http.client.IncompleteRead(b"{"), 1) is True
+    assert policy.should_retry(json.JSONDecodeError("Expecting value", "{", 1), 1) is True
+    assert policy.should_retry(TruncatedJsonError("truncated JSON array"), 1) is True
+    # 응답 형식 오류는 다시 받아도 같으므로 재시도하지 않는다.
+    assert policy.should_retry(KeyError("textRelayData"), 1) is False
+    assert policy.should_retry(TypeError("'NoneType' object is not subscriptable"), 1) is False
+    assert policy.should_retry(ValueError("missing lineup, relay, or record payload"), 1) is False
+    assert policy.delay_for(3, rng=lambda: 1.0) == 4.0
+    assert policy.delay_for(10, rng=lambda: 1.0) == 8.0
+    assert policy.delay_for(1, throttled, rng=lambda: 0.0) == 5.0
+
+
+def test_dom_schedule_discovery_fans_out_across_pages_in_date_order(tmp_path):
+    events = []
+
+    class FakePage:
+        def __init__(self, name):
+            self.name = name
+            self.url = None
+
+        def goto(self, url, wait_until=None):
+            events.append(("goto", self.name, url.rsplit("=", 1)[-1]))
+            self.url = url
+
+        def set_default_timeout(self, timeout):
+            return None
+
+    class FakeContext:
+        def __init__(self):
+            self.pages = 1
+
+        def new_page(self):
+            self.pages += 1
+            return FakePage(f"page{self.pages}")
+
+    class PagedScraper(NaverScraper):
+        def get_activated_dates(self):
+            events.append(("read", self.page.name, self.page.url.rsplit("=", 1)[-1]))
+            return {"2025-04-01": [30, 1, 2], "2025-05-01": [1, 31]}[self.page.url.rsplit("=", 1)[-1]]
+
+        def get_game_urls(self, year, month, date, soft_timeout=8, navigate=True):
+            assert navigate is False
+            day = self.page.url.rsplit("=", 1)[-1]
+            events.append(("read", self.page.name, day))
+            return [f"https://m.sports.naver.com/game/{day.replace('-', '')}NCKT02025"]
+
+    scraper = PagedScraper.__new__(PagedScraper)
+    scraper._page = FakePage("page1")
+    scraper._extra_pages = []
+    scraper.context = FakeContext()
+    scraper.DEFAULT_TIMEOUT = 10
+
+    dated_urls = list(
+        scraper.iter_dom_schedule_urls(
+            [(datetime.date(2025, 5, 1), datetime.date(2025, 5, 31)), (datetime.date(2025, 4, 2), datetime.date(2025, 4, 30))],
+            page_count=3,
+        )
+    )
+
+    assert [game_date for game_date, _ in dated_urls] == [
+        datetime.date(2025, 4, 2),
+        datetime.date(2025, 4, 30),
+        datetime.date(2025, 5, 1),
+        datetime.date(2025, 5, 31),
+    ]
+    assert dated_urls[0][1] == ["https://m.sports.naver.com/game/20250402NCKT02025"]
+    day_events = events[4:]
+    # 네 날짜 중 세 개는 첫 결과를 읽기 전에 서로 다른 탭에서 이동을 시작해야 한다.
+    assert [event[0] for event in day_events[:4]] == ["goto", "goto", "goto", "read"]
+    assert len({event[1] for event in day_events[:3]}) == 3
+    assert scraper.context.pages == 3
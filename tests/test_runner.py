@@ -0,0 +1,193 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import src.kbo_ingest.runner as runner_module
+from src.kbo_ingest.normalize_game import ensure_pa_event_runner_columns
+
+
+class FakeConnection:
+    def __init__(self, name: str, events: list) -> None:
+        self.name = name
+        self.events = events
+
+    def __enter__(self) -> "FakeConnection":
+        return self
+
+    def __exit__(self, exc_type, *_: object) -> None:
+        self.events.append((self.name, "rollback" if exc_type else "commit"))
+
+    def cursor(self) -> "FakeConnection":
+        return self
+
+    def execute(self, sql: str, params: tuple = ()) -> None:
+        self.events.append((self.name, " ".join(sql.split())))
+
+    def fetchall(self) -> list[tuple]:
+        return []
+
+    def pipeline(self):
+        return nullcontext()
+
+    def commit(self) -> None:
+        self.events.append((self.name, "commit"))
+
+    def rollback(self) -> None:
+        self.events.append((self.name, "rollback"))
+
+    def close(self) -> None:
+        return None
+
+
+def inline_process_pool(max_workers, mp_context, initializer, initargs):
+    # 워커 하나짜리 스레드 풀로 바꿔 initializer와 경기별 트랜잭션 흐름만 그대로 확인한다.
+    return ThreadPoolExecutor(max_workers=1, initializer=initializer, initargs=initargs)
+
+
+def install_fake_database(monkeypatch, events: list, names: list[str]) -> list[FakeConnection]:
+    connections: list[FakeConnection] = []
+
+    def connect(dsn):
+        connections.append(FakeConnection(names[len(connections)], events))
+        return connections[-1]
+
+    monkeypatch.setattr(runner_module.psycopg, "connect", connect)
+    monkeypatch.setattr(runner_module, "ProcessPoolExecutor", inline_process_pool)
+    monkeypatch.setattr(runner_module, "create_schema", lambda conn, schema_path: None)
+    monkeypatch.setattr(runner_module, "game_dimension_rows", fake_dimension_rows)
+
+    def upsert_dimension_rows(conn, rows_by_file):
+        rows_by_file = list(rows_by_file)
+        events.append((conn.name, f"dimensions {[teams[0][0] for teams, _, _ in rows_by_file]}"))
+        return len(rows_by_file)
+
+    monkeypatch.setattr(runner_module, "upsert_dimension_rows", upsert_dimension_rows)
+    return connections
+
+
+def fake_dimension_rows(path: Path):
+    if path.name == "broken.json":
+        raise ValueError("not JSON")
+    return [(path.stem, None, None)], [], []
+
+
+def test_parallel_load_reports_each_failed_game_without_stopping(monkeypatch):
+    events: list = []
+    install_fake_database(monkeypatch, events, ["worker1"])
+    parent = FakeConnection("parent", events)
+
+    def load_one_game(conn, path, *, upsert_dimensions=True):
+        assert upsert_dimensions is False
+        if path.name == "broken.json":
+            raise ValueError("no relay")
+        events.append((conn.name, f"load {path.name}"))
+
+    monkeypatch.setattr(runner_module, "load_one_game", load_one_game)
+    entries = [{"path": "a.json"}, {"path": "broken.json"}, {"path": "b.json"}]
+
+    failures = runner_module._load_entries_parallel(parent, "postgresql://", entries, workers=2, replaced_raw_game_ids={"b.json": []})
+
+    assert failures == {"broken.json": "ValueError: no relay"}
+    # 차원 행은 워커가 읽고 부모가 목록 순서대로 넣어 커밋한 뒤에 경기를 넘긴다. 못 읽은 파일은 건너뛴다.
+    dimensions = events.index(("parent", "dimensions ['a', 'b']"))
+    assert events[dimensions + 1] == ("parent", "commit")
+    assert events.index(("worker1", "load a.json")) > dimensions + 1
+    assert ("worker1", "load a.json") in events
+    assert ("worker1", "load b.json") in events
+    assert ("worker1", "rollback") in events
+
+
+def test_parallel_load_alters_pa_events_once_on_the_parent_connection(tmp_path: Path, monkeypatch):
+    events: list = []
+    connections = install_fake_database(monkeypatch, events, ["parent", "worker1"])
+    monkeypatch.setattr(runner_module, "load_one_game", lambda conn, path, **kwargs: events.append((conn.name, "load")))
+
+    report = runner_module.load_and_validate_entries(
+        "postgresql://",
+        [{"path": "a.json"}, {"path": "b.json"}],
+        schema_path=tmp_path / "schema.sql",
+        report_json_path=tmp_path / "report.json",
+        reset_db_first=False,
+        validate_after_load=False,
+        workers=2,
+    )
+
+    assert report["ok"] is True
+    alters = [(name, event) for name, event in events if event.startswith("ALTER TABLE pa_events")]
+    assert len(alters) == 6
+    assert {name for name, _ in alters} == {"parent"}
+    # 열 추가는 워커 연결이 열리기 전에 커밋되고, 워커 연결은 준비된 것으로 표시되어 다시 ALTER하지 않는다.
+    first_worker_event = next(index for index, (name, _) in enumerate(events) if name == "worker1")
+    last_alter = max(index for index, event in enumerate(events) if event in alters)
+    assert ("parent", "commit") in events[last_alter:first_worker_event]
+    worker = connections[1]
+    ensure_pa_event_runner_columns(worker, worker)
+    assert not any(name == "worker1" and event.startswith("ALTER") for name, event in events)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failed_game_is_reported_the_same_way_for_any_worker_count(tmp_path: Path, monkeypatch, workers: int):
+    events: list = []
+    install_fake_database(monkeypatch, events, ["parent", "worker1"])
+
+    def load_one_game(conn, path, **kwargs):
+        if path.name == "broken.json":
+            raise ValueError("no relay")
+        events.append((conn.name, f"load {path.name}"))
+
+    monkeypatch.setattr(runner_module, "load_one_game", load_one_game)
+
+    report = runner_module.load_and_validate_entries(
+        "postgresql://",
+        [{"path": "a.json"}, {"path": "broken.json"}, {"path": "b.json"}],
+        schema_path=tmp_path / "schema.sql",
+        report_json_path=tmp_path / "report.json",
+        reset_db_first=False,
+        validate_after_load=False,
+        workers=workers,
+    )
+
+    assert report["ok"] is False
+    assert report["loaded_game_count"] == 2
+    assert report["failed_game_count"] == 1
+    assert report["blocking_issue_types"] == {"load_error": 1}
+    assert report["blocking_issues"][0]["path"] == "broken.json"
+    assert {event for _, event in events if event.startswith("load ")} == {"load a.json", "load b.json"}
+    if workers == 1:
+        # 순차 적재는 실패한 경기의 세이브포인트만 되돌리고 같은 묶음을 커밋한다.
+        parent_events = [event for name, event in events if name == "parent"]
+        assert "rollback" not in parent_events
+        assert parent_events.count("ROLLBACK TO SAVEPOINT load_game") == 1
+        assert parent_events.count("RELEASE SAVEPOINT load_game") == 2
+        assert parent_events[-1] == "commit"
+
+
+def test_load_failures_become_blocking_load_error_issues():
+    report = {
+        "ok": True,
+        "blocking_issue_count": 1,
+        "blocking_issue_types": {"row_count": 1},
+        "blocking_issues": [{"type": "row_count", "scope": "table", "code": "mismatch", "message": "1 != 2"}],
+    }
+
+    assert runner_module._add_load_failures(report, {}) is report
+    assert report["ok"] is True
+
+    report = runner_module._add_load_failures(report, {"broken.json": "ValueError: no relay"})
+
+    assert report["ok"] is False
+    assert report["failed_game_count"] == 1
+    assert report["blocking_issue_count"] == 2
+    assert report["blocking_issue_types"] == {"load_error": 1, "row_count": 1}
+    assert report["blocking_issues"][0] == {
+        "type": "load_error",
+        "scope": "game",
+        "code": "load_failed",
+        "message": "ValueError: no relay",
+        "path": "broken.json",
+    }